@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+# SPDX-License-Identifier: MIT-0
+"""Per-phase overhead of the molecule CLI vs the in-process executor.
+
+Creates and prepares the scenario once, then runs each selected phase
+``--repeat`` times with MoleculeExecutorAdapter (one ``molecule`` process
+per phase) and InProcessExecutorAdapter (config loaded once, playbooks
+through ansible-runner), alternating so both see the same container state.
+The in-process adapter's one-time load is reported separately.
+
+Usage:
+    python benchmarks/bench_executor_overhead.py
+    python benchmarks/bench_executor_overhead.py -s ci -p converge,verify -n 10
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.infrastructure import (  # noqa: E402
+    InProcessExecutorAdapter,
+    MoleculeExecutorAdapter,
+    Settings,
+)
+
+PHASES = {
+    "converge": lambda executor: executor.converge(),
+    "idempotence": lambda executor: executor.check_idempotence(),
+    "verify": lambda executor: executor.verify(),
+    "cleanup": lambda executor: executor.cleanup(),
+}
+
+
+def timed(call) -> float:
+    """Run a call and return its wall time in seconds (fails loudly)."""
+    start = time.perf_counter()
+    result = call()
+    elapsed = time.perf_counter() - start
+    if result is not None and hasattr(result, "is_success") and not result.is_success():
+        raise SystemExit(f"{result.phase.value} failed:\n{result.output[-2000:]}")
+    return elapsed
+
+
+def main() -> int:
+    """Run the benchmark and print a table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scenario", "-s", default=Settings.MOLECULE_SCENARIO)
+    parser.add_argument("--phases", "-p", default="converge,verify",
+                        help=f"Comma-separated phases out of: {', '.join(PHASES)}")
+    parser.add_argument("--repeat", "-n", type=int, default=5)
+    parser.add_argument("--project-root", type=Path, default=ROOT)
+    args = parser.parse_args()
+
+    phases = [p for p in args.phases.split(",") if p]
+    unknown = set(phases) - set(PHASES)
+    if unknown:
+        parser.error(f"unknown phases: {', '.join(sorted(unknown))}")
+
+    env = Settings.get_ansible_env()
+    cli = MoleculeExecutorAdapter(args.scenario, env, args.project_root)
+    inprocess = InProcessExecutorAdapter(args.scenario, env, args.project_root)
+
+    startup = [
+        timed(lambda: subprocess.run(["molecule", "--version"], capture_output=True, check=True))
+        for _ in range(args.repeat)
+    ]
+
+    timed(cli.create_containers)
+    try:
+        timed(cli.prepare_environment)
+        load = timed(inprocess._load)
+
+        rows = []
+        for phase in phases:
+            samples = {"cli": [], "inprocess": []}
+            for _ in range(args.repeat):
+                samples["cli"].append(timed(lambda: PHASES[phase](cli)))
+                samples["inprocess"].append(timed(lambda: PHASES[phase](inprocess)))
+            rows.append((
+                phase,
+                statistics.median(samples["cli"]),
+                statistics.median(samples["inprocess"]),
+            ))
+    finally:
+        cli.destroy_containers()
+
+    print(f"\nScenario {args.scenario}, median of {args.repeat} runs (seconds)\n")
+    print(f"  molecule --version (CLI startup only): {statistics.median(startup):8.2f}")
+    print(f"  in-process config load (once):         {load:8.2f}\n")
+    print(f"  {'phase':<12} {'molecule CLI':>12} {'in-process':>12} {'saved':>8} {'saved %':>8}")
+    for phase, cli_time, inprocess_time in rows:
+        saved = cli_time - inprocess_time
+        print(
+            f"  {phase:<12} {cli_time:12.2f} {inprocess_time:12.2f} "
+            f"{saved:8.2f} {100 * saved / cli_time:7.1f}%"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
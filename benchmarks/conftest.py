@@ -0,0 +1,296 @@
+# SPDX-License-Identifier: MIT-0
+"""Shared fixtures for the agent benchmarks.
+
+Logs are synthetic Molecule output (deterministic, with ignored and real
+failures, changed items and long JSON result lines) or recorded ones
+passed with ``--molecule-log``, tiled up to each size of ``--log-sizes``.
+
+Usage:
+    pytest benchmarks --benchmark-only
+    pytest benchmarks --benchmark-only --log-sizes 1,10,100
+    pytest benchmarks --benchmark-only --molecule-log run.log --molecule-log run.cassette
+"""
+
+import json
+import random
+import sys
+import tracemalloc
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, List, Tuple
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+from src.domain.models import FixRecord, TestResult  # noqa: E402
+from src.application.ports import AsyncObserverPort, LogLevel, ObserverPort  # noqa: E402
+
+MB = 1024 * 1024
+
+
+def pytest_addoption(parser):
+    """Add benchmark options."""
+    group = parser.getgroup("agent benchmarks")
+    group.addoption(
+        "--log-sizes",
+        default="1,10",
+        help="Comma-separated log sizes in MB (default: 1,10; add 100 for the large run)",
+    )
+    group.addoption(
+        "--molecule-log",
+        action="append",
+        type=Path,
+        default=[],
+        help="Recorded Molecule log or --record cassette to benchmark as well (repeatable)",
+    )
+
+
+@dataclass(frozen=True)
+class LogSample:
+    """A Molecule log of a given size."""
+
+    name: str
+    path: Path
+    size: int
+
+    @property
+    def size_mb(self) -> float:
+        """Size in MB."""
+        return self.size / MB
+
+    def text(self) -> str:
+        """Read the whole log."""
+        return self.path.read_text(encoding="utf-8")
+
+
+# ----------------------------------------------------------------------
+# Log generation
+# ----------------------------------------------------------------------
+
+ROLES = ["common", "locale", "developer", "desktop", "security"]
+VERBS = ["Install", "Configure", "Ensure", "Template", "Enable", "Create", "Download"]
+OBJECTS = ["packages", "repositories", "dnf.conf", "services", "dotfiles", "user groups", "SDK"]
+
+
+def synthetic_chunk(rng: random.Random, host: str = "instance") -> List[str]:
+    """One play of Molecule converge output."""
+    lines = ["INFO     [default > converge] Executing", "", "PLAY [Converge] " + "*" * 60]
+    for _ in range(rng.randint(20, 60)):
+        task = f"{rng.choice(ROLES)} : {rng.choice(VERBS)} {rng.choice(OBJECTS)}"
+        lines.append(f"TASK [{task}] " + "*" * 40)
+        roll = rng.random()
+        if roll < 0.55:
+            lines.append(f"ok: [{host}]")
+        elif roll < 0.75:
+            for item in range(rng.randint(1, 8)):
+                lines.append(f"changed: [{host}] => (item=pkg-{item})")
+        elif roll < 0.9:
+            lines.append(f"skipping: [{host}]")
+        elif roll < 0.97:
+            # -v style result on one long line
+            result = {"changed": False, "msg": "x" * rng.randint(200, 4000), "rc": 0}
+            lines.append(f"ok: [{host}] => {json.dumps(result)}")
+        else:
+            lines.append(f"fatal: [{host}]: FAILED! => {{\"msg\": \"transient\"}}")
+            lines.append("...ignoring")
+        if rng.random() < 0.05:
+            lines.append("[WARNING]: Module did not set no_log for password")
+    lines += [
+        "",
+        "PLAY RECAP " + "*" * 60,
+        f"{host} : ok=40 changed=12 unreachable=0 failed=0 skipped=6 rescued=0 ignored=1",
+    ]
+    return lines
+
+
+FAILURE_TAIL = [
+    "TASK [developer : Download Android command-line tools] " + "*" * 20,
+    'fatal: [instance]: FAILED! => {"changed": false, "msg": "Request failed", "status_code": 404}',
+    "",
+    "PLAY RECAP " + "*" * 60,
+    "instance : ok=312 changed=87 unreachable=0 failed=1 skipped=40 rescued=0 ignored=3",
+    "CRITICAL Ansible return code was 2, command was: ansible-playbook converge.yml",
+    "WARNING  An error occurred during the test sequence action: 'converge'. Cleaning up.",
+]
+
+
+def recorded_text(path: Path) -> str:
+    """Read a recorded log, or every test output of a cassette."""
+    with open(path, encoding="utf-8") as f:
+        first = f.readline()
+        try:
+            is_cassette = "cassette" in json.loads(first)
+        except ValueError:
+            is_cassette = False
+        if not is_cassette:
+            return first + f.read()
+        outputs = []
+        for line in f:
+            result = json.loads(line).get("result")
+            if isinstance(result, dict) and "test_result" in result:
+                outputs.append(result["test_result"]["output"])
+        return "\n".join(outputs)
+
+
+def write_log(path: Path, size: int, source: Path = None) -> None:
+    """Write a log of about ``size`` bytes that ends in a failure."""
+    rng = random.Random(size)
+    tail = "\n".join(FAILURE_TAIL) + "\n"
+    template = recorded_text(source) if source else None
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        while written < size - len(tail):
+            chunk = (template if template else "\n".join(synthetic_chunk(rng))) + "\n"
+            f.write(chunk)
+            written += len(chunk.encode("utf-8"))
+        f.write(tail)
+
+
+def pytest_generate_tests(metafunc):
+    """Parametrize ``molecule_log`` over sources and sizes."""
+    if "molecule_log" not in metafunc.fixturenames:
+        return
+    sizes = [int(s) for s in metafunc.config.getoption("--log-sizes").split(",") if s]
+    sources = [None] + metafunc.config.getoption("--molecule-log")
+    params = [(source, size) for source in sources for size in sizes]
+    ids = [f"{source.stem if source else 'synthetic'}-{size}MB" for source, size in params]
+    metafunc.parametrize("molecule_log", params, ids=ids, indirect=True, scope="session")
+
+
+@pytest.fixture(scope="session")
+def molecule_log(request, tmp_path_factory) -> LogSample:
+    """A Molecule log file (generated once per session)."""
+    source, size_mb = request.param
+    name = f"{source.stem if source else 'synthetic'}-{size_mb}MB"
+    path = tmp_path_factory.getbasetemp() / f"{name}.log"
+    if not path.exists():
+        write_log(path, size_mb * MB, source)
+    return LogSample(name=name, path=path, size=path.stat().st_size)
+
+
+# ----------------------------------------------------------------------
+# Measurement helpers
+# ----------------------------------------------------------------------
+
+
+def rounds_for(sample: LogSample) -> int:
+    """Fewer rounds for larger logs so a full run stays in minutes."""
+    return 10 if sample.size_mb <= 2 else 5 if sample.size_mb <= 20 else 2
+
+
+def peak_memory(call: Callable) -> Tuple[object, int]:
+    """Run a call once under tracemalloc.
+
+    Returns:
+        Tuple of (result, peak traced bytes)
+    """
+    tracemalloc.start()
+    try:
+        result = call()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def run_benchmark(benchmark, sample: LogSample, call: Callable):
+    """Time a call over a log and report throughput and peak memory.
+
+    Peak memory is measured in a separate, untimed run: tracemalloc
+    slows allocation-heavy code down several times.
+    """
+    result = benchmark.pedantic(call, rounds=rounds_for(sample), iterations=1, warmup_rounds=1)
+    _, peak = peak_memory(call)
+    benchmark.extra_info["log_mb"] = round(sample.size_mb, 2)
+    benchmark.extra_info["peak_mb"] = round(peak / MB, 2)
+    benchmark.extra_info["peak_per_log_mb"] = round(peak / sample.size, 2)
+    if benchmark.stats is not None:
+        benchmark.extra_info["mb_per_s"] = round(sample.size_mb / benchmark.stats.stats.mean, 1)
+    return result
+
+
+# ----------------------------------------------------------------------
+# Observers that only count
+# ----------------------------------------------------------------------
+
+
+class CountingObserver(ObserverPort):
+    """Observer that counts streamed lines and ignores everything else."""
+
+    def __init__(self):
+        self.lines = 0
+
+    def log(self, level: LogLevel, message: str) -> None:
+        pass
+
+    def on_iteration_start(self, iteration: int, max_retries: int) -> None:
+        pass
+
+    def on_iteration_complete(self, iteration: int, success: bool) -> None:
+        pass
+
+    def on_test_start(self, phase: str) -> None:
+        pass
+
+    def on_test_complete(self, result: TestResult) -> None:
+        pass
+
+    def on_output(self, phase: str, lines: List[str]) -> None:
+        self.lines += len(lines)
+
+    def on_healing_start(self, iteration: int) -> None:
+        pass
+
+    def on_healing_complete(self, fix_record: FixRecord) -> None:
+        pass
+
+    def on_phase_change(self, phase: str) -> None:
+        pass
+
+    def on_summary(self, summary: dict) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncCountingObserver(AsyncObserverPort):
+    """Async observer that counts streamed lines and ignores everything else."""
+
+    def __init__(self):
+        self.lines = 0
+
+    async def log(self, level: LogLevel, message: str) -> None:
+        pass
+
+    async def on_iteration_start(self, iteration: int, max_retries: int) -> None:
+        pass
+
+    async def on_iteration_complete(self, iteration: int, success: bool) -> None:
+        pass
+
+    async def on_test_start(self, phase: str) -> None:
+        pass
+
+    async def on_test_complete(self, result: TestResult) -> None:
+        pass
+
+    async def on_output(self, phase: str, lines: List[str]) -> None:
+        self.lines += len(lines)
+
+    async def on_healing_start(self, iteration: int) -> None:
+        pass
+
+    async def on_healing_complete(self, fix_record: FixRecord) -> None:
+        pass
+
+    async def on_phase_change(self, phase: str) -> None:
+        pass
+
+    async def on_summary(self, summary: dict) -> None:
+        pass
+
+    async def close(self) -> None:
+        pass
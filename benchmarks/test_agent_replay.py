@@ -0,0 +1,103 @@
+# SPDX-License-Identifier: MIT-0
+"""End-to-end agent run against replayed executor and healer calls.
+
+A cassette with ``FAILURES`` failing iterations (each with the whole
+benchmark log as output), a passing one and the clean-room run is replayed
+at speed 0 through AsyncAutonomousAgentUseCase. Without containers or
+Claude, the time left is the agent's own overhead: result handling,
+error extraction and store, progress tracking, checkpoints and observers.
+"""
+
+import asyncio
+import time
+
+from conftest import MB, AsyncCountingObserver, peak_memory, rounds_for
+
+from src.domain.models import AgentConfig, FixRecord, FixStatus, TestPhase, TestResult, TestStatus
+from src.application import AsyncAutonomousAgentUseCase
+from src.infrastructure.adapters import (
+    CassetteReader,
+    CassetteWriter,
+    FileErrorStoreAdapter,
+    JournalStateStoreAdapter,
+    ReplayExecutorAdapter,
+    ReplayHealerAdapter,
+)
+
+FAILURES = 3
+
+
+def result(phase: TestPhase, output: str = "ok", failed: bool = False) -> TestResult:
+    """Build a recorded test result."""
+    return TestResult(
+        phase=phase,
+        status=TestStatus.FAILED if failed else TestStatus.SUCCESS,
+        return_code=2 if failed else 0,
+        output=output,
+    )
+
+
+def write_cassette(path, log_text: str) -> None:
+    """Record a run that fails ``FAILURES`` times, then passes."""
+    cassette = CassetteWriter(path, scenario="default", executor="molecule", healer="Claude Code")
+    clock = time.monotonic()
+
+    def record(port, method, value, **args):
+        cassette.record(port, method, args, clock, 0.0, result=value)
+
+    for iteration in range(1, FAILURES + 2):
+        failed = iteration <= FAILURES
+        record("executor", "create_containers", result(TestPhase.CREATE))
+        record("executor", "get_container_identity", {"driver": "podman", "containers": {"i": "c0ffee"}})
+        record("executor", "prepare_environment", result(TestPhase.PREPARE))
+        record("executor", "run_full_test", result(TestPhase.FULL_TEST, log_text, failed=failed))
+        if failed:
+            record("executor", "destroy_containers", result(TestPhase.DESTROY))
+            record("executor", "cleanup", result(TestPhase.CLEANUP))
+            record("healer", "analyze_and_fix", FixRecord(iteration=iteration, status=FixStatus.SUCCESS))
+
+    # Clean-room run, plus teardowns of the finalization
+    record("executor", "run_full_test", result(TestPhase.FULL_TEST, log_text))
+    for _ in range(3):
+        record("executor", "destroy_containers", result(TestPhase.DESTROY))
+        record("executor", "cleanup", result(TestPhase.CLEANUP))
+    cassette.close()
+
+
+def test_agent_replay(benchmark, molecule_log, tmp_path):
+    """AsyncAutonomousAgentUseCase.run() over a replayed cassette."""
+    cassette_file = tmp_path / "run.cassette.jsonl"
+    write_cassette(cassette_file, molecule_log.text())
+    config = AgentConfig.create(
+        max_retries=FAILURES + 1,
+        project_root=tmp_path,
+        stall_limit=0,
+        retry_delay=0,
+        settle_delay=0,
+    )
+
+    def setup():
+        # Loading the cassette is not part of the agent's work
+        cassette = CassetteReader(cassette_file, strict=False)
+        observer = AsyncCountingObserver()
+        use_case = AsyncAutonomousAgentUseCase(
+            config=config,
+            executor=ReplayExecutorAdapter(cassette, observer=observer, speed=0),
+            healer=ReplayHealerAdapter(cassette, speed=0),
+            observer=observer,
+            state_store=JournalStateStoreAdapter(tmp_path / "journal.jsonl"),
+            error_store=FileErrorStoreAdapter(tmp_path / "errors"),
+        )
+        return (use_case,), {}
+
+    def run(use_case):
+        return asyncio.run(use_case.run())
+
+    assert benchmark.pedantic(run, setup=setup, rounds=rounds_for(molecule_log), warmup_rounds=1)
+
+    (use_case,), _ = setup()
+    success, peak = peak_memory(lambda: run(use_case))
+    assert success and use_case.state.current_iteration == FAILURES + 1
+    benchmark.extra_info["log_mb"] = round(molecule_log.size_mb, 2)
+    benchmark.extra_info["peak_mb"] = round(peak / MB, 2)
+    benchmark.extra_info["peak_per_log_mb"] = round(peak / molecule_log.size, 2)
@@ -0,0 +1,109 @@
+# SPDX-License-Identifier: MIT-0
+"""Throughput and peak memory of the agent's log handling.
+
+Every iteration the agent streams the whole Molecule output, then
+reduces it to an error window, a summary, a failure position and a
+healer prompt. Each step is benchmarked on logs of every ``--log-sizes``.
+"""
+
+import asyncio
+
+from conftest import AsyncCountingObserver, CountingObserver, ROOT, run_benchmark
+
+from src.domain.models import (
+    AgentConfig,
+    AgentState,
+    FailurePosition,
+    TestPhase,
+    TestResult,
+    TestStatus,
+    extract_changed_tasks,
+    extract_error_windows,
+)
+from src.infrastructure.adapters import (
+    AsyncMoleculeExecutorAdapter,
+    ClaudeHealerAdapter,
+    MoleculeExecutorAdapter,
+)
+
+
+def failed_result(text: str) -> TestResult:
+    """Wrap a log in a failed converge result."""
+    return TestResult(phase=TestPhase.CONVERGE, status=TestStatus.FAILED, return_code=2, output=text)
+
+
+# ----------------------------------------------------------------------
+# Streaming readers
+# ----------------------------------------------------------------------
+
+
+def test_stream_sync(benchmark, molecule_log):
+    """MoleculeExecutorAdapter._run_command reading the log from a subprocess."""
+    observer = CountingObserver()
+    executor = MoleculeExecutorAdapter("default", None, ROOT, observer=observer)
+
+    result = run_benchmark(
+        benchmark, molecule_log,
+        lambda: executor._run_command(["cat", str(molecule_log.path)], TestPhase.CONVERGE),
+    )
+    assert result.is_success() and observer.lines
+
+
+def test_stream_async(benchmark, molecule_log):
+    """AsyncMoleculeExecutorAdapter._run_command reading the log from a subprocess."""
+    observer = AsyncCountingObserver()
+    executor = AsyncMoleculeExecutorAdapter("default", None, ROOT, observer=observer)
+
+    result = run_benchmark(
+        benchmark, molecule_log,
+        lambda: asyncio.run(
+            executor._run_command(["cat", str(molecule_log.path)], TestPhase.CONVERGE)
+        ),
+    )
+    assert result.is_success() and observer.lines
+
+
+# ----------------------------------------------------------------------
+# Error extraction and summaries
+# ----------------------------------------------------------------------
+
+
+def test_error_windows(benchmark, molecule_log):
+    """extract_error_windows over the whole log."""
+    text = molecule_log.text()
+    assert run_benchmark(benchmark, molecule_log, lambda: extract_error_windows(text))
+
+
+def test_error_summary(benchmark, molecule_log):
+    """TestResult.get_error_summary + get_error_window, as _record_failure does."""
+    result = failed_result(molecule_log.text())
+    summary, window = run_benchmark(
+        benchmark, molecule_log,
+        lambda: (result.get_error_summary(), result.get_error_window()),
+    )
+    assert summary and window
+
+
+def test_failure_position(benchmark, molecule_log):
+    """FailurePosition.from_output (progress tracking)."""
+    text = molecule_log.text()
+    position = run_benchmark(
+        benchmark, molecule_log, lambda: FailurePosition.from_output(text, "converge")
+    )
+    assert position.task
+
+
+def test_changed_tasks(benchmark, molecule_log):
+    """extract_changed_tasks (idempotence reports)."""
+    text = molecule_log.text()
+    assert run_benchmark(benchmark, molecule_log, lambda: extract_changed_tasks(text))
+
+
+def test_healer_prompt(benchmark, molecule_log, tmp_path):
+    """ClaudeHealerAdapter._build_prompt from the full error window."""
+    window = failed_result(molecule_log.text()).get_error_window()
+    healer = ClaudeHealerAdapter(claude_path="claude", timeout=1, project_root=tmp_path)
+    state = AgentState(config=AgentConfig.create(project_root=tmp_path))
+
+    prompt = run_benchmark(benchmark, molecule_log, lambda: healer._build_prompt(window, 1, state))
+    assert "Error Output" in prompt
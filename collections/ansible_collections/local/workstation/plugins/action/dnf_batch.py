@@ -0,0 +1,152 @@
+# SPDX-License-Identifier: MIT-0
+"""Action plugin for local.workstation.dnf_batch.
+
+Batch mode (no ``name``): collects the package intents of the play's roles
+and installs them with the dnf_batch module in one transaction. A role
+declares its intents in its defaults as ``<role>_dnf_batch``:
+
+    developer_dnf_batch:
+      - packages: "{{ developer_flutter_packages }}"
+        when: "{{ developer_install_flutter }}"
+
+The package states are kept as the ``dnf_batch`` fact for this run.
+
+Role-task mode (``name`` given, same arguments as ansible.builtin.dnf):
+when every package was batched in this run, the task answers from the
+fact (``changed`` if the batch installed one of them) without touching
+dnf. Otherwise the task checks its packages against the rpm database in
+one query (rpmdb_check): ``state: present`` runs ansible.builtin.dnf only
+for the missing packages, ``state: absent`` only if one is installed.
+Re-runs and idempotence checks never start the dnf solver. Other states
+run ansible.builtin.dnf as before.
+"""
+
+from ansible.module_utils.common.text.converters import to_text
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible_collections.local.workstation.plugins.plugin_utils.run import run_id
+
+# dnf arguments a batched answer can stand in for
+BATCHABLE_ARGS = {"name", "pkg", "state"}
+PRESENT_STATES = {None, "present", "installed"}
+ABSENT_STATES = {"absent", "removed"}
+# dnf arguments the host's rpm database cannot answer for
+NOT_RPMDB_ARGS = {"installroot", "download_only", "list", "autoremove", "update_cache"}
+
+
+class ActionModule(ActionBase):
+    """Batch dnf installs across roles."""
+
+    TRANSFERS_FILES = False
+
+    def run(self, tmp=None, task_vars=None):
+        task_vars = task_vars or {}
+        result = super().run(tmp, task_vars)
+        del tmp
+
+        args = dict(self._task.args)
+        if "name" in args or "pkg" in args:
+            result.update(self._role_task(args, task_vars))
+        else:
+            result.update(self._batch(args, task_vars))
+        return result
+
+    # ------------------------------------------------------------------
+    # Batch mode
+    # ------------------------------------------------------------------
+
+    def _intents(self, args, task_vars):
+        """Collect the enabled intents of the given roles."""
+        roles = args.get("roles")
+        if roles is None:
+            roles = task_vars.get("role_names", [])
+        intents = []
+        for role in roles:
+            short = to_text(role).rsplit(".", 1)[-1]
+            declared = self._templar.template(task_vars.get(f"{short}_dnf_batch") or [])
+            for intent in declared:
+                if not boolean(intent.get("when", True), strict=False):
+                    continue
+                packages = intent.get("packages") or []
+                if isinstance(packages, str):
+                    packages = [packages]
+                intents.append({"role": short, "packages": [to_text(p) for p in packages]})
+        for intent in args.get("intents") or []:
+            intents.append({"role": intent.get("role", ""), "packages": intent["packages"]})
+        return intents
+
+    def _batch(self, args, task_vars):
+        """Install every intent in one transaction and remember the outcome."""
+        intents = self._intents(args, task_vars)
+        if not intents:
+            return {"changed": False, "skipped": True, "msg": "No package intents"}
+
+        result = self._execute_module(
+            module_name="local.workstation.dnf_batch",
+            module_args={"intents": intents},
+            task_vars=task_vars,
+        )
+        if not result.get("failed"):
+            result["ansible_facts"] = {
+                "dnf_batch": {"run": run_id(), "packages": result.get("packages", {})}
+            }
+        return result
+
+    # ------------------------------------------------------------------
+    # Role-task mode
+    # ------------------------------------------------------------------
+
+    def _role_task(self, args, task_vars):
+        """Answer a role's dnf task from the batch or the rpmdb, or run dnf."""
+        names = args.get("name", args.get("pkg"))
+        if isinstance(names, str):
+            names = [n.strip() for n in names.split(",")]
+        batch = (task_vars.get("ansible_facts") or {}).get("dnf_batch") or {}
+        packages = batch.get("packages") or {}
+
+        answered = (
+            set(args) <= BATCHABLE_ARGS
+            and args.get("state") in PRESENT_STATES
+            and batch.get("run") == run_id()
+            and names
+            and all(packages.get(name) in ("present", "installed") for name in names)
+        )
+        if answered:
+            installed = [name for name in names if packages[name] == "installed"]
+            return {
+                "changed": bool(installed),
+                "rc": 0,
+                "msg": "Installed by dnf_batch" if installed else "Nothing to do",
+                "results": [f"Installed: {name}" for name in installed],
+                "dnf_batch": True,
+            }
+
+        state = args.get("state")
+        if state in PRESENT_STATES | ABSENT_STATES and not set(args) & NOT_RPMDB_ARGS and names:
+            check = self._execute_module(
+                module_name="local.workstation.rpmdb_check",
+                module_args={"name": names},
+                task_vars=task_vars,
+            )
+            if check.get("failed"):
+                pass  # let dnf decide
+            elif state in ABSENT_STATES:
+                if not check["present"]:
+                    return {"changed": False, "rc": 0, "msg": "Nothing to do", "results": []}
+            elif not check["missing"]:
+                return {"changed": False, "rc": 0, "msg": "Nothing to do", "results": []}
+            else:
+                args = {k: v for k, v in args.items() if k != "pkg"}
+                args["name"] = check["missing"]
+
+        return self._dnf(args, task_vars)
+
+    def _dnf(self, args, task_vars):
+        """Run what the ansible.builtin.dnf action would pick."""
+        dnf5 = (task_vars.get("ansible_facts") or {}).get("pkg_mgr") == "dnf5"
+        return self._execute_module(
+            module_name="ansible.builtin.dnf5" if dnf5 and "use_backend" not in args
+            else "ansible.builtin.dnf",
+            module_args=args,
+            task_vars=task_vars,
+        )
@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: MIT-0
+"""Action plugin for local.workstation.health_probe.
+
+Runs the health_probe module and keeps its result as the ``health_probe``
+fact for this run, under the task's ``cache_key``. A later probe in the
+same run with the same key (e.g. the health check of the next ``always``
+block, with nothing installed or updated in between) answers from the
+fact without contacting the host. Change the key whenever something that
+affects the system's health has happened since the last probe.
+"""
+
+from ansible.module_utils.common.text.converters import to_text
+from ansible.plugins.action import ActionBase
+from ansible_collections.local.workstation.plugins.plugin_utils.run import run_id
+
+# Keys of the module result that make up the cached health
+HEALTH_KEYS = ("ok", "dnf", "services", "disk", "log_dir")
+
+
+class ActionModule(ActionBase):
+    """Probe system health once per run and cache key."""
+
+    TRANSFERS_FILES = False
+
+    def run(self, tmp=None, task_vars=None):
+        task_vars = task_vars or {}
+        result = super().run(tmp, task_vars)
+        del tmp
+
+        args = dict(self._task.args)
+        key = to_text(args.pop("cache_key", ""))
+        cached = (task_vars.get("ansible_facts") or {}).get("health_probe") or {}
+
+        if cached.get("run") == run_id() and cached.get("key") == key and cached.get("health"):
+            result.update(cached["health"])
+            result.update(changed=False, cached=True)
+            return result
+
+        probe = self._execute_module(
+            module_name="local.workstation.health_probe",
+            module_args=args,
+            task_vars=task_vars,
+        )
+        result.update(probe)
+        if not probe.get("failed"):
+            result["cached"] = False
+            result["ansible_facts"] = {
+                "health_probe": {
+                    "run": run_id(),
+                    "key": key,
+                    "health": {k: probe[k] for k in HEALTH_KEYS if k in probe},
+                }
+            }
+        return result
@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: MIT-0
+"""Action plugin for local.workstation.workstation_facts.
+
+The first call of a run gathers every subset in one module execution;
+the ``workstation`` fact then lives in the configured fact cache. Later
+calls in the same run answer from it without contacting the host, and
+only gather what is not there yet (a subset, a user's groups, an
+alternatives link). ``refresh`` (true, or a list of subsets) re-gathers
+after a task changed the underlying state, e.g. generated a locale or
+added a user to a group.
+"""
+
+from ansible.module_utils.common.text.converters import to_text
+from ansible.module_utils.parsing.convert_bool import boolean
+from ansible.plugins.action import ActionBase
+from ansible_collections.local.workstation.plugins.plugin_utils.run import run_id
+
+SUBSETS = ("root_fstype", "locales", "localectl", "alternatives", "groups")
+# Subsets keyed by an argument; only the missing keys are gathered
+KEYED_SUBSETS = {"groups": "users", "alternatives": "alternatives"}
+DEFAULT_ALTERNATIVES = ["java", "javac"]
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return [to_text(v) for v in value]
+
+
+class ActionModule(ActionBase):
+    """Gather workstation facts once per run."""
+
+    TRANSFERS_FILES = False
+
+    def run(self, tmp=None, task_vars=None):
+        task_vars = task_vars or {}
+        result = super().run(tmp, task_vars)
+        del tmp
+
+        args = dict(self._task.args)
+        requested = _as_list(args.get("gather_subset")) or ["all"]
+        requested = list(SUBSETS) if "all" in requested else requested
+        keys = {
+            "users": _as_list(args.get("users")),
+            "alternatives": _as_list(args.get("alternatives")) or DEFAULT_ALTERNATIVES,
+        }
+        refresh = args.get("refresh", False)
+        if isinstance(refresh, str) and refresh not in SUBSETS:
+            refresh = boolean(refresh, strict=False)
+        if refresh is True:
+            refresh = requested
+        refresh = _as_list(refresh) if refresh else []
+
+        facts = (task_vars.get("ansible_facts") or {}).get("workstation") or {}
+        if facts.get("run") != run_id():
+            # Nothing from this run yet: gather everything in one pass
+            facts = {}
+            gather = list(SUBSETS)
+        else:
+            gather = [
+                subset for subset in requested
+                if subset in refresh
+                or subset not in facts
+                or (subset in KEYED_SUBSETS
+                    and any(key not in facts[subset] for key in keys[KEYED_SUBSETS[subset]]))
+            ]
+
+        if not gather:
+            result.update(changed=False, cached=True, ansible_facts={"workstation": facts})
+            return result
+
+        gathered = self._execute_module(
+            module_name="local.workstation.workstation_facts",
+            module_args={"gather_subset": gather, **keys},
+            task_vars=task_vars,
+        )
+        if gathered.get("failed"):
+            result.update(gathered)
+            return result
+
+        merged = dict(facts)
+        for subset, value in gathered["ansible_facts"]["workstation"].items():
+            if subset in KEYED_SUBSETS:
+                value = {**facts.get(subset, {}), **value}
+            merged[subset] = value
+        merged["run"] = run_id()
+        result.update(changed=False, cached=False, gathered=gather,
+                      ansible_facts={"workstation": merged})
+        return result
@@ -0,0 +1,110 @@
+# SPDX-License-Identifier: MIT-0
+"""Callback that logs every task result reporting ``changed``.
+
+Used by the testing agent's idempotence checks: the tasks that changed on
+the second converge are written with their role, file and line, module
+and arguments, so a failure can be diagnosed without a verbose re-run.
+"""
+
+DOCUMENTATION = r"""
+name: changed_tasks
+type: aggregate
+short_description: Write changed task results as JSON lines
+description:
+  - Appends one JSON object per host and task that reported C(changed) to
+    O(log_file), with the task's role, file and line, module and module
+    arguments, and the changed loop items.
+  - Each playbook run starts with a marker line holding only C(run) and
+    C(playbook).
+  - Does nothing while O(log_file) is unset, so it can stay enabled.
+  - Arguments of C(no_log) tasks are not written.
+requirements:
+  - Enable it in C(callbacks_enabled).
+options:
+  log_file:
+    description: JSON lines file to append to.
+    type: path
+    env:
+      - name: ANSIBLE_CHANGED_TASKS_LOG
+    ini:
+      - section: callback_changed_tasks
+        key: log_file
+"""
+
+import json
+import os
+import time
+
+from ansible.playbook.handler import Handler
+from ansible.plugins.callback import CallbackBase
+
+# Longest item label kept per loop item
+MAX_ITEM_LENGTH = 120
+
+
+class CallbackModule(CallbackBase):
+    """Log changed task results for idempotence reports."""
+
+    CALLBACK_VERSION = 2.0
+    CALLBACK_TYPE = "aggregate"
+    CALLBACK_NAME = "local.workstation.changed_tasks"
+    CALLBACK_NEEDS_ENABLED = True
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.log_file = None
+        self.run = ""
+
+    def set_options(self, task_keys=None, var_options=None, direct=None):
+        super().set_options(task_keys=task_keys, var_options=var_options, direct=direct)
+        self.log_file = self.get_option("log_file")
+
+    def _write(self, entry):
+        with open(self.log_file, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, default=str) + "\n")
+
+    def v2_playbook_on_start(self, playbook):
+        if not self.log_file:
+            return
+        self.run = f"{os.getpid()}-{time.time_ns()}"
+        self._write({"run": self.run, "playbook": playbook._file_name})
+
+    @staticmethod
+    def _module_args(task, result):
+        """Get the arguments the module ran with (templated if reported)."""
+        if task.no_log or result.get("_ansible_no_log"):
+            return {}
+        results = [result] + [r for r in result.get("results") or [] if isinstance(r, dict)]
+        for candidate in results:
+            args = (candidate.get("invocation") or {}).get("module_args")
+            if args:
+                break
+        else:
+            args = task.args
+        return {k: v for k, v in args.items() if not k.startswith("_ansible")}
+
+    def _changed_items(self, result):
+        """Get the labels of the loop items that changed."""
+        items = []
+        for item_result in result.get("results") or []:
+            if isinstance(item_result, dict) and item_result.get("changed"):
+                label = str(self._get_item_label(item_result))
+                items.append(label[:MAX_ITEM_LENGTH])
+        return items
+
+    def v2_runner_on_ok(self, result):
+        if not self.log_file or not result._result.get("changed"):
+            return
+        task = result._task
+        role = task._role.get_name(include_role_fqcn=False) if task._role else ""
+        self._write({
+            "run": self.run,
+            "host": result._host.get_name(),
+            "task": task.get_name(include_role_fqcn=False),
+            "role": role,
+            "path": task.get_path() or "",
+            "action": task.resolved_action or task.action,
+            "args": self._module_args(task, result._result),
+            "items": self._changed_items(result._result),
+            "handler": isinstance(task, Handler),
+        })
@@ -0,0 +1,41 @@
+# SPDX-License-Identifier: MIT-0
+"""Filters for fetching artifacts through a local mirror.
+
+The mirror (served by the testing agent) is a pull-through,
+content-addressed cache. The original URL is part of the mirror path, so
+the mirror can fetch and store an artifact the first time it is asked for
+and serve it locally from then on:
+
+    {{ developer_flutter_download_url | local.workstation.mirrored(developer_artifact_mirror_url) }}
+    {{ developer_lazyvim_repo | local.workstation.mirrored(developer_artifact_mirror_url, kind='git') }}
+
+With an empty mirror URL the original URL is returned unchanged.
+"""
+
+from urllib.parse import quote
+
+
+def mirrored(url, mirror_url="", kind="url"):
+    """Rewrite ``url`` to its location on the artifact mirror.
+
+    Args:
+        url: Original download or git repository URL
+        mirror_url: Mirror base URL; empty disables the mirror
+        kind: "url" for files, "git" for repositories (dumb HTTP clones)
+
+    Returns:
+        The mirror URL, or ``url`` if no mirror is configured
+    """
+    if not mirror_url:
+        return url
+    if kind not in ("url", "git"):
+        raise ValueError(f"mirrored: unknown kind {kind!r}")
+    return f"{mirror_url.rstrip('/')}/{kind}/{quote(url, safe='')}"
+
+
+class FilterModule:
+    """Artifact mirror filters."""
+
+    def filters(self):
+        """Map filter names to functions."""
+        return {"mirrored": mirrored}
@@ -0,0 +1,55 @@
+# SPDX-License-Identifier: MIT-0
+"""Batched package queries against the local rpm database.
+
+One ``rpm -q --whatprovides`` for a whole package set answers "is anything
+missing?" in well under a second, without loading repository metadata or
+starting the dnf solver.
+"""
+
+import re
+
+_NOT_PROVIDED = re.compile(r"^no package provides (?P<name>.+)$")
+
+
+def queryable(name):
+    """Check if the rpm database can answer for a package spec.
+
+    Groups, local files, URLs and version constraints need dnf.
+    """
+    return bool(name) and not (
+        name.startswith("@")
+        or "/" in name
+        or name.endswith(".rpm")
+        or any(char in name for char in "<>=*? ")
+    )
+
+
+def missing_packages(module, names):
+    """Get the names no installed package provides.
+
+    Args:
+        module: AnsibleModule used to run rpm
+        names: Package names or capabilities
+
+    Returns:
+        Missing names in input order; names rpm cannot answer for count
+        as missing, and so does everything if rpm itself cannot run
+    """
+    names = list(dict.fromkeys(names))
+    query = [name for name in names if queryable(name)]
+    if not query:
+        return names
+
+    rpm = module.get_bin_path("rpm")
+    if rpm is None:
+        return names
+    rc, out, err = module.run_command([rpm, "-q", "--whatprovides", "--qf", "", *query])
+    not_provided = set()
+    for line in (out + "\n" + err).splitlines():
+        match = _NOT_PROVIDED.match(line.strip())
+        if match:
+            not_provided.add(match.group("name"))
+    if rc != 0 and not not_provided:
+        return names  # rpm failed for another reason; let dnf decide
+
+    return [name for name in names if name in not_provided or not queryable(name)]
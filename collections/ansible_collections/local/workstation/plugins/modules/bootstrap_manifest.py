@@ -0,0 +1,237 @@
+#!/usr/bin/python
+# SPDX-License-Identifier: MIT-0
+"""Record and check the state of expensive bootstrap steps."""
+
+DOCUMENTATION = r"""
+module: bootstrap_manifest
+short_description: Skip expensive bootstrap steps whose desired spec is already installed
+description:
+  - Keeps one small JSON manifest per bootstrap step (SDK installers,
+    C(flutter precache), C(sdkmanager) components, ...) under O(state_dir).
+    A manifest holds a checksum of the step's desired O(spec) and a
+    fingerprint of the files the step produced.
+  - With O(state=check), reports whether the step is C(current): the
+    recorded spec checksum matches and every path still has its recorded
+    fingerprint. The check reads one file and stats the paths, so it is
+    cheap enough to guard every converge.
+  - With O(state=present), records the manifest after the step ran; with
+    O(state=absent), forgets it so the step runs again.
+options:
+  name:
+    description: Name of the bootstrap step (the manifest file name).
+    type: str
+    required: true
+  spec:
+    description:
+      - Desired state of the step (versions, URLs, component lists).
+      - Any change to it makes the step not current.
+    type: dict
+    default: {}
+  info:
+    description:
+      - Facts about the result of the step (e.g. the installed version),
+        recorded with O(state=present) but not compared.
+    type: dict
+    default: {}
+  paths:
+    description: Files or directories the step produces; removing or replacing one makes the step not current.
+    type: list
+    elements: path
+    default: []
+  fingerprint:
+    description:
+      - How files in O(paths) are fingerprinted. C(stat) uses size and
+        modification time; C(sha256) hashes the content (slower, for
+        small files).
+    type: str
+    choices: [stat, sha256]
+    default: stat
+  state:
+    description: C(check) the manifest, record it (C(present)) or remove it (C(absent)).
+    type: str
+    choices: [check, present, absent]
+    default: check
+  state_dir:
+    description: Directory holding the manifests.
+    type: path
+    default: /var/lib/local-workstation/bootstrap
+author:
+  - local.workstation maintainers
+"""
+
+EXAMPLES = r"""
+- name: Check the D2 bootstrap manifest
+  local.workstation.bootstrap_manifest:
+    name: d2
+    spec:
+      url: https://d2lang.com/install.sh
+    paths: [/usr/local/bin/d2]
+  register: common_d2_manifest
+
+- name: Install D2 compiler
+  ansible.builtin.command:
+    cmd: /tmp/d2-install.sh
+  when: not common_d2_manifest.current
+
+- name: Record the D2 bootstrap manifest
+  local.workstation.bootstrap_manifest:
+    name: d2
+    spec:
+      url: https://d2lang.com/install.sh
+    paths: [/usr/local/bin/d2]
+    state: present
+  when: not common_d2_manifest.current
+"""
+
+RETURN = r"""
+current:
+  description: Whether the recorded manifest matches O(spec) and O(paths) (always false for O(state=absent)).
+  returned: always
+  type: bool
+reason:
+  description: Why the step is not current (empty if it is).
+  returned: always
+  type: str
+manifest:
+  description: The recorded manifest (C(spec), C(spec_checksum), C(paths), C(info)), or null if there is none.
+  returned: always
+  type: dict
+path:
+  description: The manifest file.
+  returned: always
+  type: str
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+
+from ansible.module_utils.basic import AnsibleModule
+
+MANIFEST_VERSION = 1
+
+
+def spec_checksum(spec):
+    """Get a stable checksum of a spec."""
+    canonical = json.dumps(spec, sort_keys=True, separators=(",", ":"), default=str)
+    return "sha256:" + hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def fingerprint_path(path, method):
+    """Fingerprint a file or directory; None if it does not exist."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    if os.path.isdir(path):
+        return dict(type="directory")
+    if method == "sha256":
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                digest.update(chunk)
+        return dict(type="file", sha256=digest.hexdigest())
+    return dict(type="file", size=st.st_size, mtime_ns=st.st_mtime_ns)
+
+
+def build_manifest(params):
+    """Get the manifest for the current state of the step."""
+    return dict(
+        version=MANIFEST_VERSION,
+        name=params["name"],
+        spec=params["spec"],
+        spec_checksum=spec_checksum(params["spec"]),
+        paths={path: fingerprint_path(path, params["fingerprint"]) for path in params["paths"]},
+        info=params["info"],
+    )
+
+
+def read_manifest(path):
+    """Read a manifest; None if missing or unreadable."""
+    try:
+        with open(path, encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return manifest if isinstance(manifest, dict) else None
+
+
+def compare(recorded, params):
+    """Get the reason a recorded manifest does not match (empty if it does)."""
+    if recorded is None:
+        return "no manifest recorded"
+    if recorded.get("version") != MANIFEST_VERSION:
+        return "manifest format changed"
+    if recorded.get("spec_checksum") != spec_checksum(params["spec"]):
+        return "spec changed"
+    recorded_paths = recorded.get("paths") or {}
+    for path in params["paths"]:
+        if path not in recorded_paths:
+            return f"{path} not recorded"
+        actual = fingerprint_path(path, params["fingerprint"])
+        if actual is None:
+            return f"{path} is missing"
+        if actual != recorded_paths[path]:
+            return f"{path} changed"
+    return ""
+
+
+def write_manifest(module, path, manifest):
+    """Write a manifest atomically."""
+    directory = os.path.dirname(path)
+    os.makedirs(directory, mode=0o755, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=directory, prefix=".manifest-")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    os.chmod(tmp, 0o644)
+    module.atomic_move(tmp, path)
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            name=dict(type="str", required=True),
+            spec=dict(type="dict", default={}),
+            info=dict(type="dict", default={}),
+            paths=dict(type="list", elements="path", default=[]),
+            fingerprint=dict(type="str", choices=["stat", "sha256"], default="stat"),
+            state=dict(type="str", choices=["check", "present", "absent"], default="check"),
+            state_dir=dict(type="path", default="/var/lib/local-workstation/bootstrap"),
+        ),
+        supports_check_mode=True,
+    )
+    params = module.params
+    if not re.match(r"^[A-Za-z0-9_.-]+$", params["name"]):
+        module.fail_json(msg=f"bootstrap_manifest: invalid name {params['name']!r}")
+    path = os.path.join(params["state_dir"], params["name"] + ".json")
+    recorded = read_manifest(path)
+    state = params["state"]
+
+    if state == "check":
+        reason = compare(recorded, params)
+        module.exit_json(changed=False, current=not reason, reason=reason, manifest=recorded, path=path)
+
+    if state == "absent":
+        changed = os.path.exists(path)
+        if changed and not module.check_mode:
+            os.remove(path)
+        module.exit_json(changed=changed, current=False, reason="manifest removed", manifest=None, path=path)
+
+    manifest = build_manifest(params)
+    missing = [p for p, fingerprint in manifest["paths"].items() if fingerprint is None]
+    if missing:
+        module.fail_json(msg=f"bootstrap_manifest: {params['name']} produced no {', '.join(missing)}")
+    changed = recorded != manifest
+    if changed and not module.check_mode:
+        try:
+            write_manifest(module, path, manifest)
+        except OSError as e:
+            module.fail_json(msg=f"bootstrap_manifest: could not write {path}: {e}")
+    module.exit_json(changed=changed, current=True, reason="", manifest=manifest, path=path)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,147 @@
+#!/usr/bin/python
+# SPDX-License-Identifier: MIT-0
+"""Install the package intents of several roles in one dnf transaction."""
+
+DOCUMENTATION = r"""
+module: dnf_batch
+short_description: Install the packages of several roles in one dnf transaction
+description:
+  - Takes the package intents of several roles and installs every missing
+    package with a single C(dnf install), so repository metadata is loaded
+    and dependencies are solved once instead of once per role task.
+  - Unavailable packages do not fail the transaction; they are reported as
+    C(missing) and the role task that needs them installs (and fails) as it
+    would without the batch.
+  - Group, file, URL and version-constrained names are not batched.
+  - Usually run through the action plugin of the same name, which collects
+    the intents from the roles of the play. See the action plugin for the
+    role-task mode.
+options:
+  intents:
+    description: Package intents.
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+      role:
+        description: Role the packages belong to (for per-role results).
+        type: str
+        default: ""
+      packages:
+        description: Package names.
+        type: list
+        elements: str
+        required: true
+author:
+  - local.workstation maintainers
+"""
+
+EXAMPLES = r"""
+- name: Install the packages of every role in one dnf transaction
+  local.workstation.dnf_batch:
+    intents:
+      - role: common
+        packages: [curl, git, htop]
+      - role: embed
+        packages: [minicom, esptool]
+  become: true
+"""
+
+RETURN = r"""
+packages:
+  description: State of every batched package (C(present), C(installed) or C(missing)).
+  returned: always
+  type: dict
+installed:
+  description: Packages this transaction installed.
+  returned: always
+  type: list
+missing:
+  description: Packages that are still not installed (unavailable, or check mode).
+  returned: always
+  type: list
+results:
+  description: Per-intent results with C(role), C(packages), C(installed), C(missing) and C(changed).
+  returned: always
+  type: list
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.local.workstation.plugins.module_utils.rpmdb import (
+    missing_packages,
+    queryable,
+)
+
+
+def skip_unavailable_args(module, dnf):
+    """Get the option that lets a transaction skip unavailable packages."""
+    _, out, _ = module.run_command([dnf, "--version"])
+    return ["--skip-unavailable"] if "dnf5" in out else ["--setopt=strict=0"]
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            intents=dict(
+                type="list",
+                elements="dict",
+                required=True,
+                options=dict(
+                    role=dict(type="str", default=""),
+                    packages=dict(type="list", elements="str", required=True),
+                ),
+            ),
+        ),
+        supports_check_mode=True,
+    )
+    intents = module.params["intents"]
+
+    wanted = []
+    for intent in intents:
+        for name in intent["packages"]:
+            if queryable(name) and name not in wanted:
+                wanted.append(name)
+
+    # One rpmdb query; on re-runs nothing is missing and dnf never starts
+    missing = missing_packages(module, wanted)
+    before = [name for name in wanted if name not in missing]
+    installed = []
+    result = dict(changed=bool(missing), rc=0, stdout="", stderr="")
+
+    if missing and not module.check_mode:
+        dnf = module.get_bin_path("dnf", required=True)
+        rc, out, err = module.run_command(
+            [dnf, "-y", "install", *skip_unavailable_args(module, dnf), *missing]
+        )
+        result.update(rc=rc, stdout=out, stderr=err)
+        still_missing = missing_packages(module, missing)
+        installed = [name for name in missing if name not in still_missing]
+        missing = still_missing
+        result["changed"] = bool(installed)
+        if missing:
+            module.warn(
+                f"dnf_batch: not installed: {', '.join(missing)}; "
+                "the role tasks that need them will install them"
+            )
+
+    packages = {name: "present" for name in before}
+    packages.update({name: "installed" for name in installed})
+    packages.update({name: "missing" for name in missing})
+
+    result["results"] = []
+    for intent in intents:
+        names = [name for name in intent["packages"] if name in packages]
+        result["results"].append(dict(
+            role=intent["role"],
+            packages=names,
+            installed=[name for name in names if packages[name] == "installed"],
+            missing=[name for name in names if packages[name] == "missing"],
+            changed=any(packages[name] == "installed" for name in names),
+        ))
+
+    result.update(packages=packages, installed=installed, missing=missing)
+    module.exit_json(**result)
+
+
+if __name__ == "__main__":
+    main()
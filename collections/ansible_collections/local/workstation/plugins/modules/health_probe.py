@@ -0,0 +1,202 @@
+#!/usr/bin/python
+# SPDX-License-Identifier: MIT-0
+"""Probe DNF, service, disk and log health in one module run."""
+
+DOCUMENTATION = r"""
+module: health_probe
+short_description: Gather DNF, service, disk and log-directory health at once
+description:
+  - Runs C(dnf check), one C(systemctl is-active) for all services, a
+    C(statvfs) per path and a writability check of the log directory, and
+    optionally writes a health marker file, in a single module execution.
+  - Usually run through the action plugin of the same name, which caches
+    the result for the rest of the playbook run under O(cache_key).
+options:
+  services:
+    description: Services that should be active. Reported as C(unavailable) without systemd.
+    type: list
+    elements: str
+    default: []
+  paths:
+    description: Mount points whose usage is reported.
+    type: list
+    elements: path
+    default: [/]
+  disk_warn_percent:
+    description: Usage (percent) above which a path counts as unhealthy.
+    type: int
+    default: 80
+  log_dir:
+    description: Directory that must be writable.
+    type: path
+    default: /var/log
+  dnf_check:
+    description: Run C(dnf check) (the slowest probe).
+    type: bool
+    default: true
+  marker:
+    description: File the summary is written to (not written if unset).
+    type: path
+  cache_key:
+    description: Invalidation key for the action plugin's cache (ignored by the module).
+    type: str
+    default: ""
+author:
+  - local.workstation maintainers
+"""
+
+EXAMPLES = r"""
+- name: Probe system health
+  local.workstation.health_probe:
+    services: [sshd, dbus]
+    marker: /var/log/ansible_health_check.marker
+    cache_key: "{{ common_health_cache_key }}"
+  become: true
+  register: health_probe_result
+"""
+
+RETURN = r"""
+ok:
+  description: Whether every probe passed.
+  returned: always
+  type: bool
+dnf:
+  description: C(ok), C(rc) and C(problems) (output lines) of C(dnf check); C(ok) is null if skipped.
+  returned: always
+  type: dict
+services:
+  description: State per service (C(active), C(inactive), C(failed), ... or C(unavailable)).
+  returned: always
+  type: dict
+disk:
+  description: Per path C(used_percent), C(free_bytes) and C(ok).
+  returned: always
+  type: dict
+log_dir:
+  description: C(path), C(exists) and C(writable) of the log directory.
+  returned: always
+  type: dict
+"""
+
+import math
+import os
+import socket
+from datetime import datetime, timezone
+
+from ansible.module_utils.basic import AnsibleModule
+
+
+def probe_dnf(module):
+    """Run ``dnf check``."""
+    dnf = module.get_bin_path("dnf")
+    if dnf is None:
+        return dict(ok=False, rc=-1, problems=["dnf not found"])
+    rc, out, err = module.run_command([dnf, "check"])
+    problems = [line for line in (out + err).splitlines() if line.strip()]
+    return dict(ok=rc == 0, rc=rc, problems=problems if rc != 0 else [])
+
+
+def probe_services(module, services):
+    """Get the state of every service with one ``systemctl is-active``."""
+    if not services:
+        return {}
+    systemctl = module.get_bin_path("systemctl")
+    if systemctl is None or not os.path.isdir("/run/systemd/system"):
+        return {name: "unavailable" for name in services}
+    _, out, _ = module.run_command([systemctl, "is-active", *services])
+    states = out.split()
+    if len(states) != len(services):
+        return {name: "unknown" for name in services}
+    return dict(zip(services, states))
+
+
+def probe_disk(path, warn_percent):
+    """Get the usage of a mount point the way ``df`` reports it."""
+    try:
+        st = os.statvfs(path)
+    except OSError as e:
+        return dict(ok=False, used_percent=None, free_bytes=None, error=str(e))
+    used = st.f_blocks - st.f_bfree
+    total = used + st.f_bavail
+    percent = math.ceil(used * 100 / total) if total else 0
+    return dict(ok=percent <= warn_percent, used_percent=percent, free_bytes=st.f_bavail * st.f_frsize)
+
+
+def probe_log_dir(path):
+    """Check that the log directory exists and is writable."""
+    exists = os.path.isdir(path)
+    return dict(path=path, exists=exists, writable=exists and os.access(path, os.W_OK))
+
+
+def _without_time(content):
+    return [line for line in content.splitlines() if not line.startswith("Time: ")]
+
+
+def write_marker(module, path, health):
+    """Write the summary marker; returns True if the status in it changed.
+
+    The time line alone does not count as a change, so the marker stays put
+    on idempotent runs.
+    """
+    disk = health["disk"].get("/") or next(iter(health["disk"].values()), {})
+    content = "\n".join([
+        "Health Check Complete",
+        "=====================",
+        f"Host: {socket.gethostname()}",
+        f"Time: {datetime.now(timezone.utc).isoformat(timespec='seconds')}",
+        f"DNF Status: {'OK' if health['dnf']['ok'] is not False else 'ISSUES DETECTED'}",
+        f"Disk Usage: {disk.get('used_percent', 'unknown')}%",
+        "",
+    ])
+    try:
+        with open(path, encoding="utf-8") as f:
+            if _without_time(f.read()) == _without_time(content):
+                return False
+    except OSError:
+        pass
+    if module.check_mode:
+        return True
+    try:
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.chmod(path, 0o644)
+    except OSError as e:
+        module.warn(f"health_probe: could not write {path}: {e}")
+        return False
+    return True
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            services=dict(type="list", elements="str", default=[]),
+            paths=dict(type="list", elements="path", default=["/"]),
+            disk_warn_percent=dict(type="int", default=80),
+            log_dir=dict(type="path", default="/var/log"),
+            dnf_check=dict(type="bool", default=True),
+            marker=dict(type="path"),
+            cache_key=dict(type="str", default="", no_log=False),
+        ),
+        supports_check_mode=True,
+    )
+    params = module.params
+
+    health = dict(
+        dnf=probe_dnf(module) if params["dnf_check"] else dict(ok=None, rc=None, problems=[]),
+        services=probe_services(module, params["services"]),
+        disk={path: probe_disk(path, params["disk_warn_percent"]) for path in params["paths"]},
+        log_dir=probe_log_dir(params["log_dir"]),
+    )
+    health["ok"] = (
+        health["dnf"]["ok"] is not False
+        and all(state in ("active", "unavailable") for state in health["services"].values())
+        and all(disk["ok"] for disk in health["disk"].values())
+        and health["log_dir"]["writable"]
+    )
+
+    changed = write_marker(module, params["marker"], health) if params["marker"] else False
+    module.exit_json(changed=changed, **health)
+
+
+if __name__ == "__main__":
+    main()
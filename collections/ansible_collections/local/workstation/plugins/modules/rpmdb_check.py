@@ -0,0 +1,62 @@
+#!/usr/bin/python
+# SPDX-License-Identifier: MIT-0
+"""Check a package set against the local rpm database in one query."""
+
+DOCUMENTATION = r"""
+module: rpmdb_check
+short_description: Find which packages of a set are not installed
+description:
+  - Queries the local rpm database once for the whole package set, without
+    loading repository metadata or starting the dnf solver.
+  - Group, file, URL and version-constrained names cannot be answered by
+    the rpm database and are always reported as missing.
+  - Never changes anything. Used by the dnf_batch action plugin to skip
+    dnf for install tasks whose packages are all present.
+options:
+  name:
+    description: Package names or capabilities.
+    type: list
+    elements: str
+    required: true
+author:
+  - local.workstation maintainers
+"""
+
+EXAMPLES = r"""
+- name: Check the compiler packages
+  local.workstation.rpmdb_check:
+    name: "{{ developer_compilers_packages }}"
+  register: developer_compilers_rpmdb
+"""
+
+RETURN = r"""
+missing:
+  description: Names no installed package provides (input order).
+  returned: always
+  type: list
+present:
+  description: Names an installed package provides.
+  returned: always
+  type: list
+"""
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.local.workstation.plugins.module_utils.rpmdb import missing_packages
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(name=dict(type="list", elements="str", required=True)),
+        supports_check_mode=True,
+    )
+    names = module.params["name"]
+    missing = missing_packages(module, names)
+    module.exit_json(
+        changed=False,
+        missing=missing,
+        present=[name for name in dict.fromkeys(names) if name not in missing],
+    )
+
+
+if __name__ == "__main__":
+    main()
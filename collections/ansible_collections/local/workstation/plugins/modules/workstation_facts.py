@@ -0,0 +1,171 @@
+#!/usr/bin/python
+# SPDX-License-Identifier: MIT-0
+"""Gather the workstation facts the collection's roles use, in one pass."""
+
+DOCUMENTATION = r"""
+module: workstation_facts
+short_description: Gather the workstation facts the collection's roles need
+description:
+  - Collects the facts the roles used to query with separate C(command)
+    tasks (root filesystem type, available locales, C(localectl status),
+    the targets of alternatives links, group memberships) into the
+    C(workstation) fact.
+  - Only C(locales) and C(localectl) start a process; everything else is
+    read from C(/proc) and the passwd/group databases.
+  - Usually run through the action plugin of the same name, which answers
+    from the facts gathered earlier in the same run.
+options:
+  gather_subset:
+    description: Subsets to gather.
+    type: list
+    elements: str
+    choices: [all, root_fstype, locales, localectl, alternatives, groups]
+    default: [all]
+  users:
+    description: Users whose groups are gathered (subset C(groups)).
+    type: list
+    elements: str
+    default: []
+  alternatives:
+    description: Links under C(/usr/bin) whose targets are gathered (subset C(alternatives)).
+    type: list
+    elements: str
+    default: [java, javac]
+  refresh:
+    description:
+      - Re-gather the requested subsets (V(true)) or the listed subsets even
+        if they were gathered earlier in this run. Handled by the action
+        plugin.
+    type: raw
+    default: false
+author:
+  - local.workstation maintainers
+"""
+
+EXAMPLES = r"""
+- name: Gather workstation facts
+  local.workstation.workstation_facts:
+    users: ["{{ ansible_env.SUDO_USER | default(ansible_facts['user_id']) }}"]
+
+- name: Skip snapper setup unless / is btrfs
+  ansible.builtin.debug:
+    msg: "Root filesystem is {{ ansible_facts.workstation.root_fstype }}"
+"""
+
+RETURN = r"""
+ansible_facts:
+  description: Facts to add to ansible_facts.
+  returned: always
+  type: dict
+  contains:
+    workstation:
+      description: The gathered subsets.
+      type: dict
+      contains:
+        root_fstype:
+          description: Filesystem type of C(/) (like C(findmnt -n -o FSTYPE /)).
+          type: str
+        locales:
+          description: Output lines of C(locale -a).
+          type: list
+        localectl:
+          description: Output lines of C(localectl status) (empty without systemd).
+          type: list
+        alternatives:
+          description: Resolved target per link name (empty string if missing).
+          type: dict
+        groups:
+          description: Group names per user (empty list for unknown users).
+          type: dict
+"""
+
+import grp
+import os
+import pwd
+
+from ansible.module_utils.basic import AnsibleModule
+
+SUBSETS = ("root_fstype", "locales", "localectl", "alternatives", "groups")
+
+
+def root_fstype():
+    """Get the filesystem type mounted on ``/`` (the last mount wins)."""
+    fstype = ""
+    try:
+        with open("/proc/self/mounts", encoding="utf-8") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) > 2 and fields[1] == "/":
+                    fstype = fields[2]
+    except OSError:
+        pass
+    return fstype
+
+
+def command_lines(module, *args):
+    """Get the output lines of a command, or [] if it is missing or fails."""
+    path = module.get_bin_path(args[0])
+    if path is None:
+        return []
+    rc, out, _ = module.run_command([path, *args[1:]])
+    return out.splitlines() if rc == 0 else []
+
+
+def alternatives(names):
+    """Resolve ``/usr/bin/<name>`` like ``readlink -f``."""
+    links = {}
+    for name in names:
+        link = os.path.join("/usr/bin", name)
+        links[name] = os.path.realpath(link) if os.path.lexists(link) else ""
+    return links
+
+
+def user_groups(users):
+    """Get the groups of each user like ``groups <user>``."""
+    groups = {}
+    for user in users:
+        try:
+            entry = pwd.getpwnam(user)
+        except KeyError:
+            groups[user] = []
+            continue
+        names = [grp.getgrgid(gid).gr_name for gid in os.getgrouplist(user, entry.pw_gid)]
+        groups[user] = list(dict.fromkeys(names))
+    return groups
+
+
+def main():
+    module = AnsibleModule(
+        argument_spec=dict(
+            gather_subset=dict(
+                type="list", elements="str", default=["all"], choices=["all", *SUBSETS]
+            ),
+            users=dict(type="list", elements="str", default=[]),
+            alternatives=dict(type="list", elements="str", default=["java", "javac"]),
+            refresh=dict(type="raw", default=False),
+        ),
+        supports_check_mode=True,
+    )
+    params = module.params
+    subsets = SUBSETS if "all" in params["gather_subset"] else params["gather_subset"]
+
+    facts = {}
+    if "root_fstype" in subsets:
+        facts["root_fstype"] = root_fstype()
+    if "locales" in subsets:
+        facts["locales"] = command_lines(module, "locale", "-a")
+    if "localectl" in subsets:
+        facts["localectl"] = (
+            command_lines(module, "localectl", "status")
+            if os.path.isdir("/run/systemd/system") else []
+        )
+    if "alternatives" in subsets:
+        facts["alternatives"] = alternatives(params["alternatives"])
+    if "groups" in subsets:
+        facts["groups"] = user_groups(params["users"])
+
+    module.exit_json(changed=False, ansible_facts={"workstation": facts})
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+# SPDX-License-Identifier: MIT-0
+"""Controller-side helpers shared by the collection's action plugins."""
+
+import os
+
+
+def run_id():
+    """Identify the running ansible-playbook.
+
+    Facts set by action plugins end up in the fact cache and outlive the
+    run; results kept as facts are tagged with this to ignore stale ones.
+    Task workers are forked from the ansible-playbook process, so its pid
+    and start time identify the run.
+    """
+    pid = os.getppid()
+    try:
+        with open(f"/proc/{pid}/stat", encoding="utf-8") as f:
+            started = f.read().rsplit(")", 1)[1].split()[19]
+    except (OSError, IndexError):
+        started = ""
+    return f"{pid}-{started}"
@@ -0,0 +1,21 @@
+# SPDX-License-Identifier: MIT-0
+"""Import paths for the unit tests.
+
+The agent's tests import ``src`` from the project root; the collection's
+plugin tests import ``ansible_collections.local.workstation`` from the
+``collections`` directory.
+
+Usage:
+    pytest
+    pytest collections/ansible_collections/local/workstation/tests/unit/agent
+"""
+
+import sys
+from pathlib import Path
+
+COLLECTIONS = Path(__file__).resolve().parents[4]
+ROOT = COLLECTIONS.parent
+
+for path in (ROOT, COLLECTIONS):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
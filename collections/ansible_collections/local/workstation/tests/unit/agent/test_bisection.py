@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: MIT-0
+"""Role bisection: choosing probes and reporting the minimal role set."""
+
+import pytest
+
+from src.domain.models import BisectionProbe, BisectionResult, bisection_points
+
+
+@pytest.mark.parametrize("low, high, parallel, points", [
+    (-1, 8, 1, [3]),
+    (-1, 8, 3, [1, 3, 5]),
+    (2, 7, 1, [4]),
+    (2, 7, 10, [3, 4, 5, 6]),
+    (3, 5, 0, [4]),
+    (3, 4, 2, []),
+    (4, 4, 2, []),
+])
+def test_bisection_points(low, high, parallel, points):
+    assert bisection_points(low, high, parallel) == points
+
+
+def test_points_shrink_the_range_to_one():
+    low, high, culprit = -1, 20, 13  # prefixes >= 14 reproduce
+    rounds = 0
+    while points := bisection_points(low, high, 2):
+        for point in points:
+            if point > culprit:
+                high = min(high, point)
+            else:
+                low = max(low, point)
+        rounds += 1
+
+    assert (low, high) == (13, 14)
+    assert rounds <= 3
+
+
+ROLES = ("common", "shell", "python")
+
+
+def test_failure_depending_on_an_earlier_role():
+    result = BisectionResult(
+        failing_role="android", phase="converge", task="Accept licenses", roles=ROLES, prefix=2,
+        probes=(
+            BisectionProbe(("android",), reproduced=False, duration=40.2),
+            BisectionProbe(("common", "shell", "android"), reproduced=True, duration=80),
+            BisectionProbe(("common", "android"), reproduced=False, duration=61, failure="verify"),
+        ),
+    )
+
+    assert result.minimal_roles == ["common", "shell", "android"]
+    assert result.culprit == "shell"
+    assert result.describe().splitlines() == [
+        "The converge failure at 'android : Accept licenses' reproduces with roles "
+        "common, shell, android but not without 'shell': look at what 'shell' leaves "
+        "behind (packages, files, services, variables) before changing the failing task.",
+        "  - android: passed in 40s",
+        "  - common, shell, android: reproduced in 80s",
+        "  - common, android: did not reproduce (verify) in 61s",
+    ]
+
+
+def test_failure_of_the_role_alone():
+    result = BisectionResult(failing_role="android", phase="verify", task="", roles=ROLES)
+
+    assert (result.minimal_roles, result.culprit) == (["android"], "")
+    assert result.describe() == (
+        "The verify failure at 'android' reproduces with 'android' alone: the cause is "
+        "in that role, not in the side effects of earlier roles."
+    )
+
+
+def test_roundtrip():
+    result = BisectionResult(
+        failing_role="android", phase="converge", task="Accept licenses", roles=ROLES, prefix=1,
+        probes=(BisectionProbe(("common", "android"), reproduced=True, duration=1.23456),),
+        duration=99.5,
+    )
+
+    data = result.to_dict()
+
+    assert (data["culprit"], data["minimal_roles"]) == ("common", ["common", "android"])
+    assert data["probes"][0]["duration"] == 1.235
+    assert BisectionResult.from_dict(data) == BisectionResult.from_dict(BisectionResult.from_dict(data).to_dict())
+    assert BisectionResult.from_dict(data).probes[0].roles == ("common", "android")
@@ -0,0 +1,167 @@
+# SPDX-License-Identifier: MIT-0
+"""FailurePosition: reducing Molecule output to the failure that stopped it."""
+
+from src.domain.models import FailurePosition
+
+CONVERGE = "INFO     [default > converge] Executing"
+PLAY = "PLAY [Converge] ****************************************************"
+
+
+def log(*lines: str) -> str:
+    """Join output lines the way Molecule prints them."""
+    return "\n".join(lines) + "\n"
+
+
+def test_ignored_failure_is_skipped():
+    output = log(
+        CONVERGE,
+        PLAY,
+        "TASK [Gathering Facts] *********",
+        "ok: [instance]",
+        "TASK [common : Wait for DNF lock] *********",
+        'fatal: [instance]: FAILED! => {"changed": false, "msg": "lock held"}',
+        "...ignoring",
+        "TASK [common : Install packages] *********",
+        'fatal: [instance]: FAILED! => {"changed": false, "msg": "No package foo"}',
+        "PLAY RECAP *********",
+        "instance : ok=2 changed=0 unreachable=0 failed=1 skipped=0 rescued=0 ignored=1",
+    )
+
+    position = FailurePosition.from_output(output, "full_test")
+
+    assert position == FailurePosition(
+        phase="converge",
+        play="Converge",
+        play_index=1,
+        role="common",
+        task="Install packages",
+        task_index=3,
+        host="instance",
+    )
+
+
+def test_rescued_failure_is_skipped():
+    output = log(
+        CONVERGE,
+        PLAY,
+        "TASK [common : Download d2] *********",
+        'fatal: [instance]: FAILED! => {"msg": "timeout"}',
+        "TASK [common : Report d2 download failure] *********",
+        "ok: [instance]",
+        "TASK [common : Configure fish] *********",
+        'fatal: [instance]: FAILED! => {"msg": "missing template"}',
+    )
+
+    position = FailurePosition.from_output(output, "full_test")
+
+    assert (position.task, position.task_index) == ("Configure fish", 3)
+
+
+def test_rescued_failure_then_idempotence_report():
+    output = log(
+        CONVERGE,
+        PLAY,
+        "TASK [common : Download d2] *********",
+        'fatal: [instance]: FAILED! => {"msg": "timeout"}',
+        "TASK [common : Report d2 download failure] *********",
+        "ok: [instance]",
+        "TASK [common : Write config] *********",
+        "changed: [instance]",
+        "INFO     [default > idempotence] Executing",
+        PLAY,
+        "TASK [common : Write config] *********",
+        "changed: [instance]",
+        "ERROR    Idempotence test failed because of the following tasks:",
+        "* [instance] => common : Write config",
+    )
+
+    position = FailurePosition.from_output(output, "full_test")
+
+    assert (position.phase, position.task, position.task_index) == ("idempotence", "Write config", 1)
+
+
+def test_failed_loop_item_keeps_its_task():
+    output = log(
+        CONVERGE,
+        PLAY,
+        "TASK [common : Install tools] *********",
+        "failed: [instance] (item=foo) => {\"msg\": \"No package foo\"}",
+        "ok: [instance] (item=bar)",
+    )
+
+    position = FailurePosition.from_output(output, "full_test")
+
+    assert (position.task, position.task_index) == ("Install tools", 1)
+
+
+def test_teardown_failures_do_not_replace_the_run_failure():
+    output = log(
+        CONVERGE,
+        PLAY,
+        "TASK [common : Install packages] *********",
+        'fatal: [instance]: FAILED! => {"msg": "No package foo"}',
+        "INFO     [default > destroy] Executing",
+        "PLAY [Destroy] *********",
+        "TASK [Remove containers] *********",
+        'fatal: [localhost]: FAILED! => {"msg": "no such container"}',
+    )
+
+    position = FailurePosition.from_output(output, "full_test")
+
+    assert (position.phase, position.task, position.host) == ("converge", "Install packages", "instance")
+
+
+def test_last_unhandled_failure_across_hosts():
+    output = log(
+        CONVERGE,
+        PLAY,
+        "TASK [common : Install packages] *********",
+        'fatal: [fedora42]: FAILED! => {"msg": "No package foo"}',
+        "ok: [fedora43]",
+        "TASK [common : Configure fish] *********",
+        'fatal: [fedora43]: FAILED! => {"msg": "missing template"}',
+    )
+
+    position = FailurePosition.from_output(output, "full_test")
+
+    assert (position.task, position.host) == ("Configure fish", "fedora43")
+
+
+def test_without_failure_line_reports_last_task():
+    output = log(CONVERGE, PLAY, "TASK [common : Install packages] *********")
+
+    position = FailurePosition.from_output(output, "full_test")
+
+    assert (position.phase, position.task, position.host) == ("converge", "Install packages", "")
+
+
+def test_default_phase_and_ansi_colors():
+    output = "\x1b[0;31mfatal: [instance]: FAILED! => {}\x1b[0m\n"
+
+    position = FailurePosition.from_output(output, "create")
+
+    assert (position.phase, position.host) == ("create", "instance")
+
+
+def test_progress_ordering():
+    converge = FailurePosition(phase="converge", play_index=1, task_index=5)
+    later_task = FailurePosition(phase="converge", play_index=1, task_index=6)
+    verify = FailurePosition(phase="verify", play_index=1, task_index=1)
+    unknown = FailurePosition(phase="full_test", play_index=9, task_index=9)
+
+    assert later_task.is_further_than(converge)
+    assert verify.is_further_than(later_task)
+    assert not converge.is_further_than(converge)
+    assert converge.is_further_than(unknown)
+
+
+def test_roundtrip_and_describe():
+    position = FailurePosition(
+        phase="converge", play="Converge", play_index=1,
+        role="common", task="Install packages", task_index=3, host="instance",
+    )
+
+    assert FailurePosition.from_dict(position.to_dict()) == position
+    assert position.describe() == (
+        "converge > play 1 (Converge) > task 3 (common : Install packages) on instance"
+    )
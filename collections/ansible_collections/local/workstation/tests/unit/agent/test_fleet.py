@@ -0,0 +1,88 @@
+# SPDX-License-Identifier: MIT-0
+"""Fleet runs: parsing the recap and sizing the next wave."""
+
+import pytest
+
+from src.domain.models import ControllerStats, FleetWave, HostResult, parse_recap, tune_forks
+
+OUTPUT = """\
+PLAY RECAP *********************************************************************
+ws-01                      : ok=12   changed=2    unreachable=0    failed=0    skipped=3    rescued=0    ignored=0
+\x1b[0;31mws-02\x1b[0m                      : ok=4    changed=0    unreachable=0    failed=1    skipped=0    rescued=1    ignored=0
+ws-03                      : ok=0    changed=0    unreachable=1    failed=0    skipped=0    rescued=0    ignored=0
+
+Playbook run took 0 days, 0 hours, 1 minutes, 2 seconds
+"""
+
+STATS = ControllerStats(cpus=8, memory_available_mb=16384)
+
+
+def test_parse_recap():
+    results = parse_recap("PLAY RECAP ****\nold : ok=1 failed=1\n\n" + OUTPUT, wave=2)
+
+    assert [r.host for r in results] == ["ws-01", "ws-02", "ws-03"]
+    assert results[0] == HostResult("ws-01", ok=12, changed=2, skipped=3, wave=2)
+    assert [r.succeeded for r in results] == [True, False, False]
+    assert results[0].tasks == 15
+
+
+def test_parse_recap_without_recap():
+    assert parse_recap("fatal: [ws-01]: UNREACHABLE!") == []
+
+
+def test_host_result_roundtrip():
+    result = HostResult("ws-01", ok=3, failed=1, wave=1)
+
+    assert HostResult.from_dict({**result.to_dict(), "unknown": 1}) == result
+
+
+def test_wave_failed_hosts_and_latency():
+    wave = FleetWave(
+        index=0, hosts=("ws-01", "ws-02", "ws-03", "ws-04"), forks=2, duration=60.0,
+        results=tuple(parse_recap(OUTPUT)),
+    )
+
+    assert wave.failed_hosts == ["ws-02", "ws-03", "ws-04"]
+    assert wave.task_latency == pytest.approx(60.0 / (15 * 2))
+
+
+def wave(forks, latency):
+    """A finished wave of one host whose tasks took ``latency`` seconds each."""
+    return FleetWave(index=0, hosts=("ws",), forks=forks, duration=latency * 10,
+                     results=(HostResult("ws", ok=10),))
+
+
+@pytest.mark.parametrize("stats, cap", [
+    (ControllerStats(cpus=8, memory_available_mb=16384), 32),
+    (ControllerStats(cpus=8, memory_available_mb=1024), 8),
+    (ControllerStats(cpus=64, memory_available_mb=65536), 50),
+    (ControllerStats(cpus=0, memory_available_mb=0), 1),
+])
+def test_first_wave_starts_at_the_controller_cap(stats, cap):
+    assert tune_forks(stats, pending=100) == cap
+
+
+def test_never_more_forks_than_pending_hosts():
+    assert tune_forks(STATS, pending=5) == 5
+
+
+def test_grows_while_latency_holds():
+    assert tune_forks(STATS, pending=100, waves=[wave(8, 1.0), wave(12, 1.4)]) == 18
+
+
+def test_shrinks_when_latency_degrades():
+    assert tune_forks(STATS, pending=100, waves=[wave(8, 1.0), wave(12, 1.6)]) == 9
+
+
+def test_shrinks_when_the_controller_is_overloaded():
+    stats = ControllerStats(cpus=8, memory_available_mb=16384, load=12.0)
+
+    assert tune_forks(stats, pending=100, waves=[wave(8, 1.0)]) == 6
+
+
+def test_growth_stays_under_the_cap():
+    assert tune_forks(STATS, pending=100, waves=[wave(30, 1.0)]) == 32
+
+
+def test_at_least_one_fork():
+    assert tune_forks(STATS, pending=100, waves=[wave(1, 1.0), wave(1, 5.0)]) == 1
@@ -0,0 +1,72 @@
+# SPDX-License-Identifier: MIT-0
+"""HttpArtifactMirrorAdapter: which URLs the mirror answers for."""
+
+import pytest
+
+from src.infrastructure.adapters import HttpArtifactMirrorAdapter
+
+DEFAULTS = """\
+---
+tool_version: "1.2.3"
+tool_url: "https://example.com/releases/tool-{{ tool_version }}.tar.gz"
+tool_checksum_url: https://example.com/releases/SHA256SUMS
+tool_host_only: "https://{{ tool_mirror_host }}/tool.tar.gz"
+tool_root_template: "https://example.com{{ tool_path }}"
+tool_sources:
+  - name: sdk
+    url: "  https://dl.example.org/sdk/latest.zip  "
+  - file:///srv/local.tar.gz
+  - git@github.com:owner/repo.git
+tool_comment: see https://example.com for details
+"""
+
+
+@pytest.fixture
+def roles_dir(tmp_path):
+    """A roles directory with one role declaring downloads."""
+    defaults = tmp_path / "tool" / "defaults"
+    defaults.mkdir(parents=True)
+    (defaults / "main.yml").write_text(DEFAULTS)
+    broken = tmp_path / "broken" / "defaults"
+    broken.mkdir(parents=True)
+    (broken / "main.yaml").write_text("tool_url: [unclosed\n")
+    return tmp_path
+
+
+def test_declared_urls(roles_dir):
+    assert HttpArtifactMirrorAdapter.declared_urls(roles_dir) == [
+        "https://dl.example.org/sdk/latest.zip",
+        "https://example.com/releases/SHA256SUMS",
+        "https://example.com/releases/tool-*",
+    ]
+
+
+def mirror(tmp_path, allowed):
+    return HttpArtifactMirrorAdapter(root=tmp_path, allowed=allowed)
+
+
+@pytest.mark.parametrize("url, allowed", [
+    ("https://example.com/releases/SHA256SUMS", True),
+    ("https://example.com/releases/SHA256SUMS.sig", False),
+    ("https://example.com/releases/tool-1.2.3.tar.gz", True),
+    ("https://example.com/releases/other.tar.gz", False),
+    ("https://example.org/releases/tool-1.2.3.tar.gz", False),
+])
+def test_allows_declared_urls_and_prefixes(tmp_path, url, allowed):
+    entries = ["https://example.com/releases/SHA256SUMS", "https://example.com/releases/tool-*"]
+
+    assert mirror(tmp_path, entries).allows(url) is allowed
+
+
+@pytest.mark.parametrize("url", ["file:///etc/passwd", "ftp://example.com/a", "https:///a", "/etc/passwd"])
+def test_never_allows_non_http_urls(tmp_path, url):
+    assert mirror(tmp_path, None).allows(url) is False
+    assert mirror(tmp_path, [url, "*"]).allows(url) is False
+
+
+def test_without_allow_list_any_http_url(tmp_path):
+    assert mirror(tmp_path, None).allows("http://example.com/anything")
+
+
+def test_empty_allow_list_allows_nothing(tmp_path):
+    assert not mirror(tmp_path, []).allows("https://example.com/releases/SHA256SUMS")
@@ -0,0 +1,82 @@
+# SPDX-License-Identifier: MIT-0
+"""Test matrix: expanding images x overlays and summarizing the cells."""
+
+from pathlib import Path
+
+import pytest
+import yaml
+
+from src.domain.models import CellResult, MatrixCell, MatrixDefinition, MatrixSummary
+
+ROOT = Path(__file__).resolve().parents[7]
+
+DEFINITION = {
+    "images": {"fedora-42": "quay.io/fedora/fedora:42", "fedora-43": "quay.io/fedora/fedora:43"},
+    "overlays": {"minimal": {"flag": False}, "full": {"flag": True}},
+    "exclude": [{"image": "fedora-42", "overlay": "full"}],
+}
+
+
+def test_cells_in_image_major_order_without_excluded():
+    matrix = MatrixDefinition.from_dict(DEFINITION, scenario="stability")
+
+    cells = matrix.cells()
+
+    assert matrix.scenario == "stability"
+    assert [cell.name for cell in cells] == ["fedora-42/minimal", "fedora-43/minimal", "fedora-43/full"]
+    assert cells[2].overlay == {"flag": True}
+    assert cells[2].image == "quay.io/fedora/fedora:43"
+
+
+def test_without_overlays_one_default_cell_per_image():
+    matrix = MatrixDefinition.from_dict({"images": {"f43": "fedora:43"}, "overlays": None})
+
+    assert matrix.scenario == "default"
+    assert [(cell.name, cell.overlay) for cell in matrix.cells()] == [("f43/default", {})]
+
+
+def test_exclude_by_overlay_only():
+    matrix = MatrixDefinition.from_dict({**DEFINITION, "exclude": [{"overlay": "minimal"}]})
+
+    assert [cell.name for cell in matrix.cells()] == ["fedora-42/full", "fedora-43/full"]
+
+
+def test_no_images():
+    with pytest.raises(ValueError, match="no images"):
+        MatrixDefinition.from_dict({"overlays": DEFINITION["overlays"]})
+
+
+def test_project_matrix():
+    data = yaml.safe_load((ROOT / "molecule" / "matrix.yml").read_text())
+
+    matrix = MatrixDefinition.from_dict(data)
+
+    assert matrix.scenario == "stability"
+    assert (ROOT / "molecule" / matrix.scenario / "molecule.yml").is_file()
+    assert len(matrix.cells()) == 6
+
+
+def test_summary_grid():
+    cell = MatrixCell("fedora-43", "fedora:43", "full")
+    summary = MatrixSummary(
+        scenario="stability",
+        results=(
+            CellResult(MatrixCell("fedora-42", "fedora:42", "minimal"), success=True, duration=61),
+            CellResult(cell, success=False, duration=122.4, failed_phase="verify", error="boom"),
+        ),
+        duration=130,
+    )
+
+    assert not summary.success
+    assert summary.failed[0].cell == cell
+    assert summary.format().splitlines() == [
+        "Matrix 'stability': 1/2 cell(s) passed in 130s",
+        "             minimal   full",
+        "  fedora-42  PASS 61s  -",
+        "  fedora-43  -         FAIL(verify) 122s",
+    ]
+    assert summary.to_dict()["failed"] == ["fedora-43/full"]
+
+
+def test_empty_summary_is_not_a_success():
+    assert not MatrixSummary(scenario="default").success
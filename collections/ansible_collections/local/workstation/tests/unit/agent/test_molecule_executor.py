@@ -0,0 +1,83 @@
+# SPDX-License-Identifier: MIT-0
+"""MoleculeExecutorAdapter helper commands, against fake molecule/podman."""
+
+import os
+import stat
+
+import pytest
+
+from src.infrastructure.adapters import MoleculeExecutorAdapter
+
+MOLECULE_LIST = """\
+instance  podman  ansible  default  true  true
+other     podman  ansible  default  false false
+elsewhere podman  ansible  upgrade  true  true
+"""
+
+
+def fake_command(bin_dir, name: str, body: str) -> None:
+    """Write an executable shell script onto the fake PATH."""
+    path = bin_dir / name
+    path.write_text(f"#!/bin/sh\n{body}\n")
+    path.chmod(path.stat().st_mode | stat.S_IXUSR)
+
+
+@pytest.fixture
+def bin_dir(tmp_path):
+    """Directory of fake commands."""
+    path = tmp_path / "bin"
+    path.mkdir()
+    return path
+
+
+@pytest.fixture
+def executor(tmp_path, bin_dir):
+    """An executor whose environment finds the fake commands first."""
+    env = {"PATH": f"{bin_dir}:{os.environ.get('PATH', '')}", "AGENT_TEST_MARKER": "from-env"}
+    return MoleculeExecutorAdapter(scenario="default", env=env, project_root=tmp_path)
+
+
+def test_capture_runs_with_the_executor_env(executor, bin_dir, tmp_path):
+    fake_command(bin_dir, "show-env", 'echo "$AGENT_TEST_MARKER $(pwd)"')
+
+    rc, out = executor._capture(["show-env"])
+
+    assert rc == 0
+    assert out.split() == ["from-env", str(tmp_path)]
+
+
+def test_capture_reports_return_code(executor, bin_dir):
+    fake_command(bin_dir, "fails", "echo partial; exit 3")
+
+    assert executor._capture(["fails"]) == (3, "partial\n")
+
+
+def test_capture_missing_command(executor):
+    assert executor._capture(["no-such-command-for-the-agent"]) == (-1, "")
+
+
+def test_container_identity(executor, bin_dir):
+    fake_command(bin_dir, "molecule", f"cat <<'EOF'\n{MOLECULE_LIST}EOF")
+    fake_command(bin_dir, "podman", 'shift 3; for name; do echo "id-$name"; done')
+
+    assert executor.get_container_identity() == {
+        "driver": "podman",
+        "containers": {"instance": "id-instance"},
+    }
+
+
+def test_container_identity_without_instances(executor, bin_dir):
+    fake_command(bin_dir, "molecule", "exit 1")
+
+    assert executor.get_container_identity() == {}
+
+
+@pytest.mark.parametrize("running, alive", [("true", True), ("false", False)])
+def test_is_alive(executor, bin_dir, running, alive):
+    fake_command(bin_dir, "podman", f"echo 'id-instance {running}'")
+
+    assert executor.is_alive({"containers": {"instance": "id-instance"}}) is alive
+
+
+def test_is_alive_without_containers(executor):
+    assert executor.is_alive({}) is False
@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: MIT-0
+"""Test results: error windows, changed tasks and idempotence reports."""
+
+from src.domain import models
+from src.domain.models import (
+    ChangedTask,
+    extract_changed_tasks,
+    extract_error_windows,
+    idempotence_failure,
+    parse_idempotence_report,
+)
+
+# Imported through the package so pytest does not collect them as tests
+Phase, Result, Status = models.TestPhase, models.TestResult, models.TestStatus
+
+
+def numbered(count, errors):
+    """Output of ``count`` lines, with error lines at the given indexes."""
+    return "\n".join(f"fatal: line {i}" if i in errors else f"line {i}" for i in range(count))
+
+
+def test_error_windows_merge_and_separate():
+    windows = extract_error_windows(numbered(30, {5, 8, 25}), context=2)
+
+    assert windows.split("\n...\n") == [
+        "\n".join(["line 3", "line 4", "fatal: line 5", "line 6", "line 7", "fatal: line 8", "line 9", "line 10"]),
+        "\n".join(["line 23", "line 24", "fatal: line 25", "line 26", "line 27"]),
+    ]
+
+
+def test_error_window_patterns():
+    errors = [
+        "Traceback (most recent call last):",
+        "instance : ok=3 changed=1 unreachable=0 failed=1",
+        "error: something",
+        "failed: [instance] (item=foo)",
+    ]
+    output = "\n".join(line for error in errors for line in ("ok: [instance]", error))
+
+    assert extract_error_windows(output, context=0).split("\n...\n") == errors
+
+
+def test_no_error_lines():
+    assert extract_error_windows("ok: [instance]\nchanged: [instance]") == ""
+
+
+def test_extract_changed_tasks():
+    output = "\n".join([
+        "TASK [common : Write config] ***",
+        "\x1b[0;33mchanged: [instance]\x1b[0m",
+        "ok: [other]",
+        "RUNNING HANDLER [common : Restart sshd] ***",
+        "changed: [instance]",
+    ])
+
+    assert extract_changed_tasks(output) == [
+        ("instance", "common : Write config"),
+        ("instance", "common : Restart sshd"),
+    ]
+
+
+def test_idempotence_failure_reports_like_molecule():
+    converge = Result(phase=Phase.CONVERGE, status=Status.SUCCESS, return_code=0, output="PLAY RECAP")
+    changed = [ChangedTask.from_name("instance", "common : Write config"), ChangedTask("instance", "Gather")]
+
+    result = idempotence_failure(converge, changed)
+
+    assert (result.phase, result.status, result.return_code) == (Phase.IDEMPOTENCE, Status.FAILED, 2)
+    assert result.changed_tasks == tuple(changed)
+    assert result.output.endswith(
+        "CRITICAL Idempotence test failed because of the following tasks:\n"
+        "* [instance] => common : Write config\n"
+        "* [instance] => Gather"
+    )
+    assert parse_idempotence_report(result.output) == [
+        ChangedTask("instance", "common : Write config", role="common"),
+        ChangedTask("instance", "Gather"),
+    ]
+
+
+def test_result_roundtrip():
+    result = Result(
+        phase=Phase.IDEMPOTENCE, status=Status.FAILED, return_code=2, output="out",
+        changed_tasks=(ChangedTask("instance", "common : Write config", role="common", items=("a",)),),
+    )
+
+    assert Result.from_dict(result.to_dict()) == result
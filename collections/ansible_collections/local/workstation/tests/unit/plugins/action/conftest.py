@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: MIT-0
+"""Fixtures for running the collection's action plugins without a play.
+
+``action`` builds an action plugin for a task with the given arguments.
+Its module executions are answered from ``plugin.executions.results``
+and recorded in ``plugin.executions.calls``; ``run_id()`` is "run-1", so
+facts tagged with another run are stale.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+
+class Executions:
+    """Module results to answer with and the module calls made."""
+
+    def __init__(self):
+        self.results = []
+        self.calls = []
+
+    def __call__(self, module_name, module_args, task_vars):
+        self.calls.append((module_name, module_args))
+        return self.results.pop(0)
+
+
+@pytest.fixture
+def action(monkeypatch):
+    """Get a factory of action plugins of one module, run in run "run-1"."""
+    from ansible.plugins.action import ActionBase
+
+    monkeypatch.setattr(ActionBase, "run", lambda self, tmp=None, task_vars=None: {})
+
+    def build(plugin_module, args):
+        monkeypatch.setattr(plugin_module, "run_id", lambda: "run-1")
+        plugin = plugin_module.ActionModule(
+            task=SimpleNamespace(args=args), connection=None, play_context=None,
+            loader=None, templar=None,
+        )
+        plugin.executions = Executions()
+        plugin._execute_module = plugin.executions
+        return plugin
+    return build
@@ -0,0 +1,63 @@
+# SPDX-License-Identifier: MIT-0
+"""health_probe action: one probe per run and cache key."""
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible_collections.local.workstation.plugins.action import health_probe  # noqa: E402
+
+PROBE = {
+    "changed": False,
+    "ok": True,
+    "dnf": {"ok": True, "rc": 0, "problems": []},
+    "services": {},
+    "disk": {"/": {"ok": True, "used_percent": 40, "free_bytes": 1}},
+    "log_dir": {"path": "/var/log", "exists": True, "writable": True},
+}
+
+
+def cached(key, run="run-1"):
+    health = {k: PROBE[k] for k in health_probe.HEALTH_KEYS}
+    return {"ansible_facts": {"health_probe": {"run": run, "key": key, "health": health}}}
+
+
+def test_probe_is_kept_as_fact(action):
+    plugin = action(health_probe, {"cache_key": "after-install", "services": ["sshd"]})
+    plugin.executions.results.append(dict(PROBE))
+
+    result = plugin.run(task_vars={})
+
+    assert plugin.executions.calls == [("local.workstation.health_probe", {"services": ["sshd"]})]
+    assert result["cached"] is False
+    assert result["ansible_facts"]["health_probe"] == cached("after-install")["ansible_facts"]["health_probe"]
+
+
+def test_same_key_answers_from_the_fact(action):
+    plugin = action(health_probe, {"cache_key": "after-install"})
+
+    result = plugin.run(task_vars=cached("after-install"))
+
+    assert plugin.executions.calls == []
+    assert (result["cached"], result["changed"], result["ok"]) == (True, False, True)
+
+
+@pytest.mark.parametrize("task_vars", [cached("before-install"), cached("after-install", run="run-0")])
+def test_other_key_or_run_probes_again(action, task_vars):
+    plugin = action(health_probe, {"cache_key": "after-install"})
+    plugin.executions.results.append(dict(PROBE))
+
+    result = plugin.run(task_vars=task_vars)
+
+    assert len(plugin.executions.calls) == 1
+    assert result["cached"] is False
+
+
+def test_failed_probe_is_not_cached(action):
+    plugin = action(health_probe, {})
+    plugin.executions.results.append({"failed": True, "msg": "boom"})
+
+    result = plugin.run(task_vars={})
+
+    assert "ansible_facts" not in result
+    assert result["failed"] is True
@@ -0,0 +1,89 @@
+# SPDX-License-Identifier: MIT-0
+"""workstation_facts action: gathering once per run and answering from the fact."""
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible_collections.local.workstation.plugins.action import workstation_facts  # noqa: E402
+
+FACTS = {
+    "root_fstype": "btrfs",
+    "locales": ["C.utf8"],
+    "localectl": [],
+    "alternatives": {"java": "/usr/lib/jvm/java-21/bin/java", "javac": ""},
+    "groups": {"dev": ["dev", "wheel"]},
+}
+
+
+def cached(**facts):
+    return {"ansible_facts": {"workstation": {**FACTS, "run": "run-1", **facts}}}
+
+
+def test_first_call_gathers_everything(action):
+    plugin = action(workstation_facts, {"gather_subset": "locales", "users": ["dev"]})
+    plugin.executions.results.append({"ansible_facts": {"workstation": FACTS}})
+
+    result = plugin.run(task_vars={})
+
+    assert plugin.executions.calls == [("local.workstation.workstation_facts", {
+        "gather_subset": list(workstation_facts.SUBSETS),
+        "users": ["dev"],
+        "alternatives": ["java", "javac"],
+    })]
+    assert result["cached"] is False
+    assert result["ansible_facts"]["workstation"] == {**FACTS, "run": "run-1"}
+
+
+def test_stale_facts_of_another_run_are_gathered_again(action):
+    plugin = action(workstation_facts, {})
+    plugin.executions.results.append({"ansible_facts": {"workstation": FACTS}})
+
+    plugin.run(task_vars=cached(run="run-0"))
+
+    assert plugin.executions.calls[0][1]["gather_subset"] == list(workstation_facts.SUBSETS)
+
+
+def test_later_call_answers_from_the_fact(action):
+    plugin = action(workstation_facts, {"gather_subset": ["root_fstype", "groups"], "users": "dev"})
+
+    result = plugin.run(task_vars=cached())
+
+    assert plugin.executions.calls == []
+    assert result["cached"] is True
+    assert result["ansible_facts"]["workstation"]["root_fstype"] == "btrfs"
+
+
+def test_only_missing_keys_are_gathered_and_merged(action):
+    plugin = action(workstation_facts, {"gather_subset": "groups", "users": ["dev", "ci"]})
+    plugin.executions.results.append({"ansible_facts": {"workstation": {"groups": {"ci": ["ci"]}}}})
+
+    result = plugin.run(task_vars=cached())
+
+    assert plugin.executions.calls[0][1]["gather_subset"] == ["groups"]
+    assert result["gathered"] == ["groups"]
+    assert result["ansible_facts"]["workstation"]["groups"] == {"dev": ["dev", "wheel"], "ci": ["ci"]}
+
+
+@pytest.mark.parametrize("refresh, gathered", [
+    ("yes", ["locales", "localectl"]),
+    (True, ["locales", "localectl"]),
+    ("locales", ["locales"]),
+    (["localectl"], ["localectl"]),
+])
+def test_refresh(action, refresh, gathered):
+    plugin = action(workstation_facts, {"gather_subset": ["locales", "localectl"], "refresh": refresh})
+    plugin.executions.results.append({"ansible_facts": {"workstation": {"locales": ["C.utf8", "de_DE.utf8"]}}})
+
+    result = plugin.run(task_vars=cached())
+
+    assert result["gathered"] == gathered
+
+
+def test_module_failure_is_returned(action):
+    plugin = action(workstation_facts, {})
+    plugin.executions.results.append({"failed": True, "msg": "boom"})
+
+    result = plugin.run(task_vars={})
+
+    assert result == {"failed": True, "msg": "boom"}
@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: MIT-0
+"""changed_tasks callback: the JSON lines the idempotence reports read."""
+
+import json
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible_collections.local.workstation.plugins.callback.changed_tasks import (  # noqa: E402
+    CallbackModule,
+)
+
+
+class FakeTask:
+    """The parts of a Task the callback reads."""
+
+    def __init__(self, name, role="", args=None, no_log=False):
+        self.name = name
+        self.args = args or {}
+        self.no_log = no_log
+        self._role = SimpleNamespace(get_name=lambda include_role_fqcn=False: role) if role else None
+        self.action = "copy"
+        self.resolved_action = "ansible.builtin.copy"
+
+    def get_name(self, include_role_fqcn=False):
+        return f"{self._role.get_name()} : {self.name}" if self._role else self.name
+
+    def get_path(self):
+        return "/roles/common/tasks/main.yml:12"
+
+
+def task_result(task, result, host="instance"):
+    return SimpleNamespace(_task=task, _result=result, _host=SimpleNamespace(get_name=lambda: host))
+
+
+@pytest.fixture
+def callback(tmp_path):
+    """The callback writing to a log under ``tmp_path`` (as set_options would)."""
+    plugin = CallbackModule()
+    plugin.log_file = str(tmp_path / "changed.jsonl")
+    return plugin
+
+
+def entries(callback):
+    with open(callback.log_file, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_logs_changed_results_after_a_run_marker(callback):
+    callback.v2_playbook_on_start(SimpleNamespace(_file_name="/molecule/default/converge.yml"))
+    task = FakeTask("Write config", role="common", args={"dest": "/etc/x", "_ansible_check_mode": False})
+    callback.v2_runner_on_ok(task_result(task, {"changed": False}))
+    callback.v2_runner_on_ok(task_result(task, {"changed": True}))
+
+    marker, entry = entries(callback)
+
+    assert marker == {"run": callback.run, "playbook": "/molecule/default/converge.yml"}
+    assert entry == {
+        "run": callback.run,
+        "host": "instance",
+        "task": "common : Write config",
+        "role": "common",
+        "path": "/roles/common/tasks/main.yml:12",
+        "action": "ansible.builtin.copy",
+        "args": {"dest": "/etc/x"},
+        "items": [],
+        "handler": False,
+    }
+
+
+def test_reported_arguments_and_changed_items(callback):
+    task = FakeTask("Install tools", args={"name": "{{ item }}"})
+    callback.v2_runner_on_ok(task_result(task, {
+        "changed": True,
+        "results": [
+            {"changed": False, "item": "git"},
+            {"changed": True, "item": "fish", "invocation": {"module_args": {"name": "fish"}}},
+            {"changed": True, "_ansible_item_label": "x" * 200},
+        ],
+    }))
+
+    (entry,) = entries(callback)
+
+    assert entry["args"] == {"name": "fish"}
+    assert entry["items"] == ["fish", "x" * 120]
+
+
+def test_no_log_arguments_are_not_written(callback):
+    task = FakeTask("Set password", args={"password": "secret"}, no_log=True)
+    callback.v2_runner_on_ok(task_result(task, {"changed": True}))
+
+    (entry,) = entries(callback)
+
+    assert entry["args"] == {}
+
+
+def test_without_log_file_nothing_is_written(callback, tmp_path):
+    callback.log_file = None
+    callback.v2_playbook_on_start(SimpleNamespace(_file_name="converge.yml"))
+    callback.v2_runner_on_ok(task_result(FakeTask("Write config"), {"changed": True}))
+
+    assert not (tmp_path / "changed.jsonl").exists()
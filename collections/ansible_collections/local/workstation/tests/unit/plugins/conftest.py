@@ -0,0 +1,104 @@
+# SPDX-License-Identifier: MIT-0
+"""Fixtures for running the collection's modules in-process.
+
+``fake_host`` runs a module's ``main()`` with the given arguments against
+fake commands: ``get_bin_path`` only finds the commands a test declared
+and ``run_command`` answers from them, so no test touches the real rpm,
+dnf or systemctl. Calls and warnings are recorded for the assertions.
+
+Usage:
+    def test_present(fake_host):
+        fake_host.command("rpm", rc=0)
+        result = fake_host.run(rpmdb_check.main, {"name": ["bash"]})
+"""
+
+import contextlib
+import json
+import os
+from unittest import mock
+
+import pytest
+
+
+class ModuleExit(Exception):
+    """Raised in place of exit_json/fail_json, carrying the result."""
+
+    def __init__(self, result):
+        super().__init__(result)
+        self.result = result
+
+
+class FakeHost:
+    """Commands a module may find and run, and the calls it made."""
+
+    def __init__(self):
+        self.responses = {}
+        self.calls = []
+        self.warnings = []
+
+    def command(self, name, rc=0, out="", err=""):
+        """Declare a command; ``out`` may be a function of the arguments."""
+        self.responses[name] = (rc, out, err)
+
+    def get_bin_path(self, module, arg, required=False, opt_dirs=None):
+        if arg in self.responses:
+            return f"/usr/bin/{arg}"
+        if required:
+            module.fail_json(msg=f"Failed to find required executable {arg!r}")
+        return None
+
+    def run_command(self, module, args, **kwargs):
+        self.calls.append(list(args))
+        rc, out, err = self.responses[os.path.basename(args[0])]
+        return rc, out(args) if callable(out) else out, err
+
+    def warn(self, module, warning):
+        self.warnings.append(warning)
+
+    def run(self, main, args, check_mode=False):
+        """Run a module's main() and get what it exited with."""
+        from ansible.module_utils import basic
+
+        def exit_json(module, **result):
+            raise ModuleExit(result)
+
+        def fail_json(module, msg, **result):
+            raise ModuleExit(dict(result, failed=True, msg=msg))
+
+        with contextlib.ExitStack() as stack:
+            stack.enter_context(_patch_module_args(dict(args, _ansible_check_mode=check_mode)))
+            for name, replacement in (
+                ("exit_json", exit_json),
+                ("fail_json", fail_json),
+                ("get_bin_path", self.get_bin_path),
+                ("run_command", self.run_command),
+                ("warn", self.warn),
+            ):
+                stack.enter_context(mock.patch.object(basic.AnsibleModule, name, _method(replacement)))
+            with pytest.raises(ModuleExit) as exited:
+                main()
+        return exited.value.result
+
+
+def _method(function):
+    """Bind ``function`` to the AnsibleModule it is called on."""
+    def method(module, *args, **kwargs):
+        return function(module, *args, **kwargs)
+    return method
+
+
+def _patch_module_args(args):
+    try:
+        from ansible.module_utils.testing import patch_module_args
+    except ImportError:  # ansible-core < 2.19
+        from ansible.module_utils import basic
+
+        payload = json.dumps({"ANSIBLE_MODULE_ARGS": args}).encode()
+        return mock.patch.object(basic, "_ANSIBLE_ARGS", payload)
+    return patch_module_args(args)
+
+
+@pytest.fixture
+def fake_host():
+    """A host without any command until the test declares them."""
+    return FakeHost()
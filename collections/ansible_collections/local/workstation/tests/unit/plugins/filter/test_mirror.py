@@ -0,0 +1,36 @@
+# SPDX-License-Identifier: MIT-0
+"""mirrored: rewriting download URLs to the artifact mirror."""
+
+import pytest
+
+from ansible_collections.local.workstation.plugins.filter.mirror import FilterModule, mirrored
+
+MIRROR = "http://host.containers.internal:8080"
+
+
+def test_without_mirror_the_url_is_unchanged():
+    assert mirrored("https://example.com/a.tar.gz") == "https://example.com/a.tar.gz"
+    assert mirrored("https://example.com/a.tar.gz", "", kind="git") == "https://example.com/a.tar.gz"
+
+
+def test_file_url_is_percent_encoded():
+    url = "https://example.com/dl/tool-1.0.tar.gz?arch=x86_64"
+
+    assert mirrored(url, MIRROR + "/") == (
+        f"{MIRROR}/url/https%3A%2F%2Fexample.com%2Fdl%2Ftool-1.0.tar.gz%3Farch%3Dx86_64"
+    )
+
+
+def test_git_repository():
+    assert mirrored("https://github.com/o/r.git", MIRROR, kind="git") == (
+        f"{MIRROR}/git/https%3A%2F%2Fgithub.com%2Fo%2Fr.git"
+    )
+
+
+def test_unknown_kind():
+    with pytest.raises(ValueError, match="unknown kind 'ftp'"):
+        mirrored("https://example.com/a", MIRROR, kind="ftp")
+
+
+def test_filter_is_registered():
+    assert FilterModule().filters() == {"mirrored": mirrored}
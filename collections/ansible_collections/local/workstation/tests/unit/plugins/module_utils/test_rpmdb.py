@@ -0,0 +1,87 @@
+# SPDX-License-Identifier: MIT-0
+"""rpmdb: which packages the rpm database already provides."""
+
+import pytest
+
+from ansible_collections.local.workstation.plugins.module_utils.rpmdb import (
+    missing_packages,
+    queryable,
+)
+
+
+class FakeModule:
+    """Just enough of AnsibleModule to run rpm."""
+
+    def __init__(self, rc=0, out="", err="", rpm="/usr/bin/rpm"):
+        self.rpm = rpm
+        self.result = (rc, out, err)
+        self.calls = []
+
+    def get_bin_path(self, name):
+        return self.rpm if name == "rpm" else None
+
+    def run_command(self, args):
+        self.calls.append(args)
+        return self.result
+
+
+@pytest.mark.parametrize("name, expected", [
+    ("git", True),
+    ("python3-devel", True),
+    ("@development-tools", False),
+    ("/usr/bin/gcc", False),
+    ("https://example.com/foo.rpm", False),
+    ("local.rpm", False),
+    ("kernel >= 6.0", False),
+    ("java-*-openjdk", False),
+    ("", False),
+])
+def test_queryable(name, expected):
+    assert queryable(name) is expected
+
+
+def test_one_query_for_every_name():
+    module = FakeModule(rc=1, out="no package provides fd-find\n")
+
+    missing = missing_packages(module, ["git", "fd-find", "git", "ripgrep"])
+
+    assert missing == ["fd-find"]
+    assert module.calls == [
+        ["/usr/bin/rpm", "-q", "--whatprovides", "--qf", "", "git", "fd-find", "ripgrep"]
+    ]
+
+
+def test_not_provided_on_stderr():
+    module = FakeModule(rc=1, err="no package provides ripgrep\n")
+
+    assert missing_packages(module, ["git", "ripgrep"]) == ["ripgrep"]
+
+
+def test_nothing_missing():
+    assert missing_packages(FakeModule(), ["git", "ripgrep"]) == []
+
+
+def test_names_rpm_cannot_answer_count_as_missing():
+    module = FakeModule()
+
+    missing = missing_packages(module, ["@virtualization", "git", "/tmp/local.rpm"])
+
+    assert missing == ["@virtualization", "/tmp/local.rpm"]
+    assert module.calls[0][5:] == ["git"]
+
+
+def test_only_unqueryable_names_skip_rpm():
+    module = FakeModule()
+
+    assert missing_packages(module, ["@virtualization"]) == ["@virtualization"]
+    assert module.calls == []
+
+
+def test_without_rpm_everything_is_missing():
+    assert missing_packages(FakeModule(rpm=None), ["git", "git", "ripgrep"]) == ["git", "ripgrep"]
+
+
+def test_rpm_error_leaves_the_decision_to_dnf():
+    module = FakeModule(rc=1, err="error: rpmdb open failed\n")
+
+    assert missing_packages(module, ["git", "ripgrep"]) == ["git", "ripgrep"]
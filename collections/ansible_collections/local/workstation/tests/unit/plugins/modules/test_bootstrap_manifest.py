@@ -0,0 +1,124 @@
+# SPDX-License-Identifier: MIT-0
+"""bootstrap_manifest module: skipping bootstrap steps that are already done."""
+
+import json
+import os
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible_collections.local.workstation.plugins.modules import bootstrap_manifest  # noqa: E402
+
+SPEC = {"version": "3.24.0", "channel": "stable"}
+
+
+@pytest.fixture
+def step(tmp_path):
+    """Arguments of a step that produced one file and one directory."""
+    sdk = tmp_path / "flutter"
+    sdk.mkdir()
+    binary = sdk / "flutter.bin"
+    binary.write_text("flutter 3.24.0\n")
+    return {
+        "name": "flutter",
+        "spec": SPEC,
+        "paths": [str(sdk), str(binary)],
+        "state_dir": str(tmp_path / "state"),
+    }
+
+
+def run(fake_host, step, **overrides):
+    return fake_host.run(bootstrap_manifest.main, {**step, **overrides})
+
+
+def test_not_recorded(fake_host, step):
+    result = run(fake_host, step)
+
+    assert (result["changed"], result["current"], result["reason"]) == (False, False, "no manifest recorded")
+
+
+def test_record_then_check(fake_host, step, tmp_path):
+    recorded = run(fake_host, step, state="present", info={"installed": "3.24.0"})
+    again = run(fake_host, step, state="present", info={"installed": "3.24.0"})
+    checked = run(fake_host, step)
+
+    assert recorded["changed"] is True
+    assert again["changed"] is False
+    assert (checked["current"], checked["reason"]) == (True, "")
+    manifest = json.loads((tmp_path / "state" / "flutter.json").read_text())
+    assert manifest["info"] == {"installed": "3.24.0"}
+    assert manifest["spec_checksum"] == bootstrap_manifest.spec_checksum(dict(reversed(SPEC.items())))
+
+
+def test_spec_change(fake_host, step):
+    run(fake_host, step, state="present")
+
+    result = run(fake_host, step, spec={**SPEC, "version": "3.27.0"})
+
+    assert (result["current"], result["reason"]) == (False, "spec changed")
+
+
+@pytest.mark.parametrize("fingerprint", ["stat", "sha256"])
+def test_replaced_file(fake_host, step, fingerprint):
+    run(fake_host, step, state="present", fingerprint=fingerprint)
+    with open(step["paths"][1], "a") as f:
+        f.write("patched\n")
+
+    result = run(fake_host, step, fingerprint=fingerprint)
+
+    assert result["reason"] == f"{step['paths'][1]} changed"
+
+
+def test_removed_path(fake_host, step):
+    run(fake_host, step, state="present")
+    os.remove(step["paths"][1])
+
+    result = run(fake_host, step)
+
+    assert result["reason"] == f"{step['paths'][1]} is missing"
+
+
+def test_new_path(fake_host, step):
+    run(fake_host, step, state="present")
+
+    result = run(fake_host, step, paths=[*step["paths"], step["paths"][1] + ".new"])
+
+    assert result["reason"] == f"{step['paths'][1]}.new not recorded"
+
+
+def test_missing_output_fails_to_record(fake_host, step):
+    result = run(fake_host, step, state="present", paths=[step["paths"][1] + ".new"])
+
+    assert result["failed"] is True
+    assert "produced no" in result["msg"]
+
+
+def test_absent(fake_host, step, tmp_path):
+    run(fake_host, step, state="present")
+
+    removed = run(fake_host, step, state="absent")
+    again = run(fake_host, step, state="absent")
+
+    assert (removed["changed"], again["changed"]) == (True, False)
+    assert not (tmp_path / "state" / "flutter.json").exists()
+
+
+def test_check_mode_writes_nothing(fake_host, step, tmp_path):
+    result = fake_host.run(bootstrap_manifest.main, {**step, "state": "present"}, check_mode=True)
+
+    assert result["changed"] is True
+    assert not (tmp_path / "state").exists()
+
+
+def test_invalid_name(fake_host, step):
+    result = run(fake_host, step, name="../etc/passwd")
+
+    assert result["failed"] is True
+
+
+def test_unreadable_manifest(fake_host, step, tmp_path):
+    (tmp_path / "state").mkdir()
+    (tmp_path / "state" / "flutter.json").write_text("[not a manifest")
+
+    assert run(fake_host, step)["reason"] == "no manifest recorded"
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: MIT-0
+"""dnf_batch module: one dnf transaction for every role's packages."""
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible_collections.local.workstation.plugins.modules import dnf_batch  # noqa: E402
+
+INTENTS = [
+    {"role": "common", "packages": ["git", "fd-find", "@development-tools"]},
+    {"role": "shell", "packages": ["fish", "git"]},
+]
+
+
+def rpm_missing(*names):
+    """Fake ``rpm -q --whatprovides`` output with ``names`` not installed."""
+    def out(args):
+        return "".join(f"no package provides {name}\n" for name in args[5:] if name in names)
+    return out
+
+
+def test_nothing_missing_never_starts_dnf(fake_host):
+    fake_host.command("rpm")
+    fake_host.command("dnf")
+
+    result = fake_host.run(dnf_batch.main, {"intents": INTENTS})
+
+    assert result["changed"] is False
+    assert result["packages"] == {"git": "present", "fd-find": "present", "fish": "present"}
+    assert [call[0] for call in fake_host.calls] == ["/usr/bin/rpm"]
+    assert result["results"][1] == {
+        "role": "shell", "packages": ["fish", "git"], "installed": [], "missing": [], "changed": False,
+    }
+
+
+@pytest.mark.parametrize("version, option", [
+    ("dnf5 version 5.2.8.1", "--skip-unavailable"),
+    ("4.21.1", "--setopt=strict=0"),
+])
+def test_installs_missing_in_one_transaction(fake_host, version, option):
+    queries = []
+
+    def rpm(args):
+        queries.append(args[5:])
+        missing = ("fd-find", "fish") if len(queries) == 1 else ()
+        return rpm_missing(*missing)(args)
+
+    fake_host.command("rpm", out=rpm)
+    fake_host.command("dnf", out=lambda args: version if args[1] == "--version" else "")
+
+    result = fake_host.run(dnf_batch.main, {"intents": INTENTS})
+
+    assert ["/usr/bin/dnf", "-y", "install", option, "fd-find", "fish"] in fake_host.calls
+    assert queries == [["git", "fd-find", "fish"], ["fd-find", "fish"]]
+    assert result["changed"] is True
+    assert result["installed"] == ["fd-find", "fish"]
+    assert [r["changed"] for r in result["results"]] == [True, True]
+    assert result["results"][0]["installed"] == ["fd-find"]
+
+
+def test_unavailable_packages_are_left_to_the_roles(fake_host):
+    fake_host.command("rpm", rc=1, out=rpm_missing("fd-find", "fish"))
+    fake_host.command("dnf", out=lambda args: "dnf5" if args[1] == "--version" else "")
+
+    result = fake_host.run(dnf_batch.main, {"intents": INTENTS})
+
+    assert result["missing"] == ["fd-find", "fish"]
+    assert result["changed"] is False
+    assert result["packages"]["fish"] == "missing"
+    assert result["results"][1]["missing"] == ["fish"]
+    assert fake_host.warnings == [
+        "dnf_batch: not installed: fd-find, fish; the role tasks that need them will install them"
+    ]
+
+
+def test_check_mode_reports_without_installing(fake_host):
+    fake_host.command("rpm", rc=1, out=rpm_missing("fish"))
+
+    result = fake_host.run(dnf_batch.main, {"intents": INTENTS}, check_mode=True)
+
+    assert result["changed"] is True
+    assert result["missing"] == ["fish"]
+    assert all(call[0] == "/usr/bin/rpm" for call in fake_host.calls)
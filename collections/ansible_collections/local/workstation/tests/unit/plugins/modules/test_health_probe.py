@@ -0,0 +1,119 @@
+# SPDX-License-Identifier: MIT-0
+"""health_probe module: one probe of dnf, services, disks and the log directory."""
+
+import os
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible_collections.local.workstation.plugins.modules import health_probe  # noqa: E402
+
+
+@pytest.fixture
+def systemd(monkeypatch):
+    """Pretend the host booted with systemd."""
+    isdir = os.path.isdir
+    monkeypatch.setattr(os.path, "isdir", lambda path: path == "/run/systemd/system" or isdir(path))
+
+
+@pytest.fixture
+def healthy(fake_host, systemd):
+    """A host where dnf check passes and every service is active."""
+    fake_host.command("dnf")
+    fake_host.command("systemctl", out=lambda args: "active\n" * len(args[2:]))
+    return fake_host
+
+
+def args(tmp_path, **overrides):
+    """Module arguments probing only ``tmp_path``."""
+    return {"paths": [str(tmp_path)], "log_dir": str(tmp_path), "disk_warn_percent": 100, **overrides}
+
+
+def test_healthy(healthy, tmp_path):
+    result = healthy.run(health_probe.main, args(tmp_path, services=["sshd", "firewalld"]))
+
+    assert result["ok"] is True
+    assert result["changed"] is False
+    assert result["dnf"] == {"ok": True, "rc": 0, "problems": []}
+    assert result["services"] == {"sshd": "active", "firewalld": "active"}
+    assert result["log_dir"] == {"path": str(tmp_path), "exists": True, "writable": True}
+    assert ["/usr/bin/systemctl", "is-active", "sshd", "firewalld"] in healthy.calls
+
+
+def test_dnf_problems(healthy, tmp_path):
+    healthy.command("dnf", rc=1, out="\nfoo has missing requires of bar\n")
+
+    result = healthy.run(health_probe.main, args(tmp_path))
+
+    assert result["ok"] is False
+    assert result["dnf"] == {"ok": False, "rc": 1, "problems": ["foo has missing requires of bar"]}
+
+
+def test_dnf_check_disabled(fake_host, tmp_path):
+    result = fake_host.run(health_probe.main, args(tmp_path, dnf_check=False))
+
+    assert result["dnf"] == {"ok": None, "rc": None, "problems": []}
+    assert result["ok"] is True
+    assert fake_host.calls == []
+
+
+def test_inactive_service(healthy, tmp_path):
+    healthy.command("systemctl", rc=3, out="active\nfailed\n")
+
+    result = healthy.run(health_probe.main, args(tmp_path, services=["sshd", "firewalld"]))
+
+    assert result["services"] == {"sshd": "active", "firewalld": "failed"}
+    assert result["ok"] is False
+
+
+def test_services_without_systemd(fake_host, tmp_path):
+    fake_host.command("systemctl")
+    if os.path.isdir("/run/systemd/system"):
+        pytest.skip("the test host runs systemd")
+
+    result = fake_host.run(health_probe.main, args(tmp_path, dnf_check=False, services=["sshd"]))
+
+    assert result["services"] == {"sshd": "unavailable"}
+    assert result["ok"] is True
+
+
+def test_disk_usage(tmp_path):
+    disk = health_probe.probe_disk(str(tmp_path), 100)
+
+    assert disk["ok"] is True
+    assert 0 <= disk["used_percent"] <= 100
+    assert disk["free_bytes"] >= 0
+    assert health_probe.probe_disk(str(tmp_path), -1)["ok"] is False
+
+
+def test_disk_missing(tmp_path):
+    disk = health_probe.probe_disk(str(tmp_path / "missing"), 80)
+
+    assert (disk["ok"], disk["used_percent"]) == (False, None)
+
+
+def test_missing_log_dir(tmp_path):
+    assert health_probe.probe_log_dir(str(tmp_path / "missing")) == {
+        "path": str(tmp_path / "missing"), "exists": False, "writable": False,
+    }
+
+
+def test_marker_ignores_the_time(healthy, tmp_path):
+    marker = tmp_path / "health.txt"
+
+    first = healthy.run(health_probe.main, args(tmp_path, marker=str(marker)))
+    marker.write_text(marker.read_text().replace("Time: ", "Time: 1999-"))
+    second = healthy.run(health_probe.main, args(tmp_path, marker=str(marker)))
+
+    assert (first["changed"], second["changed"]) == (True, False)
+    assert "DNF Status: OK" in marker.read_text()
+
+
+def test_marker_in_check_mode(healthy, tmp_path):
+    marker = tmp_path / "health.txt"
+
+    result = healthy.run(health_probe.main, args(tmp_path, marker=str(marker)), check_mode=True)
+
+    assert result["changed"] is True
+    assert not marker.exists()
@@ -0,0 +1,22 @@
+# SPDX-License-Identifier: MIT-0
+"""rpmdb_check module: splitting package names into present and missing."""
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible_collections.local.workstation.plugins.modules import rpmdb_check  # noqa: E402
+
+
+def test_present_and_missing(fake_host):
+    fake_host.command("rpm", rc=1, out="no package provides fd-find\n")
+
+    result = fake_host.run(rpmdb_check.main, {"name": ["git", "fd-find", "git"]})
+
+    assert result == {"changed": False, "missing": ["fd-find"], "present": ["git"]}
+
+
+def test_without_rpm(fake_host):
+    result = fake_host.run(rpmdb_check.main, {"name": ["git"]})
+
+    assert (result["missing"], result["present"]) == (["git"], [])
@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: MIT-0
+"""workstation_facts module: the facts the roles used to gather with commands."""
+
+import grp
+import os
+import pwd
+
+import pytest
+
+pytest.importorskip("ansible")
+
+from ansible_collections.local.workstation.plugins.modules import workstation_facts  # noqa: E402
+
+
+def test_selected_subsets(fake_host):
+    fake_host.command("locale", out="C.utf8\nen_US.utf8\n")
+
+    result = fake_host.run(workstation_facts.main, {"gather_subset": ["locales", "alternatives"],
+                                                    "alternatives": ["no-such-alternative"]})
+
+    assert result["changed"] is False
+    assert result["ansible_facts"]["workstation"] == {
+        "locales": ["C.utf8", "en_US.utf8"],
+        "alternatives": {"no-such-alternative": ""},
+    }
+
+
+def test_all_subsets(fake_host):
+    result = fake_host.run(workstation_facts.main, {})
+
+    assert set(result["ansible_facts"]["workstation"]) == set(workstation_facts.SUBSETS)
+
+
+@pytest.mark.parametrize("declare", [True, False])
+def test_failing_or_missing_command_gives_no_lines(fake_host, declare):
+    if declare:
+        fake_host.command("locale", rc=1, out="C.utf8\n")
+
+    result = fake_host.run(workstation_facts.main, {"gather_subset": ["locales"]})
+
+    assert result["ansible_facts"]["workstation"] == {"locales": []}
+
+
+def test_root_fstype_last_mount_wins(monkeypatch, tmp_path):
+    mounts = tmp_path / "mounts"
+    mounts.write_text(
+        "overlay / overlay rw 0 0\n"
+        "proc /proc proc rw 0 0\n"
+        "/dev/vda3 / btrfs rw,subvol=/root 0 0\n"
+    )
+    real_open = open
+    monkeypatch.setattr(
+        "builtins.open",
+        lambda path, *a, **kw: real_open(mounts if path == "/proc/self/mounts" else path, *a, **kw),
+    )
+
+    assert workstation_facts.root_fstype() == "btrfs"
+
+
+def test_alternatives_resolve_links(monkeypatch, tmp_path):
+    target = tmp_path / "java-21"
+    target.write_text("")
+    (tmp_path / "java").symlink_to(target)
+    join = os.path.join
+    monkeypatch.setattr(
+        os.path, "join", lambda a, *p: join(str(tmp_path), *p) if a == "/usr/bin" else join(a, *p)
+    )
+
+    assert workstation_facts.alternatives(["java", "javac"]) == {"java": str(target), "javac": ""}
+
+
+def test_user_groups():
+    user = pwd.getpwuid(os.getuid())
+    primary = grp.getgrgid(user.pw_gid).gr_name
+
+    groups = workstation_facts.user_groups([user.pw_name, "no-such-user-for-the-facts"])
+
+    assert primary in groups[user.pw_name]
+    assert len(groups[user.pw_name]) == len(set(groups[user.pw_name]))
+    assert groups["no-such-user-for-the-facts"] == []
+
@@ -15,20 +15,62 @@
 #   python main.py                    # Full autonomous run
 #   python main.py --scenario ci      # Run specific scenario
 #   python main.py --skip-final       # Skip final clean-room validation
+#   python main.py --events-file .agent-events.jsonl  # Also log events as JSONL
+#   python main.py --resume           # Continue an interrupted run
+#   python main.py --daemon           # Serve runs from a warm container pool
+#   python main.py --use-daemon       # Run on the daemon's warm containers
+#   python main.py --watch            # Re-converge changed roles as you edit
+#   python main.py --fleet fleet      # Apply fleet.yaml to an inventory group in waves
+#   python main.py --matrix molecule/matrix.yml  # Test images x overlays in parallel
+#   python main.py --bisect           # Localize failures to the roles they depend on
 # =============================================================================
 
 import argparse
+import asyncio
+import dataclasses
 import json
+import signal
 import sys
+import tempfile
 from pathlib import Path
 
 # Import from clean architecture layers
 from src.domain import AgentConfig
-from src.application import AutonomousAgentUseCase
+from src.domain.models import MatrixDefinition
+from src.application import (
+    AsyncAutonomousAgentUseCase,
+    AsyncExecutorBridge,
+    AsyncObserverBridge,
+    WatchUseCase,
+    FleetUseCase,
+    MatrixUseCase,
+    BisectUseCase,
+)
+from src.interfaces.daemon import AgentDaemon, run_via_daemon
 from src.infrastructure import (
-    MoleculeExecutorAdapter,
-    ClaudeHealerAdapter,
+    AsyncMoleculeExecutorAdapter,
+    AnsibleFleetExecutorAdapter,
+    InProcessExecutorAdapter,
+    AsyncClaudeHealerAdapter,
     ConsoleObserverAdapter,
+    JsonlObserverAdapter,
+    MetricsObserverAdapter,
+    CompositeObserverAdapter,
+    JournalStateStoreAdapter,
+    FileErrorStoreAdapter,
+    ArtifactArchiveAdapter,
+    InotifyWatcherAdapter,
+    PodmanContainerPoolAdapter,
+    PooledExecutorAdapter,
+    DnfCacheAdapter,
+    HttpArtifactMirrorAdapter,
+    CassetteWriter,
+    CassetteReader,
+    RecordingExecutorAdapter,
+    RecordingHealerAdapter,
+    ReplayExecutorAdapter,
+    ReplayHealerAdapter,
+    StaticPlanCompilerAdapter,
     Settings,
 )
 
@@ -43,8 +85,20 @@ Examples:
   python main.py                      # Run with defaults
   python main.py --scenario ci        # Test CI scenario
   python main.py --max-retries 20     # More retries for complex issues
+  python main.py --stall-limit 0      # Never stop early on lack of progress
   python main.py --skip-final         # Skip clean-room validation
   python main.py --verbose            # Enable verbose logging
+  python main.py --events-file ev.jsonl --metrics-file metrics.json
+  python main.py --resume             # Continue after a pre-empted runner
+  python main.py --daemon &           # Keep warm containers for later runs
+  python main.py --use-daemon         # Get a container in seconds
+  python main.py --watch              # Edit a role, see converge results
+  python main.py --executor inprocess # Skip the molecule CLI per phase
+  python main.py --record run.jsonl   # Capture executor/healer calls
+  python main.py --replay run.jsonl --replay-speed 0  # Re-run them offline
+  python main.py --fleet fleet --wave-size 10  # Converge the fleet group in waves
+  python main.py --matrix molecule/matrix.yml  # Images x stability overlays in parallel
+  python main.py --bisect             # Find the roles a failure depends on before healing
         """
     )
 
@@ -61,6 +115,14 @@ Examples:
         help=f"Maximum retry attempts (default: {AgentConfig.DEFAULT_MAX_RETRIES})"
     )
 
+    parser.add_argument(
+        "--stall-limit",
+        type=int,
+        default=AgentConfig.DEFAULT_STALL_LIMIT,
+        help="Stop after this many iterations without the failure moving "
+             f"further into the scenario, 0 to disable (default: {AgentConfig.DEFAULT_STALL_LIMIT})"
+    )
+
     parser.add_argument(
         "--skip-final",
         action="store_true",
@@ -80,50 +142,480 @@ Examples:
         help="Project root directory (default: current directory)"
     )
 
-    return parser.parse_args()
+    parser.add_argument(
+        "--events-file",
+        type=Path,
+        default=Settings.EVENTS_FILE or None,
+        help="Append all agent events to this JSONL file"
+    )
 
+    parser.add_argument(
+        "--metrics-file",
+        type=Path,
+        default=Settings.METRICS_FILE or None,
+        help="Write aggregated run metrics to this JSON file"
+    )
 
-def create_adapters(config: AgentConfig):
-    """Create infrastructure adapters.
+    parser.add_argument(
+        "--output-policy",
+        choices=[CompositeObserverAdapter.POLICY_DROP, CompositeObserverAdapter.POLICY_BLOCK],
+        default=Settings.OBSERVER_OVERFLOW_POLICY,
+        help="What to do with output lines when observers fall behind "
+             f"(default: {Settings.OBSERVER_OVERFLOW_POLICY})"
+    )
 
-    This is where we wire up the concrete implementations.
+    parser.add_argument(
+        "--executor",
+        choices=["molecule", "inprocess"],
+        default=Settings.EXECUTOR,
+        help="molecule: one molecule CLI per phase; inprocess: load the scenario "
+             "once and run playbooks through ansible-runner "
+             f"(default: {Settings.EXECUTOR})"
+    )
+
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume the last interrupted run from its checkpoint journal"
+    )
+
+    daemon = parser.add_mutually_exclusive_group()
+    daemon.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run as a daemon that keeps warm containers and serves run requests"
+    )
+    daemon.add_argument(
+        "--use-daemon",
+        action="store_true",
+        help="Send this run to the daemon instead of running it in-process"
+    )
+    daemon.add_argument(
+        "--watch",
+        action="store_true",
+        help="Keep the container alive and re-run converge + idempotence for "
+             "roles whose files change (type 'c' + Enter for a clean-room run)"
+    )
+    daemon.add_argument(
+        "--fleet",
+        metavar="PATTERN",
+        help="Apply the fleet playbook to the inventory hosts matching PATTERN "
+             "in waves, with forks tuned per wave, instead of testing a scenario"
+    )
+    daemon.add_argument(
+        "--matrix",
+        type=Path,
+        metavar="FILE",
+        help="Test the scenario over the images x variable overlays defined in "
+             "FILE, one pooled container per cell, instead of a single run"
+    )
+
+    parser.add_argument(
+        "--daemon-socket",
+        type=Path,
+        default=Path(Settings.DAEMON_SOCKET),
+        help=f"Daemon Unix socket (default: {Settings.DAEMON_SOCKET})"
+    )
+
+    parser.add_argument(
+        "--pool-size",
+        type=int,
+        default=Settings.POOL_SIZE,
+        help=f"Daemon: warm containers per scenario (default: {Settings.POOL_SIZE})"
+    )
+
+    parser.add_argument(
+        "--pool-max-uses",
+        type=int,
+        default=Settings.POOL_MAX_USES,
+        help=f"Daemon: runs per container before recycling (default: {Settings.POOL_MAX_USES})"
+    )
+
+    parser.add_argument(
+        "--watch-debounce",
+        type=float,
+        default=Settings.WATCH_DEBOUNCE,
+        help="Watch: seconds without further changes before re-running "
+             f"(default: {Settings.WATCH_DEBOUNCE})"
+    )
+
+    parser.add_argument(
+        "--inventory", "-i",
+        help="Fleet: inventory source (default: ansible.cfg's)"
+    )
+
+    parser.add_argument(
+        "--wave-size",
+        type=int,
+        default=Settings.FLEET_WAVE_SIZE,
+        help=f"Fleet: hosts per wave (default: {Settings.FLEET_WAVE_SIZE})"
+    )
+
+    parser.add_argument(
+        "--max-forks",
+        type=int,
+        default=Settings.FLEET_MAX_FORKS,
+        help="Fleet: upper bound for the forks tuned from controller CPU, memory "
+             f"and task latency (default: {Settings.FLEET_MAX_FORKS})"
+    )
+
+    parser.add_argument(
+        "--max-fail-percent",
+        type=float,
+        default=Settings.FLEET_MAX_FAIL_PERCENT,
+        help="Fleet: start no further waves once more than this percentage of "
+             f"hosts failed (default: {Settings.FLEET_MAX_FAIL_PERCENT:g})"
+    )
+
+    parser.add_argument(
+        "--bisect",
+        action=argparse.BooleanOptionalAction,
+        default=Settings.BISECT,
+        help="Before healing a converge/idempotence failure, converge the failing "
+             "role with prefixes of the earlier roles in fresh pooled containers "
+             "to find the roles it depends on"
+    )
+
+    parser.add_argument(
+        "--bisect-parallel",
+        type=int,
+        default=Settings.BISECT_PARALLEL,
+        help=f"Bisect: probes running at the same time (default: {Settings.BISECT_PARALLEL})"
+    )
+
+    parser.add_argument(
+        "--matrix-parallel",
+        type=int,
+        default=Settings.MATRIX_PARALLEL,
+        help=f"Matrix: cells running at the same time (default: {Settings.MATRIX_PARALLEL})"
+    )
+
+    cassette = parser.add_mutually_exclusive_group()
+    cassette.add_argument(
+        "--record",
+        type=Path,
+        metavar="CASSETTE",
+        help="Record every executor and healer call (timings, outputs, "
+             "return codes) into this cassette file"
+    )
+    cassette.add_argument(
+        "--replay",
+        type=Path,
+        metavar="CASSETTE",
+        help="Replay a recorded cassette instead of running Molecule and Claude"
+    )
+
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Replay: speed factor for recorded durations, 0 for no waiting (default: 1)"
+    )
+
+    args = parser.parse_args()
+    if (args.record or args.replay) and (args.daemon or args.use_daemon):
+        parser.error("--record/--replay run in-process, not with --daemon/--use-daemon")
+    if args.resume and args.replay:
+        parser.error("--replay starts from a scratch journal, it cannot --resume")
+    if args.bisect and (args.replay or args.watch):
+        parser.error("--bisect needs real containers and a healing loop, not --replay/--watch")
+    if (args.record or args.replay) and (args.fleet or args.matrix):
+        parser.error("--record/--replay run a single scenario, not with --fleet/--matrix")
+    return args
+
+
+def create_observer(
+    config: AgentConfig,
+    events_file: Path | None = None,
+    metrics_file: Path | None = None,
+    output_policy: str = Settings.OBSERVER_OVERFLOW_POLICY,
+) -> CompositeObserverAdapter:
+    """Create the fan-out observer with all configured sinks.
 
     Args:
         config: Agent configuration
+        events_file: Optional JSONL event log destination
+        metrics_file: Optional metrics snapshot destination
+        output_policy: Overflow policy for output batches
 
     Returns:
-        Tuple of (executor, healer, observer) adapters
+        Composite observer dispatching to console and optional sinks
+    """
+    sinks = [ConsoleObserverAdapter(verbose=config.verbose)]
+    if events_file:
+        sinks.append(JsonlObserverAdapter(events_file))
+    if metrics_file:
+        sinks.append(MetricsObserverAdapter(metrics_file))
+
+    return CompositeObserverAdapter(
+        sinks,
+        queue_size=Settings.OBSERVER_QUEUE_SIZE,
+        overflow_policy=output_policy,
+    )
+
+
+def create_dnf_cache(env: dict) -> DnfCacheAdapter:
+    """Create the shared dnf cache manager from Settings."""
+    return DnfCacheAdapter(
+        prefix=Settings.DNF_CACHE_VOLUME_PREFIX,
+        max_bytes=Settings.DNF_CACHE_MAX_MB * 1024 * 1024,
+        max_age_days=Settings.DNF_CACHE_MAX_AGE_DAYS,
+        env=env,
+    )
+
+
+def create_artifact_mirror(project_root: Path) -> HttpArtifactMirrorAdapter:
+    """Create the local artifact mirror from Settings.
+
+    The mirror only serves the downloads declared in the roles' defaults.
+    """
+    allowed = HttpArtifactMirrorAdapter.declared_urls(project_root / Settings.ROLES_DIR)
+    allowed += [url.strip() for url in Settings.MIRROR_ALLOW.split(",") if url.strip()]
+    return HttpArtifactMirrorAdapter(
+        root=Path(Settings.MIRROR_DIR),
+        bind=Settings.MIRROR_BIND,
+        port=Settings.MIRROR_PORT,
+        public_host=Settings.MIRROR_HOST,
+        allowed=allowed,
+    )
+
+
+def create_env(
+    config: AgentConfig, observer: CompositeObserverAdapter
+) -> tuple[dict, HttpArtifactMirrorAdapter | None]:
+    """Create the Ansible/Molecule environment of a run.
+
+    Attaches the shared dnf cache and starts the artifact mirror.
+
+    Returns:
+        Tuple of (env, mirror); the caller stops the mirror (None if disabled)
     """
-    # Setup environment
     env = Settings.get_ansible_env()
     Settings.set_project_root(config.project_root)
+    # Molecule generates its own ansible.cfg; keep logging to the project log
+    # so the artifact archive can slice it per iteration
+    env["ANSIBLE_LOG_PATH"] = str(config.project_root / Settings.ANSIBLE_LOG_FILE)
+
+    # Containers of the same Fedora release share one dnf cache volume
+    pruned = create_dnf_cache(env).attach(env, config.project_root / "molecule" / config.scenario)
+    if pruned["files"]:
+        observer.log(
+            LogLevel.INFO,
+            f"Pruned {pruned['files']} cached packages ({pruned['bytes'] // 2**20} MiB)",
+        )
+
+    # Role downloads go through a local mirror, fetched once per URL
+    mirror = create_artifact_mirror(config.project_root) if Settings.MIRROR_ENABLED else None
+    if mirror is not None:
+        env["MOLECULE_ARTIFACT_MIRROR_URL"] = mirror.start()
+        observer.log(LogLevel.DEBUG, f"Artifact mirror at {env['MOLECULE_ARTIFACT_MIRROR_URL']}")
+    return env, mirror
+
+
+def create_adapters(
+    config: AgentConfig,
+    observer: CompositeObserverAdapter,
+    executor_kind: str = Settings.EXECUTOR,
+    env: dict | None = None,
+):
+    """Create infrastructure adapters.
+
+    This is where we wire up the concrete implementations.
+
+    Args:
+        config: Agent configuration
+        observer: Observer shared by the use case and the executor
+        executor_kind: "molecule" (CLI per phase) or "inprocess"
+        env: Environment from ``create_env`` (default: the plain Ansible
+            environment, without dnf cache or mirror)
+
+    Returns:
+        Tuple of (executor, healer, observer) adapters; the async observer
+        forwards to ``observer``
+    """
+    env = env if env is not None else Settings.get_ansible_env()
+
+    async_observer = AsyncObserverBridge(observer)
 
     # Create executor adapter
-    executor = MoleculeExecutorAdapter(
-        scenario=config.scenario,
-        env=env,
+    if executor_kind == "inprocess":
+        executor = AsyncExecutorBridge(InProcessExecutorAdapter(
+            scenario=config.scenario,
+            env=env,
+            project_root=config.project_root,
+            observer=observer,
+        ))
+    else:
+        executor = AsyncMoleculeExecutorAdapter(
+            scenario=config.scenario,
+            env=env,
+            project_root=config.project_root,
+            observer=async_observer,
+        )
+
+    # Create healer adapter
+    healer = AsyncClaudeHealerAdapter(
         project_root=config.project_root,
+        planner=StaticPlanCompilerAdapter(project_root=config.project_root),
     )
 
-    # Create healer adapter
-    healer = ClaudeHealerAdapter(
+    return executor, healer, async_observer
+
+
+def create_bisector(
+    config: AgentConfig,
+    env: dict,
+    observer: AsyncObserverBridge,
+    parallel: int,
+):
+    """Create the role bisector and the container pool its probes run in.
+
+    The pool keeps no idle containers, so every probe gets a fresh one;
+    with the image cache they start from the scenario's prepared image.
+
+    Returns:
+        Tuple of (bisector, pool); the caller closes the pool
+    """
+    # Probes don't write to the run's ansible.log (sliced per iteration)
+    env = {key: value for key, value in env.items() if key != "ANSIBLE_LOG_PATH"}
+    pool = PodmanContainerPoolAdapter(
         project_root=config.project_root,
+        env=env,
+        size=0,
+        package_cache=create_dnf_cache(env),
+        image_cache=Settings.POOL_IMAGE_CACHE,
+    )
+    bisector = BisectUseCase(
+        executor_factory=lambda: PooledExecutorAdapter(
+            pool=pool,
+            scenario=config.scenario,
+            env=env,
+            project_root=config.project_root,
+        ),
+        planner=StaticPlanCompilerAdapter(project_root=config.project_root),
+        observer=observer,
+        scenario=config.scenario,
+        parallel=parallel,
     )
+    return bisector, pool
+
+
+async def run_agent(use_case: AsyncAutonomousAgentUseCase, pool=None) -> bool:
+    """Run the agent, then remove the bisection pool's containers."""
+    try:
+        return await use_case.run()
+    finally:
+        if pool is not None:
+            await pool.close()
+
+
+def create_replay_adapters(
+    cassette_file: Path,
+    observer: CompositeObserverAdapter,
+    speed: float,
+):
+    """Create adapters that replay a recorded cassette.
+
+    Args:
+        cassette_file: Cassette written by ``--record``
+        observer: Observer shared by the use case and the executor
+        speed: Speed factor for recorded durations (0 = no waiting)
 
-    # Create observer adapter
-    observer = ConsoleObserverAdapter(verbose=config.verbose)
+    Returns:
+        Tuple of (executor, healer, observer) adapters
+    """
+    cassette = CassetteReader(cassette_file)
+    async_observer = AsyncObserverBridge(observer)
+    executor = ReplayExecutorAdapter(cassette, observer=async_observer, speed=speed)
+    healer = ReplayHealerAdapter(cassette, speed=speed)
+    return executor, healer, async_observer
+
+
+async def watch(use_case: WatchUseCase) -> bool:
+    """Run watch mode with keyboard and signal controls.
+
+    Typing ``c`` + Enter requests a clean-room run, ``q`` + Enter (or
+    SIGTERM) stops watching.
+
+    Args:
+        use_case: Watch use case to drive
+
+    Returns:
+        True if the last cycle passed
+    """
+    loop = asyncio.get_running_loop()
+    loop.add_signal_handler(signal.SIGTERM, use_case.stop)
+
+    def on_input():
+        command = sys.stdin.readline()
+        if not command or command.strip() == "q":
+            loop.remove_reader(sys.stdin.fileno())
+            use_case.stop()
+        elif command.strip() == "c":
+            use_case.request_clean_room()
+
+    if sys.stdin.isatty():
+        loop.add_reader(sys.stdin.fileno(), on_input)
+    return await use_case.run()
+
+
+async def run_matrix(
+    matrix: MatrixDefinition,
+    project_root: Path,
+    parallel: int,
+    observer: AsyncObserverBridge,
+):
+    """Run a test matrix on pooled containers.
+
+    Cells lease containers from a pool that keeps none idle: with the
+    image cache, each scenario and image is prepared once and committed,
+    and containers of the same Fedora release share a dnf cache volume.
 
-    return executor, healer, observer
+    Returns:
+        The matrix summary
+    """
+    env = Settings.get_ansible_env()
+    env["ANSIBLE_LOG_PATH"] = str(project_root / Settings.ANSIBLE_LOG_FILE)
+    mirror = create_artifact_mirror(project_root) if Settings.MIRROR_ENABLED else None
+    if mirror is not None:
+        env["MOLECULE_ARTIFACT_MIRROR_URL"] = mirror.start()
+    pool = PodmanContainerPoolAdapter(
+        project_root=project_root,
+        env=env,
+        size=0,
+        package_cache=create_dnf_cache(env),
+        image_cache=Settings.POOL_IMAGE_CACHE,
+    )
+    use_case = MatrixUseCase(
+        matrix=matrix,
+        executor_factory=lambda cell: PooledExecutorAdapter(
+            pool=pool,
+            scenario=matrix.scenario,
+            env=env,
+            project_root=project_root,
+            image=cell.image,
+            extra_vars=cell.overlay,
+        ),
+        observer=observer,
+        parallel=parallel,
+    )
+    try:
+        return await use_case.run()
+    finally:
+        await pool.close()
+        if mirror is not None:
+            mirror.stop()
 
 
-def save_summary(summary: dict, project_root: Path):
+def save_summary(summary: dict, project_root: Path, filename: str = ".agent-summary.json"):
     """Save agent run summary to file.
 
     Args:
         summary: Summary dictionary
         project_root: Project root directory
+        filename: Summary file name under the project root
     """
-    summary_file = project_root / ".agent-summary.json"
+    summary_file = project_root / filename
     with open(summary_file, "w") as f:
         json.dump(summary, f, indent=2)
     print(f"\nSummary saved to: {summary_file}")
@@ -143,25 +635,204 @@ def main():
         skip_final=args.skip_final,
         project_root=project_root,
         verbose=args.verbose,
+        stall_limit=args.stall_limit,
     )
 
+    if args.daemon:
+        daemon = AgentDaemon(
+            project_root=project_root,
+            socket_path=args.daemon_socket,
+            scenarios=[config.scenario],
+            pool_size=args.pool_size,
+            max_uses=args.pool_max_uses,
+        )
+        asyncio.run(daemon.serve())
+        return
+
     # Create adapters
-    executor, healer, observer = create_adapters(config)
+    observer = create_observer(
+        config,
+        events_file=args.events_file,
+        metrics_file=args.metrics_file,
+        output_policy=args.output_policy,
+    )
+
+    if args.use_daemon:
+        # Thin client: the daemon runs the job, events are replayed locally
+        try:
+            success, summary = run_via_daemon(
+                args.daemon_socket,
+                {
+                    "scenario": config.scenario,
+                    "max_retries": config.max_retries,
+                    "skip_final": config.skip_final,
+                    "verbose": config.verbose,
+                    "stall_limit": config.stall_limit,
+                },
+                observer,
+            )
+            if summary:
+                save_summary(summary, project_root)
+            sys.exit(0 if success else 1)
+        except KeyboardInterrupt:
+            observer.log(LogLevel.INFO, "Agent stopped by user")
+            sys.exit(130)
+        except OSError as e:
+            observer.log(LogLevel.CRITICAL, f"Cannot reach daemon at {args.daemon_socket}: {e}")
+            sys.exit(1)
+        finally:
+            observer.close()
+    if args.fleet:
+        env = Settings.get_ansible_env()
+        env["ANSIBLE_LOG_PATH"] = str(project_root / Settings.ANSIBLE_LOG_FILE)
+        async_observer = AsyncObserverBridge(observer)
+        use_case = FleetUseCase(
+            executor=AnsibleFleetExecutorAdapter(
+                project_root=project_root,
+                env=env,
+                inventory=args.inventory,
+                observer=async_observer,
+            ),
+            observer=async_observer,
+            pattern=args.fleet,
+            wave_size=args.wave_size,
+            max_forks=args.max_forks,
+            max_fail_percent=args.max_fail_percent,
+            forks_per_cpu=Settings.FLEET_FORKS_PER_CPU,
+            memory_per_fork_mb=Settings.FLEET_MEMORY_PER_FORK_MB,
+        )
+        try:
+            summary = asyncio.run(use_case.run())
+            save_summary(summary.to_dict(), project_root, Settings.FLEET_SUMMARY_FILE)
+            sys.exit(0 if summary.success else 1)
+        except KeyboardInterrupt:
+            observer.log(LogLevel.INFO, "Fleet run stopped by user")
+            sys.exit(130)
+        finally:
+            observer.close()
+
+    if args.matrix:
+        import yaml  # ships with ansible-core
+
+        try:
+            with open(args.matrix, encoding="utf-8") as f:
+                matrix = MatrixDefinition.from_dict(yaml.safe_load(f) or {}, config.scenario)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            observer.log(LogLevel.CRITICAL, f"Cannot load matrix {args.matrix}: {e}")
+            observer.close()
+            sys.exit(1)
+        try:
+            summary = asyncio.run(run_matrix(
+                matrix, project_root, args.matrix_parallel, AsyncObserverBridge(observer)
+            ))
+            save_summary(summary.to_dict(), project_root, Settings.MATRIX_SUMMARY_FILE)
+            sys.exit(0 if summary.success else 1)
+        except KeyboardInterrupt:
+            observer.log(LogLevel.INFO, "Matrix run stopped by user")
+            sys.exit(130)
+        finally:
+            observer.close()
+
+    mirror = None
+    if args.replay:
+        executor, healer, async_observer = create_replay_adapters(
+            args.replay, observer, args.replay_speed
+        )
+        # The use case's own pauses wait for real containers; scale them too
+        scale = 1 / args.replay_speed if args.replay_speed > 0 else 0
+        config = dataclasses.replace(
+            config,
+            retry_delay=config.retry_delay * scale,
+            settle_delay=config.settle_delay * scale,
+        )
+        if executor.get_scenario_name() != config.scenario:
+            observer.log(
+                LogLevel.WARNING,
+                f"Replaying scenario {executor.get_scenario_name()!r} recorded in {args.replay}",
+            )
+    else:
+        env, mirror = create_env(config, observer)
+        executor, healer, async_observer = create_adapters(config, observer, args.executor, env)
+
+    if args.record:
+        cassette = CassetteWriter(
+            args.record,
+            scenario=config.scenario,
+            executor=args.executor,
+            healer=healer.get_healer_name(),
+        )
+        executor = RecordingExecutorAdapter(executor, cassette)
+        healer = RecordingHealerAdapter(healer, cassette)
+
+    if args.watch:
+        roles_dir = project_root / Settings.ROLES_DIR
+        watcher = InotifyWatcherAdapter(
+            [roles_dir, project_root / Settings.PLAYBOOK_FILE],
+            debounce=args.watch_debounce,
+            poll_interval=Settings.WATCH_POLL_INTERVAL,
+        )
+        use_case = WatchUseCase(
+            config=config,
+            executor=executor,
+            watcher=watcher,
+            observer=async_observer,
+            roles_dir=roles_dir,
+            planner=StaticPlanCompilerAdapter(project_root=project_root, roles_dir=roles_dir),
+        )
+        try:
+            sys.exit(0 if asyncio.run(watch(use_case)) else 1)
+        except KeyboardInterrupt:
+            observer.log(LogLevel.INFO, "Watch mode stopped by user")
+            sys.exit(130)
+        finally:
+            if mirror is not None:
+                mirror.stop()
+            observer.close()
+
+    # A replay keeps its journal, error store and summary in a scratch
+    # directory and archives nothing: it must not touch the project's state
+    state_root = Path(tempfile.mkdtemp(prefix="agent-replay-")) if args.replay else project_root
+
+    # Checkpoint journal - resume from it or start a fresh history
+    state_store = JournalStateStoreAdapter(state_root / Settings.JOURNAL_FILE)
+    resume_state = None
+    if args.resume:
+        resume_state = state_store.load_latest(config)
+        if resume_state is None:
+            observer.log(LogLevel.INFO, "No interrupted run found; starting fresh")
+    if resume_state is None:
+        state_store.reset()
+
+    bisector, bisect_pool = None, None
+    if args.bisect:
+        bisector, bisect_pool = create_bisector(config, env, async_observer, args.bisect_parallel)
 
     # Create and run use case
-    use_case = AutonomousAgentUseCase(
+    use_case = AsyncAutonomousAgentUseCase(
         config=config,
         executor=executor,
         healer=healer,
-        observer=observer,
+        observer=async_observer,
+        state_store=state_store,
+        resume_state=resume_state,
+        error_store=FileErrorStoreAdapter(state_root / Settings.ERROR_STORE_DIR),
+        artifact_archive=None if args.replay else ArtifactArchiveAdapter(
+            root=project_root / Settings.ARTIFACT_DIR,
+            project_root=project_root,
+            ansible_log=project_root / Settings.ANSIBLE_LOG_FILE,
+            max_iterations=Settings.ARTIFACT_MAX_ITERATIONS,
+            max_bytes=Settings.ARTIFACT_MAX_MB * 1024 * 1024,
+            ansible_log_max_bytes=Settings.ANSIBLE_LOG_MAX_MB * 1024 * 1024,
+        ),
+        bisector=bisector,
     )
 
     try:
-        success = use_case.run()
+        success = asyncio.run(run_agent(use_case, bisect_pool))
 
         # Save summary
         summary = use_case.state.get_summary()
-        save_summary(summary, project_root)
+        save_summary(summary, state_root)
 
         sys.exit(0 if success else 1)
 
@@ -177,6 +848,11 @@ def main():
             f"Unexpected error: {e}"
         )
         sys.exit(1)
+    finally:
+        if mirror is not None:
+            mirror.stop()
+        # Drain queued events before the interpreter exits
+        observer.close()
 
 
 if __name__ == "__main__":
@@ -5,12 +5,60 @@ Contains Use Cases (Orchestrators) and Ports (Interfaces).
 Use Cases contain application logic but NO infrastructure details.
 """
 
-from src.application.ports import ExecutorPort, HealerPort, ObserverPort
-from src.application.use_cases import AutonomousAgentUseCase
+from src.application.ports import (
+    ExecutorPort,
+    HealerPort,
+    ObserverPort,
+    StateStorePort,
+    ErrorStorePort,
+    ArtifactArchivePort,
+    AsyncExecutorPort,
+    AsyncHealerPort,
+    AsyncObserverPort,
+    ContainerPoolPort,
+    FileWatcherPort,
+    PackageCachePort,
+    ArtifactMirrorPort,
+    PlanCompilerPort,
+    FleetExecutorPort,
+)
+from src.application.bridges import (
+    AsyncExecutorBridge,
+    AsyncHealerBridge,
+    AsyncObserverBridge,
+)
+from src.application.use_cases import (
+    AutonomousAgentUseCase,
+    AsyncAutonomousAgentUseCase,
+    WatchUseCase,
+    FleetUseCase,
+    MatrixUseCase,
+    BisectUseCase,
+)
 
 __all__ = [
     "ExecutorPort",
     "HealerPort",
     "ObserverPort",
+    "StateStorePort",
+    "ErrorStorePort",
+    "ArtifactArchivePort",
+    "AsyncExecutorPort",
+    "AsyncHealerPort",
+    "AsyncObserverPort",
+    "ContainerPoolPort",
+    "FileWatcherPort",
+    "PackageCachePort",
+    "ArtifactMirrorPort",
+    "PlanCompilerPort",
+    "FleetExecutorPort",
+    "AsyncExecutorBridge",
+    "AsyncHealerBridge",
+    "AsyncObserverBridge",
     "AutonomousAgentUseCase",
+    "AsyncAutonomousAgentUseCase",
+    "WatchUseCase",
+    "FleetUseCase",
+    "MatrixUseCase",
+    "BisectUseCase",
 ]
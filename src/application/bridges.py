@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: MIT-0
+"""Bridges from synchronous ports to their async counterparts.
+
+These let the async use case drive any synchronous adapter: blocking
+executor and healer calls run in worker threads, so several of them can
+still be awaited concurrently. Observers are called inline because
+ObserverPort implementations must not block (see CompositeObserverAdapter).
+"""
+
+import asyncio
+from typing import List, Optional
+
+from src.domain.models import TestResult, FixRecord
+from src.application.ports import (
+    ExecutorPort,
+    HealerPort,
+    ObserverPort,
+    AsyncExecutorPort,
+    AsyncHealerPort,
+    AsyncObserverPort,
+    LogLevel,
+)
+
+
+class AsyncExecutorBridge(AsyncExecutorPort):
+    """Run a synchronous ExecutorPort in worker threads."""
+
+    def __init__(self, executor: ExecutorPort):
+        """Initialize the bridge.
+
+        Args:
+            executor: Synchronous executor to wrap
+        """
+        self.executor = executor
+
+    async def create_containers(self) -> TestResult:
+        """Create test containers."""
+        return await asyncio.to_thread(self.executor.create_containers)
+
+    async def prepare_environment(self) -> TestResult:
+        """Prepare test environment."""
+        return await asyncio.to_thread(self.executor.prepare_environment)
+
+    async def converge(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Run converge (apply playbook), limited to ``tags`` if given."""
+        return await asyncio.to_thread(self.executor.converge, tags)
+
+    async def check_idempotence(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Check idempotence, limited to ``tags`` if given."""
+        return await asyncio.to_thread(self.executor.check_idempotence, tags)
+
+    async def verify(self) -> TestResult:
+        """Run verification tests."""
+        return await asyncio.to_thread(self.executor.verify)
+
+    async def run_full_test(self) -> TestResult:
+        """Run complete test suite."""
+        return await asyncio.to_thread(self.executor.run_full_test)
+
+    async def destroy_containers(self) -> TestResult:
+        """Destroy all containers."""
+        return await asyncio.to_thread(self.executor.destroy_containers)
+
+    async def cleanup(self) -> TestResult:
+        """Cleanup temporary files."""
+        return await asyncio.to_thread(self.executor.cleanup)
+
+    async def get_container_identity(self) -> dict:
+        """Get an identity for the live test containers (empty if none)."""
+        return await asyncio.to_thread(self.executor.get_container_identity)
+
+    async def is_alive(self, identity: dict) -> bool:
+        """Check if the containers described by ``identity`` still run."""
+        return await asyncio.to_thread(self.executor.is_alive, identity)
+
+    def get_scenario_name(self) -> str:
+        """Get the current scenario name."""
+        return self.executor.get_scenario_name()
+
+
+class AsyncHealerBridge(AsyncHealerPort):
+    """Run a synchronous HealerPort in a worker thread."""
+
+    def __init__(self, healer: HealerPort):
+        """Initialize the bridge.
+
+        Args:
+            healer: Synchronous healer to wrap
+        """
+        self.healer = healer
+
+    async def analyze_and_fix(
+        self,
+        error_output: str,
+        iteration: int,
+        state: "AgentState",
+    ) -> FixRecord:
+        """Analyze error and attempt to fix it."""
+        return await asyncio.to_thread(
+            self.healer.analyze_and_fix,
+            error_output=error_output,
+            iteration=iteration,
+            state=state,
+        )
+
+    async def is_available(self) -> bool:
+        """Check if healer is available."""
+        return await asyncio.to_thread(self.healer.is_available)
+
+    def get_healer_name(self) -> str:
+        """Get the name of this healer implementation."""
+        return self.healer.get_healer_name()
+
+
+class AsyncObserverBridge(AsyncObserverPort):
+    """Forward events to a non-blocking synchronous ObserverPort."""
+
+    def __init__(self, observer: ObserverPort):
+        """Initialize the bridge.
+
+        Args:
+            observer: Synchronous observer to wrap
+        """
+        self.observer = observer
+
+    async def log(self, level: LogLevel, message: str) -> None:
+        """Log a message."""
+        self.observer.log(level, message)
+
+    async def on_iteration_start(self, iteration: int, max_retries: int) -> None:
+        """Called when a new iteration starts."""
+        self.observer.on_iteration_start(iteration, max_retries)
+
+    async def on_iteration_complete(self, iteration: int, success: bool) -> None:
+        """Called when an iteration completes."""
+        self.observer.on_iteration_complete(iteration, success)
+
+    async def on_test_start(self, phase: str) -> None:
+        """Called when a test phase starts."""
+        self.observer.on_test_start(phase)
+
+    async def on_test_complete(self, result: TestResult) -> None:
+        """Called when a test phase completes."""
+        self.observer.on_test_complete(result)
+
+    async def on_output(self, phase: str, lines: List[str]) -> None:
+        """Called with a batch of streamed command output lines."""
+        self.observer.on_output(phase, lines)
+
+    async def on_healing_start(self, iteration: int) -> None:
+        """Called when healing starts."""
+        self.observer.on_healing_start(iteration)
+
+    async def on_healing_complete(self, fix_record: FixRecord) -> None:
+        """Called when healing completes."""
+        self.observer.on_healing_complete(fix_record)
+
+    async def on_phase_change(self, phase: str) -> None:
+        """Called when agent phase changes."""
+        self.observer.on_phase_change(phase)
+
+    async def on_summary(self, summary: dict) -> None:
+        """Called to display final summary."""
+        self.observer.on_summary(summary)
+
+    async def close(self) -> None:
+        """Drain and close the wrapped observer without blocking the loop."""
+        await asyncio.to_thread(self.observer.close)
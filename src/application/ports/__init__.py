@@ -9,10 +9,34 @@ Following Hexagonal Architecture: Domain → Ports → Adapters
 from src.application.ports.executor_port import ExecutorPort
 from src.application.ports.healer_port import HealerPort
 from src.application.ports.observer_port import ObserverPort, LogLevel
+from src.application.ports.state_store_port import StateStorePort
+from src.application.ports.error_store_port import ErrorStorePort
+from src.application.ports.artifact_archive_port import ArtifactArchivePort
+from src.application.ports.async_executor_port import AsyncExecutorPort
+from src.application.ports.async_healer_port import AsyncHealerPort
+from src.application.ports.async_observer_port import AsyncObserverPort
+from src.application.ports.container_pool_port import ContainerPoolPort
+from src.application.ports.file_watcher_port import FileWatcherPort
+from src.application.ports.package_cache_port import PackageCachePort
+from src.application.ports.artifact_mirror_port import ArtifactMirrorPort
+from src.application.ports.plan_compiler_port import PlanCompilerPort
+from src.application.ports.fleet_executor_port import FleetExecutorPort
 
 __all__ = [
     "ExecutorPort",
     "HealerPort",
     "ObserverPort",
     "LogLevel",
+    "StateStorePort",
+    "ErrorStorePort",
+    "ArtifactArchivePort",
+    "AsyncExecutorPort",
+    "AsyncHealerPort",
+    "AsyncObserverPort",
+    "ContainerPoolPort",
+    "FileWatcherPort",
+    "PackageCachePort",
+    "ArtifactMirrorPort",
+    "PlanCompilerPort",
+    "FleetExecutorPort",
 ]
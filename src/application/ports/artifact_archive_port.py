@@ -0,0 +1,43 @@
+# SPDX-License-Identifier: MIT-0
+"""Artifact Archive Port - Interface for per-iteration artifacts.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this for compressed archives, etc.
+"""
+
+from abc import ABC, abstractmethod
+
+from src.domain.models import TestResult, FixRecord
+
+
+class ArtifactArchivePort(ABC):
+    """Port for archiving everything an iteration produced.
+
+    Abstract interface that defines HOW iteration artifacts (test output,
+    logs, healer transcripts and diffs) are collected for post-mortems.
+    """
+
+    @abstractmethod
+    def begin_iteration(self, iteration: int, agent_phase: str) -> None:
+        """Start collecting artifacts for an iteration."""
+        pass
+
+    @abstractmethod
+    def add_test_result(self, result: TestResult) -> None:
+        """Archive the output of a test phase."""
+        pass
+
+    @abstractmethod
+    def begin_heal(self) -> None:
+        """Mark the start of a heal; its changes are measured from here."""
+        pass
+
+    @abstractmethod
+    def add_fix_record(self, fix_record: FixRecord) -> None:
+        """Archive a healer transcript and the changes it made."""
+        pass
+
+    @abstractmethod
+    def end_iteration(self) -> None:
+        """Finish the iteration archive and apply retention."""
+        pass
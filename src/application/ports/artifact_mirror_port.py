@@ -0,0 +1,53 @@
+# SPDX-License-Identifier: MIT-0
+"""Artifact Mirror Port - Interface for a local download mirror.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this with a local HTTP server, etc.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class ArtifactMirrorPort(ABC):
+    """Port for a local, content-addressed mirror of role downloads.
+
+    Test containers fetch artifacts and git repositories through the
+    mirror, so converge only touches the network the first time an
+    artifact is needed.
+    """
+
+    @abstractmethod
+    def start(self) -> str:
+        """Start serving the mirror.
+
+        Returns:
+            Base URL under which test containers reach the mirror
+        """
+        pass
+
+    @abstractmethod
+    def seed(self, url: str) -> str:
+        """Fetch and store an artifact unless it is already mirrored.
+
+        Args:
+            url: Original download URL
+
+        Returns:
+            SHA-256 of the artifact content
+        """
+        pass
+
+    @abstractmethod
+    def seed_git(self, repo: str) -> None:
+        """Mirror a git repository unless it is already mirrored."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Get mirrored artifact and repository counts and sizes."""
+        pass
+
+    @abstractmethod
+    def stop(self) -> None:
+        """Stop serving the mirror."""
+        pass
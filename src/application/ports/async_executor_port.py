@@ -0,0 +1,75 @@
+# SPDX-License-Identifier: MIT-0
+"""Async Executor Port - Interface for non-blocking test execution.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this with asyncio subprocesses.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+from src.domain.models import TestResult
+
+
+class AsyncExecutorPort(ABC):
+    """Port for executing tests without blocking the event loop.
+
+    Async counterpart of ExecutorPort. Several operations may be awaited
+    concurrently (e.g. tearing down one run while healing), so
+    implementations must not share per-call state between them.
+    """
+
+    @abstractmethod
+    async def create_containers(self) -> TestResult:
+        """Create test containers."""
+        pass
+
+    @abstractmethod
+    async def prepare_environment(self) -> TestResult:
+        """Prepare test environment."""
+        pass
+
+    @abstractmethod
+    async def converge(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Run converge (apply playbook), limited to ``tags`` if given."""
+        pass
+
+    @abstractmethod
+    async def check_idempotence(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Check idempotence, limited to ``tags`` if given."""
+        pass
+
+    @abstractmethod
+    async def verify(self) -> TestResult:
+        """Run verification tests."""
+        pass
+
+    @abstractmethod
+    async def run_full_test(self) -> TestResult:
+        """Run complete test suite."""
+        pass
+
+    @abstractmethod
+    async def destroy_containers(self) -> TestResult:
+        """Destroy all containers."""
+        pass
+
+    @abstractmethod
+    async def cleanup(self) -> TestResult:
+        """Cleanup temporary files."""
+        pass
+
+    @abstractmethod
+    async def get_container_identity(self) -> dict:
+        """Get an identity for the live test containers (empty if none)."""
+        pass
+
+    @abstractmethod
+    async def is_alive(self, identity: dict) -> bool:
+        """Check if the containers described by ``identity`` still run."""
+        pass
+
+    @abstractmethod
+    def get_scenario_name(self) -> str:
+        """Get the current scenario name."""
+        pass
@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: MIT-0
+"""Async Healer Port - Interface for non-blocking self-healing.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this with asyncio subprocesses.
+"""
+
+from abc import ABC, abstractmethod
+
+from src.domain.models import FixRecord
+
+
+class AsyncHealerPort(ABC):
+    """Port for self-healing without blocking the event loop.
+
+    Async counterpart of HealerPort. Cancelling ``analyze_and_fix`` must
+    stop the underlying healer process.
+    """
+
+    @abstractmethod
+    async def analyze_and_fix(
+        self,
+        error_output: str,
+        iteration: int,
+        state: "AgentState",
+    ) -> FixRecord:
+        """Analyze error and attempt to fix it.
+
+        Args:
+            error_output: The error output from failed test
+            iteration: Current iteration number
+            state: Current agent state
+
+        Returns:
+            FixRecord with status and details
+        """
+        pass
+
+    @abstractmethod
+    async def is_available(self) -> bool:
+        """Check if healer is available (e.g., Claude CLI installed)."""
+        pass
+
+    @abstractmethod
+    def get_healer_name(self) -> str:
+        """Get the name of this healer implementation."""
+        pass
@@ -0,0 +1,77 @@
+# SPDX-License-Identifier: MIT-0
+"""Async Observer Port - Interface for logging and monitoring from coroutines.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this for console, file, etc.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List
+
+from src.domain.models import TestResult, FixRecord
+from src.application.ports.observer_port import LogLevel
+
+
+class AsyncObserverPort(ABC):
+    """Port for observing agent activities from the event loop.
+
+    Async counterpart of ObserverPort. Implementations should return
+    quickly; slow sinks belong behind a queue.
+    """
+
+    @abstractmethod
+    async def log(self, level: LogLevel, message: str) -> None:
+        """Log a message."""
+        pass
+
+    @abstractmethod
+    async def on_iteration_start(self, iteration: int, max_retries: int) -> None:
+        """Called when a new iteration starts."""
+        pass
+
+    @abstractmethod
+    async def on_iteration_complete(self, iteration: int, success: bool) -> None:
+        """Called when an iteration completes."""
+        pass
+
+    @abstractmethod
+    async def on_test_start(self, phase: str) -> None:
+        """Called when a test phase starts."""
+        pass
+
+    @abstractmethod
+    async def on_test_complete(self, result: TestResult) -> None:
+        """Called when a test phase completes."""
+        pass
+
+    @abstractmethod
+    async def on_output(self, phase: str, lines: List[str]) -> None:
+        """Called with a batch of streamed command output lines."""
+        pass
+
+    @abstractmethod
+    async def on_healing_start(self, iteration: int) -> None:
+        """Called when healing starts."""
+        pass
+
+    @abstractmethod
+    async def on_healing_complete(self, fix_record: FixRecord) -> None:
+        """Called when healing completes."""
+        pass
+
+    @abstractmethod
+    async def on_phase_change(self, phase: str) -> None:
+        """Called when agent phase changes."""
+        pass
+
+    @abstractmethod
+    async def on_summary(self, summary: dict) -> None:
+        """Called to display final summary."""
+        pass
+
+    async def close(self) -> None:
+        """Flush pending observations and release resources.
+
+        Optional hook - observers without buffered state need not override it.
+        """
+        pass
@@ -0,0 +1,45 @@
+# SPDX-License-Identifier: MIT-0
+"""Container Pool Port - Interface for warm test containers.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this for Podman, Docker, etc.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class ContainerPoolPort(ABC):
+    """Port for leasing pre-created, pre-prepared test containers.
+
+    A lease is a dictionary with at least ``name``, ``id``, ``scenario``
+    and ``uses`` (how many runs the container has served before).
+    """
+
+    @abstractmethod
+    async def acquire(self, scenario: str, fresh: bool = False, image: str = None) -> dict:
+        """Lease a healthy warm container for a scenario.
+
+        Args:
+            scenario: Molecule scenario the container is prepared for
+            fresh: Only hand out a container that has never been used
+            image: Image to use instead of the scenario's platform image
+
+        Returns:
+            The lease
+        """
+        pass
+
+    @abstractmethod
+    async def release(self, lease: dict) -> None:
+        """Return a leased container to the pool (or recycle it)."""
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Get pool statistics per scenario (and image override)."""
+        pass
+
+    @abstractmethod
+    async def close(self) -> None:
+        """Remove every pooled container."""
+        pass
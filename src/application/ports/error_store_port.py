@@ -0,0 +1,28 @@
+# SPDX-License-Identifier: MIT-0
+"""Error Store Port - Interface for full error history.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this for compressed files, etc.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class ErrorStorePort(ABC):
+    """Port for content-addressed error storage.
+
+    Abstract interface that defines HOW full error text is kept.
+    Errors are addressed by a fingerprint, so identical errors seen in
+    different iterations are stored once.
+    """
+
+    @abstractmethod
+    def put(self, error_text: str) -> str:
+        """Store an error (if not already known) and return its fingerprint."""
+        pass
+
+    @abstractmethod
+    def get(self, fingerprint: str) -> Optional[str]:
+        """Get the full error text for a fingerprint, or None if unknown."""
+        pass
@@ -6,7 +6,7 @@ Infrastructure adapters will implement this for Molecule, Podman, etc.
 """
 
 from abc import ABC, abstractmethod
-from typing import Tuple
+from typing import List, Optional, Tuple
 
 from src.domain.models import TestResult, TestPhase
 
@@ -30,13 +30,13 @@ class ExecutorPort(ABC):
         pass
 
     @abstractmethod
-    def converge(self) -> TestResult:
-        """Run converge (apply playbook)."""
+    def converge(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Run converge (apply playbook), limited to ``tags`` if given."""
         pass
 
     @abstractmethod
-    def check_idempotence(self) -> TestResult:
-        """Check idempotence."""
+    def check_idempotence(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Check idempotence, limited to ``tags`` if given."""
         pass
 
     @abstractmethod
@@ -59,6 +59,16 @@ class ExecutorPort(ABC):
         """Cleanup temporary files."""
         pass
 
+    @abstractmethod
+    def get_container_identity(self) -> dict:
+        """Get an identity for the live test containers (empty if none)."""
+        pass
+
+    @abstractmethod
+    def is_alive(self, identity: dict) -> bool:
+        """Check if the containers described by ``identity`` still run."""
+        pass
+
     @abstractmethod
     def get_scenario_name(self) -> str:
         """Get the current scenario name."""
@@ -0,0 +1,32 @@
+# SPDX-License-Identifier: MIT-0
+"""File Watcher Port - Interface for source change notifications.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this with inotify, polling, etc.
+"""
+
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Set
+
+
+class FileWatcherPort(ABC):
+    """Port for watching files for changes.
+
+    Changes that arrive close together (an editor saving several files,
+    a ``git checkout``) are delivered as one batch.
+    """
+
+    @abstractmethod
+    async def next_batch(self) -> Set[Path]:
+        """Wait for the next batch of changed files.
+
+        Returns:
+            Paths that were created, modified, moved or deleted
+        """
+        pass
+
+    @abstractmethod
+    def close(self) -> None:
+        """Stop watching and release resources."""
+        pass
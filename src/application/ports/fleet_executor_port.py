@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: MIT-0
+"""Fleet Executor Port - Interface for running the playbook on many hosts.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this with ansible-playbook, etc.
+"""
+
+from abc import ABC, abstractmethod
+from typing import List, Sequence
+
+from src.domain.models import ControllerStats, FleetWave
+
+
+class FleetExecutorPort(ABC):
+    """Port for applying the playbook to shards of an inventory."""
+
+    @abstractmethod
+    async def list_hosts(self, pattern: str) -> List[str]:
+        """Resolve a host pattern against the inventory.
+
+        Args:
+            pattern: Ansible host pattern (group, host, ``a:&b``, ...)
+
+        Returns:
+            Matching hosts in inventory order
+        """
+        pass
+
+    @abstractmethod
+    async def run_wave(self, index: int, hosts: Sequence[str], forks: int) -> FleetWave:
+        """Apply the playbook to one wave of hosts.
+
+        Args:
+            index: Wave number (1-based)
+            hosts: Hosts of the wave
+            forks: Parallel host connections
+
+        Returns:
+            The wave, with the recap of every host that ran
+        """
+        pass
+
+    @abstractmethod
+    def controller_stats(self) -> ControllerStats:
+        """Get the controller's CPUs, available memory and load."""
+        pass
+
+    @abstractmethod
+    def get_playbook(self) -> str:
+        """Get the playbook the fleet runs."""
+        pass
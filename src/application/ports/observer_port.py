@@ -7,6 +7,7 @@ Infrastructure adapters will implement this for console, file, etc.
 
 from abc import ABC, abstractmethod
 from enum import Enum
+from typing import List
 
 from src.domain.models import AgentState, TestResult, FixRecord
 
@@ -54,6 +55,11 @@ class ObserverPort(ABC):
         """Called when a test phase completes."""
         pass
 
+    @abstractmethod
+    def on_output(self, phase: str, lines: List[str]) -> None:
+        """Called with a batch of streamed command output lines."""
+        pass
+
     @abstractmethod
     def on_healing_start(self, iteration: int) -> None:
         """Called when healing starts."""
@@ -73,3 +79,10 @@ class ObserverPort(ABC):
     def on_summary(self, summary: dict) -> None:
         """Called to display final summary."""
         pass
+
+    def close(self) -> None:
+        """Flush pending observations and release resources.
+
+        Optional hook - observers without buffered state need not override it.
+        """
+        pass
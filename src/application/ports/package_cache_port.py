@@ -0,0 +1,47 @@
+# SPDX-License-Identifier: MIT-0
+"""Package Cache Port - Interface for shared package caches.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this for dnf, apt, etc.
+"""
+
+from abc import ABC, abstractmethod
+
+
+class PackageCachePort(ABC):
+    """Port for package caches shared by all test containers.
+
+    One cache exists per distribution release, so containers of the same
+    release reuse downloaded packages and repository metadata.
+    """
+
+    @abstractmethod
+    def release_of(self, image: str) -> str:
+        """Get the distribution release a container image belongs to."""
+        pass
+
+    @abstractmethod
+    def ensure(self, release: str) -> str:
+        """Make sure the cache for a release exists.
+
+        Args:
+            release: Distribution release (e.g. "43")
+
+        Returns:
+            Name the test containers mount the cache by
+        """
+        pass
+
+    @abstractmethod
+    def prune(self) -> dict:
+        """Shrink the caches to their configured limits.
+
+        Returns:
+            Bytes and files removed
+        """
+        pass
+
+    @abstractmethod
+    def stats(self) -> dict:
+        """Get size and package count per cache."""
+        pass
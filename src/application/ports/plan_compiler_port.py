@@ -0,0 +1,37 @@
+# SPDX-License-Identifier: MIT-0
+"""Plan Compiler Port - Interface for static playbook plans.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this by parsing playbooks, etc.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.models import TaskPlan
+
+
+class PlanCompilerPort(ABC):
+    """Port for resolving a playbook into its effective task list.
+
+    A plan is computed without running Ansible, so it is cheap enough to
+    rebuild after every source change.
+    """
+
+    @abstractmethod
+    def compile(
+        self,
+        scenario: Optional[str] = None,
+        extra_vars: Optional[dict] = None,
+    ) -> TaskPlan:
+        """Resolve a playbook into its ordered tasks.
+
+        Args:
+            scenario: Molecule scenario whose converge playbook and
+                group_vars to use (None for the main playbook and inventory)
+            extra_vars: Variables with the highest precedence (like ``-e``)
+
+        Returns:
+            The task plan
+        """
+        pass
@@ -0,0 +1,44 @@
+# SPDX-License-Identifier: MIT-0
+"""State Store Port - Interface for run-history persistence.
+
+This is a Port (Interface) in Hexagonal Architecture.
+Infrastructure adapters will implement this for journals, SQLite, etc.
+"""
+
+from abc import ABC, abstractmethod
+from typing import Optional
+
+from src.domain.models import AgentConfig, AgentState
+
+
+class StateStorePort(ABC):
+    """Port for checkpointing agent state.
+
+    Abstract interface that defines HOW agent state survives a crash.
+    Concrete implementations (JournalStateStore, SqliteStateStore, etc.)
+    are in the infrastructure layer.
+    """
+
+    @abstractmethod
+    def checkpoint(self, state: AgentState) -> None:
+        """Durably persist a snapshot of the state.
+
+        Must be crash-safe: a snapshot interrupted mid-write may be lost,
+        but it must never corrupt earlier snapshots.
+        """
+        pass
+
+    @abstractmethod
+    def load_latest(self, config: AgentConfig) -> Optional[AgentState]:
+        """Load the latest resumable state for the configured scenario.
+
+        Returns:
+            The last checkpointed state, or None if there is no
+            interrupted run to resume
+        """
+        pass
+
+    @abstractmethod
+    def reset(self) -> None:
+        """Discard stored history before a fresh run."""
+        pass
@@ -6,7 +6,17 @@ Use Cases contain application logic but NO infrastructure details.
 """
 
 from src.application.use_cases.agent_use_case import AutonomousAgentUseCase
+from src.application.use_cases.async_agent_use_case import AsyncAutonomousAgentUseCase
+from src.application.use_cases.watch_use_case import WatchUseCase
+from src.application.use_cases.fleet_use_case import FleetUseCase
+from src.application.use_cases.matrix_use_case import MatrixUseCase
+from src.application.use_cases.bisect_use_case import BisectUseCase
 
 __all__ = [
     "AutonomousAgentUseCase",
+    "AsyncAutonomousAgentUseCase",
+    "WatchUseCase",
+    "FleetUseCase",
+    "MatrixUseCase",
+    "BisectUseCase",
 ]
@@ -0,0 +1,460 @@
+# SPDX-License-Identifier: MIT-0
+"""Async Autonomous Agent Use Case.
+
+This is the orchestrator that coordinates all operations.
+Uses async ports so independent executor and healer operations can be
+awaited concurrently - e.g. tearing down a failed run while healing.
+Following Hexagonal Architecture: Use Case → Ports → Adapters
+"""
+
+import asyncio
+import dataclasses
+from typing import Optional
+
+from src.domain import (
+    AgentConfig,
+    AgentPhase,
+    AgentState,
+    TestResult,
+)
+
+from src.application.ports import (
+    AsyncExecutorPort,
+    AsyncHealerPort,
+    AsyncObserverPort,
+    StateStorePort,
+    ErrorStorePort,
+    ArtifactArchivePort,
+    LogLevel,
+)
+from src.application.use_cases.bisect_use_case import BisectUseCase
+
+
+class AsyncAutonomousAgentUseCase:
+    """Main use case for autonomous testing agent (asyncio-native).
+
+    This use case orchestrates the entire testing and healing process.
+    It depends on abstractions (Ports), not concrete implementations.
+    """
+
+    def __init__(
+        self,
+        config: AgentConfig,
+        executor: AsyncExecutorPort,
+        healer: AsyncHealerPort,
+        observer: AsyncObserverPort,
+        state_store: Optional[StateStorePort] = None,
+        resume_state: Optional[AgentState] = None,
+        error_store: Optional[ErrorStorePort] = None,
+        artifact_archive: Optional[ArtifactArchivePort] = None,
+        bisector: Optional[BisectUseCase] = None,
+    ):
+        """Initialize the use case with required dependencies.
+
+        Args:
+            config: Agent configuration
+            executor: Port for test execution
+            healer: Port for self-healing
+            observer: Port for logging/observation
+            state_store: Port for checkpointing state after every transition
+            resume_state: Checkpointed state of an interrupted run to continue
+            error_store: Port for full, deduplicated error history
+            artifact_archive: Port for per-iteration artifact archives
+            bisector: Localizes full-test failures to the roles they depend on
+                before healing
+        """
+        self.config = config
+        self.executor = executor
+        self.healer = healer
+        self.observer = observer
+        self.state_store = state_store
+        self.error_store = error_store
+        self.artifact_archive = artifact_archive
+        self.bisector = bisector
+        # Full error window of the latest failure (not kept in the state)
+        self._last_error_output: Optional[str] = None
+        # Teardown of a failed run, overlapped with healing
+        self._teardown_task: Optional[asyncio.Task] = None
+        self.state = resume_state or AgentState(config=config)
+        self._resumed = resume_state is not None
+
+        # Steps after which the interrupted iteration can be continued;
+        # after "heal" (or nothing) the next iteration simply starts
+        self._resume_step = None
+        if resume_state and resume_state.last_completed_step in (
+            "create", "prepare", "full_test", "passed", "failed"
+        ):
+            self._resume_step = resume_state.last_completed_step
+
+    def _checkpoint(self) -> None:
+        """Persist the current state if a store is configured."""
+        if self.state_store is not None:
+            self.state_store.checkpoint(self.state)
+
+    async def _on_result(self, result: TestResult) -> None:
+        """Report a test result to the observer and the artifact archive."""
+        await self.observer.on_test_complete(result)
+        if self.artifact_archive is not None:
+            self.artifact_archive.add_test_result(result)
+
+    def _begin_archive(self, iteration: int) -> None:
+        """Start archiving artifacts of an iteration."""
+        if self.artifact_archive is not None:
+            self.artifact_archive.begin_iteration(iteration, self.state.current_phase.value)
+
+    async def _end_archive(self) -> None:
+        """Finish archiving the current iteration (off the event loop)."""
+        if self.artifact_archive is not None:
+            await asyncio.to_thread(self.artifact_archive.end_iteration)
+
+    async def _record_failure(self, phase: str, result: TestResult, fallback: str) -> None:
+        """Record a failed result: full window to the store, reference to the state.
+
+        Args:
+            phase: Phase name the failure is recorded under
+            result: Failed test result
+            fallback: Summary used when the output has no error line
+        """
+        summary = result.get_error_summary() or fallback
+        window = result.get_error_window() or summary
+        fingerprint = self.error_store.put(window) if self.error_store else None
+
+        self._last_error_output = window
+        self.state.record_error(phase, summary, fingerprint)
+
+        position = result.get_failure_position()
+        progressed = self.state.record_failure_position(position)
+        await self.observer.log(
+            LogLevel.INFO,
+            f"Failed at {position.describe()}"
+            + ("" if progressed else " (no progress)")
+        )
+        self._checkpoint()
+
+    def _complete_step(self, step: str) -> None:
+        """Mark a step of the current iteration as done and checkpoint."""
+        self.state.complete_step(step)
+        self._checkpoint()
+
+    def _start_teardown(self, cleanup: bool = True) -> None:
+        """Start destroying the containers of a failed run in the background."""
+        self._teardown_task = asyncio.create_task(self._teardown(cleanup))
+
+    async def _teardown(self, cleanup: bool) -> None:
+        """Destroy containers (and Molecule's temporary files)."""
+        await self.executor.destroy_containers()
+        if cleanup:
+            await self.executor.cleanup()
+        self.state.set_container_identity({})
+        self._checkpoint()
+
+    async def _join_teardown(self) -> None:
+        """Wait for a pending background teardown to finish."""
+        task, self._teardown_task = self._teardown_task, None
+        if task is not None:
+            await task
+
+    async def run(self) -> bool:
+        """Run the full autonomous agent workflow.
+
+        Returns:
+            True if all tests passed, False otherwise
+        """
+        await self.observer.log(
+            LogLevel.INFO,
+            f"Initialized AutonomousAgent with scenario '{self.config.scenario}'"
+        )
+        if self._resumed:
+            await self.observer.log(
+                LogLevel.INFO,
+                f"Resuming run {self.state.run_id} at iteration "
+                f"{self.state.current_iteration} "
+                f"(phase: {self.state.current_phase.value}, "
+                f"last step: {self.state.last_completed_step or 'none'})"
+            )
+
+        try:
+            # Resuming an interrupted finalization: only the cleanup is left
+            if self.state.current_phase == AgentPhase.FINALIZATION and self._resume_step:
+                success = self._resume_step == "passed"
+                await self._finalize(success=success)
+                return success
+
+            # Phase 1: Initial validation with self-healing
+            # (already passed if the run was interrupted during phase 2)
+            if self.state.current_phase != AgentPhase.CLEAN_ROOM_VALIDATION:
+                if not await self._run_initial_validation():
+                    await self._finalize(success=False)
+                    return False
+
+            # Phase 2: Clean-room final validation
+            if not await self._run_clean_room_validation():
+                await self._finalize(success=False)
+                return False
+
+            # Success!
+            await self._finalize(success=True)
+            return True
+
+        except Exception as e:
+            await self.observer.log(LogLevel.CRITICAL, f"Fatal error: {e}")
+            await self._finalize(success=False)
+            return False
+
+    async def _run_initial_validation(self) -> bool:
+        """Phase 1: Initial validation with self-healing loop."""
+        await self.observer.on_phase_change("INITIAL_VALIDATION")
+        self.state.transition_to(AgentPhase.INITIAL_VALIDATION)
+        self._checkpoint()
+
+        resume_step = self._resume_step
+        self._resume_step = None
+
+        while resume_step or self.state.can_retry():
+            if resume_step:
+                # Continue the interrupted iteration instead of starting over
+                iteration = self.state.current_iteration
+            else:
+                iteration = self.state.increment_iteration()
+                self._checkpoint()
+
+            await self.observer.on_iteration_start(iteration, self.config.max_retries)
+            self._begin_archive(iteration)
+
+            if resume_step == "full_test":
+                # Test already failed before the interruption; heal next.
+                # Containers may have survived it, so tear them down again.
+                self._start_teardown()
+                success = False
+            else:
+                # Attempt to run tests
+                success = await self._attempt_test_cycle(iteration, resume_after=resume_step)
+            resume_step = None
+
+            if success:
+                await self._end_archive()
+                await self.observer.on_iteration_complete(iteration, success=True)
+                await self.observer.log(
+                    LogLevel.INFO,
+                    f"All tests passed in {iteration} iteration(s)"
+                )
+                return True
+
+            # Failed - attempt healing
+            await self.observer.on_iteration_complete(iteration, success=False)
+
+            if self.state.is_stalled():
+                # Healing keeps failing at the same spot; stop paying for runs
+                await self._end_archive()
+                await self.observer.log(
+                    LogLevel.ERROR,
+                    f"No progress for {self.state.iterations_without_progress()} "
+                    f"iteration(s) (stall limit: {self.config.stall_limit}); stopping early"
+                )
+                return False
+
+            if self.state.can_retry():
+                # Heal while the failed run's containers are torn down
+                await asyncio.gather(
+                    self._attempt_healing(iteration),
+                    self._join_teardown(),
+                )
+                await self._end_archive()
+                # Brief pause before retry
+                await asyncio.sleep(self.config.retry_delay)
+            else:
+                await self._end_archive()
+                await self.observer.log(
+                    LogLevel.ERROR,
+                    f"Max retries ({self.config.max_retries}) exceeded"
+                )
+                return False
+
+        return False
+
+    async def _attempt_test_cycle(self, iteration: int, resume_after: Optional[str] = None) -> bool:
+        """Attempt a single test cycle.
+
+        On failure the containers are torn down in the background; the
+        caller joins that teardown while healing.
+
+        Args:
+            iteration: Current iteration number
+            resume_after: Last step completed before an interruption
+                ("create" or "prepare"); live containers are reattached
+
+        Returns:
+            True if all tests passed, False otherwise
+        """
+        await self._join_teardown()
+
+        reattached = False
+        if resume_after in ("create", "prepare"):
+            reattached = await self.executor.is_alive(self.state.container_identity)
+            await self.observer.log(
+                LogLevel.INFO,
+                "Reattached to live containers" if reattached
+                else "Checkpointed containers are gone; recreating"
+            )
+
+        if not reattached:
+            # Step 1: Create containers
+            result = await self.executor.create_containers()
+            await self._on_result(result)
+
+            if not result.is_success():
+                await self._record_failure("create", result, "Create failed")
+                return False
+
+            self.state.set_container_identity(await self.executor.get_container_identity())
+            self._complete_step("create")
+
+        if not (reattached and resume_after == "prepare"):
+            # Step 2: Prepare environment
+            result = await self.executor.prepare_environment()
+            await self._on_result(result)
+
+            if not result.is_success():
+                await self._record_failure("prepare", result, "Prepare failed")
+                self._start_teardown(cleanup=False)
+                return False
+
+            self._complete_step("prepare")
+
+        # Step 3: Run full test suite
+        await self.observer.log(LogLevel.INFO, "Running ALL tests (STRESS MODE)")
+        result = await self.executor.run_full_test()
+        await self._on_result(result)
+
+        if result.is_success():
+            return True
+
+        # Failed
+        await self._record_failure("full_test", result, "Test failed")
+        self._start_teardown()
+        self._complete_step("full_test")
+        return False
+
+    async def _bisect(self, iteration: int) -> None:
+        """Attach a role bisection to the latest full-test error.
+
+        An error seen before (same fingerprint) reuses its bisection.
+        """
+        last_error = self.state.errors_encountered[-1]
+        position = self.state.failure_positions.get(iteration)
+        if last_error["phase"] != "full_test" or position is None or "bisection" in last_error:
+            return
+        bisection = self.state.find_bisection(last_error.get("fingerprint"))
+        if bisection is None:
+            try:
+                result = await self.bisector.run(position)
+            except Exception as e:
+                await self.observer.log(LogLevel.WARNING, f"Bisection failed: {e}")
+                return
+            if result is None:
+                return
+            bisection = result.to_dict()
+        self.state.record_bisection(bisection)
+        self._checkpoint()
+
+    async def _attempt_healing(self, iteration: int) -> None:
+        """Attempt to heal the current error."""
+        await self.observer.on_healing_start(iteration)
+        if self.bisector is not None:
+            await self._bisect(iteration)
+        if self.artifact_archive is not None:
+            await asyncio.to_thread(self.artifact_archive.begin_heal)
+
+        # Get full text of the last error (from the store after a resume)
+        last_error = self.state.errors_encountered[-1]
+        fingerprint = last_error.get("fingerprint")
+        error_output = self._last_error_output
+        if error_output is None and self.error_store and fingerprint:
+            error_output = self.error_store.get(fingerprint)
+        if error_output is None:
+            error_output = last_error.get("summary", "")
+
+        # Invoke healer
+        fix_record = await self.healer.analyze_and_fix(
+            error_output=error_output,
+            iteration=iteration,
+            state=self.state,
+        )
+        fix_record = dataclasses.replace(fix_record, error_fingerprint=fingerprint or "")
+
+        await self.observer.on_healing_complete(fix_record)
+        if self.artifact_archive is not None:
+            await asyncio.to_thread(self.artifact_archive.add_fix_record, fix_record)
+        self.state.record_fix(iteration, fix_record.was_successful, fingerprint)
+        self._complete_step("heal")
+
+    async def _run_clean_room_validation(self) -> bool:
+        """Phase 2: Clean-room final validation."""
+        await self._join_teardown()
+
+        if self.config.skip_final:
+            await self.observer.log(LogLevel.INFO, "Skipping final validation (--skip-final)")
+            return True
+
+        await self.observer.on_phase_change("CLEAN_ROOM_VALIDATION")
+        self.state.transition_to(AgentPhase.CLEAN_ROOM_VALIDATION)
+        self._checkpoint()
+
+        await self.observer.log(LogLevel.INFO, "Destroying everything and starting fresh...")
+
+        # Ensure clean state
+        await self.executor.destroy_containers()
+        await self.executor.cleanup()
+
+        await self.observer.log(
+            LogLevel.INFO,
+            f"Waiting {self.config.settle_delay:g} seconds for containers to terminate...",
+        )
+        await asyncio.sleep(self.config.settle_delay)
+
+        await self.observer.log(LogLevel.INFO, "Starting FINAL validation run...")
+
+        # Run full test from scratch
+        self._begin_archive(self.state.current_iteration)
+        result = await self.executor.run_full_test()
+        await self._on_result(result)
+        await self._end_archive()
+
+        if result.is_success():
+            await self.observer.log(LogLevel.INFO, "FINAL VALIDATION PASSED!")
+            return True
+
+        await self.observer.log(LogLevel.ERROR, "FINAL VALIDATION FAILED")
+        return False
+
+    async def _finalize(self, success: bool) -> None:
+        """Finalize the agent run."""
+        await self.observer.on_phase_change("FINALIZATION")
+        self.state.transition_to(AgentPhase.FINALIZATION)
+        self._complete_step("passed" if success else "failed")
+
+        # Cleanup (a teardown that failed is retried below)
+        try:
+            await self._join_teardown()
+        except Exception as e:
+            await self.observer.log(LogLevel.WARNING, f"Background teardown failed: {e}")
+        await self.executor.destroy_containers()
+        await self.executor.cleanup()
+        self.state.set_container_identity({})
+
+        # Mark completion
+        if success:
+            self.state.mark_completed()
+        else:
+            self.state.mark_failed()
+        self._checkpoint()
+
+        # Display summary
+        summary = self.state.get_summary()
+        await self.observer.on_summary(summary)
+
+        await self.observer.log(
+            LogLevel.INFO,
+            f"Agent {'succeeded' if success else 'failed'} "
+            f"after {self.state.current_iteration} iterations"
+        )
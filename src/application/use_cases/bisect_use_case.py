@@ -0,0 +1,162 @@
+# SPDX-License-Identifier: MIT-0
+"""Bisect Use Case.
+
+Localize a converge or idempotence failure to the roles it depends on:
+the failing role is converged in fresh containers together with growing
+prefixes of the roles before it (selected by role tags, in playbook
+order), several prefixes at a time, until the shortest prefix that still
+reproduces the failure is found.
+Following Hexagonal Architecture: Use Case → Ports → Adapters
+"""
+
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional
+
+from src.domain.models import (
+    BisectionProbe,
+    BisectionResult,
+    FailurePosition,
+    bisection_points,
+)
+from src.application.ports import (
+    AsyncExecutorPort,
+    AsyncObserverPort,
+    LogLevel,
+    PlanCompilerPort,
+)
+
+
+class BisectUseCase:
+    """Find the smallest role prefix that reproduces a failure.
+
+    Assumes a prefix that reproduces the failure keeps reproducing it when
+    more roles run before the failing one; probes of a round run in
+    parallel, so ``parallel`` probes narrow the range ``parallel + 1``-fold.
+    """
+
+    # Phases whose failures a converge (plus idempotence check) reproduces
+    PHASES = ("converge", "idempotence")
+
+    def __init__(
+        self,
+        executor_factory: Callable[[], AsyncExecutorPort],
+        planner: PlanCompilerPort,
+        observer: AsyncObserverPort,
+        scenario: str,
+        parallel: int = 3,
+    ):
+        """Initialize the use case with required dependencies.
+
+        Args:
+            executor_factory: Builds an executor that runs in its own fresh container
+            planner: Port resolving the scenario's roles in playbook order
+            observer: Port for logging/observation
+            scenario: Molecule scenario that failed
+            parallel: Probes running at the same time
+        """
+        self.executor_factory = executor_factory
+        self.planner = planner
+        self.observer = observer
+        self.scenario = scenario
+        self.parallel = max(parallel, 1)
+
+    @staticmethod
+    def _short(role: str) -> str:
+        """Strip the collection from a role name ("local.workstation.common")."""
+        return role.rsplit(".", 1)[-1]
+
+    def roles(self) -> List[str]:
+        """Get the scenario's roles in playbook order."""
+        plan = self.planner.compile(self.scenario)
+        roles = (self._short(task.role) for task in plan.tasks if task.role and not task.is_handler)
+        return list(dict.fromkeys(roles))
+
+    async def run(self, position: FailurePosition) -> Optional[BisectionResult]:
+        """Bisect the roles before a failure.
+
+        Args:
+            position: Where the full test failed
+
+        Returns:
+            The bisection, or None if the failure can't be bisected (not a
+            converge/idempotence failure, unknown role or no earlier roles)
+        """
+        failing_role = self._short(position.role)
+        if position.phase not in self.PHASES or not failing_role:
+            return None
+        try:
+            roles = await asyncio.to_thread(self.roles)
+        except Exception as e:
+            await self.observer.log(LogLevel.WARNING, f"Cannot bisect: no role plan ({e})")
+            return None
+        if failing_role not in roles or roles.index(failing_role) == 0:
+            return None
+        earlier = tuple(roles[:roles.index(failing_role)])
+
+        await self.observer.log(
+            LogLevel.INFO,
+            f"Bisecting {len(earlier)} role(s) before {failing_role!r} "
+            f"({self.parallel} probe(s) at a time)",
+        )
+        started = time.monotonic()
+        # The full run is the longest prefix and reproduced the failure
+        low, high = -1, len(earlier)
+        probes: Dict[int, BisectionProbe] = {}
+        while True:
+            points = bisection_points(low, high, self.parallel)
+            if not points:
+                break
+            results = await asyncio.gather(*(
+                self._probe([*earlier[:prefix], failing_role], position) for prefix in points
+            ))
+            probes.update(zip(points, results))
+            reproduced = [prefix for prefix in points if probes[prefix].reproduced]
+            high = min(reproduced, default=high)
+            low = max((prefix for prefix in points if prefix < high), default=low)
+
+        result = BisectionResult(
+            failing_role=failing_role,
+            phase=position.phase,
+            task=position.task,
+            roles=earlier,
+            prefix=high,
+            probes=tuple(probes[prefix] for prefix in sorted(probes)),
+            duration=time.monotonic() - started,
+        )
+        await self.observer.log(LogLevel.INFO, result.describe())
+        return result
+
+    async def _probe(self, roles: List[str], position: FailurePosition) -> BisectionProbe:
+        """Converge a role subset in a fresh container and compare the failure."""
+        started = time.monotonic()
+        executor = self.executor_factory()
+        result = None
+        try:
+            steps = [executor.create_containers, executor.prepare_environment]
+            steps.append(lambda: executor.converge(tags=roles))
+            if position.phase == "idempotence":
+                steps.append(lambda: executor.check_idempotence(tags=roles))
+            for step in steps:
+                result = await step()
+                if not result.is_success():
+                    break
+        except Exception as e:
+            return BisectionProbe(
+                tuple(roles), False, time.monotonic() - started, f"{type(e).__name__}: {e}"
+            )
+        finally:
+            await executor.destroy_containers()
+
+        duration = time.monotonic() - started
+        if result is None or result.is_success():
+            return BisectionProbe(tuple(roles), False, duration)
+        failure = FailurePosition.from_output(result.output, result.phase.value)
+        reproduced = (
+            failure.phase == position.phase
+            and self._short(failure.role) == self._short(position.role)
+            and (not position.task or failure.task == position.task)
+        )
+        return BisectionProbe(
+            tuple(roles), reproduced, duration, "" if reproduced else failure.describe()
+        )
@@ -0,0 +1,131 @@
+# SPDX-License-Identifier: MIT-0
+"""Fleet Use Case.
+
+Apply the workstation playbook to many hosts from one controller: the
+inventory pattern is sharded into waves, each wave runs with forks tuned
+from the controller's resources and the task latency of earlier waves,
+and the per-host recaps are aggregated into one summary.
+Following Hexagonal Architecture: Use Case → Ports → Adapters
+"""
+
+from typing import List
+
+from src.domain.models import FleetSummary, FleetWave, tune_forks
+from src.application.ports import AsyncObserverPort, FleetExecutorPort, LogLevel
+
+
+class FleetUseCase:
+    """Run the playbook over an inventory pattern in waves.
+
+    Waves run one after another, so a broken change stops after the
+    failure threshold instead of reaching the whole fleet.
+    """
+
+    def __init__(
+        self,
+        executor: FleetExecutorPort,
+        observer: AsyncObserverPort,
+        pattern: str,
+        wave_size: int,
+        max_forks: int,
+        max_fail_percent: float = 100.0,
+        forks_per_cpu: int = 4,
+        memory_per_fork_mb: int = 128,
+    ):
+        """Initialize the use case with required dependencies.
+
+        Args:
+            executor: Port running the playbook on a wave of hosts
+            observer: Port for logging/observation
+            pattern: Inventory host pattern of the fleet
+            wave_size: Hosts per wave
+            max_forks: Upper bound for the forks of a wave
+            max_fail_percent: Stop starting waves once more than this
+                percentage of the hosts run so far failed
+            forks_per_cpu: Forks per controller CPU
+            memory_per_fork_mb: Controller memory to keep per fork
+        """
+        self.executor = executor
+        self.observer = observer
+        self.pattern = pattern
+        self.wave_size = max(wave_size, 1)
+        self.max_forks = max(max_forks, 1)
+        self.max_fail_percent = max_fail_percent
+        self.forks_per_cpu = forks_per_cpu
+        self.memory_per_fork_mb = memory_per_fork_mb
+
+    def shard(self, hosts: List[str]) -> List[List[str]]:
+        """Split the fleet into waves of ``wave_size`` hosts."""
+        return [hosts[i:i + self.wave_size] for i in range(0, len(hosts), self.wave_size)]
+
+    async def run(self) -> FleetSummary:
+        """Run every wave (until the failure threshold is reached).
+
+        Returns:
+            The aggregated fleet summary
+        """
+        await self.observer.on_phase_change("fleet")
+        hosts = await self.executor.list_hosts(self.pattern)
+        summary = FleetSummary(pattern=self.pattern, playbook=self.executor.get_playbook())
+        if not hosts:
+            await self.observer.log(LogLevel.ERROR, f"No hosts match {self.pattern!r}")
+            return summary
+
+        shards = self.shard(hosts)
+        await self.observer.log(
+            LogLevel.INFO,
+            f"Fleet {self.pattern!r}: {len(hosts)} host(s) in {len(shards)} wave(s) "
+            f"of up to {self.wave_size}",
+        )
+
+        waves: List[FleetWave] = []
+        for index, shard in enumerate(shards, start=1):
+            if waves and self._failed_percent(waves) > self.max_fail_percent:
+                not_run = tuple(host for rest in shards[index - 1:] for host in rest)
+                await self.observer.log(
+                    LogLevel.ERROR,
+                    f"{self._failed_percent(waves):.0f}% of the hosts failed "
+                    f"(limit {self.max_fail_percent:.0f}%); {len(not_run)} host(s) not run",
+                )
+                summary = FleetSummary(summary.pattern, summary.playbook, tuple(waves), not_run)
+                break
+
+            stats = self.executor.controller_stats()
+            forks = tune_forks(
+                stats,
+                len(shard),
+                waves,
+                max_forks=self.max_forks,
+                forks_per_cpu=self.forks_per_cpu,
+                memory_per_fork_mb=self.memory_per_fork_mb,
+            )
+            await self.observer.on_phase_change(f"fleet wave {index}/{len(shards)}")
+            await self.observer.log(
+                LogLevel.INFO,
+                f"Wave {index}: {len(shard)} host(s) with {forks} forks "
+                f"(controller: {stats.cpus} CPUs, {stats.memory_available_mb} MiB free, "
+                f"load {stats.load:.1f})",
+            )
+            wave = await self.executor.run_wave(index, shard, forks)
+            waves.append(wave)
+            failed = wave.failed_hosts
+            await self.observer.log(
+                LogLevel.ERROR if failed else LogLevel.INFO,
+                f"Wave {index}: {len(shard) - len(failed)}/{len(shard)} host(s) converged "
+                f"in {wave.duration:.0f}s"
+                + (f"; failed: {', '.join(failed)}" if failed else ""),
+            )
+        else:
+            summary = FleetSummary(summary.pattern, summary.playbook, tuple(waves))
+
+        await self.observer.log(
+            LogLevel.INFO if summary.success else LogLevel.ERROR, summary.format()
+        )
+        return summary
+
+    @staticmethod
+    def _failed_percent(waves: List[FleetWave]) -> float:
+        """Get the percentage of the hosts run so far that failed."""
+        ran = sum(len(wave.hosts) for wave in waves)
+        failed = sum(len(wave.failed_hosts) for wave in waves)
+        return 100.0 * failed / ran if ran else 0.0
@@ -0,0 +1,113 @@
+# SPDX-License-Identifier: MIT-0
+"""Matrix Use Case.
+
+Run one scenario over a matrix of images and variable overlays: every
+cell is an independent shard that gets its own executor, the shards run
+concurrently up to a limit, and their results are collected into one
+pass/fail and duration grid.
+Following Hexagonal Architecture: Use Case → Ports → Adapters
+"""
+
+import asyncio
+import time
+from typing import Callable
+
+from src.domain.models import (
+    CellResult,
+    FailurePosition,
+    MatrixCell,
+    MatrixDefinition,
+    MatrixSummary,
+    extract_error_windows,
+)
+from src.application.ports import AsyncExecutorPort, AsyncObserverPort, LogLevel
+
+
+class MatrixUseCase:
+    """Run a test matrix as parallel shards.
+
+    Cells don't heal: a matrix answers "where does it break", so a failing
+    cell is reported with its phase and error window and the others keep
+    running.
+    """
+
+    def __init__(
+        self,
+        matrix: MatrixDefinition,
+        executor_factory: Callable[[MatrixCell], AsyncExecutorPort],
+        observer: AsyncObserverPort,
+        parallel: int = 2,
+    ):
+        """Initialize the use case with required dependencies.
+
+        Args:
+            matrix: Scenario, images and overlays to run
+            executor_factory: Builds the executor of one cell
+            observer: Port for logging/observation
+            parallel: Cells running at the same time
+        """
+        self.matrix = matrix
+        self.executor_factory = executor_factory
+        self.observer = observer
+        self.parallel = max(parallel, 1)
+
+    async def run(self) -> MatrixSummary:
+        """Run every cell of the matrix.
+
+        Returns:
+            The matrix summary, cells in matrix order
+        """
+        cells = self.matrix.cells()
+        await self.observer.on_phase_change("matrix")
+        await self.observer.log(
+            LogLevel.INFO,
+            f"Matrix {self.matrix.scenario!r}: {len(cells)} cell(s), {self.parallel} at a time",
+        )
+
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(self.parallel)
+
+        async def shard(cell: MatrixCell) -> CellResult:
+            async with semaphore:
+                return await self._run_cell(cell)
+
+        results = await asyncio.gather(*(shard(cell) for cell in cells))
+        summary = MatrixSummary(
+            scenario=self.matrix.scenario,
+            results=tuple(results),
+            duration=time.monotonic() - started,
+        )
+        await self.observer.log(
+            LogLevel.INFO if summary.success else LogLevel.ERROR, summary.format()
+        )
+        return summary
+
+    async def _run_cell(self, cell: MatrixCell) -> CellResult:
+        """Run the full test of one cell and release its container."""
+        await self.observer.log(LogLevel.INFO, f"[{cell.name}] started ({cell.image})")
+        started = time.monotonic()
+        executor = self.executor_factory(cell)
+        try:
+            result = await executor.run_full_test()
+        except Exception as e:
+            result = None
+            error = f"{type(e).__name__}: {e}"
+        finally:
+            await executor.destroy_containers()
+        duration = time.monotonic() - started
+
+        if result is not None and result.is_success():
+            await self.observer.log(LogLevel.INFO, f"[{cell.name}] passed in {duration:.0f}s")
+            return CellResult(cell=cell, success=True, duration=duration)
+
+        if result is not None:
+            phase = FailurePosition.from_output(result.output, "full_test").phase
+            error = extract_error_windows(result.output) or "\n".join(result.output.splitlines()[-20:])
+        else:
+            phase = "full_test"
+        await self.observer.log(
+            LogLevel.ERROR, f"[{cell.name}] failed in {phase} after {duration:.0f}s\n{error}"
+        )
+        return CellResult(
+            cell=cell, success=False, duration=duration, failed_phase=phase, error=error
+        )
@@ -0,0 +1,278 @@
+# SPDX-License-Identifier: MIT-0
+"""Watch Use Case.
+
+Inner development loop: keep one scenario container alive and re-run
+converge and idempotence for the roles whose files changed.
+The clean-room run (destroy + full ``molecule test``) only happens on demand.
+Following Hexagonal Architecture: Use Case → Ports → Adapters
+"""
+
+import asyncio
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+from src.domain import AgentConfig, TestResult
+from src.domain.models import TaskPlan
+from src.application.ports import (
+    AsyncExecutorPort,
+    AsyncObserverPort,
+    FileWatcherPort,
+    LogLevel,
+    PlanCompilerPort,
+)
+
+
+class WatchUseCase:
+    """Re-converge changed roles on a long-lived scenario container.
+
+    Each role is tagged with its own name in the playbooks, so a change
+    under ``roles/<role>/`` re-runs ``--tags <role>``. A change to the
+    playbook itself (or anything that cannot be mapped to a role) re-runs
+    everything.
+
+    With a plan compiler, files are mapped through the scenario's task
+    plan instead: a task file counts for the roles whose tasks it defines
+    (also when another role imports it), and a change to a role the
+    scenario does not run re-runs nothing.
+    """
+
+    def __init__(
+        self,
+        config: AgentConfig,
+        executor: AsyncExecutorPort,
+        watcher: FileWatcherPort,
+        observer: AsyncObserverPort,
+        roles_dir: Path,
+        planner: Optional[PlanCompilerPort] = None,
+    ):
+        """Initialize the use case with required dependencies.
+
+        Args:
+            config: Agent configuration
+            executor: Port for test execution
+            watcher: Port delivering batches of changed files
+            observer: Port for logging/observation
+            roles_dir: Directory holding one subdirectory per role
+            planner: Port resolving the scenario's task plan (optional)
+        """
+        self.config = config
+        self.executor = executor
+        self.watcher = watcher
+        self.observer = observer
+        self.roles_dir = Path(roles_dir).resolve()
+        self.planner = planner
+        self.plan: Optional[TaskPlan] = None
+        self.cycles = 0
+        self.last_success = False
+        self._clean_room = asyncio.Event()
+        self._stopped = asyncio.Event()
+
+    def tags_for(self, paths: Iterable[Path]) -> Optional[List[str]]:
+        """Map changed files to the role tags to re-run.
+
+        Args:
+            paths: Changed files
+
+        Returns:
+            Sorted role tags, None if everything must re-run, or an empty
+            list if the scenario uses none of the files
+        """
+        tags = set()
+        for path in paths:
+            path = Path(path).resolve()
+            if not path.is_relative_to(self.roles_dir):
+                return None
+            parts = path.relative_to(self.roles_dir).parts
+            if len(parts) < 2:
+                # roles/ itself or a file next to the roles
+                return None
+            if self.plan is None:
+                tags.add(parts[0])
+                continue
+            roles = self.plan.roles_for_file(self._plan_path(path))
+            if not roles and parts[1] in ("tasks", "defaults", "vars", "handlers"):
+                # Not loaded by the scenario's playbook
+                continue
+            tags.update(roles or [parts[0]])
+        if self.plan is not None:
+            planned = {task.role for task in self.plan.tasks}
+            tagged = {task.role for task in self.plan.tasks if task.role in task.tags}
+            if tags & planned - tagged:
+                # A role that cannot be selected by its name
+                return None
+            tags &= planned
+        return sorted(tags)
+
+    def _plan_path(self, path: Path) -> str:
+        """Get a path the way the plan indexes it (project-relative)."""
+        root = Path(self.config.project_root).resolve()
+        return path.relative_to(root).as_posix() if path.is_relative_to(root) else path.as_posix()
+
+    async def _compile_plan(self) -> None:
+        """(Re)build the scenario's task plan; keep the old one on errors."""
+        if self.planner is None:
+            return
+        try:
+            self.plan = await asyncio.to_thread(
+                self.planner.compile, self.executor.get_scenario_name()
+            )
+        except Exception as e:
+            await self.observer.log(LogLevel.WARNING, f"Cannot compile the task plan: {e}")
+
+    def request_clean_room(self) -> None:
+        """Ask for a clean-room run after the current cycle."""
+        self._clean_room.set()
+
+    def stop(self) -> None:
+        """Ask the watch loop to finish after the current cycle."""
+        self._stopped.set()
+
+    async def run(self) -> bool:
+        """Watch until stopped or cancelled.
+
+        Returns:
+            True if the last converge/idempotence cycle passed
+        """
+        scenario = self.executor.get_scenario_name()
+        await self.observer.log(LogLevel.INFO, f"Watch mode for scenario '{scenario}'")
+
+        try:
+            if not await self._setup():
+                return False
+            await self._compile_plan()
+            self.last_success = await self._cycle(None)
+
+            while not self._stopped.is_set():
+                await self.observer.log(
+                    LogLevel.INFO, "Watching for changes (Ctrl-C to stop)..."
+                )
+                batch = await self._next_request()
+                if batch is None:
+                    break
+                if batch:
+                    await self._compile_plan()
+                    tags = self.tags_for(batch)
+                    await self._log_batch(batch, tags)
+                    if tags != []:
+                        self.last_success = await self._cycle(tags)
+                if self._clean_room.is_set():
+                    self._clean_room.clear()
+                    if not await self._run_clean_room():
+                        return False
+            return self.last_success
+        finally:
+            self.watcher.close()
+            await self.observer.on_phase_change("teardown")
+            await asyncio.shield(self.executor.destroy_containers())
+            await self.observer.log(
+                LogLevel.INFO,
+                f"Watch mode finished after {self.cycles} cycle(s); "
+                f"last cycle {'passed' if self.last_success else 'failed'}",
+            )
+
+    async def _next_request(self) -> Optional[set]:
+        """Wait for a change batch, a clean-room request or a stop request.
+
+        Returns:
+            Changed paths (empty for a clean-room request), or None when stopped
+        """
+        waits = {
+            asyncio.create_task(self.watcher.next_batch()): "batch",
+            asyncio.create_task(self._clean_room.wait()): "clean_room",
+            asyncio.create_task(self._stopped.wait()): "stop",
+        }
+        try:
+            done, _ = await asyncio.wait(waits, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            for task in waits:
+                task.cancel()
+            await asyncio.gather(*waits, return_exceptions=True)
+
+        finished = {waits[task] for task in done}
+        if "batch" in finished:
+            return next(t for t in done if waits[t] == "batch").result()
+        if "stop" in finished:
+            return None
+        return set()
+
+    async def _log_batch(self, batch: set, tags: Optional[List[str]]) -> None:
+        """Report which files changed and what re-runs."""
+        names = sorted(str(p) for p in batch)
+        shown = ", ".join(names[:5]) + (f" (+{len(names) - 5} more)" if len(names) > 5 else "")
+        await self.observer.log(LogLevel.INFO, f"Changed: {shown}")
+        if tags == []:
+            await self.observer.log(
+                LogLevel.INFO, "No task of the scenario uses these files; nothing to re-run"
+            )
+            return
+        target = f"tags {','.join(tags)}" if tags else "the whole playbook"
+        if self.plan is not None:
+            selected = self.plan.select(tags or ())
+            impacted = set(self.plan.impacted(self._plan_path(Path(p).resolve()) for p in batch))
+            target += (
+                f" ({len(selected)} task(s), {len(impacted & set(selected))} "
+                "defined in the changed files)"
+            )
+        await self.observer.log(LogLevel.INFO, f"Re-running {target}")
+
+    async def _step(self, step, *args) -> TestResult:
+        """Run one executor step and report it."""
+        result = await step(*args)
+        await self.observer.on_test_complete(result)
+        return result
+
+    async def _setup(self) -> bool:
+        """Create and prepare the container the watch loop converges on."""
+        await self.observer.on_phase_change("watch setup")
+        for step, phase in (
+            (self.executor.create_containers, "create"),
+            (self.executor.prepare_environment, "prepare"),
+        ):
+            await self.observer.on_test_start(phase)
+            result = await self._step(step)
+            if not result.is_success():
+                await self.observer.log(LogLevel.ERROR, f"Cannot start watching: {phase} failed")
+                return False
+        return True
+
+    async def _cycle(self, tags: Optional[List[str]]) -> bool:
+        """Converge and check idempotence, limited to ``tags``."""
+        self.cycles += 1
+        await self.observer.on_phase_change(f"watch cycle {self.cycles}")
+
+        success = True
+        for step, phase in (
+            (self.executor.converge, "converge"),
+            (self.executor.check_idempotence, "idempotence"),
+        ):
+            await self.observer.on_test_start(phase)
+            result = await self._step(step, tags)
+            if not result.is_success():
+                window = result.get_error_window() or ""
+                await self.observer.log(LogLevel.ERROR, window[-4000:])
+                success = False
+                break
+
+        await self.observer.log(
+            LogLevel.INFO if success else LogLevel.ERROR,
+            f"Cycle {self.cycles}: {'PASSED' if success else 'FAILED'}",
+        )
+        return success
+
+    async def _run_clean_room(self) -> bool:
+        """Run the full scenario from scratch, then restore the watch container."""
+        await self.observer.on_phase_change("clean-room validation")
+        await self._step(self.executor.destroy_containers)
+        await self._step(self.executor.cleanup)
+
+        await self.observer.on_test_start("full_test")
+        result = await self._step(self.executor.run_full_test)
+        await self.observer.log(
+            LogLevel.INFO if result.is_success() else LogLevel.ERROR,
+            f"Clean-room run {'passed' if result.is_success() else 'failed'}",
+        )
+
+        if not await self._setup():
+            return False
+        self.last_success = await self._cycle(None)
+        return True
@@ -12,6 +12,7 @@ from src.domain.models import (
     TestResult,
     TestPhase,
     TestStatus,
+    FailurePosition,
     FixRecord,
     FixStatus,
 )
@@ -34,6 +35,7 @@ __all__ = [
     "TestResult",
     "TestPhase",
     "TestStatus",
+    "FailurePosition",
     "FixRecord",
     "FixStatus",
     # Exceptions
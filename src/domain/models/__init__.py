@@ -6,7 +6,29 @@ Only use: dataclasses, typing, uuid, datetime, enum
 """
 
 from src.domain.models.agent_state import AgentState, AgentPhase
-from src.domain.models.test_result import TestResult, TestPhase, TestStatus
+from src.domain.models.test_result import (
+    TestResult,
+    TestPhase,
+    TestStatus,
+    extract_error_windows,
+    extract_changed_tasks,
+    idempotence_report,
+    idempotence_failure,
+    ERROR_LINE_PATTERN,
+)
+from src.domain.models.changed_task import ChangedTask, changed_tasks_report, parse_idempotence_report
+from src.domain.models.failure_position import FailurePosition
+from src.domain.models.task_plan import PlannedTask, PlanStatus, TaskPlan
+from src.domain.models.fleet import (
+    ControllerStats,
+    FleetSummary,
+    FleetWave,
+    HostResult,
+    parse_recap,
+    tune_forks,
+)
+from src.domain.models.bisection import BisectionProbe, BisectionResult, bisection_points
+from src.domain.models.matrix import CellResult, MatrixCell, MatrixDefinition, MatrixSummary
 from src.domain.models.fix_record import FixRecord, FixStatus
 from src.domain.models.agent_config import AgentConfig
 
@@ -16,6 +38,31 @@ __all__ = [
     "TestResult",
     "TestPhase",
     "TestStatus",
+    "extract_error_windows",
+    "extract_changed_tasks",
+    "idempotence_report",
+    "idempotence_failure",
+    "ERROR_LINE_PATTERN",
+    "ChangedTask",
+    "changed_tasks_report",
+    "parse_idempotence_report",
+    "FailurePosition",
+    "PlannedTask",
+    "PlanStatus",
+    "TaskPlan",
+    "ControllerStats",
+    "FleetSummary",
+    "FleetWave",
+    "HostResult",
+    "parse_recap",
+    "tune_forks",
+    "BisectionProbe",
+    "BisectionResult",
+    "bisection_points",
+    "CellResult",
+    "MatrixCell",
+    "MatrixDefinition",
+    "MatrixSummary",
     "FixRecord",
     "FixStatus",
     "AgentConfig",
@@ -20,6 +20,10 @@ class AgentConfig:
     skip_final: bool
     project_root: Path
     verbose: bool = False
+    stall_limit: int = 3
+    # Pause before a retry, and before the final run for containers to go away
+    retry_delay: float = 2.0
+    settle_delay: float = 3.0
 
     # Default scenario name
     DEFAULT_SCENARIO: str = "default"
@@ -27,11 +31,20 @@ class AgentConfig:
     # Default max retries
     DEFAULT_MAX_RETRIES: int = 10
 
+    # Default number of iterations without progress before giving up
+    DEFAULT_STALL_LIMIT: int = 3
+
     def __post_init__(self):
         """Validate configuration."""
         if self.max_retries < 1:
             raise ValueError("max_retries must be at least 1")
 
+        if self.stall_limit < 0:
+            raise ValueError("stall_limit must not be negative (0 disables it)")
+
+        if self.retry_delay < 0 or self.settle_delay < 0:
+            raise ValueError("delays must not be negative")
+
         if not self.project_root.exists():
             raise ValueError(f"Project root does not exist: {self.project_root}")
 
@@ -43,6 +56,9 @@ class AgentConfig:
         skip_final: bool = False,
         project_root: Path | None = None,
         verbose: bool = False,
+        stall_limit: int = DEFAULT_STALL_LIMIT,
+        retry_delay: float = 2.0,
+        settle_delay: float = 3.0,
     ) -> "AgentConfig":
         """Factory method to create AgentConfig with defaults."""
         if project_root is None:
@@ -54,4 +70,7 @@ class AgentConfig:
             skip_final=skip_final,
             project_root=project_root,
             verbose=verbose,
+            stall_limit=stall_limit,
+            retry_delay=retry_delay,
+            settle_delay=settle_delay,
         )
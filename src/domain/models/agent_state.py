@@ -5,10 +5,13 @@ Pure Python - no external dependencies.
 This is an Entity - it has identity and lifecycle.
 """
 
+import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import List
+from typing import Dict, List
+
+from src.domain.models.failure_position import FailurePosition
 
 
 class AgentPhase(Enum):
@@ -21,6 +24,10 @@ class AgentPhase(Enum):
     COMPLETED = "completed"
     FAILED = "failed"
 
+    def is_terminal(self) -> bool:
+        """Check if no further work can happen in this phase."""
+        return self in (AgentPhase.COMPLETED, AgentPhase.FAILED)
+
 
 @dataclass
 class AgentState:
@@ -35,9 +42,14 @@ class AgentState:
     current_phase: AgentPhase = AgentPhase.INITIALIZATION
     total_fixes_applied: int = 0
     errors_encountered: List[dict] = field(default_factory=list)
+    error_occurrences: Dict[str, int] = field(default_factory=dict)
     fix_history: List[dict] = field(default_factory=list)
     start_time: datetime = field(default_factory=datetime.now)
     end_time: datetime | None = None
+    run_id: str = field(default_factory=lambda: uuid.uuid4().hex)
+    last_completed_step: str | None = None
+    container_identity: dict = field(default_factory=dict)
+    failure_positions: Dict[int, FailurePosition] = field(default_factory=dict)
 
     def transition_to(self, phase: AgentPhase) -> None:
         """Transition to a new phase."""
@@ -46,27 +58,109 @@ class AgentState:
     def increment_iteration(self) -> int:
         """Increment iteration counter and return new value."""
         self.current_iteration += 1
+        self.last_completed_step = None
         return self.current_iteration
 
-    def record_error(self, phase: str, error_message: str) -> None:
-        """Record an error for tracking."""
+    def complete_step(self, step: str) -> None:
+        """Record the last step completed within the current iteration."""
+        self.last_completed_step = step
+
+    def set_container_identity(self, identity: dict) -> None:
+        """Record the identity of the live test containers (empty when destroyed)."""
+        self.container_identity = dict(identity)
+
+    def record_error(self, phase: str, summary: str, fingerprint: str | None = None) -> None:
+        """Record an error for tracking.
+
+        The full error text lives in an error store; the state only keeps a
+        one-line summary, the store reference and per-error occurrence counts.
+
+        Args:
+            phase: Phase that failed
+            summary: One-line error summary
+            fingerprint: Error store reference to the full error window
+        """
         self.errors_encountered.append({
             "iteration": self.current_iteration,
             "phase": phase,
             "timestamp": datetime.now().isoformat(),
-            "error": error_message[:500],  # Truncate long errors
+            "summary": summary,
+            "fingerprint": fingerprint,
         })
-
-    def record_fix(self, iteration: int, success: bool) -> None:
+        if fingerprint:
+            self.error_occurrences[fingerprint] = self.error_occurrences.get(fingerprint, 0) + 1
+
+    def record_bisection(self, bisection: dict) -> None:
+        """Attach a role bisection result to the latest error."""
+        if self.errors_encountered:
+            self.errors_encountered[-1]["bisection"] = dict(bisection)
+
+    def find_bisection(self, fingerprint: str | None) -> dict | None:
+        """Get the bisection of an earlier error with the same fingerprint."""
+        if not fingerprint:
+            return None
+        for error in reversed(self.errors_encountered):
+            if error.get("fingerprint") == fingerprint and error.get("bisection"):
+                return error["bisection"]
+        return None
+
+    def record_fix(self, iteration: int, success: bool, error_fingerprint: str | None = None) -> None:
         """Record a fix attempt."""
         self.fix_history.append({
             "iteration": iteration,
             "timestamp": datetime.now().isoformat(),
             "success": success,
+            "error_fingerprint": error_fingerprint,
         })
         if success:
             self.total_fixes_applied += 1
 
+    def record_failure_position(self, position: FailurePosition) -> bool:
+        """Record where the current iteration's run failed.
+
+        The fix applied in the previous iteration is marked with whether it
+        moved the failure further into the scenario.
+
+        Args:
+            position: Position of the failure
+
+        Returns:
+            True if the run got further than every earlier iteration
+        """
+        previous = list(self.failure_positions.values())
+        progressed = all(position.is_further_than(p) for p in previous)
+        self.failure_positions[self.current_iteration] = position
+
+        for fix in reversed(self.fix_history):
+            if fix["iteration"] < self.current_iteration:
+                fix["progressed"] = progressed
+                break
+        return progressed
+
+    def iterations_without_progress(self) -> int:
+        """Count trailing iterations that failed no further than an earlier one."""
+        stalled = 0
+        best = None
+        for iteration in sorted(self.failure_positions):
+            position = self.failure_positions[iteration]
+            if best is None or position.is_further_than(best):
+                best, stalled = position, 0
+            else:
+                stalled += 1
+        return stalled
+
+    def is_stalled(self) -> bool:
+        """Check if the stall limit of iterations without progress is reached."""
+        limit = self.config.stall_limit
+        return limit > 0 and self.iterations_without_progress() >= limit
+
+    def get_progress_curve(self) -> List[dict]:
+        """Get the failure position of every failed iteration, in order."""
+        return [
+            {"iteration": iteration, **self.failure_positions[iteration].to_dict()}
+            for iteration in sorted(self.failure_positions)
+        ]
+
     def is_final_iteration(self) -> bool:
         """Check if this is the final allowed iteration."""
         return self.current_iteration >= self.config.max_retries
@@ -98,6 +192,62 @@ class AgentState:
             "total_fixes": self.total_fixes_applied,
             "duration_seconds": self.get_duration_seconds(),
             "errors_count": len(self.errors_encountered),
+            "distinct_errors": len(self.error_occurrences),
+            "error_occurrences": dict(self.error_occurrences),
+            "progress_curve": self.get_progress_curve(),
+            "iterations_without_progress": self.iterations_without_progress(),
             "success": self.current_phase == AgentPhase.COMPLETED,
             "phase": self.current_phase.value,
         }
+
+    def to_dict(self) -> dict:
+        """Serialize the state to a JSON-compatible dictionary."""
+        return {
+            "run_id": self.run_id,
+            "scenario": self.config.scenario,
+            "current_iteration": self.current_iteration,
+            "current_phase": self.current_phase.value,
+            "last_completed_step": self.last_completed_step,
+            "container_identity": self.container_identity,
+            "total_fixes_applied": self.total_fixes_applied,
+            "errors_encountered": self.errors_encountered,
+            "error_occurrences": self.error_occurrences,
+            "fix_history": self.fix_history,
+            "progress_curve": self.get_progress_curve(),
+            "start_time": self.start_time.isoformat(),
+            "end_time": self.end_time.isoformat() if self.end_time else None,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict, config: "AgentConfig") -> "AgentState":
+        """Rebuild a state from ``to_dict`` output.
+
+        Args:
+            data: Serialized state
+            config: Configuration of the resuming run
+
+        Returns:
+            Restored AgentState
+        """
+        end_time = data.get("end_time")
+        failure_positions = {}
+        for entry in data.get("progress_curve", []):
+            entry = dict(entry)
+            iteration = entry.pop("iteration")
+            failure_positions[iteration] = FailurePosition.from_dict(entry)
+
+        return cls(
+            config=config,
+            current_iteration=data["current_iteration"],
+            current_phase=AgentPhase(data["current_phase"]),
+            total_fixes_applied=data.get("total_fixes_applied", 0),
+            errors_encountered=list(data.get("errors_encountered", [])),
+            error_occurrences=dict(data.get("error_occurrences", {})),
+            fix_history=list(data.get("fix_history", [])),
+            start_time=datetime.fromisoformat(data["start_time"]),
+            end_time=datetime.fromisoformat(end_time) if end_time else None,
+            run_id=data["run_id"],
+            last_completed_step=data.get("last_completed_step"),
+            container_identity=dict(data.get("container_identity", {})),
+            failure_positions=failure_positions,
+        )
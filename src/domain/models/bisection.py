@@ -0,0 +1,146 @@
+# SPDX-License-Identifier: MIT-0
+"""Role bisection value objects.
+
+Pure Python - no external dependencies.
+"""
+
+from dataclasses import dataclass
+from typing import List, Tuple
+
+
+def bisection_points(low: int, high: int, parallel: int) -> List[int]:
+    """Choose the prefix lengths to probe next.
+
+    Prefixes up to ``low`` are known not to reproduce the failure and
+    ``high`` is known to; up to ``parallel`` points split the range
+    between them evenly, so each round shrinks it by ``parallel + 1``.
+
+    Args:
+        low: Longest prefix known not to reproduce (-1 if none)
+        high: Shortest prefix known to reproduce
+        parallel: Probes that can run at the same time
+
+    Returns:
+        Sorted prefix lengths strictly between ``low`` and ``high``
+    """
+    span = high - low
+    if span <= 1:
+        return []
+    count = min(max(parallel, 1), span - 1)
+    return sorted({low + span * (i + 1) // (count + 1) for i in range(count)} - {low, high})
+
+
+@dataclass(frozen=True)
+class BisectionProbe:
+    """One converge of a role subset in a fresh container.
+
+    This is a Value Object - immutable and defined by its attributes.
+    ``failure`` describes where the probe failed when that is not the
+    original failure.
+    """
+
+    roles: Tuple[str, ...]
+    reproduced: bool
+    duration: float = 0.0
+    failure: str = ""
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "roles": list(self.roles),
+            "reproduced": self.reproduced,
+            "duration": round(self.duration, 3),
+            "failure": self.failure,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BisectionProbe":
+        """Rebuild a probe from ``to_dict`` output."""
+        return cls(
+            roles=tuple(data.get("roles", ())),
+            reproduced=data.get("reproduced", False),
+            duration=data.get("duration", 0.0),
+            failure=data.get("failure", ""),
+        )
+
+
+@dataclass(frozen=True)
+class BisectionResult:
+    """The smallest prefix of earlier roles that reproduces a failure.
+
+    This is a Value Object - immutable and defined by its attributes.
+    ``roles`` are the roles before the failing one, in playbook order;
+    the failure reproduces with ``roles[:prefix]`` followed by
+    ``failing_role``. A prefix of 0 means the failing role breaks on its
+    own; otherwise the last role of the prefix is the one whose side
+    effects the failure depends on.
+    """
+
+    failing_role: str
+    phase: str
+    task: str
+    roles: Tuple[str, ...] = ()
+    prefix: int = 0
+    probes: Tuple[BisectionProbe, ...] = ()
+    duration: float = 0.0
+
+    @property
+    def minimal_roles(self) -> List[str]:
+        """Get the smallest role list that reproduces the failure."""
+        return [*self.roles[:self.prefix], self.failing_role]
+
+    @property
+    def culprit(self) -> str:
+        """Get the earlier role the failure depends on ("" if none)."""
+        return self.roles[self.prefix - 1] if self.prefix else ""
+
+    def describe(self) -> str:
+        """Get a human-readable account of the bisection for the healer."""
+        where = f"{self.failing_role} : {self.task}" if self.task else self.failing_role
+        if self.culprit:
+            lines = [
+                f"The {self.phase} failure at {where!r} reproduces with roles "
+                f"{', '.join(self.minimal_roles)} but not without {self.culprit!r}: "
+                f"look at what {self.culprit!r} leaves behind (packages, files, "
+                "services, variables) before changing the failing task."
+            ]
+        else:
+            lines = [
+                f"The {self.phase} failure at {where!r} reproduces with "
+                f"{self.failing_role!r} alone: the cause is in that role, not in "
+                "the side effects of earlier roles."
+            ]
+        for probe in self.probes:
+            if probe.reproduced:
+                status = "reproduced"
+            else:
+                status = f"did not reproduce ({probe.failure})" if probe.failure else "passed"
+            lines.append(f"  - {', '.join(probe.roles)}: {status} in {probe.duration:.0f}s")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "failing_role": self.failing_role,
+            "phase": self.phase,
+            "task": self.task,
+            "roles": list(self.roles),
+            "prefix": self.prefix,
+            "minimal_roles": self.minimal_roles,
+            "culprit": self.culprit,
+            "probes": [probe.to_dict() for probe in self.probes],
+            "duration": round(self.duration, 3),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "BisectionResult":
+        """Rebuild a result from ``to_dict`` output."""
+        return cls(
+            failing_role=data["failing_role"],
+            phase=data.get("phase", ""),
+            task=data.get("task", ""),
+            roles=tuple(data.get("roles", ())),
+            prefix=data.get("prefix", 0),
+            probes=tuple(BisectionProbe.from_dict(p) for p in data.get("probes", ())),
+            duration=data.get("duration", 0.0),
+        )
@@ -0,0 +1,106 @@
+# SPDX-License-Identifier: MIT-0
+"""Changed task value object.
+
+Pure Python - no external dependencies.
+"""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import List, Tuple
+
+# Molecule's idempotence report: "* [instance] => role : task"
+_NOT_IDEMPOTENT = re.compile(r"^\* \[(?P<host>[^\]]+)\] => (?P<task>.+)$")
+
+# Longest argument dump kept per task in reports
+MAX_ARGS_LENGTH = 600
+
+
+@dataclass(frozen=True)
+class ChangedTask:
+    """A task that reported ``changed`` on a host.
+
+    This is a Value Object - immutable and defined by its attributes.
+    Entries written by the ``local.workstation.changed_tasks`` callback
+    carry the task's file, line and module arguments; entries parsed from
+    plain output only know the host and the task name.
+    """
+
+    host: str
+    task: str
+    role: str = ""
+    path: str = ""
+    action: str = ""
+    args: dict = field(default_factory=dict, hash=False)
+    items: Tuple[str, ...] = ()
+    handler: bool = False
+
+    @classmethod
+    def from_name(cls, host: str, task: str) -> "ChangedTask":
+        """Build an entry from a task display name ("role : task")."""
+        role, sep, _ = task.partition(" : ")
+        return cls(host=host, task=task, role=role if sep else "")
+
+    def describe(self) -> str:
+        """Get a multi-line description for reports and healer prompts."""
+        lines = [f"* [{self.host}] => {self.task}"]
+        if self.path:
+            lines.append(f"    at: {self.path}" + (" (handler)" if self.handler else ""))
+        if self.action:
+            args = json.dumps(self.args, sort_keys=True, default=str)
+            if len(args) > MAX_ARGS_LENGTH:
+                args = args[:MAX_ARGS_LENGTH] + "...}"
+            lines.append(f"    {self.action}: {args}")
+        if self.items:
+            lines.append(f"    changed items: {', '.join(self.items)}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "host": self.host,
+            "task": self.task,
+            "role": self.role,
+            "path": self.path,
+            "action": self.action,
+            "args": self.args,
+            "items": list(self.items),
+            "handler": self.handler,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ChangedTask":
+        """Rebuild an entry from ``to_dict`` output (or a callback log line)."""
+        return cls(
+            host=data["host"],
+            task=data["task"],
+            role=data.get("role", ""),
+            path=data.get("path", ""),
+            action=data.get("action", ""),
+            args=data.get("args") or {},
+            items=tuple(str(item) for item in data.get("items") or ()),
+            handler=bool(data.get("handler", False)),
+        )
+
+
+def parse_idempotence_report(output: str) -> List[ChangedTask]:
+    """Find the tasks listed in Molecule's idempotence failure report.
+
+    Args:
+        output: ``molecule idempotence`` output
+
+    Returns:
+        Reported tasks in output order (empty if idempotence passed)
+    """
+    tasks = []
+    for line in output.splitlines():
+        match = _NOT_IDEMPOTENT.match(line.strip())
+        if match:
+            tasks.append(ChangedTask.from_name(match.group("host"), match.group("task")))
+    return tasks
+
+
+def changed_tasks_report(tasks: List[ChangedTask]) -> str:
+    """Format non-idempotent tasks with their location and arguments."""
+    body = "\n".join(task.describe() for task in tasks)
+    return f"Tasks that reported changed on the second converge ({len(tasks)}):\n{body}"
@@ -0,0 +1,195 @@
+# SPDX-License-Identifier: MIT-0
+"""Failure position value object.
+
+Pure Python - no external dependencies.
+"""
+
+import re
+from dataclasses import asdict, dataclass
+from typing import Tuple
+
+# Molecule actions in the order a `molecule test` sequence runs them
+SCENARIO_SEQUENCE = (
+    "dependency",
+    "syntax",
+    "create",
+    "prepare",
+    "converge",
+    "idempotence",
+    "side_effect",
+    "verify",
+)
+
+# Actions whose start ends the phase before them
+_PHASE_ENDS = SCENARIO_SEQUENCE + ("cleanup", "destroy")
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+# "INFO     [default > converge] Executing", "Running default > converge",
+# "default ➜ converge: Executing"
+_ACTION_HEADER = re.compile(r"[\w.-]+ (?:>|➜) (?P<action>[a-z_]+)\b")
+_PLAY_HEADER = re.compile(r"^PLAY \[(?P<name>[^\]]*)\]")
+_TASK_HEADER = re.compile(r"^(?:TASK|RUNNING HANDLER) \[(?P<name>[^\]]*)\]")
+_FAILED_HOST = re.compile(r"^(?:fatal|failed): \[(?P<host>[^\]]+)\]")
+# A host's result line for a task ("ok: [instance]", "changed: [instance] => ...")
+_HOST_RESULT = re.compile(r"^(?:ok|changed|skipping|included|fatal|failed): \[(?P<host>[^\]]+)\]")
+# Printed after the failure of a task with ignore_errors
+_IGNORED = "...ignoring"
+# Molecule's idempotence report: "* [instance] => role : task"
+_NOT_IDEMPOTENT = re.compile(r"^\* \[(?P<host>[^\]]+)\] => (?P<task>.+)$")
+
+
+@dataclass(frozen=True)
+class FailurePosition:
+    """Where in the scenario a failed run stopped.
+
+    This is a Value Object - immutable and defined by its attributes.
+    Positions are ordered by how far the run got: scenario phase first,
+    then play, then task within the play. The host is informational.
+    """
+
+    phase: str
+    play: str = ""
+    play_index: int = 0
+    role: str = ""
+    task: str = ""
+    task_index: int = 0
+    host: str = ""
+
+    @property
+    def progress_key(self) -> Tuple[int, int, int]:
+        """Get a sortable key: larger means the run got further."""
+        if self.phase in SCENARIO_SEQUENCE:
+            phase_rank = SCENARIO_SEQUENCE.index(self.phase)
+        else:
+            phase_rank = -1
+        return (phase_rank, self.play_index, self.task_index)
+
+    def is_further_than(self, other: "FailurePosition") -> bool:
+        """Check if this run got further than ``other``."""
+        return self.progress_key > other.progress_key
+
+    def describe(self) -> str:
+        """Get a short human-readable description."""
+        parts = [self.phase]
+        if self.play_index:
+            parts.append(f"play {self.play_index} ({self.play})")
+        if self.task_index:
+            task = f"{self.role} : {self.task}" if self.role else self.task
+            parts.append(f"task {self.task_index} ({task})")
+        description = " > ".join(parts)
+        return f"{description} on {self.host}" if self.host else description
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FailurePosition":
+        """Rebuild a position from ``to_dict`` output."""
+        return cls(**data)
+
+    @classmethod
+    def from_output(cls, output: str, default_phase: str) -> "FailurePosition":
+        """Reduce the output of a failed run to the failure that stopped it.
+
+        Failures that did not stop the run are skipped: those followed by
+        ``...ignoring`` (``ignore_errors``) and those whose host went on to
+        run later tasks (handled by a ``rescue`` block). Of the failures
+        left when a phase ends, the last one is reported.
+
+        Args:
+            output: Full Molecule/Ansible output
+            default_phase: Phase to report when the output names none
+                (e.g. the phase of a standalone ``molecule create``)
+
+        Returns:
+            Position of the failed task, or of the last task started if no
+            task failure line is present
+        """
+        phase = default_phase
+        play, play_index = "", 0
+        task, task_index = "", 0
+        task_indexes = {}
+        # Unhandled failures of the current phase, by host
+        failures = {}
+        last_failed = ""
+
+        for raw_line in output.splitlines():
+            line = _ANSI.sub("", raw_line).strip()
+            if not line:
+                continue
+
+            match = _TASK_HEADER.match(line)
+            if match:
+                task = match.group("name")
+                task_index += 1
+                task_indexes.setdefault(task, task_index)
+                continue
+
+            if line == _IGNORED:
+                failures.pop(last_failed, None)
+                continue
+
+            match = _HOST_RESULT.match(line)
+            if match:
+                host = match.group("host")
+                failed = failures.get(host)
+                if failed and (failed.play_index, failed.task_index) < (play_index, task_index):
+                    # The host ran a later task: the failure was rescued
+                    del failures[host]
+                if _FAILED_HOST.match(line):
+                    last_failed = host
+                    # Re-insert so the latest failure comes last
+                    failures.pop(host, None)
+                    failures[host] = cls._build(phase, play, play_index, task, task_index, host)
+                continue
+
+            match = _PLAY_HEADER.match(line)
+            if match:
+                play, play_index = match.group("name"), play_index + 1
+                task, task_index = "", 0
+                task_indexes = {}
+                continue
+
+            match = _NOT_IDEMPOTENT.match(line)
+            if match:
+                if failures:
+                    return list(failures.values())[-1]
+                name = match.group("task").strip()
+                return cls._build(
+                    phase, play, play_index, name,
+                    task_indexes.get(name, task_index), match.group("host"),
+                )
+
+            if "[" in line or ">" in line or "➜" in line:
+                match = _ACTION_HEADER.search(line)
+                if match and failures and match.group("action") in _PHASE_ENDS:
+                    # The phase ended on these failures (teardown may follow)
+                    return list(failures.values())[-1]
+                if match and match.group("action") in SCENARIO_SEQUENCE:
+                    phase = match.group("action")
+                    play, play_index = "", 0
+                    task, task_index = "", 0
+                    task_indexes = {}
+
+        if failures:
+            return list(failures.values())[-1]
+        return cls._build(phase, play, play_index, task, task_index, "")
+
+    @classmethod
+    def _build(
+        cls, phase: str, play: str, play_index: int, task: str, task_index: int, host: str
+    ) -> "FailurePosition":
+        """Create a position, splitting "role : task" names."""
+        role = ""
+        if " : " in task:
+            role, task = task.split(" : ", 1)
+        return cls(
+            phase=phase,
+            play=play,
+            play_index=play_index,
+            role=role,
+            task=task,
+            task_index=task_index,
+            host=host,
+        )
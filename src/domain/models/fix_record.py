@@ -29,12 +29,36 @@ class FixRecord:
     timestamp: datetime = None
     error_context: str = ""
     claude_output: str = ""
+    error_fingerprint: str = ""
 
     def __post_init__(self):
         """Set timestamp if not provided."""
         if self.timestamp is None:
             object.__setattr__(self, "timestamp", datetime.now())
 
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "iteration": self.iteration,
+            "status": self.status.value,
+            "timestamp": self.timestamp.isoformat(),
+            "error_context": self.error_context,
+            "claude_output": self.claude_output,
+            "error_fingerprint": self.error_fingerprint,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "FixRecord":
+        """Rebuild a record from ``to_dict`` output."""
+        return cls(
+            iteration=data["iteration"],
+            status=FixStatus(data["status"]),
+            timestamp=datetime.fromisoformat(data["timestamp"]) if data.get("timestamp") else None,
+            error_context=data.get("error_context", ""),
+            claude_output=data.get("claude_output", ""),
+            error_fingerprint=data.get("error_fingerprint", ""),
+        )
+
     @property
     def was_successful(self) -> bool:
         """Check if fix was successful."""
@@ -0,0 +1,276 @@
+# SPDX-License-Identifier: MIT-0
+"""Fleet run value objects.
+
+Pure Python - no external dependencies.
+"""
+
+import math
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Sequence, Tuple
+
+# "host : ok=12 changed=1 unreachable=0 failed=0 skipped=3 rescued=0 ignored=0"
+RECAP_PATTERN = re.compile(r"^(?P<host>\S+)\s+:\s+(?P<counts>(?:\w+=\d+\s*)+)$")
+_ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+
+@dataclass(frozen=True)
+class HostResult:
+    """The PLAY RECAP counts of one host.
+
+    This is a Value Object - immutable and defined by its attributes.
+    """
+
+    host: str
+    ok: int = 0
+    changed: int = 0
+    unreachable: int = 0
+    failed: int = 0
+    skipped: int = 0
+    rescued: int = 0
+    ignored: int = 0
+    wave: int = 0
+
+    @property
+    def succeeded(self) -> bool:
+        """Check if the host converged (nothing failed or unreachable)."""
+        return self.failed == 0 and self.unreachable == 0
+
+    @property
+    def tasks(self) -> int:
+        """Get the number of task results of the host (``ok`` includes changed)."""
+        return self.ok + self.failed + self.skipped + self.unreachable
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "host": self.host,
+            "ok": self.ok,
+            "changed": self.changed,
+            "unreachable": self.unreachable,
+            "failed": self.failed,
+            "skipped": self.skipped,
+            "rescued": self.rescued,
+            "ignored": self.ignored,
+            "wave": self.wave,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "HostResult":
+        """Rebuild a result from ``to_dict`` output."""
+        return cls(**{key: data[key] for key in cls.__dataclass_fields__ if key in data})
+
+
+def parse_recap(output: str, wave: int = 0) -> List[HostResult]:
+    """Parse the PLAY RECAP of ansible-playbook output.
+
+    Args:
+        output: ansible-playbook output
+        wave: Wave the hosts ran in
+
+    Returns:
+        One result per host, from the last recap in the output
+    """
+    _, found, recap = output.rpartition("PLAY RECAP")
+    if not found:
+        return []
+    results = []
+    for line in recap.splitlines()[1:]:
+        match = RECAP_PATTERN.match(_ANSI.sub("", line).strip())
+        if not match:
+            if results:
+                break
+            continue
+        counts = {
+            key: int(value)
+            for key, value in (pair.split("=") for pair in match.group("counts").split())
+            if key in HostResult.__dataclass_fields__
+        }
+        results.append(HostResult(host=match.group("host"), wave=wave, **counts))
+    return results
+
+
+@dataclass(frozen=True)
+class ControllerStats:
+    """Resources of the controller running ansible-playbook.
+
+    This is a Value Object - immutable and defined by its attributes.
+    """
+
+    cpus: int
+    memory_available_mb: int
+    load: float = 0.0  # 1-minute load average
+
+    @property
+    def load_per_cpu(self) -> float:
+        """Get the load average per CPU."""
+        return self.load / max(self.cpus, 1)
+
+
+@dataclass(frozen=True)
+class FleetWave:
+    """One ansible-playbook run over a shard of the fleet.
+
+    This is a Value Object - immutable and defined by its attributes.
+    Hosts without a recap line (e.g. the run aborted) count as failed.
+    """
+
+    index: int
+    hosts: Tuple[str, ...]
+    forks: int
+    duration: float = 0.0
+    return_code: int = 0
+    results: Tuple[HostResult, ...] = ()
+
+    @property
+    def failed_hosts(self) -> List[str]:
+        """Get the hosts of the wave that did not converge."""
+        succeeded = {r.host for r in self.results if r.succeeded}
+        return [host for host in self.hosts if host not in succeeded]
+
+    @property
+    def task_latency(self) -> Optional[float]:
+        """Get the observed seconds per task and host.
+
+        With the linear strategy every task runs over the wave's hosts in
+        rounds of ``forks``, so the wall time is divided by the task count
+        and the number of rounds.
+        """
+        tasks = max((r.tasks for r in self.results), default=0)
+        if not tasks or self.duration <= 0:
+            return None
+        rounds = math.ceil(len(self.hosts) / max(self.forks, 1))
+        return self.duration / (tasks * rounds)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "index": self.index,
+            "hosts": list(self.hosts),
+            "forks": self.forks,
+            "duration": round(self.duration, 3),
+            "return_code": self.return_code,
+            "task_latency": self.task_latency,
+            "failed_hosts": self.failed_hosts,
+        }
+
+
+def tune_forks(
+    stats: ControllerStats,
+    pending: int,
+    waves: Sequence[FleetWave] = (),
+    max_forks: int = 50,
+    forks_per_cpu: int = 4,
+    memory_per_fork_mb: int = 128,
+) -> int:
+    """Choose the forks of the next wave.
+
+    The cap comes from the controller: ``forks_per_cpu`` per CPU and
+    ``memory_per_fork_mb`` of available memory per fork. The first wave
+    starts at the cap; later waves grow by half while the observed task
+    latency stays within 1.5x of the best wave so far, and shrink by a
+    quarter when it degrades or the controller is overloaded.
+
+    Args:
+        stats: Current controller resources
+        pending: Hosts of the next wave
+        waves: Waves run so far
+        max_forks: Upper bound
+        forks_per_cpu: Forks per controller CPU
+        memory_per_fork_mb: Controller memory per fork
+
+    Returns:
+        Forks for the next wave (at least 1, at most ``pending``)
+    """
+    cap = min(
+        max_forks,
+        max(stats.cpus, 1) * forks_per_cpu,
+        stats.memory_available_mb // max(memory_per_fork_mb, 1),
+    )
+    cap = max(cap, 1)
+    if not waves:
+        forks = cap
+    else:
+        last = waves[-1]
+        latencies = [w.task_latency for w in waves if w.task_latency is not None]
+        degraded = (
+            last.task_latency is not None
+            and last.task_latency > 1.5 * min(latencies)
+        )
+        if degraded or stats.load_per_cpu > 1.0:
+            forks = last.forks * 3 // 4
+        else:
+            forks = math.ceil(last.forks * 1.5)
+        forks = min(forks, cap)
+    return max(1, min(forks, pending))
+
+
+@dataclass(frozen=True)
+class FleetSummary:
+    """The aggregated result of a fleet run.
+
+    This is a Value Object - immutable and defined by its attributes.
+    ``not_run`` lists the hosts of waves skipped after the failure
+    threshold was reached.
+    """
+
+    pattern: str
+    playbook: str
+    waves: Tuple[FleetWave, ...] = ()
+    not_run: Tuple[str, ...] = ()
+
+    @property
+    def results(self) -> List[HostResult]:
+        """Get the results of every host that ran."""
+        return [result for wave in self.waves for result in wave.results]
+
+    @property
+    def failed_hosts(self) -> List[str]:
+        """Get the hosts that did not converge."""
+        return [host for wave in self.waves for host in wave.failed_hosts]
+
+    @property
+    def hosts(self) -> int:
+        """Get the number of hosts of the fleet."""
+        return sum(len(wave.hosts) for wave in self.waves) + len(self.not_run)
+
+    @property
+    def success(self) -> bool:
+        """Check if every host ran and converged."""
+        return bool(self.waves) and not self.failed_hosts and not self.not_run
+
+    def format(self) -> str:
+        """Get a human-readable summary: one line per wave and per failure."""
+        lines = [
+            f"Fleet {self.pattern!r}: {self.hosts} host(s), {len(self.waves)} wave(s), "
+            f"{len(self.failed_hosts)} failed, {len(self.not_run)} not run"
+        ]
+        for wave in self.waves:
+            latency = f", {wave.task_latency:.2f}s/task" if wave.task_latency else ""
+            lines.append(
+                f"  wave {wave.index}: {len(wave.hosts)} host(s), {wave.forks} forks, "
+                f"{wave.duration:.0f}s{latency}, {len(wave.failed_hosts)} failed"
+            )
+        by_host = {result.host: result for result in self.results}
+        for host in self.failed_hosts:
+            result = by_host.get(host)
+            detail = (
+                f"failed={result.failed} unreachable={result.unreachable}"
+                if result else "no recap"
+            )
+            lines.append(f"  FAILED {host}: {detail}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "pattern": self.pattern,
+            "playbook": self.playbook,
+            "success": self.success,
+            "hosts": self.hosts,
+            "failed_hosts": self.failed_hosts,
+            "not_run": list(self.not_run),
+            "changed": sum(result.changed for result in self.results),
+            "waves": [wave.to_dict() for wave in self.waves],
+            "results": [result.to_dict() for result in self.results],
+        }
@@ -0,0 +1,173 @@
+# SPDX-License-Identifier: MIT-0
+"""Test matrix value objects.
+
+Pure Python - no external dependencies.
+"""
+
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class MatrixCell:
+    """One shard of a test matrix: an image with a variable overlay.
+
+    This is a Value Object - immutable and defined by its attributes.
+    """
+
+    image_name: str
+    image: str
+    overlay_name: str
+    overlay: Dict[str, object] = field(default_factory=dict, hash=False, compare=False)
+
+    @property
+    def name(self) -> str:
+        """Get the cell name ("image/overlay")."""
+        return f"{self.image_name}/{self.overlay_name}"
+
+    def matches(self, rule: Dict[str, str]) -> bool:
+        """Check if an exclude rule (``image`` and/or ``overlay`` names) matches."""
+        return (
+            rule.get("image", self.image_name) == self.image_name
+            and rule.get("overlay", self.overlay_name) == self.overlay_name
+        )
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "name": self.name,
+            "image_name": self.image_name,
+            "image": self.image,
+            "overlay_name": self.overlay_name,
+            "overlay": dict(self.overlay),
+        }
+
+
+@dataclass(frozen=True)
+class MatrixDefinition:
+    """A scenario run over images x variable overlays.
+
+    This is a Value Object - immutable and defined by its attributes.
+    Overlays are passed as extra vars, so they win over the scenario's
+    group_vars. An empty overlay list means one "default" overlay.
+    """
+
+    scenario: str
+    images: Tuple[Tuple[str, str], ...]
+    overlays: Tuple[Tuple[str, Dict[str, object]], ...] = ()
+    exclude: Tuple[Dict[str, str], ...] = ()
+
+    def cells(self) -> List[MatrixCell]:
+        """Expand the matrix into its cells (image-major order)."""
+        overlays = self.overlays or (("default", {}),)
+        cells = [
+            MatrixCell(image_name, image, overlay_name, dict(overlay))
+            for image_name, image in self.images
+            for overlay_name, overlay in overlays
+        ]
+        return [cell for cell in cells if not any(cell.matches(rule) for rule in self.exclude)]
+
+    @classmethod
+    def from_dict(cls, data: dict, scenario: Optional[str] = None) -> "MatrixDefinition":
+        """Build a matrix from its YAML form.
+
+        ``images`` and ``overlays`` are mappings of name to image reference
+        and name to variables; ``exclude`` lists ``{image, overlay}`` rules.
+        ``scenario`` is used when the definition names none.
+
+        Raises:
+            ValueError: If the definition has no images
+        """
+        images = data.get("images") or {}
+        if not images:
+            raise ValueError("matrix defines no images")
+        return cls(
+            scenario=data.get("scenario") or scenario or "default",
+            images=tuple((str(name), str(image)) for name, image in images.items()),
+            overlays=tuple(
+                (str(name), dict(overlay or {}))
+                for name, overlay in (data.get("overlays") or {}).items()
+            ),
+            exclude=tuple(dict(rule) for rule in data.get("exclude") or ()),
+        )
+
+
+@dataclass(frozen=True)
+class CellResult:
+    """The outcome of one matrix cell.
+
+    This is a Value Object - immutable and defined by its attributes.
+    """
+
+    cell: MatrixCell
+    success: bool
+    duration: float = 0.0
+    failed_phase: str = ""
+    error: str = ""
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            **self.cell.to_dict(),
+            "success": self.success,
+            "duration": round(self.duration, 3),
+            "failed_phase": self.failed_phase,
+            "error": self.error,
+        }
+
+
+@dataclass(frozen=True)
+class MatrixSummary:
+    """The results of a matrix run.
+
+    This is a Value Object - immutable and defined by its attributes.
+    """
+
+    scenario: str
+    results: Tuple[CellResult, ...] = ()
+    duration: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        """Check if every cell passed."""
+        return bool(self.results) and all(result.success for result in self.results)
+
+    @property
+    def failed(self) -> List[CellResult]:
+        """Get the failed cells."""
+        return [result for result in self.results if not result.success]
+
+    def format(self) -> str:
+        """Get a pass/fail and duration grid (images x overlays)."""
+        images = list(dict.fromkeys(r.cell.image_name for r in self.results))
+        overlays = list(dict.fromkeys(r.cell.overlay_name for r in self.results))
+        by_cell = {(r.cell.image_name, r.cell.overlay_name): r for r in self.results}
+
+        def text(result: Optional[CellResult]) -> str:
+            if result is None:
+                return "-"
+            status = "PASS" if result.success else f"FAIL({result.failed_phase or '?'})"
+            return f"{status} {result.duration:.0f}s"
+
+        rows = [["", *overlays]] + [
+            [image, *(text(by_cell.get((image, overlay))) for overlay in overlays)]
+            for image in images
+        ]
+        widths = [max(len(row[i]) for row in rows) for i in range(len(rows[0]))]
+        lines = [
+            f"Matrix {self.scenario!r}: {len(self.results) - len(self.failed)}/"
+            f"{len(self.results)} cell(s) passed in {self.duration:.0f}s"
+        ]
+        lines += ["  " + "  ".join(cell.ljust(w) for cell, w in zip(row, widths)).rstrip() for row in rows]
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "scenario": self.scenario,
+            "success": self.success,
+            "duration": round(self.duration, 3),
+            "passed": len(self.results) - len(self.failed),
+            "failed": [result.cell.name for result in self.failed],
+            "cells": [result.to_dict() for result in self.results],
+        }
@@ -0,0 +1,285 @@
+# SPDX-License-Identifier: MIT-0
+"""Task plan value objects.
+
+Pure Python - no external dependencies.
+"""
+
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import PurePosixPath
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# Tags with a meaning of their own in Ansible's tag selection
+SPECIAL_TAGS = frozenset({"always", "never", "all", "tagged", "untagged"})
+
+
+class PlanStatus(Enum):
+    """Whether a planned task runs for the plan's variables."""
+
+    RUN = "run"  # every condition is true (or there are none)
+    SKIP = "skip"  # a condition is false
+    CONDITIONAL = "conditional"  # depends on facts or registered results
+
+
+@dataclass(frozen=True)
+class PlannedTask:
+    """A task of a playbook, as it would run for a set of variables.
+
+    This is a Value Object - immutable and defined by its attributes.
+    Tags and conditions are the effective ones, inherited from the play,
+    role, blocks and imports. ``gates`` holds the tags of the dynamic
+    includes the task was loaded by: with ``--tags``, those includes must
+    be selected too.
+    """
+
+    index: int
+    name: str
+    path: str
+    line: int
+    action: str
+    role: str = ""
+    play: str = ""
+    section: str = "tasks"  # tasks, rescue, always or handlers
+    tags: Tuple[str, ...] = ()
+    when: Tuple[str, ...] = ()
+    status: PlanStatus = PlanStatus.RUN
+    gates: Tuple[Tuple[str, ...], ...] = ()
+
+    @property
+    def display_name(self) -> str:
+        """Get the name ansible-playbook prints ("role : task")."""
+        return f"{self.role} : {self.name}" if self.role else self.name
+
+    @property
+    def location(self) -> str:
+        """Get ``path:line``."""
+        return f"{self.path}:{self.line}"
+
+    @property
+    def is_handler(self) -> bool:
+        """Check if the task is a handler (runs only when notified)."""
+        return self.section == "handlers"
+
+    def is_selected(self, tags: Iterable[str] = (), skip_tags: Iterable[str] = ()) -> bool:
+        """Check if ``--tags``/``--skip-tags`` select this task (Ansible's rules).
+
+        Args:
+            tags: Tags to run (empty for all)
+            skip_tags: Tags to skip
+
+        Returns:
+            True if the task is selected; its conditions are not considered
+        """
+        return all(
+            _tags_match(own, set(tags), set(skip_tags))
+            for own in (self.tags, *self.gates)
+        )
+
+    def describe(self) -> str:
+        """Get a multi-line description for reports and healer prompts."""
+        lines = [f"{self.display_name} ({self.action})", f"    at: {self.location}"]
+        if self.section != "tasks":
+            lines.append(f"    in: {self.section}")
+        if self.tags:
+            lines.append(f"    tags: {', '.join(self.tags)}")
+        if self.when:
+            lines.append(f"    when ({self.status.value}): {' and '.join(self.when)}")
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "index": self.index,
+            "name": self.name,
+            "path": self.path,
+            "line": self.line,
+            "action": self.action,
+            "role": self.role,
+            "play": self.play,
+            "section": self.section,
+            "tags": list(self.tags),
+            "when": list(self.when),
+            "status": self.status.value,
+            "gates": [list(gate) for gate in self.gates],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PlannedTask":
+        """Rebuild a task from ``to_dict`` output."""
+        return cls(
+            index=data["index"],
+            name=data["name"],
+            path=data["path"],
+            line=data["line"],
+            action=data["action"],
+            role=data.get("role", ""),
+            play=data.get("play", ""),
+            section=data.get("section", "tasks"),
+            tags=tuple(data.get("tags", ())),
+            when=tuple(data.get("when", ())),
+            status=PlanStatus(data.get("status", PlanStatus.RUN.value)),
+            gates=tuple(tuple(gate) for gate in data.get("gates", ())),
+        )
+
+
+def _tags_match(own: Iterable[str], tags: set, skip_tags: set) -> bool:
+    """Apply Ansible's --tags/--skip-tags rules to one set of task tags."""
+    own = set(own)
+    if own & skip_tags or ("untagged" in skip_tags and not own):
+        return False
+    if "never" in own:
+        # Only runs when one of its tags is asked for by name
+        return bool(own & tags - {"all", "tagged"})
+    if not tags or "all" in tags:
+        return True
+    if "always" in own and "always" not in skip_tags:
+        return True
+    if own & tags:
+        return True
+    if "tagged" in tags and own and "never" not in own:
+        return True
+    return "untagged" in tags and not own
+
+
+@dataclass(frozen=True)
+class TaskPlan:
+    """The ordered tasks of a playbook for one variable set, with indexes.
+
+    This is a Value Object - immutable and defined by its attributes.
+    Built statically (without running Ansible) from the playbook, the role
+    defaults and the scenario's group_vars. Paths are relative to the
+    project root. ``sources`` maps variable files (role defaults and vars)
+    to the role they belong to; ``unresolved`` lists what could not be
+    followed statically (e.g. includes with templated file names).
+    """
+
+    playbook: str
+    scenario: str = ""
+    tasks: Tuple[PlannedTask, ...] = ()
+    sources: Tuple[Tuple[str, str], ...] = ()
+    unresolved: Tuple[str, ...] = ()
+    _by_path: Dict[str, List[PlannedTask]] = field(
+        default_factory=dict, init=False, repr=False, compare=False, hash=False
+    )
+
+    def __post_init__(self):
+        """Build the file index."""
+        for task in self.tasks:
+            self._by_path.setdefault(task.path, []).append(task)
+
+    # ------------------------------------------------------------------
+    # Indexes
+    # ------------------------------------------------------------------
+
+    @property
+    def files(self) -> List[str]:
+        """Get every task file of the plan, in first-use order."""
+        return list(self._by_path)
+
+    def tasks_in(self, path: str) -> List[PlannedTask]:
+        """Get the tasks defined in a file."""
+        return list(self._by_path.get(_normalize(path), ()))
+
+    def task_at(self, path: str, line: int) -> Optional[PlannedTask]:
+        """Get the task whose definition contains ``line`` of ``path``."""
+        found = None
+        for task in self.tasks_in(path):
+            if task.line <= line and (found is None or task.line > found.line):
+                found = task
+        return found
+
+    def tags_for_file(self, path: str) -> List[str]:
+        """Get the effective tags of the tasks defined in a file."""
+        tags = set()
+        for task in self.tasks_in(path):
+            tags.update(task.tags)
+        return sorted(tags)
+
+    def file_tags(self) -> Dict[str, List[str]]:
+        """Get the file -> tags index for every task file."""
+        return {path: self.tags_for_file(path) for path in self.files}
+
+    def roles_for_file(self, path: str) -> List[str]:
+        """Get the roles whose tasks, defaults or vars a file holds."""
+        path = _normalize(path)
+        roles = {task.role for task in self._by_path.get(path, ())}
+        roles.update(role for source, role in self.sources if source == path)
+        return sorted(roles)
+
+    def impacted(self, paths: Iterable[str]) -> List[PlannedTask]:
+        """Get the tasks a change to ``paths`` can affect.
+
+        A task file affects its own tasks; a role's defaults or vars file
+        affects every task of the role.
+        """
+        paths = {_normalize(p) for p in paths}
+        roles = {role for source, role in self.sources if source in paths}
+        return [t for t in self.tasks if t.path in paths or (t.role and t.role in roles)]
+
+    def find(self, name: str, role: str = "") -> Optional[PlannedTask]:
+        """Get the first task with this name (and role, if given).
+
+        The role may be given by FQCN, as ansible-playbook prints it.
+        """
+        role = role.rsplit(".", 1)[-1]
+        for task in self.tasks:
+            if task.name == name and (not role or task.role == role):
+                return task
+        return None
+
+    def select(
+        self, tags: Iterable[str] = (), skip_tags: Iterable[str] = ()
+    ) -> List[PlannedTask]:
+        """Get the tasks a run with ``--tags``/``--skip-tags`` would reach.
+
+        Handlers and tasks whose conditions are false are left out.
+        """
+        tags, skip_tags = list(tags), list(skip_tags)
+        return [
+            task for task in self.tasks
+            if not task.is_handler
+            and task.status is not PlanStatus.SKIP
+            and task.is_selected(tags, skip_tags)
+        ]
+
+    # ------------------------------------------------------------------
+    # Reporting
+    # ------------------------------------------------------------------
+
+    def format(self, tasks: Optional[Iterable[PlannedTask]] = None) -> str:
+        """Get one line per task: index, status, name, location and tags."""
+        lines = []
+        for task in self.tasks if tasks is None else tasks:
+            section = f" [{task.section}]" if task.section != "tasks" else ""
+            tags = f"  ({', '.join(task.tags)})" if task.tags else ""
+            lines.append(
+                f"{task.index:>4} {task.status.value:<11} {task.display_name}{section}"
+                f"  {task.location}{tags}"
+            )
+        return "\n".join(lines)
+
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "playbook": self.playbook,
+            "scenario": self.scenario,
+            "tasks": [task.to_dict() for task in self.tasks],
+            "sources": [list(source) for source in self.sources],
+            "unresolved": list(self.unresolved),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TaskPlan":
+        """Rebuild a plan from ``to_dict`` output."""
+        return cls(
+            playbook=data["playbook"],
+            scenario=data.get("scenario", ""),
+            tasks=tuple(PlannedTask.from_dict(t) for t in data.get("tasks", ())),
+            sources=tuple(tuple(s) for s in data.get("sources", ())),
+            unresolved=tuple(data.get("unresolved", ())),
+        )
+
+
+def _normalize(path) -> str:
+    """Normalize a project-relative path for index lookups."""
+    return str(PurePosixPath(str(path)))
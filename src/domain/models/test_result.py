@@ -4,9 +4,101 @@
 Pure Python - no external dependencies.
 """
 
-from dataclasses import dataclass
+import re
+from dataclasses import dataclass, replace
 from datetime import datetime
 from enum import Enum
+from typing import List, Tuple
+
+from src.domain.models.changed_task import ChangedTask, changed_tasks_report
+from src.domain.models.failure_position import FailurePosition
+
+# Lines that mark an Ansible/Molecule failure (case-insensitive, as the
+# healer has always matched them)
+ERROR_LINE_PATTERN = re.compile(
+    r"FAILED|ERROR|fatal:|Task/.*failed|changed=.*failed=1|Traceback|Exception",
+    re.IGNORECASE,
+)
+
+_ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+_TASK_HEADER = re.compile(r"^(?:TASK|RUNNING HANDLER) \[(?P<name>[^\]]*)\]")
+_CHANGED_HOST = re.compile(r"^changed: \[(?P<host>[^\]]+)\]")
+
+
+def extract_error_windows(output: str, context: int = 10) -> str:
+    """Extract every error line of ``output`` with surrounding context.
+
+    Overlapping windows are merged; disjoint windows are separated by a
+    ``...`` line. Nothing inside a window is truncated.
+
+    Args:
+        output: Full command output
+        context: Lines of context kept before and after each error line
+
+    Returns:
+        The joined error windows, or an empty string if no error line matched
+    """
+    lines = output.splitlines()
+    windows: List[List[int]] = []
+    for i, line in enumerate(lines):
+        if not ERROR_LINE_PATTERN.search(line):
+            continue
+        start, end = max(0, i - context), min(len(lines), i + context + 1)
+        if windows and start <= windows[-1][1]:
+            windows[-1][1] = end
+        else:
+            windows.append([start, end])
+
+    return "\n...\n".join("\n".join(lines[start:end]) for start, end in windows)
+
+
+def extract_changed_tasks(output: str) -> List[Tuple[str, str]]:
+    """Find the tasks an Ansible run reported as changed.
+
+    Args:
+        output: Ansible playbook output
+
+    Returns:
+        (host, task name) pairs in output order
+    """
+    changed = []
+    task = ""
+    for raw_line in output.splitlines():
+        line = _ANSI.sub("", raw_line).strip()
+        match = _TASK_HEADER.match(line)
+        if match:
+            task = match.group("name")
+            continue
+        match = _CHANGED_HOST.match(line)
+        if match:
+            changed.append((match.group("host"), task))
+    return changed
+
+
+def idempotence_report(changed: List[ChangedTask]) -> str:
+    """Format changed tasks the way Molecule's idempotence check reports them."""
+    tasks = "\n".join(f"* [{task.host}] => {task.task}" for task in changed)
+    return f"CRITICAL Idempotence test failed because of the following tasks:\n{tasks}"
+
+
+def idempotence_failure(result: "TestResult", changed: List[ChangedTask]) -> "TestResult":
+    """Fail a passing second converge because ``changed`` tasks changed.
+
+    Args:
+        result: Result of converging again
+        changed: Tasks that reported changed
+
+    Returns:
+        A failed idempotence result with Molecule's report appended and
+        the changed tasks attached
+    """
+    return TestResult(
+        phase=TestPhase.IDEMPOTENCE,
+        status=TestStatus.FAILED,
+        return_code=2,
+        output=f"{result.output}\n{idempotence_report(changed)}",
+        changed_tasks=tuple(changed),
+    )
 
 
 class TestPhase(Enum):
@@ -42,12 +134,41 @@ class TestResult:
     return_code: int
     output: str
     timestamp: datetime = None
+    # Tasks that made an idempotence check fail
+    changed_tasks: Tuple[ChangedTask, ...] = ()
 
     def __post_init__(self):
         """Set timestamp if not provided."""
         if self.timestamp is None:
             object.__setattr__(self, "timestamp", datetime.now())
 
+    def to_dict(self) -> dict:
+        """Serialize to a JSON-compatible dictionary."""
+        return {
+            "phase": self.phase.value,
+            "status": self.status.value,
+            "return_code": self.return_code,
+            "output": self.output,
+            "timestamp": self.timestamp.isoformat(),
+            "changed_tasks": [task.to_dict() for task in self.changed_tasks],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "TestResult":
+        """Rebuild a result from ``to_dict`` output."""
+        return cls(
+            phase=TestPhase(data["phase"]),
+            status=TestStatus(data["status"]),
+            return_code=data["return_code"],
+            output=data["output"],
+            timestamp=datetime.fromisoformat(data["timestamp"]) if data.get("timestamp") else None,
+            changed_tasks=tuple(ChangedTask.from_dict(t) for t in data.get("changed_tasks") or ()),
+        )
+
+    def with_changed_tasks(self, changed: List[ChangedTask]) -> "TestResult":
+        """Get a copy of this result with ``changed`` attached."""
+        return replace(self, changed_tasks=tuple(changed))
+
     def is_success(self) -> bool:
         """Check if test was successful."""
         return self.status == TestStatus.SUCCESS
@@ -67,3 +188,36 @@ class TestResult:
             if "ERROR" in line or "FAILED" in line or "fatal:" in line:
                 return line.strip()
         return self.output[:200]
+
+    def get_error_window(self, context: int = 10) -> str | None:
+        """Get the full error context from output.
+
+        Unlike ``get_error_summary`` this keeps every error line of the run
+        together with its surrounding context. A failed idempotence check
+        gets the report of its changed tasks instead of the whole second
+        converge, which has no error line to cut a window around.
+
+        Args:
+            context: Lines of context kept around each error line
+
+        Returns:
+            Error windows, the whole output if no error line matched,
+            or None for successful results
+        """
+        if self.is_success():
+            return None
+        windows = extract_error_windows(self.output, context)
+        if self.changed_tasks:
+            report = changed_tasks_report(list(self.changed_tasks))
+            return f"{windows}\n...\n{report}" if windows else report
+        return windows or self.output
+
+    def get_failure_position(self) -> FailurePosition | None:
+        """Get where in the scenario this run failed.
+
+        Returns:
+            Position of the first failure, or None for successful results
+        """
+        if self.is_success():
+            return None
+        return FailurePosition.from_output(self.output, default_phase=self.phase.value)
@@ -9,6 +9,31 @@ from src.infrastructure.adapters import (
     MoleculeExecutorAdapter,
     ClaudeHealerAdapter,
     ConsoleObserverAdapter,
+    JsonlObserverAdapter,
+    MetricsObserverAdapter,
+    CompositeObserverAdapter,
+    JournalStateStoreAdapter,
+    FileErrorStoreAdapter,
+    ArtifactArchiveAdapter,
+    AsyncMoleculeExecutorAdapter,
+    AsyncClaudeHealerAdapter,
+    PodmanContainerPoolAdapter,
+    PooledExecutorAdapter,
+    SocketObserverAdapter,
+    InotifyWatcherAdapter,
+    InProcessExecutorAdapter,
+    DnfCacheAdapter,
+    HttpArtifactMirrorAdapter,
+    CassetteWriter,
+    CassetteReader,
+    CassetteMismatchError,
+    RecordingExecutorAdapter,
+    RecordingHealerAdapter,
+    ReplayExecutorAdapter,
+    ReplayHealerAdapter,
+    ChangedTasksLog,
+    StaticPlanCompilerAdapter,
+    AnsibleFleetExecutorAdapter,
 )
 from src.infrastructure.config import Settings
 
@@ -16,5 +41,30 @@ __all__ = [
     "MoleculeExecutorAdapter",
     "ClaudeHealerAdapter",
     "ConsoleObserverAdapter",
+    "JsonlObserverAdapter",
+    "MetricsObserverAdapter",
+    "CompositeObserverAdapter",
+    "JournalStateStoreAdapter",
+    "FileErrorStoreAdapter",
+    "ArtifactArchiveAdapter",
+    "AsyncMoleculeExecutorAdapter",
+    "AsyncClaudeHealerAdapter",
+    "PodmanContainerPoolAdapter",
+    "PooledExecutorAdapter",
+    "SocketObserverAdapter",
+    "InotifyWatcherAdapter",
+    "InProcessExecutorAdapter",
+    "DnfCacheAdapter",
+    "HttpArtifactMirrorAdapter",
+    "CassetteWriter",
+    "CassetteReader",
+    "CassetteMismatchError",
+    "RecordingExecutorAdapter",
+    "RecordingHealerAdapter",
+    "ReplayExecutorAdapter",
+    "ReplayHealerAdapter",
+    "ChangedTasksLog",
+    "StaticPlanCompilerAdapter",
+    "AnsibleFleetExecutorAdapter",
     "Settings",
 ]
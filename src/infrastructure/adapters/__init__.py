@@ -8,9 +8,55 @@ Following Hexagonal Architecture: Ports (interfaces) ← Adapters (implementatio
 from src.infrastructure.adapters.molecule_executor import MoleculeExecutorAdapter
 from src.infrastructure.adapters.claude_healer import ClaudeHealerAdapter
 from src.infrastructure.adapters.console_observer import ConsoleObserverAdapter
+from src.infrastructure.adapters.jsonl_observer import JsonlObserverAdapter
+from src.infrastructure.adapters.metrics_observer import MetricsObserverAdapter
+from src.infrastructure.adapters.composite_observer import CompositeObserverAdapter
+from src.infrastructure.adapters.journal_state_store import JournalStateStoreAdapter
+from src.infrastructure.adapters.file_error_store import FileErrorStoreAdapter
+from src.infrastructure.adapters.artifact_archive import ArtifactArchiveAdapter
+from src.infrastructure.adapters.async_molecule_executor import AsyncMoleculeExecutorAdapter
+from src.infrastructure.adapters.async_claude_healer import AsyncClaudeHealerAdapter
+from src.infrastructure.adapters.podman_container_pool import PodmanContainerPoolAdapter
+from src.infrastructure.adapters.pooled_executor import PooledExecutorAdapter
+from src.infrastructure.adapters.socket_observer import SocketObserverAdapter
+from src.infrastructure.adapters.inotify_watcher import InotifyWatcherAdapter
+from src.infrastructure.adapters.inprocess_executor import InProcessExecutorAdapter
+from src.infrastructure.adapters.dnf_cache import DnfCacheAdapter
+from src.infrastructure.adapters.http_artifact_mirror import HttpArtifactMirrorAdapter
+from src.infrastructure.adapters.cassette import CassetteWriter, CassetteReader, CassetteMismatchError
+from src.infrastructure.adapters.cassette_recorder import RecordingExecutorAdapter, RecordingHealerAdapter
+from src.infrastructure.adapters.cassette_replay import ReplayExecutorAdapter, ReplayHealerAdapter
+from src.infrastructure.adapters.changed_tasks_log import ChangedTasksLog
+from src.infrastructure.adapters.static_plan_compiler import StaticPlanCompilerAdapter
+from src.infrastructure.adapters.ansible_fleet_executor import AnsibleFleetExecutorAdapter
 
 __all__ = [
     "MoleculeExecutorAdapter",
     "ClaudeHealerAdapter",
     "ConsoleObserverAdapter",
+    "JsonlObserverAdapter",
+    "MetricsObserverAdapter",
+    "CompositeObserverAdapter",
+    "JournalStateStoreAdapter",
+    "FileErrorStoreAdapter",
+    "ArtifactArchiveAdapter",
+    "AsyncMoleculeExecutorAdapter",
+    "AsyncClaudeHealerAdapter",
+    "PodmanContainerPoolAdapter",
+    "PooledExecutorAdapter",
+    "SocketObserverAdapter",
+    "InotifyWatcherAdapter",
+    "InProcessExecutorAdapter",
+    "DnfCacheAdapter",
+    "HttpArtifactMirrorAdapter",
+    "CassetteWriter",
+    "CassetteReader",
+    "CassetteMismatchError",
+    "RecordingExecutorAdapter",
+    "RecordingHealerAdapter",
+    "ReplayExecutorAdapter",
+    "ReplayHealerAdapter",
+    "ChangedTasksLog",
+    "StaticPlanCompilerAdapter",
+    "AnsibleFleetExecutorAdapter",
 ]
@@ -0,0 +1,164 @@
+# SPDX-License-Identifier: MIT-0
+"""Ansible Fleet Executor Adapter.
+
+Concrete implementation of FleetExecutorPort using ansible-playbook.
+This adapter knows HOW to resolve a host pattern, run one wave of hosts
+with ``--limit``/``--forks`` and read the per-host PLAY RECAP.
+
+Waves run from the project root, so the project's ansible.cfg applies:
+its ``ControlMaster``/``ControlPersist`` SSH settings keep one master
+connection per host for the whole wave (and for later waves that reach
+the same hosts within the persist time).
+"""
+
+import asyncio
+import os
+import time
+from functools import partial
+from pathlib import Path
+from typing import List, Optional, Sequence
+
+from src.domain.models import ControllerStats, FleetWave, parse_recap
+from src.application.ports import AsyncObserverPort, FleetExecutorPort
+from src.infrastructure.adapters.output_batcher import stream_output
+from src.infrastructure.config import Settings
+
+
+class AnsibleFleetExecutorAdapter(FleetExecutorPort):
+    """Adapter for running the fleet playbook one wave at a time."""
+
+    # Ansible prints whole JSON results on one line; don't choke on them
+    STREAM_LIMIT = 16 * 1024 * 1024
+
+    def __init__(
+        self,
+        project_root: Path,
+        env: dict,
+        playbook: str = None,
+        inventory: Optional[str] = None,
+        extra_args: Sequence[str] = (),
+        observer: Optional[AsyncObserverPort] = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+    ):
+        """Initialize the executor.
+
+        Args:
+            project_root: Path to project root (holds ansible.cfg)
+            env: Environment variables for ansible-playbook
+            playbook: Fleet playbook (default: from Settings)
+            inventory: Inventory source (default: ansible.cfg's)
+            extra_args: Further ansible-playbook arguments (e.g. --tags)
+            observer: Observer that receives streamed output batches
+            batch_size: Lines per output batch (default: from Settings)
+            flush_interval: Max seconds a partial batch is held (default: from Settings)
+        """
+        self.project_root = Path(project_root)
+        self.env = env
+        self.playbook = playbook or Settings.FLEET_PLAYBOOK
+        self.inventory = inventory
+        self.extra_args = list(extra_args)
+        self.observer = observer
+        self.batch_size = batch_size or Settings.OUTPUT_BATCH_SIZE
+        self.flush_interval = flush_interval or Settings.OUTPUT_FLUSH_INTERVAL
+        self.pattern = ""
+
+    def get_playbook(self) -> str:
+        """Get the playbook the fleet runs."""
+        return self.playbook
+
+    def _inventory_args(self) -> List[str]:
+        return ["-i", self.inventory] if self.inventory else []
+
+    async def _run(self, command: List[str], phase: Optional[str] = None):
+        """Run a command from the project root.
+
+        Args:
+            command: Command and arguments
+            phase: Stream the output to the observer under this phase
+
+        Returns:
+            Tuple of (return code, output)
+        """
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=self.env,
+            cwd=str(self.project_root),
+            limit=self.STREAM_LIMIT,
+        )
+        try:
+            sink = None
+            if phase is not None and self.observer is not None:
+                sink = partial(self.observer.on_output, phase)
+            output = await stream_output(
+                process.stdout, sink, self.batch_size, self.flush_interval
+            )
+            return await process.wait(), "\n".join(output)
+        except asyncio.CancelledError:
+            if process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+
+    async def list_hosts(self, pattern: str) -> List[str]:
+        """Resolve a host pattern with ``ansible --list-hosts``."""
+        self.pattern = pattern
+        try:
+            returncode, output = await self._run(
+                ["ansible", pattern, "--list-hosts", *self._inventory_args()]
+            )
+        except OSError:
+            return []
+        if returncode != 0:
+            return []
+        # "  hosts (2):" followed by one indented host per line
+        lines = output.splitlines()
+        start = next((i for i, line in enumerate(lines) if line.strip().startswith("hosts (")), None)
+        if start is None:
+            return []
+        return [line.strip() for line in lines[start + 1:] if line.startswith(" ") and line.strip()]
+
+    async def run_wave(self, index: int, hosts: Sequence[str], forks: int) -> FleetWave:
+        """Run the playbook on one wave with ``--limit`` and ``--forks``."""
+        command = [
+            "ansible-playbook", self.playbook,
+            *self._inventory_args(),
+            "--limit", ",".join(hosts),
+            "--forks", str(forks),
+            *(["-e", f"workstation_hosts={self.pattern}"] if self.pattern else []),
+            *self.extra_args,
+        ]
+        started = time.monotonic()
+        try:
+            returncode, output = await self._run(command, phase=f"fleet wave {index}")
+        except OSError as e:
+            returncode, output = -1, f"Exception: {e}"
+        return FleetWave(
+            index=index,
+            hosts=tuple(hosts),
+            forks=forks,
+            duration=time.monotonic() - started,
+            return_code=returncode,
+            results=tuple(r for r in parse_recap(output, wave=index) if r.host in hosts),
+        )
+
+    def controller_stats(self) -> ControllerStats:
+        """Read CPUs (as usable by this process), MemAvailable and the load average."""
+        try:
+            cpus = len(os.sched_getaffinity(0))
+        except AttributeError:
+            cpus = os.cpu_count() or 1
+        memory_mb = 0
+        try:
+            with open("/proc/meminfo", encoding="utf-8") as f:
+                for line in f:
+                    if line.startswith("MemAvailable:"):
+                        memory_mb = int(line.split()[1]) // 1024
+                        break
+        except OSError:
+            pass
+        if not memory_mb:
+            memory_mb = os.sysconf("SC_AVPHYS_PAGES") * os.sysconf("SC_PAGE_SIZE") // 2**20
+        return ControllerStats(cpus=cpus, memory_available_mb=memory_mb, load=os.getloadavg()[0])
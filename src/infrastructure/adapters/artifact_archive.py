@@ -0,0 +1,347 @@
+# SPDX-License-Identifier: MIT-0
+"""Artifact Archive Adapter.
+
+Concrete implementation of ArtifactArchivePort using indexed gzip archives.
+This adapter knows HOW to lay out iteration artifacts so a post-mortem can
+seek straight to one task without decompressing the whole run.
+
+Layout under the archive root:
+
+    iteration-0003-initial_validation.gz   concatenated gzip members
+    index.jsonl                            one entry per archived task
+
+Each index entry maps (iteration, phase, kind, task) to the byte offset and
+length of the gzip member holding it, plus the task's line range inside
+that member. Small tasks are coalesced into shared members to keep the
+compression ratio reasonable.
+"""
+
+import gzip
+import json
+import os
+import re
+import shutil
+import subprocess
+import tempfile
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.domain.models import TestResult, FixRecord, ERROR_LINE_PATTERN
+from src.application.ports import ArtifactArchivePort
+
+
+class ArtifactArchiveAdapter(ArtifactArchivePort):
+    """Adapter for per-iteration compressed artifact archives.
+
+    Collects molecule output, the ansible.log slice written during the
+    iteration, healer transcripts and healer diffs. A healer diff holds
+    only what the heal changed: the working tree (including untracked
+    files) is snapshotted as a git tree before the heal and diffed against
+    a second snapshot after it, so uncommitted user edits and earlier
+    heals are left out. Retention is bounded
+    by iteration count and total size, and ansible.log is truncated once
+    it exceeds its cap (its content has been archived by then).
+    """
+
+    INDEX_FILE = "index.jsonl"
+
+    # Section headers in Ansible output and ansible.log
+    _TASK_HEADER = re.compile(r"\b(?:TASK|RUNNING HANDLER) \[(?P<name>[^\]]*)\]")
+    _DIFF_HEADER = re.compile(r"^diff --git a/(?P<name>\S+)")
+    _ANSI = re.compile(r"\x1b\[[0-9;]*[A-Za-z]")
+
+    def __init__(
+        self,
+        root: Path,
+        project_root: Path,
+        ansible_log: Optional[Path] = None,
+        max_iterations: int = 20,
+        max_bytes: int = 256 * 1024 * 1024,
+        ansible_log_max_bytes: int = 64 * 1024 * 1024,
+        member_bytes: int = 64 * 1024,
+    ):
+        """Initialize the archive.
+
+        Args:
+            root: Archive directory
+            project_root: Project root (for healer diffs)
+            ansible_log: ansible.log to slice per iteration
+            max_iterations: Keep at most this many iteration archives
+            max_bytes: Keep at most this many archive bytes in total
+            ansible_log_max_bytes: Truncate ansible.log once it exceeds this
+            member_bytes: Target uncompressed size of a coalesced gzip member
+        """
+        self.root = Path(root)
+        self.project_root = Path(project_root)
+        self.ansible_log = Path(ansible_log) if ansible_log else None
+        self.max_iterations = max_iterations
+        self.max_bytes = max_bytes
+        self.ansible_log_max_bytes = ansible_log_max_bytes
+        self.member_bytes = member_bytes
+
+        self._file = None
+        self._iteration = 0
+        self._agent_phase = ""
+        self._log_offset = 0
+        self._entries: List[dict] = []
+        self._heal_snapshot = ""
+
+    # ------------------------------------------------------------------
+    # Writing
+    # ------------------------------------------------------------------
+
+    def begin_iteration(self, iteration: int, agent_phase: str) -> None:
+        """Open the iteration archive and remember the ansible.log position."""
+        if self._file is not None:
+            self.end_iteration()
+
+        self.root.mkdir(parents=True, exist_ok=True)
+        self._iteration = iteration
+        self._agent_phase = agent_phase
+        self._entries = []
+        path = self.root / f"iteration-{iteration:04d}-{agent_phase}.gz"
+        self._file = open(path, "ab")
+        self._log_offset = self._ansible_log_size()
+
+    def add_test_result(self, result: TestResult) -> None:
+        """Archive molecule output, split per task."""
+        self._add(result.phase.value, "molecule_output", self._split(result.output, self._TASK_HEADER))
+
+    def begin_heal(self) -> None:
+        """Snapshot the working tree before the healer changes it."""
+        self._heal_snapshot = self._snapshot_tree()
+
+    def add_fix_record(self, fix_record: FixRecord) -> None:
+        """Archive the healer transcript and the changes made since ``begin_heal``."""
+        before, self._heal_snapshot = self._heal_snapshot, ""
+        if self._file is None:
+            return
+
+        self._add("heal", "healer_transcript", [("transcript", fix_record.claude_output)])
+
+        diff = self._git_diff(before)
+        if diff:
+            self._add("heal", "healer_diff", self._split(diff, self._DIFF_HEADER))
+
+    def end_iteration(self) -> None:
+        """Archive the ansible.log slice, write the index and apply retention."""
+        if self._file is None:
+            return
+
+        log_slice = self._read_ansible_log_slice()
+        if log_slice:
+            self._add("ansible_log", "ansible_log", self._split(log_slice, self._TASK_HEADER))
+
+        self._file.close()
+        self._file = None
+
+        if self._entries:
+            with open(self.root / self.INDEX_FILE, "a", encoding="utf-8") as f:
+                for entry in self._entries:
+                    f.write(json.dumps(entry) + "\n")
+        self._entries = []
+
+        self._truncate_ansible_log()
+        self._apply_retention()
+
+    def _split(self, text: str, header: re.Pattern) -> List[Tuple[str, str]]:
+        """Split text into (section name, section text) at header lines."""
+        sections = []
+        name, lines = "(preamble)", []
+        for line in text.splitlines():
+            # Cheap substring pre-check keeps the regex off most lines
+            if "[" in line or line.startswith("diff "):
+                match = header.search(self._ANSI.sub("", line))
+                if match:
+                    if lines:
+                        sections.append((name, "\n".join(lines)))
+                    name, lines = match.group("name"), []
+            lines.append(line)
+        if lines:
+            sections.append((name, "\n".join(lines)))
+        return sections
+
+    def _add(self, phase: str, kind: str, sections: List[Tuple[str, str]]) -> None:
+        """Write sections as coalesced gzip members and index each of them."""
+        if self._file is None:
+            return
+
+        member_lines: List[str] = []
+        member_size = 0
+        pending: List[dict] = []
+
+        for task, text in sections:
+            lines = text.split("\n")
+            pending.append({
+                "iteration": self._iteration,
+                "agent_phase": self._agent_phase,
+                "phase": phase,
+                "kind": kind,
+                "task": task,
+                "failed": bool(ERROR_LINE_PATTERN.search(text)),
+                "file": Path(self._file.name).name,
+                "start_line": len(member_lines),
+                "line_count": len(lines),
+            })
+            member_lines.extend(lines)
+            member_size += len(text)
+            if member_size >= self.member_bytes:
+                self._flush_member(member_lines, pending)
+                member_lines, member_size, pending = [], 0, []
+
+        if pending:
+            self._flush_member(member_lines, pending)
+
+    def _flush_member(self, lines: List[str], entries: List[dict]) -> None:
+        """Compress lines into one gzip member and record its byte range."""
+        data = gzip.compress("\n".join(lines).encode("utf-8", "replace"))
+        offset = self._file.tell()
+        self._file.write(data)
+        for entry in entries:
+            entry["offset"] = offset
+            entry["length"] = len(data)
+            self._entries.append(entry)
+
+    def _git(self, *args: str, env: Optional[dict] = None) -> str:
+        """Run git in the project root; its stdout, or "" on failure."""
+        try:
+            result = subprocess.run(
+                ["git", *args],
+                capture_output=True,
+                text=True,
+                cwd=str(self.project_root),
+                env=env,
+                timeout=60,
+            )
+            return result.stdout if result.returncode == 0 else ""
+        except Exception:
+            return ""
+
+    def _snapshot_excludes(self) -> List[str]:
+        """Get pathspecs for the agent's own outputs, left out of snapshots."""
+        excludes = [":(exclude,glob).agent-*", ":(exclude).ansible"]
+        for path in (self.root, self.ansible_log):
+            if path is None:
+                continue
+            try:
+                excludes.append(f":(exclude){path.resolve().relative_to(self.project_root.resolve())}")
+            except ValueError:
+                pass  # outside the project
+        return excludes
+
+    def _snapshot_tree(self) -> str:
+        """Write the working tree (tracked and untracked files) as a git tree.
+
+        Uses a copy of the index, so the user's staging area is untouched
+        and unchanged files are not rehashed.
+
+        Returns:
+            The tree ID, or "" if unavailable
+        """
+        index = self._git("rev-parse", "--git-path", "index").strip()
+        if not index:
+            return ""
+        with tempfile.TemporaryDirectory() as tmp:
+            env = {**os.environ, "GIT_INDEX_FILE": os.path.join(tmp, "index")}
+            index_path = self.project_root / index
+            if index_path.exists():
+                shutil.copyfile(index_path, env["GIT_INDEX_FILE"])
+            self._git("add", "-A", "--", ".", *self._snapshot_excludes(), env=env)
+            return self._git("write-tree", env=env).strip()
+
+    def _git_diff(self, before: str) -> str:
+        """Get the diff from the ``before`` snapshot to the current tree (empty if unavailable)."""
+        after = self._snapshot_tree()
+        if not before or not after:
+            return ""
+        return self._git("diff", before, after)
+
+    def _ansible_log_size(self) -> int:
+        """Get the current ansible.log size (0 if missing)."""
+        if self.ansible_log is None or not self.ansible_log.exists():
+            return 0
+        return self.ansible_log.stat().st_size
+
+    def _read_ansible_log_slice(self) -> str:
+        """Read what was appended to ansible.log during this iteration."""
+        size = self._ansible_log_size()
+        if size <= self._log_offset:
+            return ""
+        with open(self.ansible_log, "rb") as f:
+            f.seek(self._log_offset)
+            return f.read(size - self._log_offset).decode("utf-8", "replace")
+
+    def _truncate_ansible_log(self) -> None:
+        """Truncate ansible.log when it outgrows its cap."""
+        if self._ansible_log_size() > self.ansible_log_max_bytes:
+            os.truncate(self.ansible_log, 0)
+
+    def _apply_retention(self) -> None:
+        """Drop the oldest iteration archives beyond the count and size caps."""
+        archives = sorted(self.root.glob("iteration-*.gz"), key=lambda p: p.stat().st_mtime)
+        total = sum(p.stat().st_size for p in archives)
+        removed = set()
+
+        while archives and (len(archives) > self.max_iterations or total > self.max_bytes):
+            oldest = archives.pop(0)
+            total -= oldest.stat().st_size
+            oldest.unlink()
+            removed.add(oldest.name)
+
+        if removed:
+            kept = [e for e in self.entries() if e["file"] not in removed]
+            tmp_path = self.root / f"{self.INDEX_FILE}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                for entry in kept:
+                    f.write(json.dumps(entry) + "\n")
+            os.replace(tmp_path, self.root / self.INDEX_FILE)
+
+    # ------------------------------------------------------------------
+    # Reading (post-mortems)
+    # ------------------------------------------------------------------
+
+    def entries(self) -> List[dict]:
+        """Get all index entries."""
+        index = self.root / self.INDEX_FILE
+        if not index.exists():
+            return []
+        with open(index, encoding="utf-8") as f:
+            return [json.loads(line) for line in f if line.strip()]
+
+    def find(
+        self,
+        iteration: Optional[int] = None,
+        phase: Optional[str] = None,
+        kind: Optional[str] = None,
+        task: Optional[str] = None,
+        failed: Optional[bool] = None,
+    ) -> List[dict]:
+        """Find index entries matching all given filters.
+
+        Args:
+            iteration: Iteration number
+            phase: Test phase (e.g. "full_test", "heal", "ansible_log")
+            kind: Artifact kind (e.g. "molecule_output", "healer_diff")
+            task: Substring of the task name
+            failed: Only sections with (or without) error lines
+
+        Returns:
+            Matching index entries in archive order
+        """
+        return [
+            e for e in self.entries()
+            if (iteration is None or e["iteration"] == iteration)
+            and (phase is None or e["phase"] == phase)
+            and (kind is None or e["kind"] == kind)
+            and (task is None or task in e["task"])
+            and (failed is None or e["failed"] == failed)
+        ]
+
+    def read(self, entry: dict) -> str:
+        """Read one archived section by seeking to its gzip member."""
+        with open(self.root / entry["file"], "rb") as f:
+            f.seek(entry["offset"])
+            data = f.read(entry["length"])
+        lines = gzip.decompress(data).decode("utf-8", "replace").split("\n")
+        start = entry["start_line"]
+        return "\n".join(lines[start:start + entry["line_count"]])
@@ -0,0 +1,135 @@
+# SPDX-License-Identifier: MIT-0
+"""Async Claude Healer Adapter.
+
+Concrete implementation of AsyncHealerPort using Claude Code CLI.
+This adapter knows HOW to invoke Claude as an asyncio subprocess.
+"""
+
+import asyncio
+from pathlib import Path
+
+from src.domain.models import FixRecord, FixStatus, AgentState
+from src.application.ports import AsyncHealerPort, PlanCompilerPort
+from src.infrastructure.adapters.claude_healer import ClaudeHealerAdapter
+
+
+class AsyncClaudeHealerAdapter(AsyncHealerPort):
+    """Adapter for self-healing using Claude Code CLI without blocking.
+
+    Builds the same prompt as ClaudeHealerAdapter. Cancelling a heal
+    kills the claude process.
+    """
+
+    def __init__(
+        self,
+        claude_path: str = None,
+        timeout: int = None,
+        project_root: Path = None,
+        planner: PlanCompilerPort = None,
+    ):
+        """Initialize the healer.
+
+        Args:
+            claude_path: Path to claude CLI (default: from Settings)
+            timeout: Timeout in seconds (default: from Settings)
+            project_root: Project root directory
+            planner: Port resolving the scenario's task plan (optional)
+        """
+        # Shares configuration defaults and prompt building with the sync adapter
+        self._prompts = ClaudeHealerAdapter(claude_path, timeout, project_root, planner)
+        self.claude_path = self._prompts.claude_path
+        self.timeout = self._prompts.timeout
+        self.project_root = self._prompts.project_root
+        self.prompt_file = self._prompts.prompt_file
+
+    async def is_available(self) -> bool:
+        """Check if Claude CLI is available."""
+        try:
+            process = await asyncio.create_subprocess_exec(
+                self.claude_path, "--version",
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL,
+            )
+            return await asyncio.wait_for(process.wait(), timeout=5) == 0
+        except Exception:
+            return False
+
+    def get_healer_name(self) -> str:
+        """Get the name of this healer implementation."""
+        return "Claude Code"
+
+    async def analyze_and_fix(
+        self,
+        error_output: str,
+        iteration: int,
+        state: AgentState,
+    ) -> FixRecord:
+        """Analyze error and invoke Claude to fix it.
+
+        Args:
+            error_output: Error output from failed test
+            iteration: Current iteration number
+            state: Current agent state
+
+        Returns:
+            FixRecord with status and details
+        """
+        prompt = self._prompts._build_prompt(error_output, iteration, state)
+
+        # Save prompt to temp file
+        self.prompt_file.write_text(prompt)
+        process = None
+
+        try:
+            # Invoke Claude Code
+            process = await asyncio.create_subprocess_exec(
+                self.claude_path, "-y", str(self.prompt_file),
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
+                cwd=str(self.project_root),
+            )
+            stdout, stderr = await asyncio.wait_for(process.communicate(), timeout=self.timeout)
+
+            if process.returncode == 0:
+                return FixRecord(
+                    iteration=iteration,
+                    status=FixStatus.SUCCESS,
+                    claude_output=stdout.decode("utf-8", "replace"),
+                    error_context=error_output,
+                )
+            else:
+                return FixRecord(
+                    iteration=iteration,
+                    status=FixStatus.FAILED,
+                    claude_output=stderr.decode("utf-8", "replace") or "Claude failed",
+                    error_context=error_output,
+                )
+
+        except asyncio.TimeoutError:
+            await self._kill(process)
+            return FixRecord(
+                iteration=iteration,
+                status=FixStatus.TIMEOUT,
+                claude_output="Claude timed out",
+                error_context=error_output,
+            )
+        except asyncio.CancelledError:
+            await self._kill(process)
+            raise
+        except Exception as e:
+            return FixRecord(
+                iteration=iteration,
+                status=FixStatus.FAILED,
+                claude_output=f"Exception: {e}",
+                error_context=error_output,
+            )
+        finally:
+            # Clean up prompt file
+            self.prompt_file.unlink(missing_ok=True)
+
+    @staticmethod
+    async def _kill(process) -> None:
+        """Kill a still-running claude process."""
+        if process is not None and process.returncode is None:
+            process.kill()
+            await process.wait()
@@ -0,0 +1,272 @@
+# SPDX-License-Identifier: MIT-0
+"""Async Molecule Executor Adapter.
+
+Concrete implementation of AsyncExecutorPort using Molecule CLI.
+This adapter knows HOW to execute Molecule commands as asyncio subprocesses.
+"""
+
+import asyncio
+from functools import partial
+from typing import List, Optional, Tuple
+
+from src.domain.models import (
+    TestResult,
+    TestPhase,
+    TestStatus,
+    idempotence_failure,
+)
+from src.application.ports import AsyncExecutorPort, AsyncObserverPort
+from src.infrastructure.adapters.changed_tasks_log import ChangedTasksLog
+from src.infrastructure.adapters.output_batcher import stream_output
+from src.infrastructure.config import Settings
+
+
+class AsyncMoleculeExecutorAdapter(AsyncExecutorPort):
+    """Adapter for executing Molecule tests without blocking the event loop.
+
+    Every call spawns its own subprocess, so calls may run concurrently.
+    Cancelling a call kills its subprocess.
+    """
+
+    # Ansible prints whole JSON results on one line; don't choke on them
+    STREAM_LIMIT = 16 * 1024 * 1024
+
+    def __init__(
+        self,
+        scenario: str,
+        env: dict,
+        project_root,
+        observer: Optional[AsyncObserverPort] = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+    ):
+        """Initialize the executor.
+
+        Args:
+            scenario: Molecule scenario name
+            env: Environment variables for execution
+            project_root: Path to project root
+            observer: Observer that receives streamed output batches
+            batch_size: Lines per output batch (default: from Settings)
+            flush_interval: Max seconds a partial batch is held (default: from Settings)
+        """
+        self.scenario = scenario
+        self.env = env
+        self.project_root = project_root
+        self.observer = observer
+        self.batch_size = batch_size or Settings.OUTPUT_BATCH_SIZE
+        self.flush_interval = flush_interval or Settings.OUTPUT_FLUSH_INTERVAL
+
+    async def _run_command(
+        self,
+        command: List[str],
+        phase: TestPhase,
+        env: Optional[dict] = None,
+    ) -> TestResult:
+        """Run a command and return TestResult.
+
+        Args:
+            command: Command and arguments
+            phase: Test phase for this execution
+            env: Environment for this command (default: the executor's)
+
+        Returns:
+            TestResult with status and output
+        """
+        process = None
+
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.STDOUT,
+                env=self.env if env is None else env,
+                cwd=str(self.project_root),
+                limit=self.STREAM_LIMIT,
+            )
+
+            # Stream output in batches
+            full_output = await stream_output(
+                process.stdout,
+                None if self.observer is None else partial(self.observer.on_output, phase.value),
+                self.batch_size,
+                self.flush_interval,
+            )
+
+            returncode = await process.wait()
+            status = TestStatus.SUCCESS if returncode == 0 else TestStatus.FAILED
+
+            return TestResult(
+                phase=phase,
+                status=status,
+                return_code=returncode,
+                output="\n".join(full_output),
+            )
+
+        except asyncio.CancelledError:
+            if process is not None and process.returncode is None:
+                process.kill()
+                await process.wait()
+            raise
+        except Exception as e:
+            return TestResult(
+                phase=phase,
+                status=TestStatus.FAILED,
+                return_code=-1,
+                output=f"Exception: {e}",
+            )
+
+    async def create_containers(self) -> TestResult:
+        """Create test containers."""
+        return await self._run_command(
+            ["molecule", "create", "-s", self.scenario],
+            TestPhase.CREATE,
+        )
+
+    async def prepare_environment(self) -> TestResult:
+        """Prepare test environment."""
+        return await self._run_command(
+            ["molecule", "prepare", "-s", self.scenario],
+            TestPhase.PREPARE,
+        )
+
+    async def converge(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Run converge (apply playbook), limited to ``tags`` if given."""
+        return await self._run_command(
+            ["molecule", "converge", "-s", self.scenario, *self._tag_args(tags)],
+            TestPhase.CONVERGE,
+        )
+
+    async def check_idempotence(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Check idempotence, limited to ``tags`` if given.
+
+        ``molecule idempotence`` cannot pass arguments to Ansible, so a
+        tagged check converges the tags again and fails on changed tasks.
+        Either way a failed result carries the changed tasks, with file,
+        line and module arguments when the changed_tasks callback logged them.
+        """
+        with ChangedTasksLog() as log:
+            if not tags:
+                result = await self._run_command(
+                    ["molecule", "idempotence", "-s", self.scenario],
+                    TestPhase.IDEMPOTENCE,
+                    env=log.env(self.env),
+                )
+                reported = log.reported_in(result.output) if result.is_failure() else []
+                return result.with_changed_tasks(reported) if reported else result
+
+            result = await self._run_command(
+                ["molecule", "converge", "-s", self.scenario, *self._tag_args(tags)],
+                TestPhase.IDEMPOTENCE,
+                env=log.env(self.env),
+            )
+            changed = log.changed_in(result.output) if result.is_success() else []
+        return idempotence_failure(result, changed) if changed else result
+
+    @staticmethod
+    def _tag_args(tags: Optional[List[str]]) -> List[str]:
+        """Get the Ansible arguments that limit a run to ``tags``."""
+        return ["--", "--tags", ",".join(tags)] if tags else []
+
+    async def verify(self) -> TestResult:
+        """Run verification tests."""
+        return await self._run_command(
+            ["molecule", "verify", "-s", self.scenario],
+            TestPhase.VERIFY,
+        )
+
+    async def run_full_test(self) -> TestResult:
+        """Run complete test suite (with changed tasks if idempotence failed)."""
+        with ChangedTasksLog() as log:
+            result = await self._run_command(
+                ["molecule", "test", "-s", self.scenario],
+                TestPhase.FULL_TEST,
+                env=log.env(self.env),
+            )
+            reported = log.reported_in(result.output) if result.is_failure() else []
+        return result.with_changed_tasks(reported) if reported else result
+
+    async def destroy_containers(self) -> TestResult:
+        """Destroy all containers."""
+        return await self._run_command(
+            ["molecule", "destroy", "-s", self.scenario],
+            TestPhase.DESTROY,
+        )
+
+    async def cleanup(self) -> TestResult:
+        """Cleanup temporary files."""
+        return await self._run_command(
+            ["molecule", "cleanup", "-s", self.scenario],
+            TestPhase.CLEANUP,
+        )
+
+    async def _capture(self, command: List[str]) -> Tuple[int, str]:
+        """Run a short helper command quietly and capture its stdout.
+
+        Args:
+            command: Command and arguments
+
+        Returns:
+            Tuple of (return code, stdout); (-1, "") if it could not run
+        """
+        try:
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.DEVNULL,
+                env=self.env,
+                cwd=str(self.project_root),
+            )
+        except Exception:
+            return -1, ""
+
+        try:
+            stdout, _ = await asyncio.wait_for(process.communicate(), timeout=60)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+            return -1, ""
+        return process.returncode, stdout.decode("utf-8", "replace")
+
+    async def get_container_identity(self) -> dict:
+        """Get the names and podman IDs of the scenario's created instances."""
+        rc, out = await self._capture(["molecule", "list", "-s", self.scenario, "-f", "plain"])
+        if rc != 0:
+            return {}
+
+        # Plain format rows: name driver provisioner scenario created converged
+        names = []
+        for line in out.splitlines():
+            fields = line.split()
+            if len(fields) >= 5 and fields[3] == self.scenario and fields[4].lower() == "true":
+                names.append(fields[0])
+        if not names:
+            return {}
+
+        rc, out = await self._capture(["podman", "inspect", "--format", "{{.Id}}", *names])
+        if rc != 0:
+            return {}
+
+        return {
+            "driver": "podman",
+            "containers": dict(zip(names, out.split())),
+        }
+
+    async def is_alive(self, identity: dict) -> bool:
+        """Check if the recorded containers still exist and are running."""
+        containers = identity.get("containers") or {}
+        if not containers:
+            return False
+
+        rc, out = await self._capture([
+            "podman", "inspect", "--format", "{{.Id}} {{.State.Running}}", *containers
+        ])
+        if rc != 0:
+            return False
+
+        live = dict(line.split() for line in out.splitlines() if line.strip())
+        return all(live.get(cid) == "true" for cid in containers.values())
+
+    def get_scenario_name(self) -> str:
+        """Get the current scenario name."""
+        return self.scenario
@@ -0,0 +1,186 @@
+# SPDX-License-Identifier: MIT-0
+"""Cassette files for recording and replaying executor and healer calls.
+
+A cassette is a JSONL file. The first line is a header with the scenario
+and healer name, every further line one port call:
+
+    {"port": "executor", "method": "converge", "args": {"tags": null},
+     "started": 12.3, "duration": 81.9, "result": {...}}
+
+``started`` is seconds since recording began, ``result`` a serialized
+TestResult/FixRecord or plain JSON value. A call that raised has
+``error`` instead of ``result``; one that was cancelled has
+``"cancelled": true``.
+"""
+
+import json
+import threading
+from collections import defaultdict, deque
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Deque, Dict, Optional, Tuple
+
+from src.domain.models import FixRecord, TestResult
+
+CASSETTE_VERSION = 1
+
+
+class CassetteMismatchError(Exception):
+    """A replayed run made a call the cassette did not record."""
+
+
+def encode_value(value: Any) -> Any:
+    """Serialize a port call's return value."""
+    if isinstance(value, TestResult):
+        return {"test_result": value.to_dict()}
+    if isinstance(value, FixRecord):
+        return {"fix_record": value.to_dict()}
+    return value
+
+
+def decode_value(value: Any) -> Any:
+    """Rebuild a return value serialized by ``encode_value``."""
+    if isinstance(value, dict) and len(value) == 1:
+        if "test_result" in value:
+            return TestResult.from_dict(value["test_result"])
+        if "fix_record" in value:
+            return FixRecord.from_dict(value["fix_record"])
+    return value
+
+
+class CassetteWriter:
+    """Append port calls to a new cassette file.
+
+    Every call is flushed as it completes, so a crashed or interrupted run
+    still leaves a usable cassette up to that point.
+    """
+
+    def __init__(self, path: Path, **header: Any):
+        """Create (or overwrite) a cassette.
+
+        Args:
+            path: Cassette file
+            **header: Run metadata (scenario, healer, executor, ...)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w", encoding="utf-8")
+        self._lock = threading.Lock()
+        self._started = None
+        self._write({
+            "cassette": CASSETTE_VERSION,
+            "recorded": datetime.now().isoformat(),
+            **header,
+        })
+
+    def _write(self, record: dict) -> None:
+        """Write one line."""
+        with self._lock:
+            self._file.write(json.dumps(record, default=str) + "\n")
+            self._file.flush()
+
+    def record(
+        self,
+        port: str,
+        method: str,
+        args: Dict[str, Any],
+        started: float,
+        duration: float,
+        result: Any = None,
+        error: Optional[str] = None,
+        cancelled: bool = False,
+    ) -> None:
+        """Record one completed call.
+
+        Args:
+            port: "executor" or "healer"
+            method: Port method name
+            args: Call arguments that determine the outcome
+            started: time.monotonic() when the call began
+            duration: Seconds the call took
+            result: Return value (ignored with ``error``/``cancelled``)
+            error: Description of the exception the call raised
+            cancelled: The caller cancelled the call
+        """
+        if self._started is None:
+            self._started = started
+        entry = {
+            "port": port,
+            "method": method,
+            "args": args,
+            "started": round(started - self._started, 6),
+            "duration": round(duration, 6),
+        }
+        if cancelled:
+            entry["cancelled"] = True
+        elif error is not None:
+            entry["error"] = error
+        else:
+            entry["result"] = encode_value(result)
+        self._write(entry)
+
+    def close(self) -> None:
+        """Close the file."""
+        with self._lock:
+            self._file.close()
+
+
+class CassetteReader:
+    """Hand out a cassette's recorded calls in order.
+
+    Calls are queued per port and method: concurrent calls (a teardown
+    awaited while healing) may complete in a different order than they
+    were recorded, but each method sees its own calls in recorded order.
+    """
+
+    def __init__(self, path: Path, strict: bool = True):
+        """Load a cassette.
+
+        Args:
+            path: Cassette file
+            strict: Fail when a call's arguments differ from the recording
+        """
+        self.path = Path(path)
+        self.strict = strict
+        self._queues: Dict[Tuple[str, str], Deque[dict]] = defaultdict(deque)
+        self._lock = threading.Lock()
+
+        with open(self.path, encoding="utf-8") as f:
+            self.header = json.loads(f.readline() or "{}")
+            if self.header.get("cassette") != CASSETTE_VERSION:
+                raise ValueError(f"{self.path} is not a version {CASSETTE_VERSION} cassette")
+            for line in f:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._queues[(entry["port"], entry["method"])].append(entry)
+
+    def take(self, port: str, method: str, args: Dict[str, Any]) -> dict:
+        """Get the next recorded call of a method.
+
+        Args:
+            port: "executor" or "healer"
+            method: Port method name
+            args: Arguments of the replayed call
+
+        Returns:
+            The recorded entry
+
+        Raises:
+            CassetteMismatchError: No call left, or (strict) other arguments
+        """
+        with self._lock:
+            queue = self._queues.get((port, method))
+            if not queue:
+                raise CassetteMismatchError(f"Unrecorded call: {port}.{method}({args})")
+            entry = queue.popleft()
+
+        if self.strict and entry["args"] != args:
+            raise CassetteMismatchError(
+                f"{port}.{method} called with {args}, recorded with {entry['args']}"
+            )
+        return entry
+
+    def remaining(self) -> int:
+        """Count recorded calls not replayed yet."""
+        with self._lock:
+            return sum(len(queue) for queue in self._queues.values())
@@ -0,0 +1,147 @@
+# SPDX-License-Identifier: MIT-0
+"""Cassette Recorder Adapters.
+
+Concrete implementations of AsyncExecutorPort and AsyncHealerPort that
+wrap real adapters.
+These adapters know HOW to capture every call - arguments, timing, result
+or failure - into a cassette that the replay adapters can reproduce
+without containers, network or the claude CLI.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Dict, List, Optional
+
+from src.domain.models import TestResult, FixRecord
+from src.application.ports import AsyncExecutorPort, AsyncHealerPort
+from src.infrastructure.adapters.cassette import CassetteWriter
+
+
+async def _recorded(
+    cassette: CassetteWriter,
+    port: str,
+    method: str,
+    call: Awaitable,
+    args: Optional[Dict[str, Any]] = None,
+) -> Any:
+    """Await a call and record it, also when it raises or is cancelled."""
+    args = args or {}
+    started = time.monotonic()
+    try:
+        result = await call
+    except asyncio.CancelledError:
+        cassette.record(port, method, args, started, time.monotonic() - started, cancelled=True)
+        raise
+    except Exception as e:
+        cassette.record(
+            port, method, args, started, time.monotonic() - started,
+            error=f"{type(e).__name__}: {e}",
+        )
+        raise
+    cassette.record(port, method, args, started, time.monotonic() - started, result=result)
+    return result
+
+
+class RecordingExecutorAdapter(AsyncExecutorPort):
+    """Record the calls of another executor into a cassette."""
+
+    def __init__(self, executor: AsyncExecutorPort, cassette: CassetteWriter):
+        """Initialize the recorder.
+
+        Args:
+            executor: Executor that does the real work
+            cassette: Cassette the calls are written to
+        """
+        self.executor = executor
+        self.cassette = cassette
+
+    def _record(self, method: str, call: Awaitable, **args: Any) -> Awaitable:
+        """Record an executor call."""
+        return _recorded(self.cassette, "executor", method, call, args)
+
+    async def create_containers(self) -> TestResult:
+        """Create test containers."""
+        return await self._record("create_containers", self.executor.create_containers())
+
+    async def prepare_environment(self) -> TestResult:
+        """Prepare test environment."""
+        return await self._record("prepare_environment", self.executor.prepare_environment())
+
+    async def converge(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Run converge (apply playbook), limited to ``tags`` if given."""
+        return await self._record("converge", self.executor.converge(tags), tags=tags)
+
+    async def check_idempotence(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Check idempotence, limited to ``tags`` if given."""
+        return await self._record(
+            "check_idempotence", self.executor.check_idempotence(tags), tags=tags
+        )
+
+    async def verify(self) -> TestResult:
+        """Run verification tests."""
+        return await self._record("verify", self.executor.verify())
+
+    async def run_full_test(self) -> TestResult:
+        """Run complete test suite."""
+        return await self._record("run_full_test", self.executor.run_full_test())
+
+    async def destroy_containers(self) -> TestResult:
+        """Destroy all containers."""
+        return await self._record("destroy_containers", self.executor.destroy_containers())
+
+    async def cleanup(self) -> TestResult:
+        """Cleanup temporary files."""
+        return await self._record("cleanup", self.executor.cleanup())
+
+    async def get_container_identity(self) -> dict:
+        """Get an identity for the live test containers (empty if none)."""
+        return await self._record("get_container_identity", self.executor.get_container_identity())
+
+    async def is_alive(self, identity: dict) -> bool:
+        """Check if the containers described by ``identity`` still run."""
+        return await self._record("is_alive", self.executor.is_alive(identity), identity=identity)
+
+    def get_scenario_name(self) -> str:
+        """Get the current scenario name."""
+        return self.executor.get_scenario_name()
+
+
+class RecordingHealerAdapter(AsyncHealerPort):
+    """Record the calls of another healer into a cassette.
+
+    Only the returned FixRecord is captured, not the files the healer
+    edited: a replayed run sees the same outcomes on an unchanged tree.
+    """
+
+    def __init__(self, healer: AsyncHealerPort, cassette: CassetteWriter):
+        """Initialize the recorder.
+
+        Args:
+            healer: Healer that does the real work
+            cassette: Cassette the calls are written to
+        """
+        self.healer = healer
+        self.cassette = cassette
+
+    async def analyze_and_fix(
+        self,
+        error_output: str,
+        iteration: int,
+        state: "AgentState",
+    ) -> FixRecord:
+        """Analyze error and attempt to fix it."""
+        return await _recorded(
+            self.cassette,
+            "healer",
+            "analyze_and_fix",
+            self.healer.analyze_and_fix(error_output=error_output, iteration=iteration, state=state),
+            {"error_output": error_output, "iteration": iteration},
+        )
+
+    async def is_available(self) -> bool:
+        """Check if healer is available."""
+        return await _recorded(self.cassette, "healer", "is_available", self.healer.is_available())
+
+    def get_healer_name(self) -> str:
+        """Get the name of this healer implementation."""
+        return self.healer.get_healer_name()
@@ -0,0 +1,161 @@
+# SPDX-License-Identifier: MIT-0
+"""Cassette Replay Adapters.
+
+Concrete implementations of AsyncExecutorPort and AsyncHealerPort that
+reproduce a recorded cassette.
+These adapters know HOW to answer every call with its recorded result
+after its recorded duration, so the agent can be run and profiled
+without containers, network or the claude CLI.
+
+``speed`` scales the recorded durations: 1 replays in real time, 10 ten
+times faster, 0 without any waiting.
+"""
+
+import asyncio
+from typing import Any, List, Optional
+
+from src.domain.models import TestResult, FixRecord
+from src.application.ports import AsyncExecutorPort, AsyncHealerPort, AsyncObserverPort
+from src.infrastructure.adapters.cassette import CassetteReader, decode_value
+from src.infrastructure.config import Settings
+
+
+async def _sleep(seconds: float, speed: float) -> None:
+    """Wait a recorded duration scaled by the replay speed."""
+    if speed > 0 and seconds > 0:
+        await asyncio.sleep(seconds / speed)
+
+
+class ReplayExecutorAdapter(AsyncExecutorPort):
+    """Replay the executor calls of a cassette.
+
+    Test output is streamed to the observer in batches spread over the
+    recorded duration, so output handling sees the recorded load.
+    """
+
+    def __init__(
+        self,
+        cassette: CassetteReader,
+        observer: Optional[AsyncObserverPort] = None,
+        speed: float = 1.0,
+        batch_size: int = None,
+    ):
+        """Initialize the replay.
+
+        Args:
+            cassette: Recorded calls
+            observer: Observer that receives streamed output batches
+            speed: Replay speed factor (0 = no waiting)
+            batch_size: Lines per output batch (default: from Settings)
+        """
+        self.cassette = cassette
+        self.observer = observer
+        self.speed = speed
+        self.batch_size = batch_size or Settings.OUTPUT_BATCH_SIZE
+
+    async def _replay(self, method: str, **args: Any) -> Any:
+        """Replay the next recorded call of a method."""
+        entry = self.cassette.take("executor", method, args)
+        result = decode_value(entry.get("result"))
+
+        if isinstance(result, TestResult) and self.observer is not None:
+            lines = [line for line in result.output.splitlines() if line.strip()]
+            batches = [lines[i:i + self.batch_size] for i in range(0, len(lines), self.batch_size)]
+            for batch in batches:
+                await _sleep(entry["duration"] / len(batches), self.speed)
+                await self.observer.on_output(result.phase.value, batch)
+            if not batches:
+                await _sleep(entry["duration"], self.speed)
+        else:
+            await _sleep(entry["duration"], self.speed)
+
+        if entry.get("cancelled"):
+            raise asyncio.CancelledError()
+        if "error" in entry:
+            raise RuntimeError(entry["error"])
+        return result
+
+    async def create_containers(self) -> TestResult:
+        """Create test containers."""
+        return await self._replay("create_containers")
+
+    async def prepare_environment(self) -> TestResult:
+        """Prepare test environment."""
+        return await self._replay("prepare_environment")
+
+    async def converge(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Run converge (apply playbook), limited to ``tags`` if given."""
+        return await self._replay("converge", tags=tags)
+
+    async def check_idempotence(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Check idempotence, limited to ``tags`` if given."""
+        return await self._replay("check_idempotence", tags=tags)
+
+    async def verify(self) -> TestResult:
+        """Run verification tests."""
+        return await self._replay("verify")
+
+    async def run_full_test(self) -> TestResult:
+        """Run complete test suite."""
+        return await self._replay("run_full_test")
+
+    async def destroy_containers(self) -> TestResult:
+        """Destroy all containers."""
+        return await self._replay("destroy_containers")
+
+    async def cleanup(self) -> TestResult:
+        """Cleanup temporary files."""
+        return await self._replay("cleanup")
+
+    async def get_container_identity(self) -> dict:
+        """Get an identity for the live test containers (empty if none)."""
+        return await self._replay("get_container_identity")
+
+    async def is_alive(self, identity: dict) -> bool:
+        """Check if the containers described by ``identity`` still run."""
+        return await self._replay("is_alive", identity=identity)
+
+    def get_scenario_name(self) -> str:
+        """Get the recorded scenario name."""
+        return self.cassette.header.get("scenario", "")
+
+
+class ReplayHealerAdapter(AsyncHealerPort):
+    """Replay the healer calls of a cassette (no files are changed)."""
+
+    def __init__(self, cassette: CassetteReader, speed: float = 1.0):
+        """Initialize the replay.
+
+        Args:
+            cassette: Recorded calls
+            speed: Replay speed factor (0 = no waiting)
+        """
+        self.cassette = cassette
+        self.speed = speed
+
+    async def _replay(self, method: str, **args: Any) -> Any:
+        """Replay the next recorded call of a method."""
+        entry = self.cassette.take("healer", method, args)
+        await _sleep(entry["duration"], self.speed)
+        if entry.get("cancelled"):
+            raise asyncio.CancelledError()
+        if "error" in entry:
+            raise RuntimeError(entry["error"])
+        return decode_value(entry.get("result"))
+
+    async def analyze_and_fix(
+        self,
+        error_output: str,
+        iteration: int,
+        state: "AgentState",
+    ) -> FixRecord:
+        """Return the recorded fix attempt."""
+        return await self._replay("analyze_and_fix", error_output=error_output, iteration=iteration)
+
+    async def is_available(self) -> bool:
+        """Return the recorded availability."""
+        return await self._replay("is_available")
+
+    def get_healer_name(self) -> str:
+        """Get the recorded healer name."""
+        return self.cassette.header.get("healer", "Replay")
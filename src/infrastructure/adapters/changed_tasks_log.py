@@ -0,0 +1,93 @@
+# SPDX-License-Identifier: MIT-0
+"""Changed tasks log.
+
+Temporary JSON lines file written by the collection's
+``local.workstation.changed_tasks`` callback. The callback is enabled in
+ansible.cfg and molecule/config.yml but only writes while
+``ANSIBLE_CHANGED_TASKS_LOG`` names a file, so executors point a single
+run (the second converge of an idempotence check) at a log of its own.
+
+Every playbook run starts with a ``{"run": ..., "playbook": ...}`` marker
+line, so the changed tasks of one playbook run can be picked out of a
+``molecule test`` that converged twice.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+from src.domain.models import ChangedTask, extract_changed_tasks, parse_idempotence_report
+
+ENV_VAR = "ANSIBLE_CHANGED_TASKS_LOG"
+
+
+class ChangedTasksLog:
+    """A changed tasks log for one run, removed when the context exits.
+
+    Usage:
+        with ChangedTasksLog() as log:
+            result = run(command, env=log.env(base_env))
+            changed = log.read()
+    """
+
+    def __init__(self):
+        fd, path = tempfile.mkstemp(prefix="changed-tasks-", suffix=".jsonl")
+        os.close(fd)
+        self.path = Path(path)
+
+    def env(self, base: Optional[dict] = None) -> dict:
+        """Get ``base`` (default: the process environment) pointing at this log."""
+        return {**(os.environ if base is None else base), ENV_VAR: str(self.path)}
+
+    def read(self, playbook: Optional[str] = None) -> List[ChangedTask]:
+        """Get the changed tasks written so far (empty if the callback is off).
+
+        Args:
+            playbook: Only the last run of the playbook with this file name
+        """
+        runs: List[tuple] = []  # (playbook file name, [entries])
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue  # a line cut off by a killed run
+                    if "host" not in entry:
+                        runs.append((os.path.basename(entry.get("playbook", "")), []))
+                    elif runs:
+                        runs[-1][1].append(entry)
+        except OSError:
+            pass
+
+        if playbook is not None:
+            runs = [run for run in runs if run[0] == playbook][-1:]
+        return [ChangedTask.from_dict(entry) for _, entries in runs for entry in entries]
+
+    def changed_in(self, output: str) -> List[ChangedTask]:
+        """Get the changed tasks of a converge, parsed from ``output`` if not logged."""
+        return self.read() or [
+            ChangedTask.from_name(host, task) for host, task in extract_changed_tasks(output)
+        ]
+
+    def reported_in(self, output: str) -> List[ChangedTask]:
+        """Get the tasks a failed ``molecule idempotence`` or ``test`` reported.
+
+        Logged tasks come from the last converge, i.e. the idempotence
+        run. Empty if the failure was not an idempotence report (e.g.
+        converge itself failed), even when the log has entries.
+        """
+        reported = parse_idempotence_report(output)
+        return (self.read("converge.yml") or reported) if reported else []
+
+    def close(self) -> None:
+        """Remove the log file."""
+        self.path.unlink(missing_ok=True)
+
+    def __enter__(self) -> "ChangedTasksLog":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -6,13 +6,19 @@ This adapter knows HOW to invoke Claude for self-healing.
 """
 
 import os
-import re
 import subprocess
 from typing import List
 from pathlib import Path
 
-from src.domain.models import FixRecord, FixStatus, AgentState
-from src.application.ports import HealerPort
+from src.domain.models import (
+    FixRecord,
+    FixStatus,
+    AgentState,
+    BisectionResult,
+    FailurePosition,
+    extract_error_windows,
+)
+from src.application.ports import HealerPort, PlanCompilerPort
 from src.infrastructure.config import Settings
 
 
@@ -27,6 +33,7 @@ class ClaudeHealerAdapter(HealerPort):
         claude_path: str = None,
         timeout: int = None,
         project_root: Path = None,
+        planner: PlanCompilerPort = None,
     ):
         """Initialize the healer.
 
@@ -34,7 +41,10 @@ class ClaudeHealerAdapter(HealerPort):
             claude_path: Path to claude CLI (default: from Settings)
             timeout: Timeout in seconds (default: from Settings)
             project_root: Project root directory
+            planner: Port resolving the scenario's task plan, to point the
+                prompt at the failing task's file and line (optional)
         """
+        self.planner = planner
         self.claude_path = claude_path or Settings.CLAUDE_CLI_PATH
         self.timeout = timeout or Settings.CLAUDE_TIMEOUT
         self.project_root = project_root or Settings.PROJECT_ROOT
@@ -66,33 +76,38 @@ class ClaudeHealerAdapter(HealerPort):
         Returns:
             Relevant error context
         """
-        lines = output.splitlines()
-
-        # Find error indicators
-        error_patterns = [
-            r"FAILED",
-            r"ERROR",
-            r"fatal:",
-            r"Task/.*failed",
-            r"changed=.*failed=1",
-            r"Traceback",
-            r"Exception",
-        ]
-
-        relevant_lines = []
-        for i, line in enumerate(lines):
-            if any(re.search(pattern, line, re.IGNORECASE) for pattern in error_patterns):
-                # Include context around error
-                start = max(0, i - 10)
-                end = min(len(lines), i + 10)
-                relevant_lines.extend(lines[start:end])
-                break
-
-        # If no specific error found, return last N lines
-        if not relevant_lines:
-            return "\n".join(lines[-max_lines:])
-
-        return "\n".join(relevant_lines[-max_lines:])
+        # Windows around every error line, not just the first one
+        context = extract_error_windows(output) or output
+        return "\n".join(context.splitlines()[-max_lines:])
+
+    def _failing_task_context(self, output: str, state: AgentState) -> str:
+        """Locate the failing task in the scenario's task plan.
+
+        Args:
+            output: Full output from failed test
+            state: Agent state
+
+        Returns:
+            Description of the task (file, line, tags, conditions), or ""
+        """
+        if self.planner is None:
+            return ""
+        position = FailurePosition.from_output(output, "converge")
+        if not position.task:
+            return ""
+        try:
+            plan = self.planner.compile(state.config.scenario)
+        except Exception:
+            return ""
+        task = plan.find(position.task, position.role)
+        return task.describe() if task else ""
+
+    def _bisection_context(self, state: AgentState) -> str:
+        """Describe the role bisection attached to the latest error, if any."""
+        bisection = state.errors_encountered[-1].get("bisection") if state.errors_encountered else None
+        if not bisection:
+            return ""
+        return BisectionResult.from_dict(bisection).describe()
 
     def _build_prompt(
         self,
@@ -111,6 +126,20 @@ class ClaudeHealerAdapter(HealerPort):
             Prompt string for Claude
         """
         error_context = self._extract_error_context(error_output)
+        failing_task = self._failing_task_context(error_output, state)
+        if failing_task:
+            failing_task = f"""
+## Failing Task (static plan of the scenario)
+```
+{failing_task}
+```
+"""
+        bisection = self._bisection_context(state)
+        if bisection:
+            failing_task += f"""
+## Role Bisection (converged in fresh containers)
+{bisection}
+"""
 
         prompt = f"""AUTONOMOUS ANSIBLE HEALING PROTOCOL
 
@@ -128,10 +157,12 @@ Analyze the Ansible/Molecule error below and FIX THE ROOT CAUSE directly.
 ```
 {error_context}
 ```
-
+{failing_task}
 ## Fixing Guidelines
 1. DO NOT explain - just fix the code
-2. Ensure idempotency - tasks should not repeat changes
+2. Ensure idempotency - tasks should not repeat changes. If the error lists
+   tasks that reported changed on the second converge, fix exactly those
+   tasks (their file, line and module arguments are given)
 3. Skip preflight checks in container environments: `common_skip_preflight: true`
 4. For container testing, set these vars:
    - `common_enable_rpm_fusion: false`
@@ -139,7 +170,8 @@ Analyze the Ansible/Molecule error below and FIX THE ROOT CAUSE directly.
    - `common_configure_custom_dns: false`
    - `locale_install_gui_tools: false`
 5. Handle systemd-dependent tasks gracefully (use `when: not container_detect`)
-6. If a role fails, check the role's tasks/handlers for errors
+6. If a role fails, check the role's tasks/handlers for errors; if a role
+   bisection names an earlier role, fix the cause there, not the symptom
 7. Update defaults/main.yml if needed for container compatibility
 
 ## Working Directory
@@ -190,14 +222,14 @@ Apply the fixes now. Exit when done.
                     iteration=iteration,
                     status=FixStatus.SUCCESS,
                     claude_output=result.stdout or "",
-                    error_context=error_output[:200],
+                    error_context=error_output,
                 )
             else:
                 return FixRecord(
                     iteration=iteration,
                     status=FixStatus.FAILED,
                     claude_output=result.stderr or "Claude failed",
-                    error_context=error_output[:200],
+                    error_context=error_output,
                 )
 
         except subprocess.TimeoutExpired:
@@ -205,14 +237,14 @@ Apply the fixes now. Exit when done.
                 iteration=iteration,
                 status=FixStatus.TIMEOUT,
                 claude_output="Claude timed out",
-                error_context=error_output[:200],
+                error_context=error_output,
             )
         except Exception as e:
             return FixRecord(
                 iteration=iteration,
                 status=FixStatus.FAILED,
                 claude_output=f"Exception: {e}",
-                error_context=error_output[:200],
+                error_context=error_output,
             )
         finally:
             # Clean up prompt file
@@ -0,0 +1,168 @@
+# SPDX-License-Identifier: MIT-0
+"""Composite Observer Adapter.
+
+Concrete implementation of ObserverPort that fans events out to several sinks.
+This adapter knows HOW to decouple the agent from slow observers: events are
+queued and dispatched by a background writer thread, so a slow terminal or
+disk never throttles the caller (e.g. the molecule output read loop).
+"""
+
+import logging
+import queue
+import threading
+from typing import List, Sequence
+
+from src.domain.models import TestResult, FixRecord
+from src.application.ports import ObserverPort, LogLevel
+
+
+class CompositeObserverAdapter(ObserverPort):
+    """Adapter for dispatching observations to multiple sinks.
+
+    Control events (logs, phase changes, summaries) are never dropped - the
+    caller blocks if the queue is full. Output batches follow the configured
+    overflow policy:
+
+    - ``drop``: discard the batch and report the number of dropped lines
+    - ``block``: wait for the writer thread to make room
+    """
+
+    POLICY_DROP = "drop"
+    POLICY_BLOCK = "block"
+
+    _STOP = object()
+
+    def __init__(
+        self,
+        sinks: Sequence[ObserverPort],
+        queue_size: int = 1000,
+        overflow_policy: str = POLICY_DROP,
+    ):
+        """Initialize the observer and start the writer thread.
+
+        Args:
+            sinks: Observers that receive every event
+            queue_size: Maximum number of pending events
+            overflow_policy: What to do with output batches when the queue is
+                full ("drop" or "block")
+        """
+        if overflow_policy not in (self.POLICY_DROP, self.POLICY_BLOCK):
+            raise ValueError(f"Unknown overflow policy: {overflow_policy}")
+
+        self.sinks = list(sinks)
+        self.overflow_policy = overflow_policy
+        self.dropped_lines = 0
+        self._pending_dropped = 0
+        self._closed = False
+        self._logger = logging.getLogger(__name__)
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_size)
+        self._writer = threading.Thread(
+            target=self._drain,
+            name="observer-writer",
+            daemon=True,
+        )
+        self._writer.start()
+
+    def _drain(self) -> None:
+        """Writer thread loop: dispatch queued events to every sink."""
+        while True:
+            item = self._queue.get()
+            if item is self._STOP:
+                return
+            method, args = item
+            for sink in self.sinks:
+                try:
+                    getattr(sink, method)(*args)
+                except Exception:
+                    # A broken sink must not take down the others
+                    self._logger.exception(
+                        "Observer sink %s failed on %s", type(sink).__name__, method
+                    )
+
+    def _emit(self, method: str, *args) -> None:
+        """Queue a control event (blocks while the queue is full)."""
+        if not self._closed:
+            self._queue.put((method, args))
+
+    def log(self, level: LogLevel, message: str) -> None:
+        """Log a message."""
+        self._emit("log", level, message)
+
+    def on_iteration_start(self, iteration: int, max_retries: int) -> None:
+        """Called when a new iteration starts."""
+        self._emit("on_iteration_start", iteration, max_retries)
+
+    def on_iteration_complete(self, iteration: int, success: bool) -> None:
+        """Called when an iteration completes."""
+        self._emit("on_iteration_complete", iteration, success)
+
+    def on_test_start(self, phase: str) -> None:
+        """Called when a test phase starts."""
+        self._emit("on_test_start", phase)
+
+    def on_test_complete(self, result: TestResult) -> None:
+        """Called when a test phase completes."""
+        self._emit("on_test_complete", result)
+
+    def on_output(self, phase: str, lines: List[str]) -> None:
+        """Queue a batch of output lines according to the overflow policy."""
+        if self._closed or not lines:
+            return
+
+        if self.overflow_policy == self.POLICY_BLOCK:
+            self._queue.put(("on_output", (phase, lines)))
+            return
+
+        try:
+            self._queue.put_nowait(("on_output", (phase, lines)))
+        except queue.Full:
+            self.dropped_lines += len(lines)
+            self._pending_dropped += len(lines)
+            return
+
+        if self._pending_dropped:
+            # Report the gap as soon as the writer catches up
+            try:
+                self._queue.put_nowait((
+                    "log",
+                    (LogLevel.WARNING, f"Observer queue full: dropped {self._pending_dropped} output lines"),
+                ))
+                self._pending_dropped = 0
+            except queue.Full:
+                pass
+
+    def on_healing_start(self, iteration: int) -> None:
+        """Called when healing starts."""
+        self._emit("on_healing_start", iteration)
+
+    def on_healing_complete(self, fix_record: FixRecord) -> None:
+        """Called when healing completes."""
+        self._emit("on_healing_complete", fix_record)
+
+    def on_phase_change(self, phase: str) -> None:
+        """Called when agent phase changes."""
+        self._emit("on_phase_change", phase)
+
+    def on_summary(self, summary: dict) -> None:
+        """Called to display final summary."""
+        self._emit("on_summary", summary)
+
+    def close(self) -> None:
+        """Drain pending events, stop the writer thread and close all sinks."""
+        if self._closed:
+            return
+
+        if self.dropped_lines:
+            self._emit(
+                "log",
+                LogLevel.WARNING,
+                f"Observer dropped {self.dropped_lines} output lines in total "
+                f"(policy: {self.overflow_policy})",
+            )
+
+        self._closed = True
+        self._queue.put(self._STOP)
+        self._writer.join()
+
+        for sink in self.sinks:
+            sink.close()
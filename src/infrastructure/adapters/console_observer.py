@@ -7,9 +7,9 @@ This adapter knows HOW to display messages to the user.
 
 import logging
 import sys
-from typing import Optional
+from typing import List, Optional
 
-from src.domain.models import TestResult, FixRecord, AgentState
+from src.domain.models import TestResult, FixRecord, AgentState, FailurePosition
 from src.application.ports import ObserverPort, LogLevel
 
 
@@ -116,6 +116,12 @@ class ConsoleObserverAdapter(ObserverPort):
                 self.RED
             ))
 
+    def on_output(self, phase: str, lines: List[str]) -> None:
+        """Called with a batch of streamed command output lines."""
+        # One write per batch keeps terminal syscalls off the per-line path
+        sys.stdout.write("".join(f"  │ {line}\n" for line in lines))
+        sys.stdout.flush()
+
     def on_healing_start(self, iteration: int) -> None:
         """Called when healing starts."""
         self.log(LogLevel.INFO, self._colorize(
@@ -158,6 +164,16 @@ class ConsoleObserverAdapter(ObserverPort):
         self.log(LogLevel.INFO, f"  Total iterations: {summary['total_iterations']}")
         self.log(LogLevel.INFO, f"  Fixes applied:    {summary['total_fixes']}")
         self.log(LogLevel.INFO, f"  Errors handled:   {summary['errors_count']}")
+        self.log(LogLevel.INFO, f"  Distinct errors:  {summary.get('distinct_errors', 0)}")
+
+        curve = summary.get("progress_curve", [])
+        if curve:
+            self.log(LogLevel.INFO, "  Failure positions:")
+            for point in curve:
+                position = FailurePosition.from_dict(
+                    {k: v for k, v in point.items() if k != "iteration"}
+                )
+                self.log(LogLevel.INFO, f"    #{point['iteration']:<3} {position.describe()}")
 
         duration = int(summary['duration_seconds'])
         minutes, seconds = divmod(duration, 60)
@@ -0,0 +1,183 @@
+# SPDX-License-Identifier: MIT-0
+"""Dnf Cache Adapter.
+
+Concrete implementation of PackageCachePort using Podman named volumes.
+This adapter knows HOW to share dnf's package and metadata cache
+(/var/cache/libdnf5) between test containers and keep it bounded.
+
+The scenarios mount ``${MOLECULE_DNF_CACHE}`` (default:
+``ansible-agent-dnf-<release>``) and prepare enables ``keepcache``, so a
+package is downloaded once per Fedora release instead of once per container.
+Podman creates a missing named volume on first use, so plain ``molecule``
+runs share the cache too; the agent additionally caps its size.
+"""
+
+import logging
+import re
+import subprocess
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+from src.application.ports import PackageCachePort
+
+_RELEASE = re.compile(r"^(\d+)")
+
+
+class DnfCacheAdapter(PackageCachePort):
+    """Adapter for per-release dnf cache volumes.
+
+    Pruning removes cached packages least recently used first: every
+    package unused for ``max_age_days``, then more until all cache volumes
+    together fit in ``max_bytes``. Repository metadata is left to dnf,
+    which revalidates it on ``--refresh``.
+    """
+
+    LABEL = "io.ansible-agent.dnf-cache"
+
+    def __init__(
+        self,
+        prefix: str = "ansible-agent-dnf",
+        max_bytes: int = 4096 * 1024 * 1024,
+        max_age_days: int = 30,
+        env: dict = None,
+    ):
+        """Initialize the cache manager.
+
+        Args:
+            prefix: Volume name prefix; the release is appended
+            max_bytes: Size cap over all cache volumes
+            max_age_days: Packages unused for longer are always pruned
+            env: Environment for podman
+        """
+        self.prefix = prefix
+        self.max_bytes = max_bytes
+        self.max_age_days = max_age_days
+        self.env = env
+        self._logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def release_of(image: str) -> str:
+        """Get the Fedora release of an image from its tag.
+
+        ``quay.io/fedora/fedora-toolbox:43`` gives "43"; untagged or
+        non-numeric tags (``latest``, ``rawhide``) are used as they are.
+        """
+        tag = image.rsplit("/", 1)[-1].partition("@")[0].partition(":")[2] or "latest"
+        match = _RELEASE.match(tag)
+        return match.group(1) if match else tag
+
+    def scenario_release(self, scenario_dir: Path) -> str:
+        """Get the release of a scenario's first platform image."""
+        import yaml  # ships with ansible-core
+
+        try:
+            with open(Path(scenario_dir) / "molecule.yml", encoding="utf-8") as f:
+                platforms = (yaml.safe_load(f) or {}).get("platforms") or [{}]
+        except OSError:
+            platforms = [{}]
+        return self.release_of(platforms[0].get("image", ""))
+
+    def attach(self, env: dict, scenario_dir: Path) -> dict:
+        """Point a scenario run at its release's cache and prune the caches.
+
+        Sets ``MOLECULE_DNF_CACHE`` in ``env``, which the scenarios mount.
+
+        Args:
+            env: Environment of the Molecule/podman run (updated in place)
+            scenario_dir: Molecule scenario directory
+
+        Returns:
+            What prune() removed
+        """
+        env["MOLECULE_DNF_CACHE"] = self.ensure(self.scenario_release(scenario_dir))
+        return self.prune()
+
+    def volume_name(self, release: str) -> str:
+        """Get the cache volume name of a release."""
+        return f"{self.prefix}-{release}"
+
+    def _podman(self, *args: str) -> Tuple[int, str]:
+        """Run a podman command and capture its output."""
+        try:
+            result = subprocess.run(
+                ["podman", *args], capture_output=True, text=True, env=self.env, timeout=60
+            )
+        except (OSError, subprocess.TimeoutExpired) as e:
+            return -1, str(e)
+        return result.returncode, result.stdout
+
+    def _volumes(self) -> Dict[str, Path]:
+        """Get the mountpoints of all cache volumes."""
+        rc, out = self._podman("volume", "ls", "--format", "{{.Name}} {{.Mountpoint}}")
+        if rc != 0:
+            return {}
+        volumes = {}
+        for line in out.splitlines():
+            name, _, mountpoint = line.partition(" ")
+            if name.startswith(f"{self.prefix}-") and mountpoint:
+                volumes[name] = Path(mountpoint)
+        return volumes
+
+    @staticmethod
+    def _files(mountpoint: Path) -> List[Tuple[Path, float, int]]:
+        """Get (path, last use, size) of every file in a volume."""
+        files = []
+        for path in mountpoint.rglob("*"):
+            try:
+                stat = path.lstat()
+            except OSError:
+                continue
+            if path.is_file():
+                files.append((path, max(stat.st_atime, stat.st_mtime), stat.st_size))
+        return files
+
+    # ------------------------------------------------------------------
+    # PackageCachePort
+    # ------------------------------------------------------------------
+
+    def ensure(self, release: str) -> str:
+        """Create the release's cache volume unless it exists."""
+        name = self.volume_name(release)
+        rc, out = self._podman(
+            "volume", "create", "--ignore", "--label", f"{self.LABEL}={release}", name
+        )
+        if rc != 0:
+            self._logger.warning("Could not create dnf cache volume %s: %s", name, out.strip())
+        return name
+
+    def prune(self) -> dict:
+        """Remove least recently used packages beyond the age and size limits."""
+        removed = {"files": 0, "bytes": 0}
+        files = [f for mountpoint in self._volumes().values() for f in self._files(mountpoint)]
+        total = sum(size for _, _, size in files)
+        cutoff = time.time() - self.max_age_days * 86400
+
+        packages = sorted((f for f in files if f[0].suffix == ".rpm"), key=lambda f: f[1])
+        for path, last_use, size in packages:
+            if last_use >= cutoff and total <= self.max_bytes:
+                break
+            try:
+                path.unlink()
+            except OSError as e:
+                # Rootless podman: files written by non-root container users
+                # belong to subordinate UIDs
+                self._logger.debug("Cannot prune %s: %s", path, e)
+                continue
+            total -= size
+            removed["files"] += 1
+            removed["bytes"] += size
+
+        return removed
+
+    def stats(self) -> dict:
+        """Get release, size and package count of every cache volume."""
+        stats = {}
+        for name, mountpoint in sorted(self._volumes().items()):
+            files = self._files(mountpoint)
+            stats[name] = {
+                "release": name[len(self.prefix) + 1:],
+                "bytes": sum(size for _, _, size in files),
+                "packages": sum(1 for path, _, _ in files if path.suffix == ".rpm"),
+            }
+        return stats
@@ -0,0 +1,84 @@
+# SPDX-License-Identifier: MIT-0
+"""File Error Store Adapter.
+
+Concrete implementation of ErrorStorePort using gzip files on disk.
+This adapter knows HOW to fingerprint, deduplicate and compress errors.
+"""
+
+import gzip
+import hashlib
+import os
+import re
+from pathlib import Path
+from typing import Optional
+
+from src.application.ports import ErrorStorePort
+
+
+class FileErrorStoreAdapter(ErrorStorePort):
+    """Adapter for storing full error windows as compressed blobs.
+
+    The fingerprint is a SHA-256 of the error with volatile details
+    (colors, timestamps, temp paths, durations) normalized away, so the
+    same failure seen in different iterations maps to the same blob.
+    """
+
+    # Volatile fragments that differ between otherwise identical errors
+    _NORMALIZERS = [
+        (re.compile(r"\x1b\[[0-9;]*[A-Za-z]"), ""),
+        (re.compile(r"\d{4}-\d{2}-\d{2}[ T]\d{2}:\d{2}:\d{2}(?:[.,]\d+)?"), "<ts>"),
+        (re.compile(r"ansible-tmp-[\d.-]+"), "ansible-tmp-<id>"),
+        (re.compile(r"\b\d+:\d{2}:\d{2}\.\d+\b"), "<duration>"),
+        (re.compile(r"\([\d.]+s\)"), "(<duration>)"),
+        (re.compile(r"\b[0-9a-f]{12,64}\b"), "<hex>"),
+    ]
+
+    def __init__(self, root: Path):
+        """Initialize the store.
+
+        Args:
+            root: Directory holding the compressed error blobs
+        """
+        self.root = Path(root)
+
+    @classmethod
+    def fingerprint(cls, error_text: str) -> str:
+        """Compute the content address of an error.
+
+        Args:
+            error_text: Full error text
+
+        Returns:
+            Hex SHA-256 of the normalized error
+        """
+        normalized = error_text
+        for pattern, replacement in cls._NORMALIZERS:
+            normalized = pattern.sub(replacement, normalized)
+        return hashlib.sha256(normalized.encode("utf-8", "replace")).hexdigest()
+
+    def _blob_path(self, fingerprint: str) -> Path:
+        """Get the blob location for a fingerprint."""
+        return self.root / fingerprint[:2] / f"{fingerprint}.txt.gz"
+
+    def put(self, error_text: str) -> str:
+        """Store an error once and return its fingerprint."""
+        fingerprint = self.fingerprint(error_text)
+        path = self._blob_path(fingerprint)
+        if path.exists():
+            return fingerprint
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a crash never leaves a half-written blob
+        tmp_path = path.with_suffix(f".tmp{os.getpid()}")
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            f.write(error_text)
+        os.replace(tmp_path, path)
+        return fingerprint
+
+    def get(self, fingerprint: str) -> Optional[str]:
+        """Load the full error text for a fingerprint."""
+        path = self._blob_path(fingerprint)
+        if not path.exists():
+            return None
+        with gzip.open(path, "rt", encoding="utf-8") as f:
+            return f.read()
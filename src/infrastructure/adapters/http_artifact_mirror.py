@@ -0,0 +1,344 @@
+# SPDX-License-Identifier: MIT-0
+"""HTTP Artifact Mirror Adapter.
+
+Concrete implementation of ArtifactMirrorPort using a local HTTP server.
+This adapter knows HOW to serve role downloads and git clones from a
+content-addressed store, fetching each artifact only once.
+
+URL scheme (see the ``local.workstation.mirrored`` filter):
+
+    /url/<percent-encoded original URL>            one file
+    /git/<percent-encoded repository URL>/<path>   dumb-HTTP git clone
+
+Layout under the mirror root:
+
+    blobs/<aa>/<sha256>       artifact content, stored once per checksum
+    index.json                original URL -> sha256, size, fetch time
+    git/<sha256 of URL>.git   bare mirror prepared for dumb HTTP
+
+A request for something not yet mirrored fetches it first (pull-through),
+so the first converge seeds the mirror and later ones stay off the network.
+Only http(s) URLs are fetched, and the server only answers for the URLs the
+roles declare in their defaults (``declared_urls``): it is not a proxy for
+whatever a client asks for.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+import urllib.request
+from datetime import datetime
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import unquote, urlsplit
+
+from src.application.ports import ArtifactMirrorPort
+
+# Schemes the mirror fetches from (no file://, local paths or git transports)
+ALLOWED_SCHEMES = ("http", "https")
+
+
+def _check_scheme(url: str) -> None:
+    """Reject anything but an absolute http(s) URL."""
+    parts = urlsplit(url)
+    if parts.scheme not in ALLOWED_SCHEMES or not parts.netloc:
+        raise ValueError(f"Not an http(s) URL: {url!r}")
+
+
+class HttpArtifactMirrorAdapter(ArtifactMirrorPort):
+    """Adapter for a pull-through, content-addressed download mirror.
+
+    Concurrent requests for the same artifact wait for a single fetch.
+    The server runs in a daemon thread, so it never blocks the agent.
+    """
+
+    INDEX_FILE = "index.json"
+    CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        root: Path,
+        bind: str = "127.0.0.1",
+        port: int = 0,
+        public_host: str = "host.containers.internal",
+        timeout: float = 600.0,
+        allowed: Optional[Iterable[str]] = None,
+    ):
+        """Initialize the mirror.
+
+        Args:
+            root: Mirror directory
+            bind: Address to listen on
+            port: Port to listen on (0 picks a free one)
+            public_host: Host name test containers reach this machine by
+            timeout: Seconds to wait for an upstream download to respond
+            allowed: URLs the server answers for; an entry ending in ``*``
+                is a prefix (None: any http(s) URL)
+        """
+        self.root = Path(root)
+        self.bind = bind
+        self.port = port
+        self.public_host = public_host
+        self.timeout = timeout
+        self.allowed = None if allowed is None else tuple(allowed)
+
+        self._index_lock = threading.Lock()
+        self._key_locks: Dict[str, threading.Lock] = {}
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def declared_urls(roles_dir: Path) -> List[str]:
+        """Collect the download URLs the roles declare in their defaults.
+
+        A templated URL is cut at its first ``{{`` and kept as a prefix
+        (``https://host/path/*``), as long as that prefix still names the
+        host and a path.
+
+        Args:
+            roles_dir: Directory of the collection's roles
+
+        Returns:
+            Entries for ``allowed``
+        """
+        import yaml  # ships with ansible-core
+
+        def strings(value):
+            if isinstance(value, str):
+                yield value
+            elif isinstance(value, dict):
+                for item in value.values():
+                    yield from strings(item)
+            elif isinstance(value, list):
+                for item in value:
+                    yield from strings(item)
+
+        urls = set()
+        for defaults in sorted(Path(roles_dir).glob("*/defaults/main.y*ml")):
+            try:
+                data = yaml.safe_load(defaults.read_text())
+            except (OSError, yaml.YAMLError):
+                continue
+            for value in strings(data):
+                url, templated, _ = value.strip().partition("{{")
+                parts = urlsplit(url.strip())
+                if parts.scheme not in ALLOWED_SCHEMES or not parts.netloc:
+                    continue
+                if not templated:
+                    urls.add(url.strip())
+                elif parts.path:
+                    urls.add(f"{url.strip()}*")
+        return sorted(urls)
+
+    # ------------------------------------------------------------------
+    # Store
+    # ------------------------------------------------------------------
+
+    def _blob_path(self, digest: str) -> Path:
+        """Get where content with a checksum is stored."""
+        return self.root / "blobs" / digest[:2] / digest
+
+    def _repo_path(self, repo: str) -> Path:
+        """Get where a git repository is mirrored."""
+        return self.root / "git" / f"{hashlib.sha256(repo.encode()).hexdigest()}.git"
+
+    def _lock_for(self, key: str) -> threading.Lock:
+        """Get the lock serializing fetches of one URL."""
+        with self._index_lock:
+            return self._key_locks.setdefault(key, threading.Lock())
+
+    def _load_index(self) -> dict:
+        """Read the URL index."""
+        try:
+            return json.loads((self.root / self.INDEX_FILE).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def _record(self, url: str, digest: str, size: int) -> None:
+        """Add a URL to the index (atomically replaced)."""
+        with self._index_lock:
+            index = self._load_index()
+            index[url] = {"sha256": digest, "size": size, "fetched": datetime.now().isoformat()}
+            tmp = self.root / f"{self.INDEX_FILE}.tmp"
+            tmp.write_text(json.dumps(index, indent=2, sort_keys=True))
+            os.replace(tmp, self.root / self.INDEX_FILE)
+
+    def allows(self, url: str) -> bool:
+        """Check if the server may fetch a URL for a client."""
+        try:
+            _check_scheme(url)
+        except ValueError:
+            return False
+        if self.allowed is None:
+            return True
+        return any(
+            url.startswith(entry[:-1]) if entry.endswith("*") else url == entry
+            for entry in self.allowed
+        )
+
+    def blob_for(self, url: str) -> Path:
+        """Get the stored content of a URL, fetching it on first use."""
+        return self._blob_path(self.seed(url))
+
+    def repo_for(self, repo: str) -> Path:
+        """Get the mirrored repository, cloning it on first use."""
+        self.seed_git(repo)
+        return self._repo_path(repo)
+
+    # ------------------------------------------------------------------
+    # ArtifactMirrorPort
+    # ------------------------------------------------------------------
+
+    def seed(self, url: str) -> str:
+        """Download an artifact into the store unless it is indexed."""
+        _check_scheme(url)
+        with self._lock_for(url):
+            entry = self._load_index().get(url)
+            if entry and self._blob_path(entry["sha256"]).exists():
+                return entry["sha256"]
+
+            self.root.mkdir(parents=True, exist_ok=True)
+            sha256 = hashlib.sha256()
+            size = 0
+            with tempfile.NamedTemporaryFile(dir=self.root, prefix=".fetch-", delete=False) as tmp:
+                try:
+                    with urllib.request.urlopen(url, timeout=self.timeout) as response:
+                        while chunk := response.read(self.CHUNK_SIZE):
+                            sha256.update(chunk)
+                            size += len(chunk)
+                            tmp.write(chunk)
+                except BaseException:
+                    os.unlink(tmp.name)
+                    raise
+
+            digest = sha256.hexdigest()
+            blob = self._blob_path(digest)
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            if blob.exists():
+                os.unlink(tmp.name)  # same content under another URL
+            else:
+                os.chmod(tmp.name, 0o644)
+                os.replace(tmp.name, blob)
+            self._record(url, digest, size)
+            self._logger.info("Mirrored %s (%d bytes, sha256 %s)", url, size, digest)
+            return digest
+
+    def seed_git(self, repo: str) -> None:
+        """Clone a bare mirror of a repository unless it exists."""
+        _check_scheme(repo)
+        path = self._repo_path(repo)
+        with self._lock_for(f"git:{repo}"):
+            if path.exists():
+                return
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = Path(tempfile.mkdtemp(dir=path.parent, prefix=".clone-"))
+            try:
+                subprocess.run(
+                    ["git", "clone", "--mirror", "--quiet", "--", repo, str(tmp)],
+                    check=True, capture_output=True, timeout=self.timeout,
+                    # Redirects and submodules must not switch to other transports
+                    env={**os.environ, "GIT_ALLOW_PROTOCOL": ":".join(ALLOWED_SCHEMES)},
+                )
+                # Dumb-HTTP clients need info/refs and objects/info/packs
+                subprocess.run(
+                    ["git", "update-server-info"],
+                    cwd=tmp, check=True, capture_output=True,
+                )
+                os.replace(tmp, path)
+            finally:
+                shutil.rmtree(tmp, ignore_errors=True)
+            self._logger.info("Mirrored git repository %s", repo)
+
+    def start(self) -> str:
+        """Serve the mirror from a daemon thread."""
+        if self._server is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            handler = type("MirrorHandler", (_MirrorHandler,), {"mirror": self})
+            self._server = ThreadingHTTPServer((self.bind, self.port), handler)
+            self._server.daemon_threads = True
+            threading.Thread(
+                target=self._server.serve_forever, name="artifact-mirror", daemon=True
+            ).start()
+        return f"http://{self.public_host}:{self._server.server_address[1]}"
+
+    def stats(self) -> dict:
+        """Count mirrored artifacts, their stored bytes and repositories."""
+        blobs = [p for p in (self.root / "blobs").glob("*/*") if p.is_file()]
+        return {
+            "artifacts": len(self._load_index()),
+            "blobs": len(blobs),
+            "bytes": sum(p.stat().st_size for p in blobs),
+            "repositories": len(list((self.root / "git").glob("*.git"))),
+        }
+
+    def stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+
+class _MirrorHandler(BaseHTTPRequestHandler):
+    """Serve /url/<url> and /git/<repo>/<path> from the mirror."""
+
+    mirror: HttpArtifactMirrorAdapter = None
+
+    def _resolve(self) -> Optional[Path]:
+        """Map the request path to a file, fetching on a miss."""
+        kind, _, rest = self.path.split("?", 1)[0].lstrip("/").partition("/")
+        key, _, inner = rest.partition("/")
+        if not key:
+            return None
+        url = unquote(key)
+        if not self.mirror.allows(url):
+            raise PermissionError(f"Not a declared download: {url}")
+
+        if kind == "url" and not inner:
+            return self.mirror.blob_for(url)
+        if kind == "git":
+            repo_dir = self.mirror.repo_for(url)
+            path = (repo_dir / unquote(inner)).resolve()
+            if path.is_relative_to(repo_dir.resolve()) and path.is_file():
+                return path
+        return None
+
+    def _serve(self, body: bool) -> None:
+        """Answer a GET or HEAD request."""
+        try:
+            path = self._resolve()
+        except PermissionError as e:
+            self.send_error(403, str(e))
+            return
+        except Exception as e:
+            self.send_error(502, f"Upstream fetch failed: {e}")
+            return
+        if path is None:
+            self.send_error(404)
+            return
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(path.stat().st_size))
+        self.end_headers()
+        if body:
+            with open(path, "rb") as f:
+                shutil.copyfileobj(f, self.wfile)
+
+    def do_GET(self):  # noqa: N802 - http.server naming
+        """Handle GET."""
+        self._serve(body=True)
+
+    def do_HEAD(self):  # noqa: N802 - http.server naming
+        """Handle HEAD."""
+        self._serve(body=False)
+
+    def log_message(self, format, *args):  # noqa: A002 - http.server signature
+        """Log requests at debug level instead of stderr."""
+        self.mirror._logger.debug("%s - %s", self.address_string(), format % args)
@@ -0,0 +1,272 @@
+# SPDX-License-Identifier: MIT-0
+"""Inotify Watcher Adapter.
+
+Concrete implementation of FileWatcherPort using Linux inotify.
+This adapter knows HOW to turn kernel file events into debounced batches
+of changed paths.
+
+inotify is reached through ctypes, so no extra package is needed. Where it
+is unavailable (non-Linux hosts, exhausted watch limits) the adapter falls
+back to polling modification times.
+"""
+
+import asyncio
+import ctypes
+import ctypes.util
+import logging
+import os
+import struct
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple
+
+from src.application.ports import FileWatcherPort
+
+# <sys/inotify.h>
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+WATCH_MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+# Directories that never hold role sources
+SKIP_DIRS = {".git", "__pycache__", ".pytest_cache", ".mypy_cache"}
+
+
+def is_noise(path: Path) -> bool:
+    """Check if a path is an editor or VCS side effect rather than a source change."""
+    name = path.name
+    return (
+        name.startswith(".#")           # emacs lock files
+        or name.endswith(("~", ".swp", ".swx", ".swo", ".tmp"))
+        or name == "4913"               # vim's write-permission probe
+        or any(part in SKIP_DIRS for part in path.parts)
+    )
+
+
+class InotifyWatcherAdapter(FileWatcherPort):
+    """Adapter for watching directory trees and single files.
+
+    Directories are watched recursively (new subdirectories included),
+    files through their parent directory. A batch is delivered once no
+    new change arrived for ``debounce`` seconds.
+    """
+
+    def __init__(
+        self,
+        paths: Iterable[Path],
+        debounce: float = 0.5,
+        poll_interval: float = 1.0,
+    ):
+        """Initialize the watcher.
+
+        Args:
+            paths: Directories (watched recursively) and files to watch
+            debounce: Seconds without changes that close a batch
+            poll_interval: Seconds between scans when polling
+        """
+        paths = [Path(p).resolve() for p in paths]
+        self.dirs = [p for p in paths if p.is_dir()]
+        self.files = {p for p in paths if not p.is_dir()}
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+
+        self._pending: Set[Path] = set()
+        self._changed = asyncio.Event()
+        self._last_change = 0.0
+        self._started = False
+        self._fd = -1
+        self._libc = None
+        self._watches: Dict[int, Path] = {}
+        self._poll_task: asyncio.Task | None = None
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def backend(self) -> str:
+        """Get the active backend name."""
+        return "inotify" if self._fd >= 0 else "polling"
+
+    # ------------------------------------------------------------------
+    # Change bookkeeping
+    # ------------------------------------------------------------------
+
+    def _wanted(self, path: Path) -> bool:
+        """Check if a changed path is one we watch."""
+        if is_noise(path):
+            return False
+        return path in self.files or any(path.is_relative_to(d) for d in self.dirs)
+
+    def _record(self, paths: Iterable[Path]) -> None:
+        """Add changed paths to the pending batch."""
+        wanted = {p for p in paths if self._wanted(p)}
+        if wanted:
+            self._pending |= wanted
+            self._last_change = time.monotonic()
+            self._changed.set()
+
+    # ------------------------------------------------------------------
+    # inotify backend
+    # ------------------------------------------------------------------
+
+    def _start_inotify(self) -> None:
+        """Open an inotify instance and watch every target."""
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._libc, self._fd = libc, fd
+
+        try:
+            for directory in self.dirs:
+                self._add_tree(directory)
+            for parent in {f.parent for f in self.files}:
+                self._add_watch(parent)
+        except OSError:
+            self._stop_inotify()
+            raise
+
+        asyncio.get_running_loop().add_reader(self._fd, self._read_events)
+
+    def _add_watch(self, directory: Path) -> None:
+        """Watch one directory."""
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(directory), WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, f"inotify_add_watch {directory}: {os.strerror(errno)}")
+        self._watches[wd] = directory
+
+    def _add_tree(self, root: Path) -> None:
+        """Watch a directory and all its subdirectories."""
+        for current, subdirs, _ in os.walk(root):
+            subdirs[:] = [d for d in subdirs if d not in SKIP_DIRS]
+            self._add_watch(Path(current))
+
+    def _read_events(self) -> None:
+        """Drain the inotify descriptor (event loop reader callback)."""
+        try:
+            buffer = os.read(self._fd, 64 * 1024)
+        except BlockingIOError:
+            return
+
+        changed = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(buffer):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+            name = buffer[offset + EVENT_HEADER.size:offset + EVENT_HEADER.size + length]
+            offset += EVENT_HEADER.size + length
+
+            if mask & IN_Q_OVERFLOW:
+                # Events were lost; report every target as changed
+                changed += self.dirs + list(self.files)
+                continue
+            if mask & IN_IGNORED:
+                self._watches.pop(wd, None)
+                continue
+
+            directory = self._watches.get(wd)
+            if directory is None:
+                continue
+            path = directory / os.fsdecode(name.rstrip(b"\0")) if length else directory
+            changed.append(path)
+
+            # New directories (mkdir, git checkout, mv) need their own watches
+            if mask & IN_ISDIR and mask & (IN_CREATE | IN_MOVED_TO) and self._wanted(path):
+                try:
+                    self._add_tree(path)
+                except OSError as e:
+                    self._logger.warning("Cannot watch %s: %s", path, e)
+                changed += [p for p in path.rglob("*") if p.is_file()]
+
+        self._record(changed)
+
+    def _stop_inotify(self) -> None:
+        """Close the inotify instance."""
+        if self._fd < 0:
+            return
+        try:
+            asyncio.get_running_loop().remove_reader(self._fd)
+        except RuntimeError:
+            pass
+        os.close(self._fd)
+        self._fd = -1
+        self._watches.clear()
+
+    # ------------------------------------------------------------------
+    # Polling backend
+    # ------------------------------------------------------------------
+
+    def _snapshot(self) -> Dict[Path, Tuple[int, int]]:
+        """Get (mtime, size) of every watched file."""
+        snapshot = {}
+        candidates: List[Path] = list(self.files)
+        for directory in self.dirs:
+            for current, subdirs, names in os.walk(directory):
+                subdirs[:] = [d for d in subdirs if d not in SKIP_DIRS]
+                candidates += [Path(current) / name for name in names]
+        for path in candidates:
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    async def _poll(self) -> None:
+        """Scan for changes every ``poll_interval`` seconds."""
+        previous = await asyncio.to_thread(self._snapshot)
+        while True:
+            await asyncio.sleep(self.poll_interval)
+            current = await asyncio.to_thread(self._snapshot)
+            changed = {p for p in previous.keys() | current.keys() if previous.get(p) != current.get(p)}
+            previous = current
+            self._record(changed)
+
+    # ------------------------------------------------------------------
+    # FileWatcherPort
+    # ------------------------------------------------------------------
+
+    def _start(self) -> None:
+        """Start the inotify backend, or polling if inotify is unavailable."""
+        self._started = True
+        try:
+            self._start_inotify()
+        except (OSError, AttributeError) as e:
+            self._logger.info("inotify unavailable (%s); polling every %ss", e, self.poll_interval)
+            self._poll_task = asyncio.create_task(self._poll())
+
+    def start(self) -> None:
+        """Start watching now (otherwise the first next_batch() starts it).
+
+        Must be called from a running event loop.
+        """
+        if not self._started:
+            self._start()
+
+    async def next_batch(self) -> Set[Path]:
+        """Wait for changes, then until ``debounce`` seconds pass without one."""
+        self.start()
+        while True:
+            await self._changed.wait()
+            quiet_for = time.monotonic() - self._last_change
+            if quiet_for >= self.debounce:
+                break
+            await asyncio.sleep(self.debounce - quiet_for)
+
+        batch, self._pending = self._pending, set()
+        self._changed.clear()
+        return batch
+
+    def close(self) -> None:
+        """Stop watching."""
+        self._stop_inotify()
+        if self._poll_task is not None:
+            self._poll_task.cancel()
+            self._poll_task = None
+        self._started = False
@@ -0,0 +1,281 @@
+# SPDX-License-Identifier: MIT-0
+"""In-Process Executor Adapter.
+
+Concrete implementation of ExecutorPort using the Molecule Python API and
+ansible-runner.
+This adapter knows HOW to run a scenario's playbooks without starting a
+``molecule`` CLI per phase.
+
+Every ``molecule <command>`` re-imports Molecule and Ansible, re-resolves
+the scenario config and re-runs the dependency step before it gets to the
+playbook. Here the scenario config is loaded and the dependency step run
+once; each phase then goes straight to ansible-runner with the generated
+ansible.cfg, inventory and environment kept warm.
+
+Both packages ship with ansible-dev-tools (the ``dev`` extra) and are only
+imported when the first phase runs.
+"""
+
+import os
+from functools import partial
+from pathlib import Path
+from typing import List, Optional
+
+from src.domain.models import (
+    TestResult,
+    TestPhase,
+    TestStatus,
+    idempotence_failure,
+)
+from src.application.ports import ObserverPort
+from src.infrastructure.adapters.changed_tasks_log import ChangedTasksLog
+from src.infrastructure.adapters.molecule_executor import MoleculeExecutorAdapter
+from src.infrastructure.adapters.output_batcher import OutputBatcher
+
+
+class InProcessExecutorAdapter(MoleculeExecutorAdapter):
+    """Adapter for executing Molecule scenarios in-process.
+
+    Phases keep Molecule's semantics: the driver's create/destroy playbooks,
+    Molecule's instance state file and inventory, Molecule-style action
+    headers and idempotence reports. Container identity and liveness checks
+    are inherited from MoleculeExecutorAdapter.
+    """
+
+    def __init__(
+        self,
+        scenario: str,
+        env: dict,
+        project_root,
+        observer: Optional[ObserverPort] = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+    ):
+        """Initialize the executor.
+
+        Args:
+            scenario: Molecule scenario name
+            env: Environment variables for execution
+            project_root: Path to project root
+            observer: Observer that receives streamed output batches
+            batch_size: Lines per output batch (default: from Settings)
+            flush_interval: Max seconds a partial batch is held (default: from Settings)
+        """
+        super().__init__(scenario, env, project_root, observer, batch_size, flush_interval)
+        self.runner_dir = Path(project_root) / ".ansible" / "runner" / scenario
+        self._config = None
+        self._runner_env: dict = {}
+
+    # ------------------------------------------------------------------
+    # Warm scenario state
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        """Load the scenario config and run the dependency step (once)."""
+        if self._config is not None:
+            return self._config
+
+        from molecule.config import Config
+
+        # Molecule resolves the project and interpolates molecule.yml from
+        # the process environment; the scenario's variables are only set
+        # while the config loads, not for the rest of the agent process
+        saved = dict(os.environ)
+        os.environ.update(self.env)
+        os.environ.setdefault("MOLECULE_PROJECT_DIRECTORY", str(self.project_root))
+        try:
+            molecule_file = Path(self.project_root) / "molecule" / self.scenario / "molecule.yml"
+            config = Config(
+                molecule_file=str(molecule_file),
+                args={},
+                command_args={"subcommand": "test", "scenario_name": self.scenario},
+            )
+            config.dependency.execute()
+            config.provisioner.write_config()
+            config.provisioner.manage_inventory()
+        finally:
+            os.environ.clear()
+            os.environ.update(saved)
+
+        self._runner_env = {**self.env, **config.provisioner.env}
+        self._config = config
+        return config
+
+    def _playbook_path(self, action: str) -> Optional[str]:
+        """Get the scenario (or driver default) playbook for an action."""
+        path = getattr(self._load().provisioner.playbooks, action, None)
+        return path if path and os.path.exists(path) else None
+
+    # ------------------------------------------------------------------
+    # Execution
+    # ------------------------------------------------------------------
+
+    def _header(self, action: str) -> str:
+        """Get a Molecule-style action header line."""
+        return f"INFO     [{self.scenario} > {action}] Executing"
+
+    def _result(self, phase: TestPhase, return_code: int, output: str) -> TestResult:
+        """Build a TestResult."""
+        return TestResult(
+            phase=phase,
+            status=TestStatus.SUCCESS if return_code == 0 else TestStatus.FAILED,
+            return_code=return_code,
+            output=output,
+        )
+
+    def _playbook(
+        self,
+        action: str,
+        phase: TestPhase,
+        tags: Optional[List[str]] = None,
+        env: Optional[dict] = None,
+    ) -> TestResult:
+        """Run one of the scenario's playbooks through ansible-runner.
+
+        Args:
+            action: Molecule action whose playbook runs (create, converge, ...)
+            phase: Test phase for this execution
+            tags: Limit the run to these tags
+            env: Extra environment variables for this run
+
+        Returns:
+            TestResult with status and output
+        """
+        sink = None if self.observer is None else partial(self.observer.on_output, phase.value)
+        output = OutputBatcher(sink, self.batch_size, self.flush_interval)
+        output.add(self._header(action))
+
+        def on_event(event: dict) -> bool:
+            for line in (event.get("stdout") or "").splitlines():
+                output.add(line)
+            return False  # nothing else reads the event files
+
+        try:
+            import ansible_runner
+
+            config = self._load()
+            playbook = self._playbook_path(action)
+            if playbook is None:
+                return self._result(
+                    phase, 0, f"{self._header(action)}\nSkipping, {action} playbook not found"
+                )
+
+            with output:
+                runner = ansible_runner.run(
+                    private_data_dir=str(self.runner_dir),
+                    project_dir=str(self.project_root),
+                    playbook=playbook,
+                    inventory=config.provisioner.inventory_directory,
+                    envvars={**self._runner_env, **(env or {})},
+                    cmdline=f"--tags {','.join(tags)}" if tags else None,
+                    event_handler=on_event,
+                    rotate_artifacts=1,
+                    quiet=True,
+                )
+            return self._result(phase, runner.rc, "\n".join(output.lines))
+
+        except Exception as e:
+            return self._result(phase, -1, f"Exception: {e}")
+
+    def create_containers(self) -> TestResult:
+        """Create test containers."""
+        result = self._playbook("create", TestPhase.CREATE)
+        if result.is_success():
+            self._config.state.change_state("created", True)
+            # The driver wrote its instance config; refresh the inventory
+            self._config.provisioner.manage_inventory()
+        return result
+
+    def prepare_environment(self) -> TestResult:
+        """Prepare test environment."""
+        result = self._playbook("prepare", TestPhase.PREPARE)
+        if result.is_success():
+            self._config.state.change_state("prepared", True)
+        return result
+
+    def converge(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Run converge (apply playbook), limited to ``tags`` if given."""
+        result = self._playbook("converge", TestPhase.CONVERGE, tags)
+        if result.is_success() and not tags:
+            self._config.state.change_state("converged", True)
+        return result
+
+    def check_idempotence(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Converge again and fail on any changed task."""
+        with ChangedTasksLog() as log:
+            result = self._playbook("converge", TestPhase.IDEMPOTENCE, tags, env=log.env({}))
+            changed = log.changed_in(result.output) if result.is_success() else []
+        return idempotence_failure(result, changed) if changed else result
+
+    def verify(self) -> TestResult:
+        """Run verification tests."""
+        return self._playbook("verify", TestPhase.VERIFY)
+
+    def run_full_test(self) -> TestResult:
+        """Run the scenario's test_sequence from scratch like ``molecule test``.
+
+        The dependency step already ran when the config was loaded. The
+        instances are always destroyed at the end, also after a failure.
+        """
+        steps = {
+            "cleanup": self.cleanup,
+            "destroy": self.destroy_containers,
+            "create": self.create_containers,
+            "prepare": self.prepare_environment,
+            "converge": self.converge,
+            "idempotence": self.check_idempotence,
+            "side_effect": lambda: self._playbook("side_effect", TestPhase.FULL_TEST),
+            "verify": self.verify,
+        }
+        try:
+            sequence = self._load().scenario.test_sequence
+        except Exception as e:
+            return self._result(TestPhase.FULL_TEST, -1, f"Exception: {e}")
+
+        outputs = []
+        return_code = 0
+        changed = ()
+        for action in sequence:
+            if action not in steps:
+                continue
+            result = steps[action]()
+            outputs.append(result.output)
+            if not result.is_success():
+                return_code = result.return_code
+                changed = result.changed_tasks
+                outputs.append(self.destroy_containers().output)
+                break
+
+        result = self._result(TestPhase.FULL_TEST, return_code, "\n".join(outputs))
+        return result.with_changed_tasks(changed) if changed else result
+
+    def destroy_containers(self) -> TestResult:
+        """Destroy all containers."""
+        result = self._playbook("destroy", TestPhase.DESTROY)
+        if result.is_success():
+            self._config.state.reset()
+        return result
+
+    def cleanup(self) -> TestResult:
+        """Cleanup temporary files."""
+        return self._playbook("cleanup", TestPhase.CLEANUP)
+
+    def get_container_identity(self) -> dict:
+        """Get the names and podman IDs of the scenario's created instances."""
+        try:
+            statuses = self._load().driver.status()
+        except Exception:
+            return {}
+
+        names = [s.instance_name for s in statuses if str(s.created).lower() == "true"]
+        if not names:
+            return {}
+
+        rc, out = self._capture(["podman", "inspect", "--format", "{{.Id}}", *names])
+        if rc != 0:
+            return {}
+
+        return {
+            "driver": "podman",
+            "containers": dict(zip(names, out.split())),
+        }
@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: MIT-0
+"""Journal State Store Adapter.
+
+Concrete implementation of StateStorePort using an append-only JSONL journal.
+This adapter knows HOW to make agent state survive a pre-empted runner.
+"""
+
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+from src.domain.models import AgentConfig, AgentState
+from src.application.ports import StateStorePort
+
+
+class JournalStateStoreAdapter(StateStorePort):
+    """Adapter for checkpointing state to an append-only journal.
+
+    Each checkpoint appends one full state snapshot and fsyncs it.
+    Earlier lines are never rewritten, so a crash can at worst leave a
+    truncated final line, which is ignored on load.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the store.
+
+        Args:
+            path: Journal file location
+        """
+        self.path = Path(path)
+
+    def checkpoint(self, state: AgentState) -> None:
+        """Append a durable snapshot of the state."""
+        record = {
+            "ts": datetime.now().isoformat(),
+            "state": state.to_dict(),
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(record, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _last_record(self) -> Optional[dict]:
+        """Get the last complete journal record, if any."""
+        if not self.path.exists():
+            return None
+
+        last = None
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    last = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn write from a crash - keep the previous snapshot
+                    continue
+        return last
+
+    def load_latest(self, config: AgentConfig) -> Optional[AgentState]:
+        """Load the last checkpoint if it belongs to an unfinished run."""
+        record = self._last_record()
+        if record is None:
+            return None
+
+        data = record["state"]
+        if data.get("scenario") != config.scenario:
+            return None
+
+        state = AgentState.from_dict(data, config)
+        if state.current_phase.is_terminal():
+            return None
+        return state
+
+    def reset(self) -> None:
+        """Remove the journal before a fresh run."""
+        self.path.unlink(missing_ok=True)
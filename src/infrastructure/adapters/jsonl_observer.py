@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: MIT-0
+"""JSONL Observer Adapter.
+
+Concrete implementation of ObserverPort that appends events to a JSONL file.
+This adapter knows HOW to persist observations for later machine processing.
+"""
+
+import json
+from datetime import datetime
+from pathlib import Path
+from typing import List
+
+from src.domain.models import TestResult, FixRecord
+from src.application.ports import ObserverPort, LogLevel
+
+
+class JsonlObserverAdapter(ObserverPort):
+    """Adapter for observing via a JSON Lines event file.
+
+    Every observation becomes one JSON object per line, so the file can be
+    tailed, grepped or loaded with any JSONL reader.
+    """
+
+    def __init__(self, path: Path):
+        """Initialize the observer.
+
+        Args:
+            path: Destination JSONL file (appended to, created if missing)
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "a", encoding="utf-8")
+
+    def _write(self, event: str, **data) -> None:
+        """Write a single event record.
+
+        Args:
+            event: Event name
+            **data: Event payload
+        """
+        record = {"ts": datetime.now().isoformat(), "event": event, **data}
+        self._file.write(json.dumps(record, default=str) + "\n")
+
+    def log(self, level: LogLevel, message: str) -> None:
+        """Log a message."""
+        self._write("log", level=level.value, message=message)
+
+    def on_iteration_start(self, iteration: int, max_retries: int) -> None:
+        """Called when a new iteration starts."""
+        self._write("iteration_start", iteration=iteration, max_retries=max_retries)
+
+    def on_iteration_complete(self, iteration: int, success: bool) -> None:
+        """Called when an iteration completes."""
+        self._write("iteration_complete", iteration=iteration, success=success)
+
+    def on_test_start(self, phase: str) -> None:
+        """Called when a test phase starts."""
+        self._write("test_start", phase=phase)
+
+    def on_test_complete(self, result: TestResult) -> None:
+        """Called when a test phase completes."""
+        self._write(
+            "test_complete",
+            phase=result.phase.value,
+            status=result.status.value,
+            return_code=result.return_code,
+            error=result.get_error_summary(),
+        )
+
+    def on_output(self, phase: str, lines: List[str]) -> None:
+        """Called with a batch of streamed command output lines."""
+        self._write("output", phase=phase, lines=lines)
+
+    def on_healing_start(self, iteration: int) -> None:
+        """Called when healing starts."""
+        self._write("healing_start", iteration=iteration)
+
+    def on_healing_complete(self, fix_record: FixRecord) -> None:
+        """Called when healing completes."""
+        self._write(
+            "healing_complete",
+            iteration=fix_record.iteration,
+            status=fix_record.status.value,
+        )
+
+    def on_phase_change(self, phase: str) -> None:
+        """Called when agent phase changes."""
+        self._write("phase_change", phase=phase)
+
+    def on_summary(self, summary: dict) -> None:
+        """Called to display final summary."""
+        self._write("summary", summary=summary)
+
+    def close(self) -> None:
+        """Flush and close the event file."""
+        if not self._file.closed:
+            self._file.flush()
+            self._file.close()
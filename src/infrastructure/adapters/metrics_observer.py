@@ -0,0 +1,114 @@
+# SPDX-License-Identifier: MIT-0
+"""Metrics Observer Adapter.
+
+Concrete implementation of ObserverPort that aggregates run metrics.
+This adapter knows HOW to turn observations into counters and timings.
+"""
+
+import json
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List
+
+from src.domain.models import TestResult, FixRecord
+from src.application.ports import ObserverPort, LogLevel
+
+
+class MetricsObserverAdapter(ObserverPort):
+    """Adapter for observing via aggregated metrics.
+
+    Counts events, output volume and phase durations in memory and
+    writes a JSON snapshot when closed.
+    """
+
+    def __init__(self, path: Path | None = None):
+        """Initialize the observer.
+
+        Args:
+            path: Optional JSON file the final snapshot is written to
+        """
+        self.path = Path(path) if path else None
+        self.events: Counter = Counter()
+        self.log_levels: Counter = Counter()
+        self.output_lines = 0
+        self.output_bytes = 0
+        self.phase_durations: Dict[str, List[float]] = {}
+        self.phase_failures: Counter = Counter()
+        self._phase_started: Dict[str, float] = {}
+
+    def log(self, level: LogLevel, message: str) -> None:
+        """Log a message."""
+        self.events["log"] += 1
+        self.log_levels[level.value] += 1
+
+    def on_iteration_start(self, iteration: int, max_retries: int) -> None:
+        """Called when a new iteration starts."""
+        self.events["iteration_start"] += 1
+
+    def on_iteration_complete(self, iteration: int, success: bool) -> None:
+        """Called when an iteration completes."""
+        self.events["iteration_complete"] += 1
+
+    def on_test_start(self, phase: str) -> None:
+        """Called when a test phase starts."""
+        self.events["test_start"] += 1
+        self._phase_started[phase] = time.monotonic()
+
+    def on_test_complete(self, result: TestResult) -> None:
+        """Called when a test phase completes."""
+        self.events["test_complete"] += 1
+        phase = result.phase.value
+        started = self._phase_started.pop(phase, None)
+        if started is not None:
+            self.phase_durations.setdefault(phase, []).append(time.monotonic() - started)
+        if not result.is_success():
+            self.phase_failures[phase] += 1
+
+    def on_output(self, phase: str, lines: List[str]) -> None:
+        """Called with a batch of streamed command output lines."""
+        self.events["output"] += 1
+        self.output_lines += len(lines)
+        self.output_bytes += sum(len(line) + 1 for line in lines)
+
+    def on_healing_start(self, iteration: int) -> None:
+        """Called when healing starts."""
+        self.events["healing_start"] += 1
+
+    def on_healing_complete(self, fix_record: FixRecord) -> None:
+        """Called when healing completes."""
+        self.events["healing_complete"] += 1
+        self.events[f"healing_{fix_record.status.value}"] += 1
+
+    def on_phase_change(self, phase: str) -> None:
+        """Called when agent phase changes."""
+        self.events["phase_change"] += 1
+
+    def on_summary(self, summary: dict) -> None:
+        """Called to display final summary."""
+        self.events["summary"] += 1
+
+    def snapshot(self) -> dict:
+        """Get the current metrics as a plain dictionary."""
+        return {
+            "events": dict(self.events),
+            "log_levels": dict(self.log_levels),
+            "output_lines": self.output_lines,
+            "output_bytes": self.output_bytes,
+            "phase_durations_seconds": {
+                phase: {
+                    "count": len(durations),
+                    "total": sum(durations),
+                    "max": max(durations),
+                }
+                for phase, durations in self.phase_durations.items()
+            },
+            "phase_failures": dict(self.phase_failures),
+        }
+
+    def close(self) -> None:
+        """Write the final metrics snapshot."""
+        if self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.path, "w") as f:
+                json.dump(self.snapshot(), f, indent=2)
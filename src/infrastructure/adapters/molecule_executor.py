@@ -6,10 +6,18 @@ This adapter knows HOW to execute Molecule commands.
 """
 
 import subprocess
-from typing import List
+from functools import partial
+from typing import List, Optional
 
-from src.domain.models import TestResult, TestPhase, TestStatus
-from src.application.ports import ExecutorPort
+from src.domain.models import (
+    TestResult,
+    TestPhase,
+    TestStatus,
+    idempotence_failure,
+)
+from src.application.ports import ExecutorPort, ObserverPort
+from src.infrastructure.adapters.changed_tasks_log import ChangedTasksLog
+from src.infrastructure.adapters.output_batcher import OutputBatcher
 from src.infrastructure.config import Settings
 
 
@@ -19,53 +27,65 @@ class MoleculeExecutorAdapter(ExecutorPort):
     Implements ExecutorPort using subprocess to call molecule CLI.
     """
 
-    def __init__(self, scenario: str, env: dict, project_root):
+    def __init__(
+        self,
+        scenario: str,
+        env: dict,
+        project_root,
+        observer: Optional[ObserverPort] = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+    ):
         """Initialize the executor.
 
         Args:
             scenario: Molecule scenario name
             env: Environment variables for execution
             project_root: Path to project root
+            observer: Observer that receives streamed output batches
+            batch_size: Lines per output batch (default: from Settings)
+            flush_interval: Max seconds a partial batch is held (default: from Settings)
         """
         self.scenario = scenario
         self.env = env
         self.project_root = project_root
+        self.observer = observer
+        self.batch_size = batch_size or Settings.OUTPUT_BATCH_SIZE
+        self.flush_interval = flush_interval or Settings.OUTPUT_FLUSH_INTERVAL
 
     def _run_command(
         self,
         command: List[str],
         phase: TestPhase,
+        env: Optional[dict] = None,
     ) -> TestResult:
         """Run a command and return TestResult.
 
         Args:
             command: Command and arguments
             phase: Test phase for this execution
+            env: Environment for this command (default: the executor's)
 
         Returns:
             TestResult with status and output
         """
-        full_output = []
-
         try:
             process = subprocess.Popen(
                 command,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
                 text=True,
-                env=self.env,
+                env=self.env if env is None else env,
                 cwd=str(self.project_root),
             )
 
-            # Stream output
-            for line in iter(process.stdout.readline, ""):
-                if not line:
-                    break
-                clean_line = line.rstrip()
-                if clean_line:
-                    # Use observer for streaming (pass to console)
-                    print(f"  │ {clean_line}")
-                    full_output.append(clean_line)
+            # Stream output - batches are handed to the observer, which must
+            # never block this loop (see CompositeObserverAdapter)
+            sink = None if self.observer is None else partial(self.observer.on_output, phase.value)
+            with OutputBatcher(sink, self.batch_size, self.flush_interval) as output:
+                for line in process.stdout:
+                    output.add(line)
+            full_output = output.lines
 
             process.wait()
             returncode = process.returncode
@@ -102,19 +122,43 @@ class MoleculeExecutorAdapter(ExecutorPort):
             TestPhase.PREPARE,
         )
 
-    def converge(self) -> TestResult:
-        """Run converge (apply playbook)."""
+    def converge(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Run converge (apply playbook), limited to ``tags`` if given."""
         return self._run_command(
-            ["molecule", "converge", "-s", self.scenario],
+            ["molecule", "converge", "-s", self.scenario, *self._tag_args(tags)],
             TestPhase.CONVERGE,
         )
 
-    def check_idempotence(self) -> TestResult:
-        """Check idempotence."""
-        return self._run_command(
-            ["molecule", "idempotence", "-s", self.scenario],
-            TestPhase.IDEMPOTENCE,
-        )
+    def check_idempotence(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Check idempotence, limited to ``tags`` if given.
+
+        ``molecule idempotence`` cannot pass arguments to Ansible, so a
+        tagged check converges the tags again and fails on changed tasks.
+        Either way a failed result carries the changed tasks, with file,
+        line and module arguments when the changed_tasks callback logged them.
+        """
+        with ChangedTasksLog() as log:
+            if not tags:
+                result = self._run_command(
+                    ["molecule", "idempotence", "-s", self.scenario],
+                    TestPhase.IDEMPOTENCE,
+                    env=log.env(self.env),
+                )
+                reported = log.reported_in(result.output) if result.is_failure() else []
+                return result.with_changed_tasks(reported) if reported else result
+
+            result = self._run_command(
+                ["molecule", "converge", "-s", self.scenario, *self._tag_args(tags)],
+                TestPhase.IDEMPOTENCE,
+                env=log.env(self.env),
+            )
+            changed = log.changed_in(result.output) if result.is_success() else []
+        return idempotence_failure(result, changed) if changed else result
+
+    @staticmethod
+    def _tag_args(tags: Optional[List[str]]) -> List[str]:
+        """Get the Ansible arguments that limit a run to ``tags``."""
+        return ["--", "--tags", ",".join(tags)] if tags else []
 
     def verify(self) -> TestResult:
         """Run verification tests."""
@@ -124,11 +168,15 @@ class MoleculeExecutorAdapter(ExecutorPort):
         )
 
     def run_full_test(self) -> TestResult:
-        """Run complete test suite."""
-        return self._run_command(
-            ["molecule", "test", "-s", self.scenario],
-            TestPhase.FULL_TEST,
-        )
+        """Run complete test suite (with changed tasks if idempotence failed)."""
+        with ChangedTasksLog() as log:
+            result = self._run_command(
+                ["molecule", "test", "-s", self.scenario],
+                TestPhase.FULL_TEST,
+                env=log.env(self.env),
+            )
+            reported = log.reported_in(result.output) if result.is_failure() else []
+        return result.with_changed_tasks(reported) if reported else result
 
     def destroy_containers(self) -> TestResult:
         """Destroy all containers."""
@@ -144,6 +192,67 @@ class MoleculeExecutorAdapter(ExecutorPort):
             TestPhase.CLEANUP,
         )
 
+    def _capture(self, command: List[str]) -> tuple[int, str]:
+        """Run a short helper command quietly and capture its stdout.
+
+        Args:
+            command: Command and arguments
+
+        Returns:
+            Tuple of (return code, stdout); (-1, "") if it could not run
+        """
+        try:
+            result = subprocess.run(
+                command,
+                capture_output=True,
+                text=True,
+                env=self.env,
+                cwd=str(self.project_root),
+                timeout=60,
+            )
+            return result.returncode, result.stdout
+        except Exception:
+            return -1, ""
+
+    def get_container_identity(self) -> dict:
+        """Get the names and podman IDs of the scenario's created instances."""
+        rc, out = self._capture(["molecule", "list", "-s", self.scenario, "-f", "plain"])
+        if rc != 0:
+            return {}
+
+        # Plain format rows: name driver provisioner scenario created converged
+        names = []
+        for line in out.splitlines():
+            fields = line.split()
+            if len(fields) >= 5 and fields[3] == self.scenario and fields[4].lower() == "true":
+                names.append(fields[0])
+        if not names:
+            return {}
+
+        rc, out = self._capture(["podman", "inspect", "--format", "{{.Id}}", *names])
+        if rc != 0:
+            return {}
+
+        return {
+            "driver": "podman",
+            "containers": dict(zip(names, out.split())),
+        }
+
+    def is_alive(self, identity: dict) -> bool:
+        """Check if the recorded containers still exist and are running."""
+        containers = identity.get("containers") or {}
+        if not containers:
+            return False
+
+        rc, out = self._capture([
+            "podman", "inspect", "--format", "{{.Id}} {{.State.Running}}", *containers
+        ])
+        if rc != 0:
+            return False
+
+        live = dict(line.split() for line in out.splitlines() if line.strip())
+        return all(live.get(cid) == "true" for cid in containers.values())
+
     def get_scenario_name(self) -> str:
         """Get the current scenario name."""
         return self.scenario
@@ -0,0 +1,143 @@
+# SPDX-License-Identifier: MIT-0
+"""Output batching for streaming executors.
+
+Groups output lines into batches for an observer: a batch is handed over
+when it is full or, at the latest, ``flush_interval`` seconds after its
+first line - also while the command prints nothing (e.g. a TASK header
+followed by a long-running task).
+"""
+
+import asyncio
+import threading
+import time
+from typing import Awaitable, Callable, List, Optional
+
+
+class OutputBatcher:
+    """Thread-safe line batcher for synchronous observers.
+
+    A background thread flushes partial batches that are due, so a quiet
+    command doesn't hold them back. Use as a context manager; leaving it
+    flushes the rest.
+    """
+
+    def __init__(
+        self,
+        sink: Optional[Callable[[List[str]], None]],
+        batch_size: int,
+        flush_interval: float,
+    ):
+        """Initialize the batcher.
+
+        Args:
+            sink: Receives each batch (None: lines are only collected)
+            batch_size: Lines per batch
+            flush_interval: Max seconds a partial batch is held
+        """
+        self.sink = sink
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.lines: List[str] = []
+        self._batch: List[str] = []
+        self._since = 0.0
+        self._lock = threading.Lock()
+        self._closed = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> "OutputBatcher":
+        if self.sink is not None:
+            self._thread = threading.Thread(target=self._flush_loop, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def add(self, line: str) -> None:
+        """Add one output line (empty lines are dropped)."""
+        line = line.rstrip()
+        if not line:
+            return
+        self.lines.append(line)
+        if self.sink is None:
+            return
+        with self._lock:
+            if not self._batch:
+                self._since = time.monotonic()
+            self._batch.append(line)
+            if len(self._batch) >= self.batch_size:
+                self._flush()
+
+    def _flush(self) -> None:
+        """Hand the current batch to the sink (lock held)."""
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self.sink(batch)
+
+    def _flush_loop(self) -> None:
+        """Flush partial batches once they are ``flush_interval`` old."""
+        while not self._closed.wait(self.flush_interval / 2):
+            with self._lock:
+                if self._batch and time.monotonic() - self._since >= self.flush_interval:
+                    self._flush()
+
+    def close(self) -> None:
+        """Stop the flusher and flush the rest."""
+        self._closed.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self.sink is not None:
+            with self._lock:
+                self._flush()
+
+
+async def stream_output(
+    stream: asyncio.StreamReader,
+    sink: Optional[Callable[[List[str]], Awaitable[None]]],
+    batch_size: int,
+    flush_interval: float,
+) -> List[str]:
+    """Read a stream to its end, handing batches of lines to ``sink``.
+
+    A partial batch is flushed ``flush_interval`` seconds after its first
+    line even if no further line arrives.
+
+    Args:
+        stream: Output of a subprocess
+        sink: Receives each batch (None: lines are only collected)
+        batch_size: Lines per batch
+        flush_interval: Max seconds a partial batch is held
+
+    Returns:
+        Every non-empty line
+    """
+    lines: List[str] = []
+    batch: List[str] = []
+    deadline = None
+    while True:
+        timeout = None if deadline is None else max(deadline - time.monotonic(), 0)
+        try:
+            # Cancelling readline() leaves a partial line in the buffer
+            raw_line = await asyncio.wait_for(stream.readline(), timeout)
+        except asyncio.TimeoutError:
+            await sink(batch)
+            batch, deadline = [], None
+            continue
+        if not raw_line:
+            break
+        line = raw_line.decode("utf-8", "replace").rstrip()
+        if not line:
+            continue
+        lines.append(line)
+        if sink is None:
+            continue
+        batch.append(line)
+        if deadline is None:
+            deadline = time.monotonic() + flush_interval
+        if len(batch) >= batch_size:
+            await sink(batch)
+            batch, deadline = [], None
+    if batch:
+        await sink(batch)
+    return lines
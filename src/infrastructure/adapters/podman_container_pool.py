@@ -0,0 +1,391 @@
+# SPDX-License-Identifier: MIT-0
+"""Podman Container Pool Adapter.
+
+Concrete implementation of ContainerPoolPort using Podman.
+This adapter knows HOW to keep pre-created, pre-prepared containers warm
+so a run gets a container in seconds instead of minutes.
+
+Containers are started from the scenario's first platform in molecule.yml
+(or an image given per lease, e.g. by a test matrix) and prepared with the
+scenario's prepare.yml. Each container is recycled after ``max_uses`` runs
+or as soon as a health check fails.
+
+With ``image_cache``, the first prepared container of a scenario and base
+image is committed as a local image; later containers start from it and
+skip prepare. The tag hashes the base image ID and prepare.yml, so either
+changing invalidates it. Cached images carry the pool label and can be
+removed with ``podman image prune -a --filter label=io.ansible-agent.pool``.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import re
+import shlex
+import uuid
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.application.ports import ContainerPoolPort, PackageCachePort
+from src.infrastructure.config import Settings
+
+# ${VAR} and ${VAR:-default}, as Molecule interpolates molecule.yml
+_ENV_REFERENCE = re.compile(r"\$\{(?P<name>\w+)(?::-(?P<default>[^}]*))?\}")
+
+
+class PodmanContainerPoolAdapter(ContainerPoolPort):
+    """Adapter for a warm Podman container pool.
+
+    Keeps ``size`` idle containers per scenario (and image override) that
+    has been requested or warmed up explicitly. Refills happen in the
+    background.
+    """
+
+    NAME_PREFIX = "agent-pool"
+    LABEL = "io.ansible-agent.pool"
+
+    def __init__(
+        self,
+        project_root: Path,
+        env: dict,
+        size: int = 2,
+        max_uses: int = 5,
+        health_interval: float = 30.0,
+        package_cache: Optional[PackageCachePort] = None,
+        image_cache: bool = False,
+    ):
+        """Initialize the pool.
+
+        Args:
+            project_root: Project root (holds molecule/<scenario>/)
+            env: Environment for podman and ansible-playbook
+            size: Idle containers to keep per scenario
+            max_uses: Runs a container may serve before it is recycled
+            health_interval: Seconds between health checks of idle containers
+            package_cache: Shared dnf cache; its volume is mounted per release
+            image_cache: Commit prepared containers and start later ones from them
+        """
+        self.project_root = Path(project_root)
+        self.env = dict(env)
+        # The collection's roles, as ansible.cfg's roles_path resolves them
+        self.env["ANSIBLE_ROLES_PATH"] = str(self.project_root / Settings.ROLES_DIR)
+        self.size = size
+        self.max_uses = max_uses
+        self.health_interval = health_interval
+        self.package_cache = package_cache
+        self.image_cache = image_cache
+        self.inventory_dir = self.project_root / ".agent-pool"
+
+        self._idle: Dict[str, List[dict]] = {}
+        self._leased: Dict[str, dict] = {}
+        self._warming: Dict[str, int] = {}
+        self._refills: Dict[str, asyncio.Task] = {}
+        self._prepared: Dict[str, asyncio.Lock] = {}
+        self._health_task: asyncio.Task | None = None
+        self._logger = logging.getLogger(__name__)
+
+    # ------------------------------------------------------------------
+    # Scenario configuration
+    # ------------------------------------------------------------------
+
+    def scenario_dir(self, scenario: str) -> Path:
+        """Get the Molecule directory of a scenario."""
+        return self.project_root / "molecule" / scenario
+
+    @staticmethod
+    def pool_key(scenario: str, image: Optional[str] = None) -> str:
+        """Get the key idle containers are kept under ("scenario[@image]")."""
+        return f"{scenario}@{image}" if image else scenario
+
+    def _molecule_config(self, scenario: str) -> dict:
+        """Load a scenario's molecule.yml."""
+        import yaml  # ships with ansible-core
+
+        with open(self.scenario_dir(scenario) / "molecule.yml", encoding="utf-8") as f:
+            return yaml.safe_load(f) or {}
+
+    def inventory_for(self, lease: dict) -> Path:
+        """Write (once) and return an inventory that targets a leased container.
+
+        Mirrors what Molecule would generate: the container is reached via
+        the podman connection plugin and gets the scenario's group_vars.
+        """
+        path = self.inventory_dir / f"{lease['name']}.yml"
+        if path.exists():
+            return path
+
+        config = self._molecule_config(lease["scenario"])
+        group_vars = {
+            name: self._interpolate(value, self.env) if isinstance(value, str) else value
+            for name, value in (
+                config.get("provisioner", {}).get("inventory", {}).get("group_vars", {}).get("all", {})
+            ).items()
+        }
+        inventory = {
+            "all": {
+                "hosts": {
+                    lease["name"]: {"ansible_connection": "containers.podman.podman"},
+                },
+                "vars": group_vars,
+            },
+        }
+        self.inventory_dir.mkdir(parents=True, exist_ok=True)
+        # JSON is valid YAML, so the yaml inventory plugin reads it as-is
+        path.write_text(json.dumps(inventory, indent=2))
+        return path
+
+    def _interpolate(self, value: str, env: dict) -> str:
+        """Expand environment references in a molecule.yml value."""
+        return _ENV_REFERENCE.sub(
+            lambda m: env.get(m.group("name")) or m.group("default") or "", value
+        )
+
+    def playbook_command(self, lease: dict, playbook: str) -> List[str]:
+        """Build the ansible-playbook command for a scenario playbook."""
+        command = ["ansible-playbook", "-i", str(self.inventory_for(lease))]
+        scenario_inventory = self.scenario_dir(lease["scenario"]) / "inventory.yml"
+        if scenario_inventory.exists():
+            command += ["-i", str(scenario_inventory)]
+        command.append(str(self.scenario_dir(lease["scenario"]) / playbook))
+        return command
+
+    # ------------------------------------------------------------------
+    # Podman plumbing
+    # ------------------------------------------------------------------
+
+    async def _exec(self, *command: str) -> Tuple[int, str]:
+        """Run a command and capture its combined output."""
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.STDOUT,
+            env=self.env,
+            cwd=str(self.project_root),
+        )
+        stdout, _ = await process.communicate()
+        return process.returncode, stdout.decode("utf-8", "replace")
+
+    async def _prepared_image(self, scenario: str, image: str) -> Tuple[str, bool]:
+        """Get the cached prepared image of a scenario and base image.
+
+        Returns:
+            Tuple of (image tag, whether it exists yet)
+        """
+        rc, out = await self._exec("podman", "image", "inspect", "--format", "{{.Id}}", image)
+        if rc != 0:
+            rc, out = await self._exec("podman", "pull", "-q", image)
+            if rc != 0:
+                raise RuntimeError(f"podman pull failed for {image}: {out.strip()}")
+        digest = hashlib.sha256(out.strip().splitlines()[-1].encode())
+        prepare = self.scenario_dir(scenario) / "prepare.yml"
+        if prepare.exists():
+            digest.update(prepare.read_bytes())
+        tag = f"localhost/{self.NAME_PREFIX}-prepared:{scenario}-{digest.hexdigest()[:16]}"
+        rc, _ = await self._exec("podman", "image", "exists", tag)
+        return tag, rc == 0
+
+    async def _warm(self, key: str) -> dict:
+        """Start and prepare one container for a pool key."""
+        scenario, _, image = key.partition("@")
+        platform = (self._molecule_config(scenario).get("platforms") or [{}])[0]
+        image = image or platform.get("image", "quay.io/fedora/fedora-toolbox:latest")
+        name = f"{self.NAME_PREFIX}-{scenario}-{uuid.uuid4().hex[:8]}"
+
+        env = dict(self.env)
+        if self.package_cache is not None:
+            release = self.package_cache.release_of(image)
+            env["MOLECULE_DNF_CACHE"] = self.package_cache.ensure(release)
+
+        if not self.image_cache:
+            return await self._start(key, scenario, image, platform, name, env, prepare=True)
+        # One container per cache key prepares and commits; the others wait
+        lock = self._prepared.setdefault(f"{scenario}@{image}", asyncio.Lock())
+        async with lock:
+            tag, cached = await self._prepared_image(scenario, image)
+            if not cached:
+                lease = await self._start(key, scenario, image, platform, name, env, prepare=True)
+                rc, out = await self._exec(
+                    "podman", "commit", "-q", "--change", f"LABEL {self.LABEL}={scenario}", name, tag
+                )
+                if rc != 0:
+                    self._logger.warning("Could not cache the prepared image %s: %s", tag, out.strip())
+                return lease
+        return await self._start(key, scenario, tag, platform, name, env, prepare=False)
+
+    async def _start(
+        self,
+        key: str,
+        scenario: str,
+        image: str,
+        platform: dict,
+        name: str,
+        env: dict,
+        prepare: bool,
+    ) -> dict:
+        """Run one container from ``image`` and prepare it if asked to."""
+        command = ["podman", "run", "-d", "--name", name, "--label", f"{self.LABEL}={scenario}"]
+        for variable, value in (platform.get("env") or {}).items():
+            command += ["--env", f"{variable}={value}"]
+        for volume in platform.get("volumes") or []:
+            command += ["--volume", self._interpolate(volume, env)]
+        if platform.get("privileged"):
+            command.append("--privileged")
+        command.append(image)
+        command += shlex.split(platform.get("command", "sleep infinity"))
+
+        rc, out = await self._exec(*command)
+        if rc != 0:
+            raise RuntimeError(f"podman run failed for {name}: {out.strip()}")
+        lease = {
+            "name": name,
+            "id": out.strip().splitlines()[-1],
+            "scenario": scenario,
+            "key": key,
+            "uses": 0,
+        }
+
+        if prepare and (self.scenario_dir(scenario) / "prepare.yml").exists():
+            rc, out = await self._exec(*self.playbook_command(lease, "prepare.yml"))
+            if rc != 0:
+                await self._remove(lease)
+                tail = "\n".join(out.splitlines()[-20:])
+                raise RuntimeError(f"prepare failed for {name}:\n{tail}")
+
+        return lease
+
+    async def _healthy(self, lease: dict) -> bool:
+        """Check that a container is running and responsive."""
+        rc, _ = await self._exec("podman", "exec", lease["name"], "true")
+        return rc == 0
+
+    async def _remove(self, lease: dict) -> None:
+        """Force-remove a container and its inventory."""
+        await self._exec("podman", "rm", "-f", lease["name"])
+        (self.inventory_dir / f"{lease['name']}.yml").unlink(missing_ok=True)
+
+    # ------------------------------------------------------------------
+    # Pool maintenance
+    # ------------------------------------------------------------------
+
+    def _schedule_refill(self, key: str) -> None:
+        """Start a background refill of a pool key unless one is running."""
+        task = self._refills.get(key)
+        if task is None or task.done():
+            self._refills[key] = asyncio.create_task(self._refill(key))
+            self._refills[key].add_done_callback(self._log_task_exception)
+
+    async def _refill(self, key: str) -> None:
+        """Warm containers until the pool key has ``size`` idle ones."""
+        idle = self._idle.setdefault(key, [])
+        while len(idle) + self._warming.get(key, 0) < self.size:
+            self._warming[key] = self._warming.get(key, 0) + 1
+            try:
+                idle.append(await self._warm(key))
+            except Exception:
+                self._logger.exception("Could not warm a container for %s", key)
+                return
+            finally:
+                self._warming[key] -= 1
+
+    async def _health_loop(self) -> None:
+        """Periodically replace idle containers that stopped responding."""
+        while True:
+            await asyncio.sleep(self.health_interval)
+            # acquire() and refills add keys and leases while this awaits
+            for key, idle in list(self._idle.items()):
+                for lease in list(idle):
+                    if not await self._healthy(lease) and lease in idle:
+                        self._logger.warning("Recycling unhealthy container %s", lease["name"])
+                        idle.remove(lease)
+                        await self._remove(lease)
+                self._schedule_refill(key)
+
+    def _log_task_exception(self, task: asyncio.Task) -> None:
+        """Log the exception that ended a background task (nothing awaits it)."""
+        if not task.cancelled() and task.exception() is not None:
+            self._logger.error(
+                "Pool task %s failed", task.get_name(), exc_info=task.exception()
+            )
+
+    async def start(self, scenarios: List[str]) -> None:
+        """Remove containers left by a previous daemon and warm scenarios."""
+        rc, out = await self._exec("podman", "ps", "-aq", "--filter", f"label={self.LABEL}")
+        if rc == 0 and out.split():
+            await self._exec("podman", "rm", "-f", *out.split())
+
+        if self.package_cache is not None:
+            await asyncio.to_thread(self.package_cache.prune)
+
+        if self._health_task is None:
+            self._health_task = asyncio.create_task(self._health_loop())
+            self._health_task.add_done_callback(self._log_task_exception)
+        for scenario in scenarios:
+            self._schedule_refill(scenario)
+
+    # ------------------------------------------------------------------
+    # ContainerPoolPort
+    # ------------------------------------------------------------------
+
+    async def acquire(self, scenario: str, fresh: bool = False, image: str = None) -> dict:
+        """Lease a healthy warm container, warming one on demand if needed."""
+        key = self.pool_key(scenario, image)
+        idle = self._idle.setdefault(key, [])
+        lease = None
+        for candidate in list(idle):
+            if fresh and candidate["uses"]:
+                continue
+            idle.remove(candidate)
+            if await self._healthy(candidate):
+                lease = candidate
+                break
+            await self._remove(candidate)
+
+        if lease is None:
+            lease = await self._warm(key)
+
+        self._leased[lease["name"]] = lease
+        self._schedule_refill(key)
+        return lease
+
+    async def release(self, lease: dict) -> None:
+        """Return a container to the pool, recycling it when worn out or surplus."""
+        self._leased.pop(lease["name"], None)
+        lease["uses"] += 1
+
+        idle = self._idle.setdefault(lease["key"], [])
+        if (
+            lease["uses"] >= self.max_uses
+            or len(idle) >= self.size
+            or not await self._healthy(lease)
+        ):
+            await self._remove(lease)
+        else:
+            idle.append(lease)
+        self._schedule_refill(lease["key"])
+
+    def stats(self) -> dict:
+        """Get idle, fresh, leased and warming counts per pool key."""
+        keys = set(self._idle) | {lease["key"] for lease in self._leased.values()}
+        return {
+            key: {
+                "idle": len(self._idle.get(key, [])),
+                "fresh": sum(1 for lease in self._idle.get(key, []) if not lease["uses"]),
+                "leased": sum(1 for lease in self._leased.values() if lease["key"] == key),
+                "warming": self._warming.get(key, 0),
+            }
+            for key in sorted(keys)
+        }
+
+    async def close(self) -> None:
+        """Stop maintenance and remove every pooled container."""
+        tasks = [t for t in (self._health_task, *self._refills.values()) if t is not None]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        leases = [lease for idle in self._idle.values() for lease in idle]
+        leases += list(self._leased.values())
+        await asyncio.gather(*(self._remove(lease) for lease in leases))
+        self._idle.clear()
+        self._leased.clear()
@@ -0,0 +1,206 @@
+# SPDX-License-Identifier: MIT-0
+"""Pooled Executor Adapter.
+
+Concrete implementation of AsyncExecutorPort on top of a warm container pool.
+This adapter knows HOW to run a scenario's playbooks against a leased
+container instead of creating and preparing one with Molecule.
+"""
+
+import json
+from typing import List, Optional
+
+from src.domain.models import (
+    TestResult,
+    TestPhase,
+    TestStatus,
+    idempotence_failure,
+)
+from src.application.ports import AsyncObserverPort
+from src.infrastructure.adapters.async_molecule_executor import AsyncMoleculeExecutorAdapter
+from src.infrastructure.adapters.changed_tasks_log import ChangedTasksLog
+from src.infrastructure.adapters.podman_container_pool import PodmanContainerPoolAdapter
+
+
+class PooledExecutorAdapter(AsyncMoleculeExecutorAdapter):
+    """Adapter for executing a scenario against pooled containers.
+
+    create/prepare lease a warm container, destroy runs the scenario's
+    cleanup.yml and hands the container back. A full test without a lease
+    (the clean-room run) always gets a never-used container. Output carries
+    Molecule-style action headers so failure positions parse the same way.
+
+    ``image`` and ``extra_vars`` make the executor one cell of a test
+    matrix: containers come from that image and every scenario playbook
+    gets the variables as extra vars.
+    """
+
+    def __init__(
+        self,
+        pool: PodmanContainerPoolAdapter,
+        scenario: str,
+        env: dict,
+        project_root,
+        observer: Optional[AsyncObserverPort] = None,
+        batch_size: int = None,
+        flush_interval: float = None,
+        image: Optional[str] = None,
+        extra_vars: Optional[dict] = None,
+    ):
+        """Initialize the executor.
+
+        Args:
+            pool: Warm container pool
+            scenario: Molecule scenario name
+            env: Environment variables for execution
+            project_root: Path to project root
+            observer: Observer that receives streamed output batches
+            batch_size: Lines per output batch (default: from Settings)
+            flush_interval: Max seconds a partial batch is held (default: from Settings)
+            image: Image to run instead of the scenario's platform image
+            extra_vars: Variables passed to every playbook with ``-e``
+        """
+        env = {**env, "ANSIBLE_ROLES_PATH": pool.env["ANSIBLE_ROLES_PATH"]}
+        super().__init__(scenario, env, project_root, observer, batch_size, flush_interval)
+        self.pool = pool
+        self.image = image
+        self.extra_vars = dict(extra_vars or {})
+        self.lease: Optional[dict] = None
+
+    def _command(self, playbook: str) -> List[str]:
+        """Build the command for one of the scenario's playbooks."""
+        command = self.pool.playbook_command(self.lease, playbook)
+        if self.extra_vars:
+            command += ["-e", json.dumps(self.extra_vars)]
+        return command
+
+    def _result(self, phase: TestPhase, success: bool, output: str) -> TestResult:
+        """Build a TestResult for a step that ran no command."""
+        return TestResult(
+            phase=phase,
+            status=TestStatus.SUCCESS if success else TestStatus.FAILED,
+            return_code=0 if success else 1,
+            output=output,
+        )
+
+    def _header(self, action: str) -> str:
+        """Get a Molecule-style action header line."""
+        return f"INFO     [{self.scenario} > {action}] Executing"
+
+    async def _playbook(
+        self,
+        action: str,
+        playbook: str,
+        phase: TestPhase,
+        tags: Optional[List[str]] = None,
+        env: Optional[dict] = None,
+    ) -> TestResult:
+        """Run one of the scenario's playbooks against the leased container."""
+        if self.lease is None:
+            return self._result(phase, False, "ERROR: no container leased")
+        if not (self.pool.scenario_dir(self.scenario) / playbook).exists():
+            return self._result(phase, True, f"{self._header(action)}\nSkipping, {playbook} not found")
+
+        command = self._command(playbook)
+        if tags:
+            command += ["--tags", ",".join(tags)]
+        result = await self._run_command(command, phase, env)
+        return TestResult(
+            phase=phase,
+            status=result.status,
+            return_code=result.return_code,
+            output=f"{self._header(action)}\n{result.output}",
+        )
+
+    async def create_containers(self) -> TestResult:
+        """Lease a warm container."""
+        try:
+            self.lease = await self.pool.acquire(self.scenario, image=self.image)
+        except Exception as e:
+            return self._result(TestPhase.CREATE, False, f"ERROR: could not lease a container: {e}")
+        return self._result(
+            TestPhase.CREATE,
+            True,
+            f"Leased {self.lease['name']} (previous uses: {self.lease['uses']})",
+        )
+
+    async def prepare_environment(self) -> TestResult:
+        """Nothing to do - pooled containers are prepared when warmed."""
+        if self.lease is None:
+            return self._result(TestPhase.PREPARE, False, "ERROR: no container leased")
+        return self._result(TestPhase.PREPARE, True, f"{self.lease['name']} is already prepared")
+
+    async def converge(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Run converge (apply playbook), limited to ``tags`` if given."""
+        return await self._playbook("converge", "converge.yml", TestPhase.CONVERGE, tags)
+
+    async def check_idempotence(self, tags: Optional[List[str]] = None) -> TestResult:
+        """Converge again and fail on any changed task."""
+        with ChangedTasksLog() as log:
+            result = await self._playbook(
+                "idempotence", "converge.yml", TestPhase.IDEMPOTENCE, tags, env=log.env(self.env)
+            )
+            if not result.is_success():
+                return result
+            changed = log.changed_in(result.output)
+        return idempotence_failure(result, changed) if changed else result
+
+    async def verify(self) -> TestResult:
+        """Run verification tests."""
+        return await self._playbook("verify", "verify.yml", TestPhase.VERIFY)
+
+    async def run_full_test(self) -> TestResult:
+        """Run converge, idempotence and verify on the leased container.
+
+        Without a lease (e.g. the clean-room run) a never-used container is
+        leased first.
+        """
+        if self.lease is None:
+            try:
+                self.lease = await self.pool.acquire(self.scenario, fresh=True, image=self.image)
+            except Exception as e:
+                return self._result(TestPhase.FULL_TEST, False, f"ERROR: could not lease a container: {e}")
+
+        outputs = []
+        for step in (self.converge, self.check_idempotence, self.verify):
+            result = await step()
+            outputs.append(result.output)
+            if not result.is_success():
+                return TestResult(
+                    phase=TestPhase.FULL_TEST,
+                    status=TestStatus.FAILED,
+                    return_code=result.return_code,
+                    output="\n".join(outputs),
+                    changed_tasks=result.changed_tasks,
+                )
+
+        return self._result(TestPhase.FULL_TEST, True, "\n".join(outputs))
+
+    async def destroy_containers(self) -> TestResult:
+        """Run cleanup.yml and hand the leased container back to the pool."""
+        if self.lease is None:
+            return self._result(TestPhase.DESTROY, True, "No container leased")
+
+        output = ""
+        if (self.pool.scenario_dir(self.scenario) / "cleanup.yml").exists():
+            result = await self._run_command(
+                self._command("cleanup.yml"), TestPhase.CLEANUP
+            )
+            output = result.output
+
+        lease, self.lease = self.lease, None
+        await self.pool.release(lease)
+        return self._result(TestPhase.DESTROY, True, f"{output}\nReleased {lease['name']}".strip())
+
+    async def cleanup(self) -> TestResult:
+        """Nothing to do - cleanup.yml runs before a container is released."""
+        return self._result(TestPhase.CLEANUP, True, "")
+
+    async def get_container_identity(self) -> dict:
+        """Get the name and podman ID of the leased container."""
+        if self.lease is None:
+            return {}
+        return {
+            "driver": "podman",
+            "pool": True,
+            "containers": {self.lease["name"]: self.lease["id"]},
+        }
@@ -0,0 +1,98 @@
+# SPDX-License-Identifier: MIT-0
+"""Socket Observer Adapter.
+
+Concrete implementation of AsyncObserverPort that streams events to a client.
+This adapter knows HOW to forward observations over a daemon connection as
+JSON lines, in the same event format JsonlObserverAdapter writes to disk.
+"""
+
+import asyncio
+import json
+from datetime import datetime
+from typing import List
+
+from src.domain.models import TestResult, FixRecord
+from src.application.ports import AsyncObserverPort, LogLevel
+
+
+class SocketObserverAdapter(AsyncObserverPort):
+    """Adapter for observing via a stream connection.
+
+    A vanished client must not break the run it started, so write errors
+    only mark the observer as disconnected.
+    """
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        """Initialize the observer.
+
+        Args:
+            writer: Connection to the client
+        """
+        self.writer = writer
+        self.connected = True
+
+    async def send(self, event: str, **data) -> None:
+        """Send a single event record.
+
+        Args:
+            event: Event name
+            **data: Event payload
+        """
+        if not self.connected:
+            return
+        record = {"ts": datetime.now().isoformat(), "event": event, **data}
+        try:
+            self.writer.write((json.dumps(record, default=str) + "\n").encode("utf-8"))
+            await self.writer.drain()
+        except (ConnectionError, RuntimeError):
+            self.connected = False
+
+    async def log(self, level: LogLevel, message: str) -> None:
+        """Log a message."""
+        await self.send("log", level=level.value, message=message)
+
+    async def on_iteration_start(self, iteration: int, max_retries: int) -> None:
+        """Called when a new iteration starts."""
+        await self.send("iteration_start", iteration=iteration, max_retries=max_retries)
+
+    async def on_iteration_complete(self, iteration: int, success: bool) -> None:
+        """Called when an iteration completes."""
+        await self.send("iteration_complete", iteration=iteration, success=success)
+
+    async def on_test_start(self, phase: str) -> None:
+        """Called when a test phase starts."""
+        await self.send("test_start", phase=phase)
+
+    async def on_test_complete(self, result: TestResult) -> None:
+        """Called when a test phase completes."""
+        await self.send(
+            "test_complete",
+            phase=result.phase.value,
+            status=result.status.value,
+            return_code=result.return_code,
+            error=result.get_error_summary(),
+        )
+
+    async def on_output(self, phase: str, lines: List[str]) -> None:
+        """Called with a batch of streamed command output lines."""
+        await self.send("output", phase=phase, lines=lines)
+
+    async def on_healing_start(self, iteration: int) -> None:
+        """Called when healing starts."""
+        await self.send("healing_start", iteration=iteration)
+
+    async def on_healing_complete(self, fix_record: FixRecord) -> None:
+        """Called when healing completes."""
+        await self.send(
+            "healing_complete",
+            iteration=fix_record.iteration,
+            status=fix_record.status.value,
+        )
+
+    async def on_phase_change(self, phase: str) -> None:
+        """Called when agent phase changes."""
+        await self.send("phase_change", phase=phase)
+
+    async def on_summary(self, summary: dict) -> None:
+        """Called to display final summary."""
+        await self.send("summary", summary=summary)
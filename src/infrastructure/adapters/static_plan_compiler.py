@@ -0,0 +1,674 @@
+# SPDX-License-Identifier: MIT-0
+"""Static Plan Compiler Adapter.
+
+Concrete implementation of PlanCompilerPort using PyYAML and Jinja2.
+This adapter knows HOW to resolve a playbook without running Ansible.
+"""
+
+import ast
+import os
+import re
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.domain.models import PlannedTask, PlanStatus, TaskPlan
+from src.application.ports import PlanCompilerPort
+from src.infrastructure.config import Settings
+
+# Key the line-aware loader adds to every mapping
+LINE_KEY = "__line__"
+
+# Task keywords; the first other key of a task is its action
+TASK_KEYWORDS = frozenset({
+    "name", "when", "tags", "register", "notify", "listen", "loop", "loop_control",
+    "vars", "become", "become_user", "become_method", "become_flags", "changed_when",
+    "failed_when", "ignore_errors", "ignore_unreachable", "delegate_to",
+    "delegate_facts", "run_once", "environment", "no_log", "check_mode", "diff",
+    "retries", "delay", "until", "async", "poll", "args", "any_errors_fatal",
+    "throttle", "timeout", "debugger", "module_defaults", "collections",
+    "connection", "port", "remote_user", "local_action", "action", "apply",
+    LINE_KEY,
+}) | {f"with_{kind}" for kind in (
+    "items", "list", "dict", "fileglob", "subelements", "sequence", "nested",
+    "together", "random_choice", "first_found", "indexed_items", "flattened",
+)}
+
+IMPORT_TASKS = {"import_tasks", "ansible.builtin.import_tasks"}
+INCLUDE_TASKS = {"include_tasks", "ansible.builtin.include_tasks", "include"}
+IMPORT_ROLE = {"import_role", "ansible.builtin.import_role"}
+INCLUDE_ROLE = {"include_role", "ansible.builtin.include_role"}
+IMPORT_PLAYBOOK = {"import_playbook", "ansible.builtin.import_playbook"}
+
+# Molecule-style ${VAR} / ${VAR:-default} interpolation
+_ENV_REF = re.compile(r"\$\{(?P<name>\w+)(?::?-(?P<default>[^}]*))?\}")
+
+# Variables are resolved at most this deep (guards against self-references)
+MAX_DEPTH = 20
+
+# Set at run time; unknown to the plan unless set statically
+RUNTIME_VARS = frozenset({
+    "ansible_facts", "hostvars", "groups", "group_names", "inventory_hostname",
+    "item", "ansible_loop", "omit", "play_hosts", "ansible_play_hosts",
+    "ansible_failed_result", "ansible_failed_task",
+})
+
+
+class _Unknown(Exception):
+    """A value depends on something the plan cannot know (facts, results)."""
+
+
+def _line_loader():
+    """Get a YAML loader that records the line of every mapping."""
+    import yaml  # ships with ansible-core
+
+    class LineLoader(getattr(yaml, "CSafeLoader", yaml.SafeLoader)):
+        def construct_mapping(self, node, deep=False):
+            mapping = super().construct_mapping(node, deep=deep)
+            mapping[LINE_KEY] = node.start_mark.line + 1
+            return mapping
+
+    for tag in ("!unsafe", "!vault"):
+        LineLoader.add_constructor(tag, lambda loader, node: loader.construct_scalar(node))
+    return LineLoader
+
+
+def _strip_lines(value):
+    """Remove the loader's line keys from a loaded value."""
+    if isinstance(value, dict):
+        return {k: _strip_lines(v) for k, v in value.items() if k != LINE_KEY}
+    if isinstance(value, list):
+        return [_strip_lines(v) for v in value]
+    return value
+
+
+def _as_list(value) -> List:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return value
+    if isinstance(value, str) and "," in value and "{{" not in value:
+        return [v.strip() for v in value.split(",")]
+    return [value]
+
+
+def _interpolate_env(value):
+    """Resolve Molecule's ``${VAR:-default}`` references from the environment."""
+    if isinstance(value, str):
+        return _ENV_REF.sub(
+            lambda m: os.environ.get(m.group("name"), m.group("default") or ""), value
+        )
+    if isinstance(value, dict):
+        return {k: _interpolate_env(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [_interpolate_env(v) for v in value]
+    return value
+
+
+# ----------------------------------------------------------------------
+# Templating
+# ----------------------------------------------------------------------
+
+
+class _Templar:
+    """Jinja2 evaluation of conditions and variables, Ansible-style.
+
+    Undefined variables (facts, registered results) and unknown filters,
+    tests and lookups make a value unknown instead of failing.
+    """
+
+    def __init__(self):
+        import jinja2  # ships with ansible-core
+
+        class Undefined(jinja2.ChainableUndefined, jinja2.StrictUndefined):
+            """Chains like Ansible's (``a.b | default(x)``), fails on use."""
+
+        self._jinja = jinja2
+        self._templates = {}
+        self.env = jinja2.Environment(
+            undefined=Undefined,
+            extensions=["jinja2.ext.loopcontrols", "jinja2.ext.do"],
+        )
+        self.env.filters.update(
+            bool=_to_bool,
+            ternary=lambda value, yes, no=None: yes if value else no,
+            regex_replace=lambda value, pattern, repl="", ignorecase=False: re.sub(
+                pattern, repl, str(value), flags=re.I if ignorecase else 0
+            ),
+            regex_search=lambda value, pattern: (
+                m.group(0) if (m := re.search(pattern, str(value))) else None
+            ),
+            combine=lambda *dicts: {k: v for d in dicts for k, v in d.items()},
+            dict2items=lambda d: [{"key": k, "value": v} for k, v in d.items()],
+            items2dict=lambda items: {i["key"]: i["value"] for i in items},
+            flatten=_flatten,
+            basename=os.path.basename,
+            dirname=os.path.dirname,
+            to_json=lambda value: __import__("json").dumps(value),
+        )
+        self.env.tests.update(
+            match=lambda value, pattern: re.match(pattern, str(value)) is not None,
+            search=lambda value, pattern: re.search(pattern, str(value)) is not None,
+            regex=lambda value, pattern: re.search(pattern, str(value)) is not None,
+            truthy=bool,
+            falsy=lambda value: not value,
+        )
+
+    @staticmethod
+    def is_template(value) -> bool:
+        return isinstance(value, str) and ("{{" in value or "{%" in value)
+
+    def render(self, text: str, variables: "_Variables"):
+        """Render a template string; a lone expression keeps its type."""
+        try:
+            template = self._templates.get(text)
+            if template is None:
+                template = self._templates[text] = self.env.from_string(text)
+            context = template.new_context(variables, shared=True)
+            rendered = self.env.concat(template.root_render_func(context))
+        except self._jinja.TemplateError as e:
+            raise _Unknown(str(e)) from e
+        except (TypeError, ValueError, KeyError, AttributeError, IndexError) as e:
+            raise _Unknown(str(e)) from e
+        stripped = text.strip()
+        if stripped.startswith("{{") and stripped.endswith("}}") and stripped.count("{{") == 1:
+            return _native(rendered)
+        return rendered
+
+    def condition(self, expression, variables: "_Variables") -> bool:
+        """Evaluate a ``when`` expression (raises _Unknown)."""
+        if isinstance(expression, bool):
+            return expression
+        text = str(expression).strip()
+        if self.is_template(text):
+            # Ansible warns but accepts templated conditions
+            text = text.replace("{{", "(").replace("}}", ")")
+        return self.render(
+            "{% if " + text + " %}True{% else %}False{% endif %}", variables
+        ) == "True"
+
+
+def _to_bool(value) -> bool:
+    if isinstance(value, bool):
+        return value
+    return str(value).strip().lower() in ("yes", "on", "1", "true", "y", "t")
+
+
+def _flatten(items, levels=None):
+    flat = []
+    for item in items:
+        if isinstance(item, list) and levels != 0:
+            flat.extend(_flatten(item, None if levels is None else levels - 1))
+        else:
+            flat.append(item)
+    return flat
+
+
+def _native(rendered: str):
+    """Turn the text of a lone expression back into a value, like Ansible does."""
+    try:
+        return ast.literal_eval(rendered.strip())
+    except (ValueError, SyntaxError, MemoryError, RecursionError):
+        return rendered
+
+
+class _Variables(dict):
+    """Layered variables whose template values are rendered on lookup.
+
+    ``runtime`` holds the names tasks register or set_fact; looking them
+    up (even with ``is defined``) makes the expression unknown, as do
+    facts and magic variables that are not set statically.
+    """
+
+    def __init__(self, templar: _Templar, layers: List[dict], runtime: set = None):
+        merged = {}
+        for layer in layers:
+            merged.update(layer)
+        super().__init__(merged)
+        self.templar = templar
+        self.runtime = set() if runtime is None else runtime
+        self._resolving = set()
+        self._cache = {}
+
+    def child(self, *layers: dict) -> "_Variables":
+        """Get variables with more layers on top."""
+        return _Variables(self.templar, [dict(self), *layers], self.runtime)
+
+    def _is_runtime(self, key) -> bool:
+        if key in self.runtime:
+            return True
+        return not super().__contains__(key) and (
+            key in RUNTIME_VARS or str(key).startswith("ansible_")
+        )
+
+    def __contains__(self, key) -> bool:
+        return self._is_runtime(key) or super().__contains__(key)
+
+    def __getitem__(self, key):
+        if self._is_runtime(key):
+            raise _Unknown(f"{key} is only known at run time")
+        if key in self._cache:
+            return self._cache[key]
+        value = super().__getitem__(key)
+        if key in self._resolving or len(self._resolving) > MAX_DEPTH:
+            raise _Unknown(f"recursive variable {key}")
+        self._resolving.add(key)
+        try:
+            value = self.resolve(value)
+        finally:
+            self._resolving.discard(key)
+        self._cache[key] = value
+        return value
+
+    def get(self, key, default=None):
+        return self[key] if key in self else default
+
+    def resolve(self, value):
+        """Render the templates in a value."""
+        if isinstance(value, str) and self.templar.is_template(value):
+            return self.templar.render(value, self)
+        if isinstance(value, list):
+            return [self.resolve(v) for v in value]
+        if isinstance(value, dict):
+            return {k: self.resolve(v) for k, v in value.items()}
+        return value
+
+
+# ----------------------------------------------------------------------
+# Compiler
+# ----------------------------------------------------------------------
+
+
+class _Context:
+    """What a task inherits from its play, role, blocks and imports."""
+
+    def __init__(self, **kwargs):
+        self.play = kwargs.get("play", "")
+        self.role = kwargs.get("role", "")
+        self.role_dir: Optional[Path] = kwargs.get("role_dir")
+        self.tags: Tuple[str, ...] = kwargs.get("tags", ())
+        self.when: Tuple = kwargs.get("when", ())
+        self.section = kwargs.get("section", "tasks")
+        self.gates: Tuple[Tuple[str, ...], ...] = kwargs.get("gates", ())
+        self.variables: _Variables = kwargs["variables"]
+
+    def but(self, **changes) -> "_Context":
+        values = dict(vars(self))
+        values.update(changes)
+        return _Context(**values)
+
+    def with_task(self, task: dict) -> "_Context":
+        """Get the context with a block's or import's tags and conditions added."""
+        tags = tuple(dict.fromkeys(self.tags + tuple(str(t) for t in _as_list(task.get("tags")))))
+        when = self.when + tuple(_as_list(task.get("when")))
+        variables = self.variables
+        if isinstance(task.get("vars"), dict):
+            variables = variables.child(_strip_lines(task["vars"]))
+        return self.but(tags=tags, when=when, variables=variables)
+
+
+class StaticPlanCompilerAdapter(PlanCompilerPort):
+    """Adapter resolving playbooks into task plans without Ansible.
+
+    Follows ``import_playbook``, roles, ``import_tasks``/``include_tasks``
+    and ``import_role``/``include_role`` with literal (or statically
+    renderable) names. Variable precedence is simplified to: role
+    defaults < inventory group_vars < play vars < role vars < role and
+    include parameters < extra vars. ``set_fact``, registered results and
+    facts are unknown, so conditions on them stay CONDITIONAL.
+    """
+
+    def __init__(
+        self,
+        project_root: Path = None,
+        roles_dir: Path = None,
+        playbook_file: str = None,
+    ):
+        """Initialize the compiler.
+
+        Args:
+            project_root: Project root directory (default: from Settings)
+            roles_dir: Directory holding one subdirectory per role
+                (default: Settings.ROLES_DIR under the project root)
+            playbook_file: Main playbook, relative to the project root
+                (default: from Settings)
+        """
+        self.project_root = Path(project_root or Settings.PROJECT_ROOT).resolve()
+        self.roles_dir = Path(roles_dir or self.project_root / Settings.ROLES_DIR).resolve()
+        self.playbook_file = playbook_file or Settings.PLAYBOOK_FILE
+
+    def compile(
+        self,
+        scenario: Optional[str] = None,
+        extra_vars: Optional[dict] = None,
+    ) -> TaskPlan:
+        """Resolve a playbook into its ordered tasks."""
+        self._loader = _line_loader()
+        self._templar = _Templar()
+        self._tasks: List[PlannedTask] = []
+        self._sources: Dict[str, str] = {}
+        self._unresolved: List[str] = []
+        self._extra_vars = dict(extra_vars or {})
+        self._runtime = set()
+
+        if scenario:
+            playbook = self.project_root / "molecule" / scenario / "converge.yml"
+            inventory_vars = self._scenario_vars(scenario)
+        else:
+            playbook = self.project_root / self.playbook_file
+            inventory_vars = self._inventory_vars()
+
+        self._playbook(playbook, inventory_vars)
+        return TaskPlan(
+            playbook=self._relative(playbook),
+            scenario=scenario or "",
+            tasks=tuple(self._tasks),
+            sources=tuple(self._sources.items()),
+            unresolved=tuple(self._unresolved),
+        )
+
+    # ------------------------------------------------------------------
+    # Files and variables
+    # ------------------------------------------------------------------
+
+    def _relative(self, path: Path) -> str:
+        path = Path(path).resolve()
+        if path.is_relative_to(self.project_root):
+            return path.relative_to(self.project_root).as_posix()
+        return path.as_posix()
+
+    def _load(self, path: Path):
+        """Load a YAML file with line numbers (None if it does not exist)."""
+        import yaml  # ships with ansible-core
+
+        try:
+            with open(path, encoding="utf-8") as f:
+                return yaml.load(f, Loader=self._loader)
+        except OSError:
+            return None
+        except yaml.YAMLError as e:
+            self._unresolved.append(f"{self._relative(path)}: invalid YAML ({e.problem})")
+            return None
+
+    def _load_vars(self, path: Path, role: str = "") -> dict:
+        """Load a variables file, remembering which role it belongs to."""
+        for candidate in (path, path.with_suffix(".yml"), path.with_suffix(".yaml")):
+            if candidate.is_file():
+                data = self._load(candidate)
+                if role:
+                    self._sources[self._relative(candidate)] = role
+                return _strip_lines(data) if isinstance(data, dict) else {}
+        return {}
+
+    def _inventory_vars(self) -> dict:
+        """Get the ``all`` group_vars of the project inventory."""
+        group_vars = self.project_root / "inventory" / "group_vars"
+        variables = self._load_vars(group_vars / "all")
+        if (group_vars / "all").is_dir():
+            for path in sorted((group_vars / "all").glob("*.y*ml")):
+                variables.update(self._load_vars(path))
+        return variables
+
+    def _scenario_vars(self, scenario: str) -> dict:
+        """Get the ``all`` vars of a Molecule scenario's inventory."""
+        variables = {}
+        scenario_dir = self.project_root / "molecule" / scenario
+        for config in (self.project_root / "molecule" / "config.yml", scenario_dir / "molecule.yml"):
+            data = _strip_lines(self._load(config) or {})
+            inventory = (data.get("provisioner") or {}).get("inventory") or {}
+            variables.update(((inventory.get("group_vars") or {}).get("all")) or {})
+            variables.update(((inventory.get("host_vars") or {}).get("all")) or {})
+        inventory = _strip_lines(self._load(scenario_dir / "inventory.yml") or {})
+        variables.update(((inventory.get("all") or {}).get("vars")) or {})
+        return _interpolate_env(variables)
+
+    def _role_dir(self, name: str) -> Optional[Path]:
+        """Find a role by name or FQCN."""
+        short = str(name).rsplit(".", 1)[-1]
+        for candidate in (self.roles_dir / short, self.project_root / "roles" / short):
+            if (candidate / "tasks").is_dir():
+                return candidate
+        return None
+
+    def _render(self, value, ctx: _Context):
+        """Render a file or role name; None if it depends on runtime values."""
+        try:
+            return ctx.variables.resolve(value)
+        except _Unknown:
+            return None
+
+    # ------------------------------------------------------------------
+    # Plays and roles
+    # ------------------------------------------------------------------
+
+    def _playbook(self, path: Path, inventory_vars: dict) -> None:
+        plays = self._load(path)
+        if not isinstance(plays, list):
+            self._unresolved.append(f"{self._relative(path)}: not a playbook")
+            return
+        for play in plays:
+            if not isinstance(play, dict):
+                continue
+            imported = next((play[k] for k in IMPORT_PLAYBOOK if k in play), None)
+            if imported is not None:
+                self._playbook(path.parent / str(imported), inventory_vars)
+            else:
+                self._play(play, path, inventory_vars)
+
+    @staticmethod
+    def _role_entry(entry) -> Tuple[str, dict]:
+        """Split a ``roles:`` entry into the role name and its keywords/params."""
+        if isinstance(entry, str):
+            return entry, {}
+        entry = dict(entry)
+        name = entry.pop("role", None) or entry.pop("name", "")
+        return str(name), entry
+
+    def _play(self, play: dict, path: Path, inventory_vars: dict) -> None:
+        name = str(play.get("name") or play.get("hosts") or "")
+        roles = [self._role_entry(entry) for entry in play.get("roles") or []]
+
+        # Defaults of every role in the play, then inventory, play and role vars
+        defaults, role_vars = {}, {}
+        for role_name, _ in roles:
+            role_dir = self._role_dir(role_name)
+            if role_dir is not None:
+                short = role_dir.name
+                defaults.update(self._load_vars(role_dir / "defaults" / "main", short))
+                role_vars.update(self._load_vars(role_dir / "vars" / "main", short))
+        play_vars = _strip_lines(play.get("vars") or {})
+        for vars_file in _as_list(play.get("vars_files")):
+            if isinstance(vars_file, str) and not _Templar.is_template(vars_file):
+                play_vars.update(self._load_vars(path.parent / vars_file))
+        variables = _Variables(
+            self._templar,
+            [defaults, inventory_vars, play_vars, role_vars, self._extra_vars],
+            self._runtime,
+        )
+
+        ctx = _Context(play=name, variables=variables).with_task(
+            {"tags": play.get("tags"), "when": None}
+        )
+        handlers = []
+        self._tasks_list(play.get("pre_tasks"), path, ctx)
+        for role_name, params in roles:
+            role_dir = self._role_dir(role_name)
+            if role_dir is None:
+                self._unresolved.append(f"{self._relative(path)}: role {role_name} not found")
+                continue
+            role_ctx = self._role_context(ctx, role_dir, params)
+            self._role_tasks(role_dir, "main", role_ctx)
+            handlers.append((role_dir, role_ctx))
+        self._tasks_list(play.get("tasks"), path, ctx)
+        self._tasks_list(play.get("post_tasks"), path, ctx)
+
+        self._tasks_list(play.get("handlers"), path, ctx.but(section="handlers"))
+        for role_dir, role_ctx in handlers:
+            self._role_file(role_dir / "handlers" / "main", role_ctx.but(section="handlers"))
+
+    def _role_context(self, ctx: _Context, role_dir: Path, params: dict) -> _Context:
+        """Get the context for a role's tasks."""
+        keywords = {k: params.pop(k) for k in ("tags", "when", "vars") if k in params}
+        params = _strip_lines(params)
+        params.pop("tasks_from", None)
+        role_ctx = ctx.but(role=role_dir.name, role_dir=role_dir).with_task(keywords)
+        if params:
+            role_ctx = role_ctx.but(variables=role_ctx.variables.child(params))
+        return role_ctx
+
+    def _role_tasks(self, role_dir: Path, tasks_from: str, ctx: _Context) -> None:
+        # Dependencies run first, with the same inherited keywords
+        meta = _strip_lines(self._load(role_dir / "meta" / "main.yml") or {})
+        for dependency in meta.get("dependencies") or []:
+            dep_name, dep_params = self._role_entry(dependency)
+            dep_dir = self._role_dir(dep_name)
+            if dep_dir is not None:
+                dep_ctx = self._role_context(ctx.but(role="", role_dir=None), dep_dir, dep_params)
+                self._role_tasks(dep_dir, "main", dep_ctx)
+        self._role_file(role_dir / "tasks" / tasks_from, ctx)
+
+    def _role_file(self, path: Path, ctx: _Context) -> None:
+        for candidate in (path, path.with_suffix(".yml"), path.with_suffix(".yaml")):
+            if candidate.is_file():
+                self._tasks_file(candidate, ctx)
+                return
+
+    # ------------------------------------------------------------------
+    # Tasks
+    # ------------------------------------------------------------------
+
+    def _tasks_file(self, path: Path, ctx: _Context) -> None:
+        if not path.is_file():
+            self._unresolved.append(f"{self._relative(path)}: not found")
+            return
+        self._tasks_list(self._load(path), path, ctx)
+
+    def _tasks_list(self, items, path: Path, ctx: _Context) -> None:
+        for item in items or []:
+            if isinstance(item, dict):
+                self._task(item, path, ctx)
+
+    def _task(self, task: dict, path: Path, ctx: _Context) -> None:
+        line = task.get(LINE_KEY, 0)
+        if "block" in task:
+            block_ctx = ctx.with_task(task)
+            self._tasks_list(task.get("block"), path, block_ctx)
+            self._tasks_list(task.get("rescue"), path, block_ctx.but(section="rescue"))
+            self._tasks_list(task.get("always"), path, block_ctx.but(section="always"))
+            return
+
+        action = next((k for k in task if k not in TASK_KEYWORDS), None)
+        args = task.get(action) if action else None
+        if action is None:
+            # "action: module args" / "local_action: module args"
+            spec = task.get("action") or task.get("local_action")
+            if isinstance(spec, dict):
+                action = str(spec.get("module", ""))
+            elif spec:
+                action = str(spec).split()[0]
+            else:
+                return
+
+        if action in IMPORT_TASKS:
+            target = self._task_file(args, path, ctx, line)
+            if target is not None:
+                self._tasks_file(target, ctx.with_task(task))
+            return
+        if action in IMPORT_ROLE:
+            self._included_role(args, path, ctx.with_task(task), line)
+            return
+
+        own = self._add(task, action, path, line, ctx)
+        if action in INCLUDE_TASKS or action in INCLUDE_ROLE:
+            # The include's own tags only decide whether it runs; its
+            # condition is evaluated once, for everything it loads
+            inner = ctx.but(
+                when=own.when,
+                gates=ctx.gates + (own.tags,),
+                variables=ctx.variables.child(_strip_lines(task.get("vars") or {})),
+            )
+            apply = (args or {}).get("apply") if isinstance(args, dict) else None
+            if isinstance(apply, dict):
+                inner = inner.with_task({"tags": apply.get("tags"), "when": apply.get("when")})
+            if action in INCLUDE_TASKS:
+                target = self._task_file(args, path, ctx, line)
+                if target is not None:
+                    self._tasks_file(target, inner)
+            else:
+                self._included_role(args, path, inner, line)
+
+    def _add(self, task: dict, action: str, path: Path, line: int, ctx: _Context) -> PlannedTask:
+        """Add a task to the plan."""
+        task_ctx = ctx.with_task(task)
+        planned = PlannedTask(
+            index=len(self._tasks) + 1,
+            name=str(task.get("name") or action),
+            path=self._relative(path),
+            line=line,
+            action=action,
+            role=ctx.role,
+            play=ctx.play,
+            section=ctx.section,
+            tags=task_ctx.tags,
+            when=tuple(str(w) for w in task_ctx.when),
+            status=self._status(task_ctx),
+            gates=ctx.gates,
+        )
+        self._tasks.append(planned)
+
+        # Later conditions on what this task sets are only known at run time
+        if task.get("register"):
+            self._runtime.add(str(task["register"]))
+        if action in ("set_fact", "ansible.builtin.set_fact") and isinstance(task.get(action), dict):
+            self._runtime.update(k for k in task[action] if k not in (LINE_KEY, "cacheable"))
+        return planned
+
+    def _status(self, ctx: _Context) -> PlanStatus:
+        """Evaluate a task's conditions."""
+        # Rescue tasks only run when their block fails
+        status = PlanStatus.CONDITIONAL if ctx.section == "rescue" else PlanStatus.RUN
+        for condition in ctx.when:
+            try:
+                if not self._templar.condition(condition, ctx.variables):
+                    return PlanStatus.SKIP
+            except _Unknown:
+                status = PlanStatus.CONDITIONAL
+        return status
+
+    def _task_file(self, args, path: Path, ctx: _Context, line: int) -> Optional[Path]:
+        """Resolve the file of an import/include_tasks."""
+        name = args.get("file") if isinstance(args, dict) else args
+        rendered = self._render(name, ctx)
+        where = f"{self._relative(path)}:{line}"
+        if not isinstance(rendered, str) or not rendered:
+            self._unresolved.append(f"{where}: cannot resolve task file {name!r}")
+            return None
+        candidates = [path.parent / rendered]
+        if ctx.role_dir is not None:
+            candidates.append(ctx.role_dir / "tasks" / rendered)
+        for candidate in candidates:
+            if candidate.is_file():
+                return candidate
+        self._unresolved.append(f"{where}: task file {rendered} not found")
+        return None
+
+    def _included_role(self, args, path: Path, ctx: _Context, line: int) -> None:
+        """Follow an import_role/include_role."""
+        args = _strip_lines(args) if isinstance(args, dict) else {"name": args}
+        name = self._render(args.get("name"), ctx)
+        role_dir = self._role_dir(name) if isinstance(name, str) else None
+        if role_dir is None:
+            self._unresolved.append(f"{self._relative(path)}:{line}: cannot resolve role {args.get('name')!r}")
+            return
+        short = role_dir.name
+        layers = [
+            self._load_vars(role_dir / "defaults" / str(args.get("defaults_from", "main")), short),
+            dict(ctx.variables),
+            self._load_vars(role_dir / "vars" / str(args.get("vars_from", "main")), short),
+        ]
+        role_ctx = ctx.but(
+            role=short,
+            role_dir=role_dir,
+            variables=_Variables(self._templar, layers + [self._extra_vars], self._runtime),
+        )
+        self._role_tasks(role_dir, str(args.get("tasks_from", "main")), role_ctx)
+        self._role_file(role_dir / "handlers" / "main", role_ctx.but(section="handlers"))
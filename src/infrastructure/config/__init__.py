@@ -17,6 +17,7 @@ class Settings:
 
     # Molecule settings
     MOLECULE_SCENARIO: str = os.getenv("MOLECULE_SCENARIO", "default")
+    EXECUTOR: str = os.getenv("AGENT_EXECUTOR", "molecule")  # molecule | inprocess
     MOLECULE_TIMEOUT: int = int(os.getenv("MOLECULE_TIMEOUT", "300"))  # 5 minutes
 
     # Claude settings
@@ -34,6 +35,78 @@ class Settings:
     LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO")
     LOG_COLORS: bool = os.getenv("LOG_COLORS", "true").lower() == "true"
 
+    # Observer pipeline settings
+    OBSERVER_QUEUE_SIZE: int = int(os.getenv("OBSERVER_QUEUE_SIZE", "1000"))
+    OBSERVER_OVERFLOW_POLICY: str = os.getenv("OBSERVER_OVERFLOW_POLICY", "drop")  # drop | block
+    OUTPUT_BATCH_SIZE: int = int(os.getenv("OUTPUT_BATCH_SIZE", "64"))
+    OUTPUT_FLUSH_INTERVAL: float = float(os.getenv("OUTPUT_FLUSH_INTERVAL", "0.2"))  # seconds
+    EVENTS_FILE: str = os.getenv("AGENT_EVENTS_FILE", "")
+    METRICS_FILE: str = os.getenv("AGENT_METRICS_FILE", "")
+
+    # Run-history settings
+    JOURNAL_FILE: str = os.getenv("AGENT_JOURNAL_FILE", ".agent-journal.jsonl")
+    ERROR_STORE_DIR: str = os.getenv("AGENT_ERROR_STORE_DIR", ".agent-errors")
+
+    # Artifact archive settings (under ansible.cfg's artifact_path)
+    ARTIFACT_DIR: str = os.getenv("AGENT_ARTIFACT_DIR", ".ansible/artifacts/agent")
+    ARTIFACT_MAX_ITERATIONS: int = int(os.getenv("AGENT_ARTIFACT_MAX_ITERATIONS", "20"))
+    ARTIFACT_MAX_MB: int = int(os.getenv("AGENT_ARTIFACT_MAX_MB", "256"))
+    ANSIBLE_LOG_FILE: str = os.getenv("AGENT_ANSIBLE_LOG_FILE", "ansible.log")
+    ANSIBLE_LOG_MAX_MB: int = int(os.getenv("AGENT_ANSIBLE_LOG_MAX_MB", "64"))
+
+    # Daemon settings (warm container pool behind a Unix socket)
+    DAEMON_SOCKET: str = os.getenv(
+        "AGENT_DAEMON_SOCKET",
+        os.path.join(os.getenv("XDG_RUNTIME_DIR", "/tmp"), f"ansible-agent-{os.getuid()}.sock"),
+    )
+    POOL_SIZE: int = int(os.getenv("AGENT_POOL_SIZE", "2"))  # warm containers per scenario
+    POOL_MAX_USES: int = int(os.getenv("AGENT_POOL_MAX_USES", "5"))  # runs before recycling
+    POOL_HEALTH_INTERVAL: float = float(os.getenv("AGENT_POOL_HEALTH_INTERVAL", "30"))  # seconds
+    POOL_IMAGE_CACHE: bool = os.getenv("AGENT_POOL_IMAGE_CACHE", "true").lower() == "true"  # reuse prepare
+
+    # Shared dnf cache (one podman volume per Fedora release)
+    DNF_CACHE_VOLUME_PREFIX: str = os.getenv("AGENT_DNF_CACHE_VOLUME_PREFIX", "ansible-agent-dnf")
+    DNF_CACHE_MAX_MB: int = int(os.getenv("AGENT_DNF_CACHE_MAX_MB", "4096"))  # all releases
+    DNF_CACHE_MAX_AGE_DAYS: int = int(os.getenv("AGENT_DNF_CACHE_MAX_AGE_DAYS", "30"))
+
+    # Local artifact mirror for role downloads (get_url, git)
+    MIRROR_ENABLED: bool = os.getenv("AGENT_MIRROR", "true").lower() == "true"
+    MIRROR_DIR: str = os.getenv(
+        "AGENT_MIRROR_DIR",
+        os.path.join(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "ansible-agent", "mirror"),
+    )
+    # Rootless podman maps host.containers.internal to the host's loopback;
+    # with rootful podman, bind the bridge address (e.g. 10.88.0.1) instead
+    MIRROR_BIND: str = os.getenv("AGENT_MIRROR_BIND", "127.0.0.1")
+    MIRROR_PORT: int = int(os.getenv("AGENT_MIRROR_PORT", "0"))  # 0 = any free port
+    MIRROR_HOST: str = os.getenv("AGENT_MIRROR_HOST", "host.containers.internal")  # as seen by containers
+    # URLs served besides the ones declared in role defaults (comma-separated,
+    # a trailing * makes a prefix)
+    MIRROR_ALLOW: str = os.getenv("AGENT_MIRROR_ALLOW", "")
+
+    # Watch mode settings
+    ROLES_DIR: str = os.getenv("AGENT_ROLES_DIR", "collections/ansible_collections/local/workstation/roles")
+    PLAYBOOK_FILE: str = os.getenv("AGENT_PLAYBOOK_FILE", "playbook.yaml")
+    WATCH_DEBOUNCE: float = float(os.getenv("AGENT_WATCH_DEBOUNCE", "0.5"))  # seconds of quiet
+    WATCH_POLL_INTERVAL: float = float(os.getenv("AGENT_WATCH_POLL_INTERVAL", "1"))  # no inotify
+
+    # Fleet mode (playbook over an inventory pattern, in waves)
+    FLEET_PLAYBOOK: str = os.getenv("AGENT_FLEET_PLAYBOOK", "fleet.yaml")
+    FLEET_WAVE_SIZE: int = int(os.getenv("AGENT_FLEET_WAVE_SIZE", "25"))  # hosts per wave
+    FLEET_MAX_FORKS: int = int(os.getenv("AGENT_FLEET_MAX_FORKS", "50"))
+    FLEET_FORKS_PER_CPU: int = int(os.getenv("AGENT_FLEET_FORKS_PER_CPU", "4"))
+    FLEET_MEMORY_PER_FORK_MB: int = int(os.getenv("AGENT_FLEET_MEMORY_PER_FORK_MB", "128"))
+    FLEET_MAX_FAIL_PERCENT: float = float(os.getenv("AGENT_FLEET_MAX_FAIL_PERCENT", "50"))
+    FLEET_SUMMARY_FILE: str = os.getenv("AGENT_FLEET_SUMMARY_FILE", ".agent-fleet-summary.json")
+
+    # Role bisection before healing (fresh pooled containers per probe)
+    BISECT: bool = os.getenv("AGENT_BISECT", "false").lower() == "true"
+    BISECT_PARALLEL: int = int(os.getenv("AGENT_BISECT_PARALLEL", "3"))  # probes at a time
+
+    # Test matrix (images x variable overlays, one pooled container per cell)
+    MATRIX_PARALLEL: int = int(os.getenv("AGENT_MATRIX_PARALLEL", "2"))  # cells at a time
+    MATRIX_SUMMARY_FILE: str = os.getenv("AGENT_MATRIX_SUMMARY_FILE", ".agent-matrix-summary.json")
+
     @classmethod
     def get_ansible_env(cls) -> Dict[str, str]:
         """Get environment variables for Ansible/Molecule execution."""
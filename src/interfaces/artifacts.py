@@ -0,0 +1,54 @@
+# SPDX-License-Identifier: MIT-0
+"""Artifact archive CLI - post-mortem access to iteration artifacts.
+
+Usage:
+    python -m src.interfaces.artifacts list --failed
+    python -m src.interfaces.artifacts show --iteration 3 --task "Install base"
+"""
+
+import argparse
+from pathlib import Path
+
+from src.infrastructure import ArtifactArchiveAdapter, Settings
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Inspect archived agent iterations")
+    parser.add_argument("command", choices=["list", "show"])
+    parser.add_argument("--root", type=Path, default=Path(Settings.ARTIFACT_DIR),
+                        help=f"Archive directory (default: {Settings.ARTIFACT_DIR})")
+    parser.add_argument("--iteration", "-i", type=int, help="Iteration number")
+    parser.add_argument("--phase", "-p", help="Phase (full_test, heal, ansible_log, ...)")
+    parser.add_argument("--kind", "-k", help="Artifact kind (molecule_output, healer_diff, ...)")
+    parser.add_argument("--task", "-t", help="Substring of the task name")
+    parser.add_argument("--failed", action="store_true", help="Only sections with errors")
+    return parser.parse_args()
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    archive = ArtifactArchiveAdapter(root=args.root, project_root=Path.cwd())
+    entries = archive.find(
+        iteration=args.iteration,
+        phase=args.phase,
+        kind=args.kind,
+        task=args.task,
+        failed=True if args.failed else None,
+    )
+
+    for entry in entries:
+        marker = "✗" if entry["failed"] else " "
+        header = (
+            f"{marker} iter {entry['iteration']:>3} {entry['agent_phase']:<22} "
+            f"{entry['phase']:<12} {entry['kind']:<18} {entry['task']}"
+        )
+        print(header)
+        if args.command == "show":
+            print(archive.read(entry))
+            print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,309 @@
+# SPDX-License-Identifier: MIT-0
+"""Agent daemon - long-lived agent with a warm container pool.
+
+The daemon keeps pre-prepared containers per scenario and accepts requests
+over a local Unix socket. The protocol is JSON lines: the client sends one
+request line, the daemon answers with event lines (the JsonlObserverAdapter
+event format) and a final ``result`` line.
+
+Requests:
+    {"action": "run", "scenario": "default", "max_retries": 10, ...}
+    {"action": "status"}
+    {"action": "shutdown"}
+
+Runs are serialized because the healer edits the shared working tree;
+the pool keeps serving warm containers to each of them.
+"""
+
+import asyncio
+import json
+import os
+import signal
+from pathlib import Path
+from typing import List, Optional, Tuple
+
+from src.domain.models import (
+    AgentConfig,
+    FixRecord,
+    FixStatus,
+    TestPhase,
+    TestResult,
+    TestStatus,
+)
+from src.application import AsyncAutonomousAgentUseCase, ObserverPort
+from src.application.ports import LogLevel
+from src.infrastructure import (
+    ArtifactArchiveAdapter,
+    AsyncClaudeHealerAdapter,
+    DnfCacheAdapter,
+    HttpArtifactMirrorAdapter,
+    FileErrorStoreAdapter,
+    JournalStateStoreAdapter,
+    PodmanContainerPoolAdapter,
+    PooledExecutorAdapter,
+    Settings,
+    SocketObserverAdapter,
+)
+
+# Output batches can carry long Ansible result lines
+STREAM_LIMIT = 16 * 1024 * 1024
+
+
+class AgentDaemon:
+    """Unix-socket server that runs agent jobs on pooled containers."""
+
+    def __init__(
+        self,
+        project_root: Path,
+        socket_path: Path,
+        scenarios: List[str],
+        pool_size: int = Settings.POOL_SIZE,
+        max_uses: int = Settings.POOL_MAX_USES,
+        health_interval: float = Settings.POOL_HEALTH_INTERVAL,
+    ):
+        """Initialize the daemon.
+
+        Args:
+            project_root: Project the daemon serves
+            socket_path: Unix socket to listen on
+            scenarios: Scenarios to keep warm from the start
+            pool_size: Idle containers per scenario
+            max_uses: Runs per container before it is recycled
+            health_interval: Seconds between health checks
+        """
+        self.project_root = Path(project_root)
+        self.socket_path = Path(socket_path)
+        self.scenarios = scenarios
+
+        self.env = Settings.get_ansible_env()
+        self.env["ANSIBLE_LOG_PATH"] = str(self.project_root / Settings.ANSIBLE_LOG_FILE)
+        allowed = HttpArtifactMirrorAdapter.declared_urls(self.project_root / Settings.ROLES_DIR)
+        allowed += [url.strip() for url in Settings.MIRROR_ALLOW.split(",") if url.strip()]
+        self.mirror = HttpArtifactMirrorAdapter(
+            root=Path(Settings.MIRROR_DIR),
+            bind=Settings.MIRROR_BIND,
+            port=Settings.MIRROR_PORT,
+            public_host=Settings.MIRROR_HOST,
+            allowed=allowed,
+        ) if Settings.MIRROR_ENABLED else None
+        self.pool = PodmanContainerPoolAdapter(
+            project_root=self.project_root,
+            env=self.env,
+            size=pool_size,
+            max_uses=max_uses,
+            health_interval=health_interval,
+            package_cache=DnfCacheAdapter(
+                prefix=Settings.DNF_CACHE_VOLUME_PREFIX,
+                max_bytes=Settings.DNF_CACHE_MAX_MB * 1024 * 1024,
+                max_age_days=Settings.DNF_CACHE_MAX_AGE_DAYS,
+                env=self.env,
+            ),
+            image_cache=Settings.POOL_IMAGE_CACHE,
+        )
+        self._lock = asyncio.Lock()
+        self._stopped = asyncio.Event()
+
+    async def serve(self) -> None:
+        """Warm the pool and serve requests until shut down."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            loop.add_signal_handler(sig, self._stopped.set)
+
+        if self.mirror is not None:
+            # Set before warming: the pool's inventories pick it up
+            self.env["MOLECULE_ARTIFACT_MIRROR_URL"] = self.mirror.start()
+            self.pool.env["MOLECULE_ARTIFACT_MIRROR_URL"] = self.env["MOLECULE_ARTIFACT_MIRROR_URL"]
+        await self.pool.start(self.scenarios)
+        self.socket_path.unlink(missing_ok=True)
+        server = await asyncio.start_unix_server(
+            self._handle, path=str(self.socket_path), limit=STREAM_LIMIT
+        )
+        os.chmod(self.socket_path, 0o600)
+        print(f"Agent daemon listening on {self.socket_path}")
+
+        try:
+            async with server:
+                await self._stopped.wait()
+        finally:
+            await self.pool.close()
+            if self.mirror is not None:
+                self.mirror.stop()
+            self.socket_path.unlink(missing_ok=True)
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Serve one client connection."""
+        observer = SocketObserverAdapter(writer)
+        try:
+            request = json.loads(await reader.readline() or b"{}")
+            action = request.get("action")
+
+            if action == "run":
+                await self._run(request, reader, observer)
+            elif action == "status":
+                await observer.send(
+                    "status",
+                    pool=self.pool.stats(),
+                    mirror=self.mirror.stats() if self.mirror is not None else None,
+                    busy=self._lock.locked(),
+                )
+            elif action == "shutdown":
+                await observer.send("result", success=True)
+                self._stopped.set()
+            else:
+                await observer.send("result", success=False, error=f"Unknown action: {action}")
+        except Exception as e:
+            await observer.send("result", success=False, error=str(e))
+        finally:
+            writer.close()
+
+    async def _run(
+        self,
+        request: dict,
+        reader: asyncio.StreamReader,
+        observer: SocketObserverAdapter,
+    ) -> None:
+        """Run one agent job and stream its events to the client."""
+        if self._lock.locked():
+            await observer.log(LogLevel.INFO, "Waiting for the running job to finish...")
+
+        async with self._lock:
+            config = AgentConfig.create(
+                scenario=request.get("scenario", AgentConfig.DEFAULT_SCENARIO),
+                max_retries=request.get("max_retries", AgentConfig.DEFAULT_MAX_RETRIES),
+                skip_final=request.get("skip_final", False),
+                project_root=self.project_root,
+                verbose=request.get("verbose", False),
+                stall_limit=request.get("stall_limit", AgentConfig.DEFAULT_STALL_LIMIT),
+            )
+            executor = PooledExecutorAdapter(
+                pool=self.pool,
+                scenario=config.scenario,
+                env=self.env,
+                project_root=self.project_root,
+                observer=observer,
+            )
+            state_store = JournalStateStoreAdapter(self.project_root / Settings.JOURNAL_FILE)
+            state_store.reset()
+            use_case = AsyncAutonomousAgentUseCase(
+                config=config,
+                executor=executor,
+                healer=AsyncClaudeHealerAdapter(project_root=self.project_root),
+                observer=observer,
+                state_store=state_store,
+                error_store=FileErrorStoreAdapter(self.project_root / Settings.ERROR_STORE_DIR),
+                artifact_archive=ArtifactArchiveAdapter(
+                    root=self.project_root / Settings.ARTIFACT_DIR,
+                    project_root=self.project_root,
+                    ansible_log=self.project_root / Settings.ANSIBLE_LOG_FILE,
+                    max_iterations=Settings.ARTIFACT_MAX_ITERATIONS,
+                    max_bytes=Settings.ARTIFACT_MAX_MB * 1024 * 1024,
+                    ansible_log_max_bytes=Settings.ANSIBLE_LOG_MAX_MB * 1024 * 1024,
+                ),
+            )
+
+            # A client that hangs up (e.g. a cancelled CI job) cancels its run
+            run_task = asyncio.create_task(use_case.run())
+            hangup_task = asyncio.create_task(reader.read())
+            done, _ = await asyncio.wait(
+                {run_task, hangup_task}, return_when=asyncio.FIRST_COMPLETED
+            )
+
+            if run_task not in done:
+                run_task.cancel()
+                await asyncio.gather(run_task, return_exceptions=True)
+                await executor.destroy_containers()
+                return
+
+            hangup_task.cancel()
+            await observer.send(
+                "result",
+                success=run_task.result(),
+                summary=use_case.state.get_summary(),
+            )
+
+
+# ----------------------------------------------------------------------
+# Client side
+# ----------------------------------------------------------------------
+
+
+def replay_event(observer: ObserverPort, record: dict) -> None:
+    """Replay a daemon event record on a local observer."""
+    event = record.get("event")
+    if event == "log":
+        observer.log(LogLevel(record["level"]), record["message"])
+    elif event == "output":
+        observer.on_output(record["phase"], record["lines"])
+    elif event == "iteration_start":
+        observer.on_iteration_start(record["iteration"], record["max_retries"])
+    elif event == "iteration_complete":
+        observer.on_iteration_complete(record["iteration"], record["success"])
+    elif event == "test_start":
+        observer.on_test_start(record["phase"])
+    elif event == "test_complete":
+        observer.on_test_complete(TestResult(
+            phase=TestPhase(record["phase"]),
+            status=TestStatus(record["status"]),
+            return_code=record["return_code"],
+            output=record.get("error") or "",
+        ))
+    elif event == "healing_start":
+        observer.on_healing_start(record["iteration"])
+    elif event == "healing_complete":
+        observer.on_healing_complete(FixRecord(
+            iteration=record["iteration"],
+            status=FixStatus(record["status"]),
+        ))
+    elif event == "phase_change":
+        observer.on_phase_change(record["phase"])
+    elif event == "summary":
+        observer.on_summary(record["summary"])
+
+
+async def send_request(
+    socket_path: Path,
+    request: dict,
+    observer: Optional[ObserverPort] = None,
+) -> dict:
+    """Send a request to the daemon and replay its events.
+
+    Args:
+        socket_path: Daemon socket
+        request: Request object
+        observer: Local observer the daemon's events are replayed on
+
+    Returns:
+        The daemon's final ``result`` (or ``status``) record
+    """
+    reader, writer = await asyncio.open_unix_connection(str(socket_path), limit=STREAM_LIMIT)
+    try:
+        writer.write((json.dumps(request) + "\n").encode("utf-8"))
+        await writer.drain()
+
+        async for line in reader:
+            record = json.loads(line)
+            if record.get("event") in ("result", "status"):
+                return record
+            if observer is not None:
+                replay_event(observer, record)
+    finally:
+        writer.close()
+
+    return {"event": "result", "success": False, "error": "Daemon closed the connection"}
+
+
+def run_via_daemon(socket_path: Path, request: dict, observer: ObserverPort) -> Tuple[bool, dict]:
+    """Run an agent job on the daemon.
+
+    Args:
+        socket_path: Daemon socket
+        request: Run parameters (scenario, max_retries, skip_final, ...)
+        observer: Local observer for the streamed events
+
+    Returns:
+        Tuple of (success, summary)
+    """
+    result = asyncio.run(send_request(socket_path, {"action": "run", **request}, observer))
+    if result.get("error"):
+        observer.log(LogLevel.ERROR, f"Daemon error: {result['error']}")
+    return bool(result.get("success")), result.get("summary", {})
@@ -0,0 +1,97 @@
+# SPDX-License-Identifier: MIT-0
+"""Task plan CLI - which tasks run for a scenario, without running Ansible.
+
+Usage:
+    python -m src.interfaces.plan --scenario default
+    python -m src.interfaces.plan --tags level2 --skip-tags never
+    python -m src.interfaces.plan --file roles/common/tasks/packages.yml
+    python -m src.interfaces.plan -e common_install_d2=true -e @ci_vars.yml --json
+"""
+
+import argparse
+import json
+from pathlib import Path
+
+from src.domain.models import PlanStatus
+from src.infrastructure import StaticPlanCompilerAdapter, Settings
+
+
+def parse_args():
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Show the effective task list of a playbook")
+    parser.add_argument("--scenario", "-s",
+                        help="Molecule scenario (default: the main playbook and inventory)")
+    parser.add_argument("--extra-vars", "-e", action="append", default=[],
+                        help="key=value or @file.yml, like ansible-playbook -e")
+    parser.add_argument("--tags", "-t", default="", help="Comma-separated tags to select")
+    parser.add_argument("--skip-tags", default="", help="Comma-separated tags to skip")
+    parser.add_argument("--file", "-f", action="append", default=[],
+                        help="Only tasks a change to this file affects (repeatable)")
+    parser.add_argument("--skipped", action="store_true",
+                        help="Include tasks whose conditions are false")
+    parser.add_argument("--index", action="store_true", help="Print the file -> tags index")
+    parser.add_argument("--json", action="store_true", help="Print the plan as JSON")
+    return parser.parse_args()
+
+
+def load_extra_vars(values):
+    """Parse ``-e`` values."""
+    import yaml  # ships with ansible-core
+
+    extra = {}
+    for value in values:
+        if value.startswith("@"):
+            with open(value[1:], encoding="utf-8") as f:
+                extra.update(yaml.safe_load(f) or {})
+        elif value.lstrip().startswith("{"):
+            extra.update(json.loads(value))
+        else:
+            for pair in value.split():
+                key, _, raw = pair.partition("=")
+                extra[key] = yaml.safe_load(raw) if raw else ""
+    return extra
+
+
+def relative_path(root: Path, path: str) -> str:
+    """Get a path relative to the project root, as the plan indexes it."""
+    resolved = Path(path).resolve()
+    return resolved.relative_to(root).as_posix() if resolved.is_relative_to(root) else path
+
+
+def main():
+    """Main entry point."""
+    args = parse_args()
+    root = Path.cwd().resolve()
+    compiler = StaticPlanCompilerAdapter(project_root=root, roles_dir=root / Settings.ROLES_DIR)
+    plan = compiler.compile(args.scenario, load_extra_vars(args.extra_vars))
+
+    if args.json:
+        print(json.dumps(plan.to_dict(), indent=2))
+        return
+    if args.index:
+        for path, tags in plan.file_tags().items():
+            print(f"{path}: {', '.join(tags)}")
+        return
+
+    tags = [t for t in args.tags.split(",") if t]
+    skip_tags = [t for t in args.skip_tags.split(",") if t]
+    if args.skipped:
+        tasks = [t for t in plan.tasks if not t.is_handler and t.is_selected(tags, skip_tags)]
+    else:
+        tasks = plan.select(tags, skip_tags)
+    if args.file:
+        impacted = set(plan.impacted(relative_path(root, f) for f in args.file))
+        tasks = [t for t in tasks if t in impacted]
+
+    print(plan.format(tasks))
+    counts = {status: sum(t.status is status for t in tasks) for status in PlanStatus}
+    print(
+        f"\n{len(tasks)} task(s) from {plan.playbook}: "
+        + ", ".join(f"{n} {status.value}" for status, n in counts.items() if n)
+    )
+    for note in plan.unresolved:
+        print(f"unresolved: {note}")
+
+
+if __name__ == "__main__":
+    main()